@@ -55,6 +55,10 @@ class CodeAnalyzer:
     def analyze_file(self, file_path: Path) -> list[AuditResult]:  # noqa: C901
         """Analyze a single Python file for security patterns.
 
+        The raw bytes are searched first (memory-mapped for large files): a
+        file that contains none of the patterns is neither decoded nor
+        parsed, and the line scan only checks the patterns present.
+
         Args:
             file_path: Path to the Python file to analyze
 
@@ -69,6 +73,10 @@ class CodeAnalyzer:
         findings: list[AuditResult] = []
 
         try:
+            candidates = self._candidate_patterns(file_path)
+            if not candidates:
+                return findings
+
             content = self.fs.read_text(file_path, encoding="utf-8")
             lines = content.splitlines()
 
@@ -81,7 +89,7 @@ class CodeAnalyzer:
 
             # Check for patterns in each line
             for line_num, line in enumerate(lines, 1):
-                for pattern in self.patterns:
+                for pattern in candidates:
                     if pattern.pattern in line:
                         # Check for suppression comments (noqa)
                         if self._is_suppressed(line, pattern):
@@ -124,6 +132,25 @@ class CodeAnalyzer:
 
         return findings
 
+    def _candidate_patterns(self, file_path: Path) -> list[SecurityPattern]:
+        """Return the patterns whose UTF-8 bytes occur in the file.
+
+        A pattern can only match a line of the decoded text if its encoded
+        form occurs in the raw bytes, so the others are skipped.
+
+        Args:
+            file_path: Path to the Python file to analyze
+
+        Returns:
+            Patterns that may match, in configuration order
+        """
+        with self.fs.map_bytes(file_path) as data:
+            return [
+                pattern
+                for pattern in self.patterns
+                if data.find(pattern.pattern.encode("utf-8")) != -1
+            ]
+
     def _is_suppressed(self, line: str, pattern: SecurityPattern) -> bool:
         """Check if a pattern is suppressed by noqa comment.
 
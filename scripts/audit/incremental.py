@@ -0,0 +1,345 @@
+"""Incremental (changed-files-only) Code Audit.
+
+Audits only the files git reports as changed and reuses cached findings for
+every other file, so the report still covers the whole workspace while the
+analysis cost follows the size of the diff.
+
+- Changed files: ``git diff <base_ref>`` (working tree against a ref, plus
+  untracked files) or ``git diff --cached`` (the index, for pre-commit)
+- Cached findings are keyed by file and by the git object id of its
+  content in the index (``git ls-files -s``); files whose working tree
+  differs from the index have no trustworthy id and are always analyzed
+- The cache is dropped when the patterns, the audit limits or the analyzer
+  source (``scripts/audit/analyzer.py``) change
+
+Classes:
+    ChangeSet: Files to analyze and object ids of the clean tracked files
+    FindingsCache: Per-file findings stored under ``.cache/code-audit/``
+    IncrementalAudit: Merges fresh and cached findings in scan order
+
+Author: DevOps Engineering Team
+License: MIT
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import subprocess
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from scripts.audit.models import AuditResult, SecurityPattern
+from scripts.utils.atomic import AtomicFileWriter
+
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+CACHE_PATH = Path(".cache") / "code-audit" / "findings.json"
+"""Findings cache, relative to the workspace root."""
+
+CACHE_FORMAT = 1
+
+# Source of the analysis logic: editing it invalidates every cached finding
+ANALYZER_SOURCE = Path(__file__).with_name("analyzer.py")
+
+# Runs a git command and returns its stdout, or None if it failed
+GitRunner = Callable[[Sequence[str]], str | None]
+
+
+@dataclass
+class ChangeSet:
+    """Git view of the workspace for one incremental audit.
+
+    Attributes:
+        changed: Files to analyze regardless of the cache (absolute paths)
+        object_ids: Index object id of each tracked file whose working tree
+            matches the index (absolute path -> id)
+    """
+
+    changed: set[Path] = field(default_factory=set)
+    object_ids: dict[Path, str] = field(default_factory=dict)
+
+
+def _split(output: str) -> list[str]:
+    """Split NUL-separated git output."""
+    return [item for item in output.split("\0") if item]
+
+
+def collect_changes(
+    workspace_root: Path,
+    *,
+    base_ref: str | None = None,
+    staged: bool = False,
+    runner: GitRunner | None = None,
+) -> ChangeSet | None:
+    """Ask git which files changed and which cached ids can be trusted.
+
+    Args:
+        workspace_root: Directory inside the repository (paths are resolved
+            relative to it)
+        base_ref: Compare the working tree against this ref (e.g. "HEAD",
+            "origin/main"); untracked files count as changed
+        staged: Compare the index against HEAD instead (pre-commit)
+        runner: Callable running a git command in workspace_root and
+            returning stdout or None on failure (default: subprocess)
+
+    Returns:
+        ChangeSet, or None if git failed (not a repository, unknown ref)
+    """
+    root = workspace_root.resolve()
+
+    def default_runner(command: Sequence[str]) -> str | None:
+        """Run git in the workspace; None on failure or timeout."""
+        try:
+            result = subprocess.run(  # noqa: S603
+                list(command),
+                cwd=root,
+                shell=False,  # Security: prevent shell injection
+                capture_output=True,
+                text=True,
+                check=False,
+                timeout=60,
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+        return result.stdout if result.returncode == 0 else None
+
+    run = runner or default_runner
+    diff = ["git", "diff", "--name-only", "--relative", "-z"]
+    if staged:
+        commands = [[*diff, "--cached"]]
+    else:
+        commands = [
+            [*diff, base_ref or "HEAD"],
+            ["git", "ls-files", "--others", "--exclude-standard", "-z"],
+        ]
+    commands += [diff, ["git", "ls-files", "--stage", "-z"]]
+
+    outputs = [run(command) for command in commands]
+    if any(output is None for output in outputs):
+        return None
+    *changed_outputs, dirty_output, stage_output = (str(o) for o in outputs)
+
+    changes = ChangeSet()
+    for output in changed_outputs:
+        changes.changed.update(root / name for name in _split(output))
+    # Modified but unstaged: the index id does not describe the file on disk
+    dirty = {root / name for name in _split(dirty_output)}
+    for record in _split(stage_output):
+        # "<mode> <object id> <stage>\t<path>"
+        meta, _, name = record.partition("\t")
+        path = root / name
+        if path not in dirty:
+            changes.object_ids[path] = meta.split(" ")[1]
+    return changes
+
+
+def audit_fingerprint(patterns: list[SecurityPattern], settings: dict[str, Any]) -> str:
+    """Fingerprint of everything besides the file content that shapes findings.
+
+    Covers the patterns, the settings and a digest of the analyzer source,
+    so a change to CodeAnalyzer never serves findings of the old logic.
+
+    Args:
+        patterns: Security patterns in use
+        settings: Other options affecting findings (e.g. max findings per file)
+
+    Returns:
+        Hex digest; cached findings from another fingerprint are discarded
+    """
+    try:
+        analyzer = hashlib.sha256(ANALYZER_SOURCE.read_bytes()).hexdigest()
+    except OSError:
+        analyzer = None  # no source (frozen build): the format version still applies
+    payload = json.dumps(
+        {
+            "format": CACHE_FORMAT,
+            "analyzer": analyzer,
+            "patterns": [pattern.model_dump(mode="json") for pattern in patterns],
+            "settings": settings,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class FindingsCache:
+    """Findings per file, valid while the file's object id is unchanged.
+
+    Stored as compact JSON: ``{"fingerprint": ..., "files": {path: {"id": ...,
+    "file": ..., "findings": [[line, pattern index, code, suggestion], ...]}}}``
+    with paths relative to the workspace root. Patterns are stored by index:
+    the fingerprint guarantees the same pattern list on load.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        workspace_root: Path,
+        patterns: list[SecurityPattern],
+        settings: dict[str, Any],
+    ) -> None:
+        """Load the cache (a missing, corrupt or stale file starts empty).
+
+        Args:
+            path: Cache file
+            workspace_root: Root the stored paths are relative to
+            patterns: Security patterns in use
+            settings: Other options affecting findings (see audit_fingerprint)
+        """
+        self.path = path
+        self.workspace_root = workspace_root.resolve()
+        self.patterns = list(patterns)
+        self.fingerprint = audit_fingerprint(self.patterns, settings)
+        self._pattern_index = {pattern: i for i, pattern in enumerate(self.patterns)}
+        self._files: dict[str, dict[str, Any]] = {}
+        self._modified = False
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("fingerprint") == self.fingerprint:
+            self._files = data.get("files", {})
+
+    def _key(self, file_path: Path) -> str:
+        """Cache key of a file: POSIX path relative to the workspace root."""
+        try:
+            return file_path.relative_to(self.workspace_root).as_posix()
+        except ValueError:
+            return file_path.as_posix()
+
+    def get(self, file_path: Path, object_id: str) -> list[AuditResult] | None:
+        """Return the cached findings if they were computed for ``object_id``."""
+        entry = self._files.get(self._key(file_path))
+        if entry is None or entry.get("id") != object_id:
+            return None
+        try:
+            reported = Path(entry["file"])
+            # Stored findings were validated when produced: skip re-validation
+            return [
+                AuditResult.model_construct(
+                    file_path=reported,
+                    line_number=line,
+                    pattern=self.patterns[index],
+                    code_snippet=code,
+                    suggestion=suggestion,
+                )
+                for line, index, code, suggestion in entry["findings"]
+            ]
+        except (IndexError, KeyError, TypeError, ValueError):
+            return None
+
+    def put(
+        self,
+        file_path: Path,
+        object_id: str,
+        findings: list[AuditResult],
+    ) -> None:
+        """Store the findings computed for ``object_id``."""
+        self._files[self._key(file_path)] = {
+            "id": object_id,
+            "file": str(findings[0].file_path) if findings else "",
+            "findings": [
+                [
+                    finding.line_number,
+                    self._pattern_index[finding.pattern],
+                    finding.code_snippet,
+                    finding.suggestion,
+                ]
+                for finding in findings
+            ],
+        }
+        self._modified = True
+
+    def save(self, files: list[Path]) -> None:
+        """Write the cache if it changed, keeping only entries of ``files``."""
+        keep = {self._key(file_path) for file_path in files}
+        if not self._modified and keep.issuperset(self._files):
+            return
+        self._files = {k: v for k, v in self._files.items() if k in keep}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with AtomicFileWriter(self.path, fsync=False) as stream:
+            json.dump(
+                {"fingerprint": self.fingerprint, "files": self._files},
+                stream,
+                separators=(",", ":"),
+                ensure_ascii=False,
+            )
+        self._modified = False
+
+
+@dataclass
+class IncrementalResult:
+    """Findings of an incremental audit.
+
+    Attributes:
+        findings: Findings of every file, in scan order
+        analyzed: Files analyzed in this run
+        reused: Files whose findings came from the cache
+    """
+
+    findings: list[AuditResult]
+    analyzed: list[Path]
+    reused: list[Path]
+
+
+class IncrementalAudit:
+    """Analyze changed files and reuse cached findings for the rest."""
+
+    def __init__(
+        self,
+        analyze: Callable[[Path], list[AuditResult]],
+        cache: FindingsCache,
+    ) -> None:
+        """Initialize the audit.
+
+        Args:
+            analyze: Analyzer of one file (e.g. CodeAnalyzer.analyze_file)
+            cache: Findings cache to read and update
+        """
+        self.analyze = analyze
+        self.cache = cache
+
+    def run(self, files: list[Path], changes: ChangeSet) -> IncrementalResult:
+        """Collect findings for ``files``, analyzing as few as possible.
+
+        A file is analyzed if git reports it as changed, if it has no
+        trustworthy object id (untracked or modified but unstaged), or if
+        the cache has no findings for its current id.
+
+        Args:
+            files: Every file of the full audit, in scan order
+            changes: Output of collect_changes()
+
+        Returns:
+            IncrementalResult; findings equal those of a full audit
+        """
+        result = IncrementalResult(findings=[], analyzed=[], reused=[])
+        for file_path in files:
+            object_id = changes.object_ids.get(file_path)
+            cached = None
+            if object_id is not None and file_path not in changes.changed:
+                cached = self.cache.get(file_path, object_id)
+
+            if cached is not None:
+                result.reused.append(file_path)
+                result.findings.extend(cached)
+                continue
+
+            findings = self.analyze(file_path)
+            result.analyzed.append(file_path)
+            result.findings.extend(findings)
+            if object_id is not None:
+                self.cache.put(file_path, object_id, findings)
+
+        self.cache.save(files)
+        logger.info(
+            "Incremental audit: %d files analyzed, %d from cache",
+            len(result.analyzed),
+            len(result.reused),
+        )
+        return result
@@ -16,6 +16,122 @@ logger = logging.getLogger(__name__)
 class MetricsCalculator:
     """Business logic for calculating and updating audit metrics."""
 
+    @staticmethod
+    def build_audit_event(
+        audit_result: dict[str, Any],
+        timestamp: str,
+    ) -> dict[str, Any]:
+        """Reduce an audit result to the event persisted in the event log.
+
+        The event holds exactly what :meth:`apply_audit_event` needs, so
+        replaying the log reproduces the in-memory metrics.
+
+        Args:
+            audit_result: Complete audit result dictionary
+            timestamp: ISO format timestamp of the audit
+
+        Returns:
+            JSON-serializable audit event
+
+        """
+        dependencies = audit_result.get("external_dependencies", [])
+        if not isinstance(dependencies, list):
+            logger.warning("external_dependencies is not a list, treating as empty")
+            dependencies = []
+
+        ci_simulation = audit_result.get("ci_simulation", {})
+        return {
+            "timestamp": timestamp,
+            "month": datetime.now().strftime("%Y-%m"),
+            # Malformed entries still count as prevented failures
+            "dependencies": [
+                (
+                    {
+                        key: dep[key]
+                        for key in ("pattern", "file", "severity")
+                        if key in dep
+                    }
+                    if isinstance(dep, dict)
+                    else None
+                )
+                for dep in dependencies
+            ],
+            "ci_simulation_passed": ci_simulation.get("tests_passed", True),
+        }
+
+    @staticmethod
+    def event_totals(
+        event: dict[str, Any],
+        time_per_failure: int,
+    ) -> tuple[int, int, int]:
+        """Compute the per-audit totals of an event.
+
+        Args:
+            event: Event built by :meth:`build_audit_event`
+            time_per_failure: Minutes saved per prevented failure
+
+        Returns:
+            Tuple (failures prevented, high severity count, minutes saved)
+
+        """
+        dependencies = event["dependencies"]
+        failures_prevented = len(dependencies)
+        high_severity_count = sum(
+            1
+            for dep in dependencies
+            if isinstance(dep, dict) and dep.get("severity") == "HIGH"
+        )
+        return (
+            failures_prevented,
+            high_severity_count,
+            failures_prevented * time_per_failure,
+        )
+
+    @classmethod
+    def apply_audit_event(
+        cls,
+        metrics: dict[str, Any],
+        event: dict[str, Any],
+    ) -> tuple[int, int]:
+        """Apply one audit event to the aggregated metrics.
+
+        Args:
+            metrics: Metrics dictionary to update (modified in place)
+            event: Event built by :meth:`build_audit_event`
+
+        Returns:
+            Tuple (failures prevented, minutes saved) for this audit
+
+        """
+        dependencies = event["dependencies"]
+        failures_prevented, high_severity_count, time_saved = cls.event_totals(
+            event,
+            metrics["configuration"]["time_per_failure_minutes"],
+        )
+
+        metrics["audits_performed"] += 1
+        metrics["last_audit"] = event["timestamp"]
+        metrics["failures_prevented"] += failures_prevented
+        metrics["time_saved_minutes"] += time_saved
+
+        cls.update_pattern_statistics(metrics, dependencies)
+        cls.update_monthly_statistics(
+            metrics,
+            failures_prevented,
+            time_saved,
+            month_key=event["month"],
+        )
+        cls.record_audit_history(
+            metrics,
+            event["timestamp"],
+            failures_prevented,
+            high_severity_count,
+            time_saved,
+            {"ci_simulation": {"tests_passed": event["ci_simulation_passed"]}},
+        )
+        cls.update_success_rate(metrics)
+        return failures_prevented, time_saved
+
     @staticmethod
     def update_pattern_statistics(
         metrics: dict[str, Any],
@@ -57,6 +173,7 @@ class MetricsCalculator:
         metrics: dict[str, Any],
         failures_prevented: int,
         time_saved: int,
+        month_key: str | None = None,
     ) -> None:
         """Update monthly aggregated statistics.
 
@@ -64,9 +181,11 @@ class MetricsCalculator:
             metrics: Metrics dictionary to update (modified in place)
             failures_prevented: Number of failures prevented
             time_saved: Time saved in minutes
+            month_key: Month ("YYYY-MM") to update (defaults to current month)
 
         """
-        month_key = datetime.now().strftime("%Y-%m")
+        if month_key is None:
+            month_key = datetime.now().strftime("%Y-%m")
 
         if month_key not in metrics["monthly_stats"]:
             metrics["monthly_stats"][month_key] = {
@@ -10,6 +10,7 @@ import gettext
 import logging
 import os
 import sys
+from datetime import datetime
 from pathlib import Path
 
 from scripts.audit_dashboard.dashboard import AuditDashboard
@@ -53,6 +54,7 @@ Examples:
   %(prog)s --export-html            Export HTML dashboard
   %(prog)s --export-json metrics.json  Export metrics as JSON
   %(prog)s --reset-stats            Reset all statistics
+  %(prog)s --storage sqlite --since 2026-01-01 --export-html
         """,
     )
 
@@ -88,6 +90,27 @@ Examples:
         help="Metrics file name (default: audit_metrics.json)",
     )
 
+    parser.add_argument(
+        "--storage",
+        choices=["json", "sqlite"],
+        default="json",
+        help="Metrics backend: json snapshot or queryable sqlite (default: json)",
+    )
+
+    parser.add_argument(
+        "--since",
+        type=datetime.fromisoformat,
+        metavar="DATE",
+        help="Only report audits at or after DATE (ISO 8601, sqlite storage)",
+    )
+
+    parser.add_argument(
+        "--until",
+        type=datetime.fromisoformat,
+        metavar="DATE",
+        help="Only report audits before DATE (ISO 8601, sqlite storage)",
+    )
+
     parser.add_argument(
         "--verbose",
         "-v",
@@ -115,15 +138,16 @@ def main() -> int:
     try:
         # Initialize dashboard
         workspace_root = args.workspace or Path.cwd()
-        dashboard = AuditDashboard(workspace_root, args.metrics_file)
+        dashboard = AuditDashboard(workspace_root, args.metrics_file, args.storage)
+        window = {"since": args.since, "until": args.until}
 
         # Execute requested action
         if args.export_html:
-            html_file = dashboard.export_html_dashboard()
+            html_file = dashboard.export_html_dashboard(**window)
             print(_("📄 Dashboard HTML exportado para: {file}").format(file=html_file))
 
         elif args.export_json:
-            json_file = dashboard.export_json_metrics(Path(args.export_json))
+            json_file = dashboard.export_json_metrics(Path(args.export_json), **window)
             print(_("📊 Métricas exportadas para: {file}").format(file=json_file))
 
         elif args.reset_stats:
@@ -131,7 +155,7 @@ def main() -> int:
             print(_("🔄 Estatísticas resetadas com backup criado"))
 
         else:
-            dashboard.print_console_dashboard()
+            dashboard.print_console_dashboard(**window)
             # Mostrar dica sobre exportação HTML (exceto em modo verbose)
             if not args.verbose:
                 tip_msg = (
@@ -18,7 +18,8 @@ from scripts.audit_dashboard.exporters import (
     HTMLExporter,
     JSONExporter,
 )
-from scripts.audit_dashboard.models import AuditMetricsError
+from scripts.audit_dashboard.models import AuditMetricsError, StorageBackend
+from scripts.audit_dashboard.sqlite_storage import SQLiteMetricsStorage
 from scripts.audit_dashboard.storage import MetricsStorage
 
 logger = logging.getLogger(__name__)
@@ -35,12 +36,15 @@ class AuditDashboard:
         self,
         workspace_root: Path | None = None,
         metrics_filename: str = "audit_metrics.json",
+        backend: StorageBackend = "json",
     ) -> None:
         """Initialize audit dashboard with thread-safe operations.
 
         Args:
             workspace_root: Root directory for metrics storage
             metrics_filename: Name of the metrics file
+            backend: "json" (snapshot + event log) or "sqlite" (full,
+                queryable history; a ".json" filename becomes ".db")
 
         """
         self.workspace_root = workspace_root or Path.cwd()
@@ -51,7 +55,13 @@ class AuditDashboard:
         self.workspace_root.mkdir(parents=True, exist_ok=True)
 
         # Initialize components
-        self.storage = MetricsStorage(self.metrics_file, self._lock)
+        self.storage: MetricsStorage | SQLiteMetricsStorage
+        if backend == "sqlite":
+            if self.metrics_file.suffix == ".json":
+                self.metrics_file = self.metrics_file.with_suffix(".db")
+            self.storage = SQLiteMetricsStorage(self.metrics_file, self._lock)
+        else:
+            self.storage = MetricsStorage(self.metrics_file, self._lock)
         self.calculator = MetricsCalculator()
         self.html_exporter = HTMLExporter()
         self.json_exporter = JSONExporter()
@@ -87,53 +97,14 @@ class AuditDashboard:
         with self._lock:
             try:
                 now = datetime.now(timezone.utc).isoformat()
-
-                self._metrics["audits_performed"] += 1
-                self._metrics["last_audit"] = now
-
-                # Process external dependencies
-                dependencies = audit_result.get("external_dependencies", [])
-                if not isinstance(dependencies, list):
-                    logger.warning(
-                        "external_dependencies is not a list, treating as empty",
-                    )
-                    dependencies = []
-
-                failures_prevented = len(dependencies)
-                high_severity_count = sum(
-                    1
-                    for dep in dependencies
-                    if isinstance(dep, dict) and dep.get("severity") == "HIGH"
-                )
-
-                self._metrics["failures_prevented"] += failures_prevented
-
-                # Calculate time saved with configurable rate
-                time_per_failure = self._metrics["configuration"][
-                    "time_per_failure_minutes"
-                ]
-                time_saved = failures_prevented * time_per_failure
-                self._metrics["time_saved_minutes"] += time_saved
-
-                # Update statistics using calculator
-                self.calculator.update_pattern_statistics(self._metrics, dependencies)
-                self.calculator.update_monthly_statistics(
-                    self._metrics,
-                    failures_prevented,
-                    time_saved,
-                )
-                self.calculator.record_audit_history(
+                event = self.calculator.build_audit_event(audit_result, now)
+                failures_prevented, time_saved = self.calculator.apply_audit_event(
                     self._metrics,
-                    now,
-                    failures_prevented,
-                    high_severity_count,
-                    time_saved,
-                    audit_result,
+                    event,
                 )
-                self.calculator.update_success_rate(self._metrics)
 
-                # Persist changes
-                self.storage.save_metrics(self._metrics)
+                # Persist changes (one appended line; periodic compaction)
+                self.storage.append_event(event, self._metrics)
 
                 logger.info(
                     "Audit recorded: %d failures prevented, %d minutes saved",
@@ -146,19 +117,69 @@ class AuditDashboard:
                 msg = f"Cannot record audit: {e}"
                 raise AuditMetricsError(msg) from e
 
-    def generate_html_dashboard(self) -> str:
+    def query_metrics(
+        self,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        include_files: bool = True,
+    ) -> dict[str, Any]:
+        """Return the metrics used by the reports.
+
+        With the SQLite backend the metrics are aggregated by queries (and
+        include audits recorded by other processes); the JSON backend only
+        keeps rolling aggregates, so it cannot answer time-window queries.
+
+        Args:
+            since: Only audits at or after this moment (SQLite backend)
+            until: Only audits before this moment (SQLite backend)
+            include_files: List affected files per pattern (SQLite backend;
+                reports that only show counts skip this query)
+
+        Returns:
+            Metrics dictionary
+
+        Raises:
+            AuditMetricsError: If a time window is requested on the JSON backend
+
+        """
+        if isinstance(self.storage, SQLiteMetricsStorage):
+            return self.storage.query_metrics(since, until, include_files)
+        if since is not None or until is not None:
+            msg = "Time-window queries require the sqlite storage backend"
+            raise AuditMetricsError(msg)
+        return self._metrics
+
+    def generate_html_dashboard(
+        self,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> str:
         """Generate secure HTML dashboard with sanitized content.
 
+        Args:
+            since: Only audits at or after this moment (SQLite backend)
+            until: Only audits before this moment (SQLite backend)
+
         Returns:
             HTML string with complete dashboard
 
         """
         with self._lock:
-            return self.html_exporter.export(self._metrics)
+            return self.html_exporter.export(
+                self.query_metrics(since, until, include_files=False),
+            )
 
-    def export_html_dashboard(self) -> Path:
+    def export_html_dashboard(
+        self,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> Path:
         """Export dashboard as HTML file.
 
+        Args:
+            since: Only audits at or after this moment (SQLite backend)
+            until: Only audits before this moment (SQLite backend)
+
         Returns:
             Path to generated HTML file
 
@@ -167,7 +188,7 @@ class AuditDashboard:
 
         """
         try:
-            html_content = self.generate_html_dashboard()
+            html_content = self.generate_html_dashboard(since, until)
             html_file = self.workspace_root / "audit_dashboard.html"
 
             with html_file.open("w", encoding="utf-8") as f:
@@ -181,11 +202,18 @@ class AuditDashboard:
             msg = f"Cannot export HTML dashboard: {e}"
             raise AuditMetricsError(msg) from e
 
-    def export_json_metrics(self, output_file: Path | None = None) -> Path:
+    def export_json_metrics(
+        self,
+        output_file: Path | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> Path:
         """Export metrics as JSON for external monitoring systems.
 
         Args:
             output_file: Optional custom output file path
+            since: Only audits at or after this moment (SQLite backend)
+            until: Only audits before this moment (SQLite backend)
 
         Returns:
             Path to exported JSON file
@@ -199,7 +227,9 @@ class AuditDashboard:
                 if output_file is None:
                     output_file = self.workspace_root / "audit_metrics_export.json"
 
-                json_content = self.json_exporter.export(self._metrics)
+                json_content = self.json_exporter.export(
+                    self.query_metrics(since, until),
+                )
 
                 with output_file.open("w", encoding="utf-8") as f:
                     f.write(json_content)
@@ -212,10 +242,22 @@ class AuditDashboard:
                 msg = f"Cannot export JSON metrics: {e}"
                 raise AuditMetricsError(msg) from e
 
-    def print_console_dashboard(self) -> None:
-        """Print formatted dashboard to console."""
+    def print_console_dashboard(
+        self,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> None:
+        """Print formatted dashboard to console.
+
+        Args:
+            since: Only audits at or after this moment (SQLite backend)
+            until: Only audits before this moment (SQLite backend)
+
+        """
         with self._lock:
-            self.console_reporter.print_dashboard(self._metrics)
+            self.console_reporter.print_dashboard(
+                self.query_metrics(since, until, include_files=False),
+            )
 
     def reset_metrics(self) -> None:
         """Reset all metrics to default state.
@@ -226,15 +268,7 @@ class AuditDashboard:
         """
         with self._lock:
             try:
-                # Backup current metrics
-                if self.metrics_file.exists():
-                    backup_file = self.metrics_file.with_suffix(".backup")
-                    self.metrics_file.rename(backup_file)
-                    logger.info("Metrics backed up to %s", backup_file)
-
-                # Reload default metrics
-                self._metrics = self.storage._get_default_metrics()
-                self.storage.save_metrics(self._metrics)
+                self._metrics = self.storage.reset(self._metrics)
                 logger.info("Metrics reset to default state")
 
             except OSError as e:
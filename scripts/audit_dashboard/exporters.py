@@ -86,7 +86,10 @@ class HTMLExporter:
                 {
                     "pattern": html.escape(str(pattern)),
                     "count": data["count"],
-                    "files_count": len(data["files_affected"]),
+                    "files_count": data.get(
+                        "files_count",
+                        len(data["files_affected"]),
+                    ),
                     "severity_class": severity_class,
                 },
             )
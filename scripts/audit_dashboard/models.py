@@ -7,7 +7,7 @@ used by the audit dashboard system.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Literal
 
 from scripts.audit.models import SecuritySeverity
 
@@ -16,6 +16,11 @@ DEFAULT_TIME_PER_FAILURE_MINUTES = 7
 MAX_HISTORY_RECORDS = 50
 METRICS_FILE_PERMISSIONS = 0o644
 DEFAULT_METRICS_FILENAME = "audit_metrics.json"
+EVENT_LOG_SUFFIX = ".events.jsonl"
+EVENT_LOG_COMPACT_INTERVAL = 100
+
+# Persistence backends for AuditDashboard
+StorageBackend = Literal["json", "sqlite"]
 
 
 class AuditMetricsError(Exception):
@@ -0,0 +1,428 @@
+"""SQLite storage backend for audit metrics.
+
+Keeps every audit and finding in indexed tables instead of rolling
+aggregates inside one JSON document, so history is never truncated.
+Pattern, monthly and success-rate statistics are aggregated in SQL, and
+an optional time window (``since``/``until``) restricts every aggregate.
+
+The views returned by :meth:`SQLiteMetricsStorage.query_metrics` have the
+same shape as the JSON metrics dictionary, so the exporters work with
+either backend.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+from contextlib import closing
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from scripts.audit_dashboard.calculator import MetricsCalculator
+from scripts.audit_dashboard.models import (
+    DEFAULT_TIME_PER_FAILURE_MINUTES,
+    MAX_HISTORY_RECORDS,
+    AuditMetricsError,
+)
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS audits (
+    id INTEGER PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    month TEXT NOT NULL,
+    failures_prevented INTEGER NOT NULL,
+    high_severity INTEGER NOT NULL,
+    time_saved INTEGER NOT NULL,
+    ci_simulation_passed INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_audits_timestamp ON audits (timestamp);
+CREATE TABLE IF NOT EXISTS patterns (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS findings (
+    id INTEGER PRIMARY KEY,
+    audit_id INTEGER NOT NULL REFERENCES audits (id) ON DELETE CASCADE,
+    pattern_id INTEGER NOT NULL REFERENCES patterns (id),
+    file TEXT NOT NULL,
+    severity TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_findings_audit ON findings (audit_id);
+CREATE INDEX IF NOT EXISTS idx_findings_pattern
+    ON findings (pattern_id, file, severity);
+"""
+
+# Audits inside the optional time window (bound to :since / :until)
+_WINDOW = (
+    "(:since IS NULL OR timestamp >= :since) AND (:until IS NULL OR timestamp < :until)"
+)
+
+
+def _iso_utc(moment: datetime | None) -> str | None:
+    """Convert a window bound to the ISO format stored in ``audits``.
+
+    Naive datetimes are interpreted as UTC.
+    """
+    if moment is None:
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc).isoformat()
+
+
+class SQLiteMetricsStorage:
+    """Thread-safe SQLite storage for audit metrics.
+
+    Drop-in alternative to MetricsStorage: the dashboard calls
+    ``load_metrics``, ``append_event``, ``save_metrics`` and ``reset`` on
+    either backend; exports read through :meth:`query_metrics`.
+    """
+
+    def __init__(
+        self,
+        metrics_file: Path,
+        lock: threading.RLock | None = None,
+    ) -> None:
+        """Initialize SQLite storage.
+
+        Args:
+            metrics_file: Path to the SQLite database
+            lock: Optional threading lock (creates new if not provided)
+
+        """
+        self.metrics_file = metrics_file
+        self._lock = lock or threading.RLock()
+        self._connection: sqlite3.Connection | None = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Open (once) the database and create the schema."""
+        if self._connection is None:
+            try:
+                connection = sqlite3.connect(
+                    self.metrics_file,
+                    check_same_thread=False,  # Access is serialized by _lock
+                )
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute("PRAGMA foreign_keys=ON")
+                connection.executescript(SCHEMA)
+            except sqlite3.Error as e:
+                raise AuditMetricsError(f"Cannot open metrics database: {e}") from e
+            self._connection = connection
+        return self._connection
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def load_metrics(self) -> dict[str, Any]:
+        """Load the all-time metrics view, initializing the database if new.
+
+        Returns:
+            Dictionary containing metrics data
+
+        """
+        with self._lock:
+            with self.connection as db:
+                db.executemany(
+                    "INSERT OR IGNORE INTO meta (key, value) VALUES (?, ?)",
+                    [
+                        ("version", "1.0"),
+                        ("created_at", datetime.now(timezone.utc).isoformat()),
+                        ("configuration", json.dumps(self._default_configuration())),
+                    ],
+                )
+            logger.info(f"Loaded metrics from {self.metrics_file}")
+            # Reports query the database; the in-memory copy needs counts only
+            return self.query_metrics(include_files=False)
+
+    def append_event(self, event: dict[str, Any], metrics: dict[str, Any]) -> None:
+        """Insert one audit and its findings in a single transaction.
+
+        Args:
+            event: Audit event built by MetricsCalculator.build_audit_event
+            metrics: Current aggregated metrics (provides the configuration)
+
+        Raises:
+            AuditMetricsError: If the audit cannot be stored
+
+        """
+        failures, high_severity, time_saved = MetricsCalculator.event_totals(
+            event,
+            metrics["configuration"]["time_per_failure_minutes"],
+        )
+        findings = [
+            (
+                str(dep.get("pattern", "unknown")),
+                str(dep.get("file", "")),
+                str(dep.get("severity", "MEDIUM")),
+            )
+            for dep in event["dependencies"]
+            if isinstance(dep, dict)
+        ]
+
+        with self._lock:
+            try:
+                with self.connection as db:
+                    cursor = db.execute(
+                        "INSERT INTO audits (timestamp, month, failures_prevented,"
+                        " high_severity, time_saved, ci_simulation_passed)"
+                        " VALUES (?, ?, ?, ?, ?, ?)",
+                        (
+                            event["timestamp"],
+                            event["month"],
+                            failures,
+                            high_severity,
+                            time_saved,
+                            bool(event["ci_simulation_passed"]),
+                        ),
+                    )
+                    audit_id = cursor.lastrowid
+                    db.executemany(
+                        "INSERT OR IGNORE INTO patterns (name) VALUES (?)",
+                        {(pattern,) for pattern, _, _ in findings},
+                    )
+                    db.executemany(
+                        "INSERT INTO findings (audit_id, pattern_id, file, severity)"
+                        " SELECT ?, id, ?, ? FROM patterns WHERE name = ?",
+                        [
+                            (audit_id, file, severity, pattern)
+                            for pattern, file, severity in findings
+                        ],
+                    )
+            except sqlite3.Error as e:
+                raise AuditMetricsError(f"Cannot store audit: {e}") from e
+
+    def save_metrics(self, metrics: dict[str, Any]) -> None:
+        """Persist the metadata of ``metrics`` (audits are stored per event).
+
+        Args:
+            metrics: Dictionary containing metrics data
+
+        Raises:
+            AuditMetricsError: If save operation fails
+
+        """
+        with self._lock:
+            try:
+                with self.connection as db:
+                    db.executemany(
+                        "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                        [
+                            ("version", str(metrics.get("version", "1.0"))),
+                            ("created_at", str(metrics.get("created_at", ""))),
+                            (
+                                "configuration",
+                                json.dumps(
+                                    metrics.get(
+                                        "configuration",
+                                        self._default_configuration(),
+                                    ),
+                                ),
+                            ),
+                        ],
+                    )
+            except sqlite3.Error as e:
+                raise AuditMetricsError(f"Cannot save metrics: {e}") from e
+
+    def reset(self, metrics: dict[str, Any]) -> dict[str, Any]:
+        """Back up the database and delete every audit.
+
+        Args:
+            metrics: Current aggregated metrics (unused; kept for API parity)
+
+        Returns:
+            Fresh (empty) metrics view
+
+        Raises:
+            AuditMetricsError: If the backup or the reset fails
+
+        """
+        backup_file = self.metrics_file.with_suffix(".backup")
+        with self._lock:
+            try:
+                with closing(sqlite3.connect(backup_file)) as backup:
+                    self.connection.backup(backup)
+                logger.info("Metrics backed up to %s", backup_file)
+
+                with self.connection as db:
+                    db.execute("DELETE FROM findings")
+                    db.execute("DELETE FROM audits")
+                    db.execute("DELETE FROM patterns")
+                    db.execute("DELETE FROM meta")
+            except sqlite3.Error as e:
+                raise AuditMetricsError(f"Cannot reset metrics: {e}") from e
+            return self.load_metrics()
+
+    def query_metrics(
+        self,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        include_files: bool = True,
+    ) -> dict[str, Any]:
+        """Aggregate the metrics of a time window in SQL.
+
+        Args:
+            since: Include audits at or after this moment (None = no bound)
+            until: Include audits before this moment (None = no bound)
+            include_files: List every affected file per pattern (otherwise
+                only ``files_count`` is computed and ``files_affected`` is
+                left empty)
+
+        Returns:
+            Dictionary with the same structure as the JSON metrics; the
+            history and success rate cover the most recent
+            ``max_history_records`` audits of the window
+
+        """
+        window = {"since": _iso_utc(since), "until": _iso_utc(until)}
+        with self._lock:
+            db = self.connection
+            meta = dict(db.execute("SELECT key, value FROM meta").fetchall())
+            configuration = self._configuration(meta)
+
+            audits, failures, time_saved = db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(failures_prevented), 0),"
+                f" COALESCE(SUM(time_saved), 0) FROM audits WHERE {_WINDOW}",
+                window,
+            ).fetchone()
+            last_audit = db.execute(
+                f"SELECT timestamp FROM audits WHERE {_WINDOW}"
+                " ORDER BY id DESC LIMIT 1",
+                window,
+            ).fetchone()
+            history = self._query_history(
+                db,
+                window,
+                configuration["max_history_records"],
+            )
+
+            metrics: dict[str, Any] = {
+                "version": meta.get("version", "1.0"),
+                "created_at": meta.get("created_at"),
+                "audits_performed": audits,
+                "failures_prevented": failures,
+                "time_saved_minutes": time_saved,
+                "last_audit": last_audit[0] if last_audit else None,
+                "audit_history": history,
+                "pattern_statistics": self._query_patterns(
+                    db,
+                    window,
+                    include_files,
+                ),
+                "monthly_stats": self._query_monthly(db, window),
+                "success_rate": 100.0,
+                "configuration": configuration,
+            }
+        MetricsCalculator.update_success_rate(metrics)
+        return metrics
+
+    @staticmethod
+    def _query_history(
+        db: sqlite3.Connection,
+        window: dict[str, str | None],
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        """Most recent audits of the window, oldest first."""
+        rows = db.execute(
+            "SELECT timestamp, failures_prevented, high_severity, time_saved,"
+            f" ci_simulation_passed FROM audits WHERE {_WINDOW}"
+            " ORDER BY id DESC LIMIT :limit",
+            {**window, "limit": limit},
+        ).fetchall()
+        return [
+            {
+                "timestamp": timestamp,
+                "failures_prevented": failures,
+                "high_severity": high_severity,
+                "time_saved": time_saved,
+                "ci_simulation_passed": bool(passed),
+            }
+            for timestamp, failures, high_severity, time_saved, passed in reversed(
+                rows,
+            )
+        ]
+
+    @staticmethod
+    def _query_patterns(
+        db: sqlite3.Connection,
+        window: dict[str, str | None],
+        include_files: bool,
+    ) -> dict[str, Any]:
+        """Per-pattern counts, affected files and severity distribution."""
+        in_window = "1"
+        if window["since"] is not None or window["until"] is not None:
+            in_window = f"f.audit_id IN (SELECT id FROM audits WHERE {_WINDOW})"
+
+        statistics: dict[str, Any] = {}
+        for name, count, files, high, medium, low in db.execute(
+            "SELECT p.name, COUNT(*), COUNT(DISTINCT NULLIF(f.file, '')),"
+            " SUM(f.severity = 'HIGH'), SUM(f.severity = 'MEDIUM'),"
+            " SUM(f.severity = 'LOW') FROM findings f"
+            f" JOIN patterns p ON p.id = f.pattern_id WHERE {in_window}"
+            " GROUP BY f.pattern_id ORDER BY MIN(f.id)",
+            window,
+        ):
+            statistics[name] = {
+                "count": count,
+                "files_count": files,
+                "files_affected": [],
+                "severity_distribution": {"HIGH": high, "MEDIUM": medium, "LOW": low},
+            }
+
+        if include_files:
+            for name, file in db.execute(
+                "SELECT p.name, f.file FROM findings f"
+                f" JOIN patterns p ON p.id = f.pattern_id WHERE {in_window}"
+                " AND f.file != '' GROUP BY f.pattern_id, f.file ORDER BY MIN(f.id)",
+                window,
+            ):
+                statistics[name]["files_affected"].append(file)
+        return statistics
+
+    @staticmethod
+    def _query_monthly(
+        db: sqlite3.Connection,
+        window: dict[str, str | None],
+    ) -> dict[str, Any]:
+        """Audits, failures and minutes saved per month."""
+        return {
+            month: {
+                "audits": audits,
+                "failures_prevented": failures,
+                "time_saved": time_saved,
+            }
+            for month, audits, failures, time_saved in db.execute(
+                "SELECT month, COUNT(*), SUM(failures_prevented), SUM(time_saved)"
+                f" FROM audits WHERE {_WINDOW} GROUP BY month ORDER BY month",
+                window,
+            )
+        }
+
+    def _configuration(self, meta: dict[str, str]) -> dict[str, Any]:
+        """Decode the stored configuration (defaults if missing/corrupt)."""
+        try:
+            configuration: dict[str, Any] = json.loads(meta["configuration"])
+        except (KeyError, ValueError):
+            return self._default_configuration()
+        return {**self._default_configuration(), **configuration}
+
+    @staticmethod
+    def _default_configuration() -> dict[str, int]:
+        """Return the default metrics configuration."""
+        return {
+            "time_per_failure_minutes": DEFAULT_TIME_PER_FAILURE_MINUTES,
+            "max_history_records": MAX_HISTORY_RECORDS,
+        }
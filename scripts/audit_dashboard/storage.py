@@ -2,6 +2,12 @@
 
 This module handles thread-safe loading, saving, and validation
 of audit metrics data.
+
+Metrics are persisted as a snapshot (``audit_metrics.json``) plus an
+append-only event log (``audit_metrics.events.jsonl``). Recording an audit
+appends one line to the log; every ``compact_interval`` events the
+aggregates are written to a new snapshot and the log is discarded. Loading
+reads the snapshot and replays only the events appended after it.
 """
 
 from __future__ import annotations
@@ -14,8 +20,11 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from scripts.audit_dashboard.calculator import MetricsCalculator
 from scripts.audit_dashboard.models import (
     DEFAULT_TIME_PER_FAILURE_MINUTES,
+    EVENT_LOG_COMPACT_INTERVAL,
+    EVENT_LOG_SUFFIX,
     MAX_HISTORY_RECORDS,
     METRICS_FILE_PERMISSIONS,
     AuditMetricsError,
@@ -23,6 +32,9 @@ from scripts.audit_dashboard.models import (
 
 logger = logging.getLogger(__name__)
 
+# Snapshot key recording the last event folded into it
+_EVENT_SEQ_KEY = "event_seq"
+
 
 class MetricsStorage:
     """Thread-safe persistent storage for audit metrics."""
@@ -31,16 +43,26 @@ class MetricsStorage:
         self,
         metrics_file: Path,
         lock: threading.RLock | None = None,
+        compact_interval: int = EVENT_LOG_COMPACT_INTERVAL,
     ) -> None:
         """Initialize metrics storage.
 
         Args:
-            metrics_file: Path to the metrics JSON file
+            metrics_file: Path to the metrics JSON file (snapshot)
             lock: Optional threading lock (creates new if not provided)
+            compact_interval: Appended events that trigger a new snapshot
 
         """
         self.metrics_file = metrics_file
+        self.event_log = metrics_file.with_suffix(EVENT_LOG_SUFFIX)
+        self.compact_interval = max(1, compact_interval)
         self._lock = lock or threading.RLock()
+        # Sequence number of the last event written or replayed
+        self._seq = 0
+        # Events in the log that are not yet part of the snapshot
+        self._pending = 0
+        # Whether a snapshot exists on disk (else the next event writes one)
+        self._has_snapshot = False
 
     def load_metrics(self) -> dict[str, Any]:
         """Load metrics from persistent storage with error handling.
@@ -55,12 +77,15 @@ class MetricsStorage:
                     with open(self.metrics_file, encoding="utf-8") as f:
                         metrics: dict[str, Any] = json.load(f)
                     logger.info(f"Loaded metrics from {self.metrics_file}")
+                    self._has_snapshot = True
                 else:
                     metrics = self._get_default_metrics()
                     logger.info("Initialized default metrics")
 
                 # Validate and migrate metrics structure
+                self._seq = int(metrics.pop(_EVENT_SEQ_KEY, 0) or 0)
                 self._validate_metrics_structure(metrics)
+                self._pending = self._replay_events(metrics)
                 return metrics
 
             except (OSError, json.JSONDecodeError) as e:
@@ -68,8 +93,87 @@ class MetricsStorage:
                 logger.info("Initializing with default metrics")
                 return self._get_default_metrics()
 
+    def _replay_events(self, metrics: dict[str, Any]) -> int:
+        """Apply events appended after the snapshot.
+
+        Lines that cannot be parsed (e.g. torn by a crash mid-append) and
+        events already folded into the snapshot are skipped.
+
+        Args:
+            metrics: Snapshot metrics (modified in place)
+
+        Returns:
+            Number of events replayed
+
+        """
+        if not self.event_log.exists():
+            return 0
+
+        replayed = 0
+        with open(self.event_log, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                try:
+                    event = json.loads(line)
+                    seq = int(event["seq"])
+                    if seq <= self._seq:
+                        continue
+                    MetricsCalculator.apply_audit_event(metrics, event)
+                except (ValueError, KeyError, TypeError) as e:
+                    logger.warning(
+                        "Skipping invalid event at %s:%d: %s",
+                        self.event_log,
+                        line_number,
+                        e,
+                    )
+                    continue
+                self._seq = seq
+                replayed += 1
+
+        if replayed:
+            logger.info("Replayed %d audit events from %s", replayed, self.event_log)
+        return replayed
+
+    def append_event(self, event: dict[str, Any], metrics: dict[str, Any]) -> None:
+        """Persist one audit event (O(1) I/O), compacting periodically.
+
+        Args:
+            event: Audit event, already applied to ``metrics``
+            metrics: Current aggregated metrics (written on compaction)
+
+        Raises:
+            AuditMetricsError: If the event cannot be written
+
+        """
+        with self._lock:
+            if not self._has_snapshot:
+                # First event of a new store: the snapshot carries created_at
+                self._seq += 1
+                self.save_metrics(metrics)
+                return
+
+            line = json.dumps({"seq": self._seq + 1, **event}, ensure_ascii=False)
+            try:
+                with open(self.event_log, "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+                    f.flush()
+                    os.fsync(f.fileno())  # Force write to disk physical media
+            except OSError as e:
+                raise AuditMetricsError(f"Cannot append audit event: {e}") from e
+
+            if self._pending == 0:
+                # New log file: same permissions as the snapshot
+                self._restore_permissions(self.event_log)
+
+            self._seq += 1
+            self._pending += 1
+            if self._pending >= self.compact_interval:
+                self.save_metrics(metrics)
+
     def save_metrics(self, metrics: dict[str, Any]) -> None:
-        """Save metrics with atomic write guarantees (POSIX).
+        """Save a metrics snapshot with atomic write guarantees (POSIX).
+
+        The snapshot includes every event appended so far, so the event
+        log is discarded afterwards.
 
         Args:
             metrics: Dictionary containing metrics data
@@ -83,7 +187,12 @@ class MetricsStorage:
 
         try:
             with open(temp_file, "w", encoding="utf-8") as f:
-                json.dump(metrics, f, indent=2, ensure_ascii=False)
+                json.dump(
+                    {**metrics, _EVENT_SEQ_KEY: self._seq},
+                    f,
+                    indent=2,
+                    ensure_ascii=False,
+                )
                 f.flush()
                 os.fsync(f.fileno())  # Force write to disk physical media
 
@@ -92,14 +201,12 @@ class MetricsStorage:
             temp_file.replace(self.metrics_file)
 
             # Restore permissions
-            try:
-                os.chmod(self.metrics_file, METRICS_FILE_PERMISSIONS)
-            except OSError as e:
-                logger.debug(
-                    "Could not set permissions on %s: %s",
-                    self.metrics_file,
-                    e,
-                )
+            self._restore_permissions(self.metrics_file)
+
+            # Events up to self._seq now live in the snapshot
+            self.event_log.unlink(missing_ok=True)
+            self._pending = 0
+            self._has_snapshot = True
 
         except Exception as e:
             # Cleanup temp file on failure
@@ -114,6 +221,41 @@ class MetricsStorage:
                     )
             raise AuditMetricsError(f"Cannot save metrics: {e}") from e
 
+    def reset(self, metrics: dict[str, Any]) -> dict[str, Any]:
+        """Back up the current metrics and start over with defaults.
+
+        Args:
+            metrics: Current aggregated metrics
+
+        Returns:
+            Fresh default metrics (already persisted)
+
+        Raises:
+            OSError: If the backup cannot be created
+
+        """
+        with self._lock:
+            # Fold pending events into the snapshot before backing it up
+            if self.event_log.exists():
+                self.save_metrics(metrics)
+
+            if self.metrics_file.exists():
+                backup_file = self.metrics_file.with_suffix(".backup")
+                self.metrics_file.rename(backup_file)
+                logger.info("Metrics backed up to %s", backup_file)
+
+            defaults = self._get_default_metrics()
+            self.save_metrics(defaults)
+            return defaults
+
+    @staticmethod
+    def _restore_permissions(path: Path) -> None:
+        """Apply METRICS_FILE_PERMISSIONS to ``path`` (best effort)."""
+        try:
+            os.chmod(path, METRICS_FILE_PERMISSIONS)
+        except OSError as e:
+            logger.debug("Could not set permissions on %s: %s", path, e)
+
     def _get_default_metrics(self) -> dict[str, Any]:
         """Return default metrics structure.
 
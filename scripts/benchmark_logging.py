@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""Logging Overhead Benchmark.
+
+Measures what a ``logger.info(...)`` call costs the calling thread with
+``setup_logging`` in synchronous mode versus async (queue) mode.
+
+Methodology:
+    - Each mode gets a fresh logger writing to stdout, stderr and a log file
+      in a temporary directory (stdout/stderr redirected to os.devnull)
+    - Per-call overhead = wall time of N ``logger.info`` calls / N, measured
+      on the producer thread only
+    - In async mode the time to drain the queue (``handler.close()``) is
+      reported separately: it is paid by the background thread
+    - Median over several rounds to reduce noise
+    - ``--formatter`` instead times ``JSONFormatter.format`` alone: the
+      original dict + ``json.dumps`` implementation versus the cached-fragment
+      formatter and each optional encoder that is installed
+
+Usage:
+    python scripts/benchmark_logging.py
+    python scripts/benchmark_logging.py --calls 50000 --rounds 7 --json
+    python scripts/benchmark_logging.py --formatter
+
+Author: Performance Engineering Team
+Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Add project root to sys.path (script may be run as a file)
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+from scripts.utils.logger import JSONFormatter, setup_logging  # noqa: E402
+
+
+class LegacyJSONFormatter(logging.Formatter):
+    """JSONFormatter before fragment caching (baseline for --formatter)."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Build a dict per record and encode it with json.dumps."""
+        log_entry = {
+            "timestamp": datetime.fromtimestamp(
+                record.created,
+                tz=timezone.utc,
+            ).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "trace_id": getattr(record, "trace_id", "no-trace-id"),
+            "location": f"{record.filename}:{record.lineno}",
+        }
+        return json.dumps(log_entry, ensure_ascii=False)
+
+
+def measure_mode(
+    *,
+    async_mode: bool,
+    use_json: bool,
+    calls: int,
+    log_dir: Path,
+) -> tuple[float, float]:
+    """Log ``calls`` records and time the producer side.
+
+    Args:
+        async_mode: Use the queue-based pipeline
+        use_json: Use the JSON formatter instead of the text format
+        calls: Number of ``logger.info`` calls
+        log_dir: Directory for the log file
+
+    Returns:
+        Tuple (producer microseconds per call, drain milliseconds)
+    """
+    name = f"benchmark.logging.{'async' if async_mode else 'sync'}"
+    with (
+        open(os.devnull, "w", encoding="utf-8") as devnull,
+        contextlib.redirect_stdout(devnull),
+        contextlib.redirect_stderr(devnull),
+    ):
+        logger = setup_logging(
+            name,
+            log_file=str(log_dir / f"{name}.log"),
+            use_json=use_json,
+            async_mode=async_mode,
+            # Large enough that producers never wait on the writer thread
+            queue_size=calls + 1,
+        )
+        logger.propagate = False
+
+        start = time.perf_counter()
+        for i in range(calls):
+            logger.info("Processed entry %s with %d links", "kno-001", i)
+        produced = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for handler in logger.handlers:
+            handler.close()
+        drained = time.perf_counter() - start
+        logger.handlers.clear()
+
+    return produced / calls * 1e6, drained * 1e3
+
+
+def run(calls: int, rounds: int, use_json: bool) -> dict[str, dict[str, float]]:
+    """Run every mode ``rounds`` times and keep the medians.
+
+    Args:
+        calls: Log calls per round
+        rounds: Rounds per mode
+        use_json: Use the JSON formatter
+
+    Returns:
+        Mapping mode -> {"per_call_us", "drain_ms"}
+    """
+    results: dict[str, dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode, async_mode in (("sync", False), ("async", True)):
+            samples = [
+                measure_mode(
+                    async_mode=async_mode,
+                    use_json=use_json,
+                    calls=calls,
+                    log_dir=Path(tmp),
+                )
+                for _ in range(rounds)
+            ]
+            results[mode] = {
+                "per_call_us": statistics.median(s[0] for s in samples),
+                "drain_ms": statistics.median(s[1] for s in samples),
+            }
+    return results
+
+
+def measure_formatters(calls: int, rounds: int) -> dict[str, float]:
+    """Time ``format()`` of each JSON formatter variant.
+
+    Args:
+        calls: Records formatted per round
+        rounds: Rounds per variant
+
+    Returns:
+        Mapping variant -> median microseconds per record
+    """
+    base = time.time()
+    records = []
+    for i in range(calls):
+        record = logging.LogRecord(
+            "scripts.core.cortex.knowledge_sync",
+            logging.INFO,
+            "/project/scripts/core/cortex/knowledge_sync.py",
+            120 + i % 8,
+            "Processed entry %s with %d links",
+            ("kno-001", i),
+            None,
+        )
+        # ~1000 records per second, as in a busy sync run
+        record.created = base + i / 1000
+        record.trace_id = "a1b2c3d4-e5f6-7890-1234-567890abcdef"
+        records.append(record)
+
+    variants: dict[str, logging.Formatter] = {"legacy": LegacyJSONFormatter()}
+    for encoder in ("json", "orjson", "msgspec"):
+        formatter = JSONFormatter(encoder=encoder)
+        if formatter.encoder == encoder:
+            variants[encoder] = formatter
+
+    results: dict[str, float] = {}
+    for name, variant in variants.items():
+        samples = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            for record in records:
+                variant.format(record)
+            samples.append((time.perf_counter() - start) / calls * 1e6)
+        results[name] = statistics.median(samples)
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20_000, help="Calls per round")
+    parser.add_argument("--rounds", type=int, default=5, help="Rounds per mode")
+    parser.add_argument("--json", action="store_true", help="Use JSONFormatter")
+    parser.add_argument(
+        "--formatter",
+        action="store_true",
+        help="Microbenchmark JSONFormatter.format only",
+    )
+    args = parser.parse_args(argv)
+
+    if args.formatter:
+        timings = measure_formatters(args.calls, args.rounds)
+        print(f"JSONFormatter.format ({args.calls} records x {args.rounds} rounds)")
+        print(f"{'variant':<10}{'per record (µs)':>18}")
+        for name, per_record in timings.items():
+            print(f"{name:<10}{per_record:>18.2f}")
+        return 0
+
+    results = run(args.calls, args.rounds, args.json)
+
+    fmt = "json" if args.json else "text"
+    print(f"Logging overhead ({args.calls} calls x {args.rounds} rounds, {fmt})")
+    print(f"{'mode':<8}{'per call (µs)':>16}{'drain (ms)':>14}")
+    for mode, values in results.items():
+        print(f"{mode:<8}{values['per_call_us']:>16.2f}{values['drain_ms']:>14.1f}")
+    speedup = results["sync"]["per_call_us"] / results["async"]["per_call_us"]
+    print(f"Producer speedup: {speedup:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
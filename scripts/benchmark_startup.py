@@ -0,0 +1,568 @@
+#!/usr/bin/env python3
+"""Startup Benchmark and Regression Gate for Console Entry Points.
+
+This script measures the cold-start cost of every console script declared
+in ``[project.scripts]`` of ``pyproject.toml`` (``cortex``, ``doctor``,
+``audit``, ``install-dev``, ``git-sync``) by running ``<entry> --help`` in
+fresh interpreters under ``-X importtime``.
+
+Methodology:
+    - Entry points are read from pyproject.toml, never hard-coded
+    - Each sample runs ``sys.argv = [name, "--help"]; target()`` in a new
+      interpreter, so ``--help`` parsing and rendering are included
+    - Modules loaded by a bare interpreter (``site``, ``encodings``...) are
+      subtracted so only the entry point's own imports are counted
+    - Import time is the sum of ``self`` times, broken down per top-level
+      package (``scripts``, ``typer``, ``rich``, ``pydantic``...)
+    - Median over N iterations (default: 5)
+
+Scenarios:
+    ``--scenarios`` also times the hot ``cortex`` invocations run by the git
+    hooks (``cortex --version``, ``cortex audit --help``...); they are
+    reported only, never written to the baseline.
+
+Regression Gate:
+    ``--check`` compares against the JSON baseline and exits with 1 when an
+    entry point's import time grows by more than ``--threshold`` (relative)
+    AND ``--min-delta-ms`` (absolute, filters noise on tiny numbers).
+
+Usage:
+    python scripts/benchmark_startup.py                 # Report only
+    python scripts/benchmark_startup.py --update        # Rewrite baseline
+    python scripts/benchmark_startup.py --check         # Regression gate
+    python scripts/benchmark_startup.py --check --threshold 0.3
+    python scripts/benchmark_startup.py --entry cortex --scenarios
+
+Author: Performance Engineering Team
+Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+# Compatibilidade com Python 3.10 (tomllib disponível apenas em 3.11+)
+try:
+    import tomllib
+except ImportError:  # pragma: no cover
+    import tomli as tomllib
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_BASELINE = PROJECT_ROOT / "benchmarks" / "startup_baseline.json"
+DEFAULT_THRESHOLD = 0.20
+DEFAULT_MIN_DELTA_MS = 15.0
+BASELINE_SCHEMA_VERSION = 1
+BASELINE_TOP_PACKAGES = 15
+
+SCENARIOS = [
+    "cortex --version",
+    "cortex --help",
+    "cortex audit --help",
+    "cortex knowledge-scan --help",
+]
+"""Invocations the git hooks run on every commit (see --scenarios)."""
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    """One line of ``-X importtime`` output.
+
+    Attributes:
+        module: Fully qualified module name
+        self_us: Time spent in the module body itself (microseconds)
+        cumulative_us: Time including nested imports (microseconds)
+        depth: Nesting level (0 = imported directly by the measured code)
+    """
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass(frozen=True)
+class EntryPoint:
+    """A console script declared in ``[project.scripts]``.
+
+    Attributes:
+        name: Script name as installed (e.g. ``git-sync``)
+        target: Object reference in ``module:attribute`` format
+    """
+
+    name: str
+    target: str
+
+    @property
+    def module(self) -> str:
+        """Module part of the target."""
+        return self.target.partition(":")[0]
+
+    @property
+    def attribute(self) -> str:
+        """Attribute part of the target."""
+        return self.target.partition(":")[2]
+
+
+@dataclass
+class StartupResult:
+    """Median startup measurements for one entry point.
+
+    Attributes:
+        name: Entry point name
+        wall_ms: Median wall time of ``<entry> --help`` (milliseconds)
+        import_ms: Median total import time (milliseconds)
+        packages_ms: Median import time per top-level package (milliseconds)
+    """
+
+    name: str
+    wall_ms: float
+    import_ms: float
+    packages_ms: dict[str, float] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class Regression:
+    """An entry point whose import time exceeded the allowed growth.
+
+    Attributes:
+        name: Entry point name
+        baseline_ms: Import time recorded in the baseline
+        current_ms: Import time measured now
+        top_growth: Packages that grew the most, as (package, delta_ms)
+    """
+
+    name: str
+    baseline_ms: float
+    current_ms: float
+    top_growth: list[tuple[str, float]]
+
+    @property
+    def growth(self) -> float:
+        """Relative growth (0.25 = +25%)."""
+        if self.baseline_ms <= 0:
+            return float("inf")
+        return (self.current_ms - self.baseline_ms) / self.baseline_ms
+
+
+def parse_importtime(stderr: str) -> list[ImportRecord]:
+    """Parse ``-X importtime`` output into records.
+
+    Lines look like ``import time:       327 |     193605 |   scripts.core``;
+    the indentation of the module name encodes the nesting depth (two spaces
+    per level). The header line and unrelated stderr output are ignored.
+
+    Args:
+        stderr: Raw stderr captured from the interpreter
+
+    Returns:
+        Records in the order the interpreter reported them
+    """
+    records: list[ImportRecord] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3:
+            continue
+        self_field, cumulative_field, name_field = parts
+        try:
+            self_us = int(self_field.strip())
+            cumulative_us = int(cumulative_field.strip())
+        except ValueError:
+            # Header line ("self [us] | cumulative | imported package")
+            continue
+        module = name_field.strip()
+        indent = len(name_field) - len(name_field.lstrip(" ")) - 1
+        records.append(
+            ImportRecord(
+                module=module,
+                self_us=self_us,
+                cumulative_us=cumulative_us,
+                depth=max(indent, 0) // 2,
+            ),
+        )
+    return records
+
+
+def child_env() -> dict[str, str]:
+    """Environment for child interpreters with the project root importable."""
+    env = os.environ.copy()
+    python_path = env.get("PYTHONPATH")
+    env["PYTHONPATH"] = (
+        f"{PROJECT_ROOT}{os.pathsep}{python_path}" if python_path else str(PROJECT_ROOT)
+    )
+    return env
+
+
+def run_importtime(code: str) -> tuple[list[ImportRecord], float]:
+    """Run ``code`` in a fresh interpreter under ``-X importtime``.
+
+    Args:
+        code: Python source passed to ``-c``
+
+    Returns:
+        Tuple of (import records, wall time in seconds)
+
+    Raises:
+        RuntimeError: If the child exits with a non-zero status
+    """
+    start = time.perf_counter()
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_ROOT,
+        env=child_env(),
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        msg = f"Failed to run {code!r}:\n{result.stderr[-2000:]}"
+        raise RuntimeError(msg)
+    return parse_importtime(result.stderr), elapsed
+
+
+def interpreter_startup_modules() -> set[str]:
+    """Modules a bare interpreter imports before running any user code."""
+    records, _ = run_importtime("pass")
+    return {record.module for record in records}
+
+
+def load_entry_points(
+    pyproject: Path = PROJECT_ROOT / "pyproject.toml",
+) -> list[EntryPoint]:
+    """Read console scripts from ``[project.scripts]``.
+
+    Args:
+        pyproject: Path to pyproject.toml
+
+    Returns:
+        Entry points in declaration order
+    """
+    with pyproject.open("rb") as f:
+        data: dict[str, Any] = tomllib.load(f)
+    scripts: dict[str, str] = data.get("project", {}).get("scripts", {})
+    return [EntryPoint(name=name, target=target) for name, target in scripts.items()]
+
+
+def _invocation(entry: EntryPoint, args: Sequence[str]) -> str:
+    """Python source that runs ``<entry> <args>`` like the installed script."""
+    return (
+        "import sys\n"
+        f"sys.argv = {[entry.name, *args]!r}\n"
+        f"from {entry.module} import {entry.attribute} as _entry\n"
+        "try:\n"
+        "    _entry()\n"
+        "except SystemExit as exc:\n"
+        "    if exc.code not in (0, None):\n"
+        "        raise\n"
+    )
+
+
+def aggregate_by_package(
+    records: list[ImportRecord],
+    exclude: set[str],
+) -> dict[str, float]:
+    """Sum ``self`` import times per top-level package, in milliseconds.
+
+    Args:
+        records: Parsed ``-X importtime`` records
+        exclude: Module names to ignore (interpreter startup)
+
+    Returns:
+        Mapping of top-level package to import time (ms)
+    """
+    totals: dict[str, float] = {}
+    for record in records:
+        if record.module in exclude:
+            continue
+        package = record.module.split(".", 1)[0]
+        totals[package] = totals.get(package, 0.0) + record.self_us / 1000
+    return totals
+
+
+def measure_entry_point(
+    entry: EntryPoint,
+    iterations: int,
+    startup_modules: set[str],
+    args: Sequence[str] = ("--help",),
+    name: str | None = None,
+) -> StartupResult:
+    """Measure ``<entry> <args>`` over several fresh interpreters.
+
+    Args:
+        entry: Entry point to measure
+        iterations: Number of samples
+        startup_modules: Modules to exclude (see interpreter_startup_modules)
+        args: Command-line arguments (default: ``--help``)
+        name: Name of the result (default: the entry point's)
+
+    Returns:
+        Median measurements
+    """
+    code = _invocation(entry, args)
+    walls: list[float] = []
+    totals: list[float] = []
+    per_package: dict[str, list[float]] = {}
+
+    for _ in range(iterations):
+        records, elapsed = run_importtime(code)
+        packages = aggregate_by_package(records, startup_modules)
+        walls.append(elapsed * 1000)
+        totals.append(sum(packages.values()))
+        for package, ms in packages.items():
+            per_package.setdefault(package, []).append(ms)
+
+    packages_ms = {
+        package: round(statistics.median(samples), 2)
+        for package, samples in per_package.items()
+    }
+    return StartupResult(
+        name=name or entry.name,
+        wall_ms=round(statistics.median(walls), 2),
+        import_ms=round(statistics.median(totals), 2),
+        packages_ms=dict(
+            sorted(packages_ms.items(), key=lambda item: item[1], reverse=True),
+        ),
+    )
+
+
+def measure_scenarios(
+    scenarios: Sequence[str],
+    entries: list[EntryPoint],
+    iterations: int,
+    startup_modules: set[str],
+) -> list[StartupResult]:
+    """Measure command lines such as ``cortex audit --help``.
+
+    Args:
+        scenarios: Command lines starting with an entry point name
+        entries: Known entry points; scenarios of other commands are skipped
+        iterations: Number of samples per scenario
+        startup_modules: Modules to exclude (see interpreter_startup_modules)
+
+    Returns:
+        Median measurements, in scenario order
+    """
+    by_name = {entry.name: entry for entry in entries}
+    results: list[StartupResult] = []
+    for scenario in scenarios:
+        name, *args = scenario.split()
+        if name in by_name:
+            results.append(
+                measure_entry_point(
+                    by_name[name],
+                    iterations,
+                    startup_modules,
+                    args,
+                    name=scenario,
+                ),
+            )
+    return results
+
+
+def find_regressions(
+    current: list[StartupResult],
+    baseline: dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+    min_delta_ms: float = DEFAULT_MIN_DELTA_MS,
+) -> list[Regression]:
+    """Compare measurements against a baseline document.
+
+    An entry point regresses when its import time grows by more than
+    ``threshold`` (relative) and by more than ``min_delta_ms`` (absolute).
+    Entry points missing from the baseline are ignored (new scripts).
+
+    Args:
+        current: Fresh measurements
+        baseline: Parsed baseline JSON (see save_baseline)
+        threshold: Allowed relative growth (0.20 = +20%)
+        min_delta_ms: Allowed absolute growth in milliseconds
+
+    Returns:
+        Regressions, in the order of ``current``
+    """
+    recorded: dict[str, Any] = baseline.get("entry_points", {})
+    regressions: list[Regression] = []
+
+    for result in current:
+        previous = recorded.get(result.name)
+        if previous is None:
+            continue
+        baseline_ms = float(previous["import_ms"])
+        delta = result.import_ms - baseline_ms
+        if delta <= min_delta_ms or delta <= baseline_ms * threshold:
+            continue
+
+        previous_packages: dict[str, float] = previous.get("packages_ms", {})
+        growth = sorted(
+            (
+                (package, ms - float(previous_packages.get(package, 0.0)))
+                for package, ms in result.packages_ms.items()
+            ),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+        regressions.append(
+            Regression(
+                name=result.name,
+                baseline_ms=baseline_ms,
+                current_ms=result.import_ms,
+                top_growth=[item for item in growth[:3] if item[1] > 0],
+            ),
+        )
+    return regressions
+
+
+def save_baseline(results: list[StartupResult], path: Path, iterations: int) -> None:
+    """Write measurements as the new JSON baseline.
+
+    Only the heaviest packages are kept per entry point; they are what a
+    regression report needs to point at the culprit.
+
+    Args:
+        results: Measurements to persist
+        path: Baseline file path
+        iterations: Samples per entry point (recorded as metadata)
+    """
+    document = {
+        "schema_version": BASELINE_SCHEMA_VERSION,
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": f"{platform.system()} {platform.machine()}",
+        "iterations": iterations,
+        "entry_points": {
+            result.name: {
+                "wall_ms": result.wall_ms,
+                "import_ms": result.import_ms,
+                "packages_ms": dict(
+                    list(result.packages_ms.items())[:BASELINE_TOP_PACKAGES],
+                ),
+            }
+            for result in results
+        },
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+
+
+def load_baseline(path: Path) -> dict[str, Any]:
+    """Load a baseline document, or an empty one if the file is missing."""
+    if not path.exists():
+        return {}
+    data: dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+    return data
+
+
+def print_report(results: list[StartupResult], baseline: dict[str, Any]) -> None:
+    """Print a Markdown-friendly table of the measurements."""
+    recorded: dict[str, Any] = baseline.get("entry_points", {})
+    print("| Command | Wall | Imports | Baseline | Top packages |")
+    print("|---------|-----:|--------:|---------:|--------------|")
+    for result in results:
+        previous = recorded.get(result.name)
+        baseline_cell = f"{previous['import_ms']:.0f} ms" if previous else "-"
+        top = ", ".join(
+            f"{package} {ms:.0f}"
+            for package, ms in list(result.packages_ms.items())[:3]
+        )
+        print(
+            f"| `{result.name}` | {result.wall_ms:.0f} ms | "
+            f"{result.import_ms:.0f} ms | {baseline_cell} | {top} |",
+        )
+
+
+def main() -> int:
+    """Parse arguments, measure all entry points and apply the gate.
+
+    Returns:
+        Exit code (0 = ok, 1 = regression detected in --check mode)
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark cold-start time of console entry points",
+    )
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--entry",
+        action="append",
+        default=None,
+        help="Only measure this entry point (repeatable)",
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--update", action="store_true", help="Rewrite the baseline")
+    mode.add_argument("--check", action="store_true", help="Fail on regressions")
+    parser.add_argument(
+        "--scenarios",
+        action="store_true",
+        help="Also time the cortex invocations run by the git hooks",
+    )
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--min-delta-ms", type=float, default=DEFAULT_MIN_DELTA_MS)
+    args = parser.parse_args()
+
+    entries = load_entry_points()
+    if args.entry:
+        entries = [entry for entry in entries if entry.name in args.entry]
+
+    print(f"⏱️  Measuring {len(entries)} entry point(s), {args.iterations} run(s) each")
+    startup_modules = interpreter_startup_modules()
+    results = [
+        measure_entry_point(entry, args.iterations, startup_modules)
+        for entry in entries
+    ]
+
+    baseline = load_baseline(args.baseline)
+    print_report(results, baseline)
+    if args.scenarios:
+        print()
+        print_report(
+            measure_scenarios(SCENARIOS, entries, args.iterations, startup_modules),
+            {},
+        )
+
+    if args.update:
+        save_baseline(results, args.baseline, args.iterations)
+        print(f"📝 Baseline written to {args.baseline}")
+        return 0
+
+    if args.check:
+        if not baseline:
+            print(f"⚠️  No baseline at {args.baseline}; run with --update first")
+            return 1
+        regressions = find_regressions(
+            results,
+            baseline,
+            threshold=args.threshold,
+            min_delta_ms=args.min_delta_ms,
+        )
+        for regression in regressions:
+            culprits = ", ".join(
+                f"{package} +{delta:.0f} ms" for package, delta in regression.top_growth
+            )
+            print(
+                f"❌ {regression.name}: {regression.baseline_ms:.0f} ms → "
+                f"{regression.current_ms:.0f} ms (+{regression.growth:.0%})"
+                + (f" [{culprits}]" if culprits else ""),
+            )
+        if regressions:
+            return 1
+        print("✅ No startup regressions above threshold")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,6 +7,7 @@ CI/CD pipelines to prevent outdated documentation from being merged.
 
 Features:
 - Generates documentation in-memory (no file changes)
+- Parses the CLI sources statically (no imports, cached per source hash)
 - Normalizes content by removing timestamps
 - Shows diff when documentation is outdated
 - Returns appropriate exit codes for CI/CD integration
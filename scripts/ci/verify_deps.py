@@ -12,6 +12,7 @@ Features:
 - Auto-fix capability (--fix flag) for self-healing
 - Cryptographic integrity seals (v2.2 Autoimunity Protocol)
 - File locking for concurrency safety (v2.5.4 Concurrency Immunity)
+- Cached resolutions: repeated checks skip pip-compile (--refresh recompiles)
 
 Exit Codes:
 - 0: Lockfile synchronized or successfully fixed
@@ -27,6 +28,19 @@ import sys
 import tempfile
 from pathlib import Path
 
+# Add project root to sys.path (script may be run as a file)
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+from scripts.core.dependency_guardian import DependencyGuardian  # noqa: E402
+from scripts.core.resolution_cache import (  # noqa: E402
+    COMPILE_FLAGS,
+    DEFAULT_CACHE_DIR,
+    ResolutionCache,
+    probe_interpreter,
+)
+
 
 def _ensure_piptools_installed(python_exec: str, project_root: Path) -> bool:
     """Ensure pip-tools is installed in the target Python interpreter.
@@ -150,10 +164,7 @@ def _compile_in_memory(
             str(in_file),
             "--output-file",
             str(tmp_path),
-            "--resolver=backtracking",
-            "--strip-extras",
-            "--allow-unsafe",
-            "--quiet",
+            *COMPILE_FLAGS,
         ],
         cwd=str(project_root),
     )
@@ -182,13 +193,61 @@ def _show_diff(txt_file_path: Path, tmp_path: Path) -> None:
         pass  # diff returns non-zero when files differ (expected)
 
 
-def check_sync(req_name: str) -> bool:
+def _resolution_key(
+    cache: ResolutionCache,
+    python_exec: str,
+    project_root: Path,
+    req_name: str,
+) -> str | None:
+    """Build the resolution cache key, or None if it cannot be computed.
+
+    Args:
+        cache: Resolution cache.
+        python_exec: Python executable running pip-compile.
+        project_root: Project root directory.
+        req_name: Requirements file name (e.g., 'dev').
+
+    Returns:
+        Cache key, or None (missing .in file, unusable interpreter).
+    """
+    interpreter = probe_interpreter(python_exec)
+    if interpreter is None:
+        return None
+    requirements_dir = project_root / "requirements"
+    try:
+        input_hash = DependencyGuardian(requirements_dir).compute_input_hash(req_name)
+    except (FileNotFoundError, OSError):
+        return None
+    return cache.key(requirements_dir / f"{req_name}.in", input_hash, interpreter)
+
+
+def _report_sync(
+    project_root: Path,
+    in_file: Path,
+    txt_file: Path,
+    compiled: Path,
+) -> bool:
+    """Compare the lockfile with a pip-compile output and report the result."""
+    if _compare_files_content(project_root / txt_file, compiled):
+        print("✅ Sincronizado")
+        return True
+
+    print("❌ DESSINCRONIZADO")
+    _print_remediation_message(in_file, txt_file)
+    _show_diff(project_root / txt_file, compiled)
+    return False
+
+
+def check_sync(req_name: str, refresh: bool = False) -> bool:
     """Verify if a requirements file is synchronized with its input file.
 
     SIMPLIFICADO: Remove file locking e complexidade. Apenas compara conteúdo.
+    A resolução do pip-compile é reutilizada do cache (.cache/pip-compile)
+    enquanto .in, interpretador e índices não mudarem.
 
     Args:
         req_name: The name of the requirements file (e.g., 'dev', 'prod').
+        refresh: Ignore the cached resolution and recompile.
 
     Returns:
         bool: True if synchronized, False otherwise.
@@ -199,6 +258,13 @@ def check_sync(req_name: str) -> bool:
 
     python_exec = _select_python_executable(project_root)
 
+    cache = ResolutionCache(project_root / DEFAULT_CACHE_DIR)
+    cache_key = _resolution_key(cache, python_exec, project_root, req_name)
+    if cache_key is not None and not refresh:
+        cached = cache.lookup(cache_key)
+        if cached is not None:
+            return _report_sync(project_root, in_file, txt_file, cached)
+
     # AUTO-IMMUNE CHECK: Ensure pip-tools is installed
     if not _ensure_piptools_installed(python_exec, project_root):
         print("\n❌ ERRO: Não foi possível instalar pip-tools")
@@ -207,15 +273,9 @@ def check_sync(req_name: str) -> bool:
     tmp_path = None
     try:
         tmp_path = _compile_in_memory(python_exec, in_file, project_root)
-
-        if _compare_files_content(project_root / txt_file, tmp_path):
-            print("✅ Sincronizado")
-            return True
-
-        print("❌ DESSINCRONIZADO")
-        _print_remediation_message(in_file, txt_file)
-        _show_diff(project_root / txt_file, tmp_path)
-        return False
+        if cache_key is not None:
+            cache.store(cache_key, tmp_path)
+        return _report_sync(project_root, in_file, txt_file, tmp_path)
 
     except subprocess.CalledProcessError as e:
         print(
@@ -305,10 +365,7 @@ def fix_sync(req_name: str) -> bool:
                 str(in_file),
                 "--output-file",
                 str(txt_file),
-                "--resolver=backtracking",
-                "--strip-extras",
-                "--allow-unsafe",
-                "--quiet",
+                *COMPILE_FLAGS,
             ],
             cwd=str(project_root),
         )
@@ -343,6 +400,9 @@ Examples:
   # Validate cryptographic seal only
   python scripts/ci/verify_deps.py --validate-seal
 
+  # Ignore the cached resolution (recompile against the index now)
+  python scripts/ci/verify_deps.py --refresh
+
 Exit Codes:
   0 - Lockfile synchronized or successfully fixed
   1 - Lockfile desynchronized (without --fix) or fix failed
@@ -359,6 +419,11 @@ Exit Codes:
         action="store_true",
         help="Validate cryptographic integrity seal (v2.2 Protocol)",
     )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore the cached pip-compile resolution and recompile",
+    )
     args = parser.parse_args()
 
     project_root = Path(__file__).parent.parent.parent.resolve()
@@ -366,10 +431,6 @@ Exit Codes:
     # If seal validation requested, check and exit
     if args.validate_seal:
         try:
-            # Import Guardian for seal validation
-            sys.path.insert(0, str(project_root))
-            from scripts.core.dependency_guardian import DependencyGuardian
-
             guardian = DependencyGuardian(project_root / "requirements")
 
             print(
@@ -399,7 +460,7 @@ Exit Codes:
             sys.exit(2)
 
     # Execute check
-    is_synced = check_sync("dev")
+    is_synced = check_sync("dev", refresh=args.refresh)
 
     if is_synced:
         sys.exit(0)
@@ -32,6 +32,12 @@ if str(_project_root) not in sys.path:
 # Import from the audit package (located in scripts/audit/)
 from scripts.audit.analyzer import CodeAnalyzer  # noqa: E402
 from scripts.audit.config import load_config  # noqa: E402
+from scripts.audit.incremental import (  # noqa: E402
+    CACHE_PATH,
+    FindingsCache,
+    IncrementalAudit,
+    collect_changes,
+)
 from scripts.audit.models import (  # noqa: E402
     AuditResult,
     SecurityCategory,
@@ -47,7 +53,8 @@ from scripts.audit_dashboard import AuditDashboard, AuditMetricsError  # noqa: E
 
 # Import novo sistema de logging e banner
 from scripts.utils.banner import print_startup_banner  # noqa: E402
-from scripts.utils.filesystem import RealFileSystem  # noqa: E402
+from scripts.utils.caching_filesystem import MIB, CachingFileSystem  # noqa: E402
+from scripts.utils.filesystem import FileSystemAdapter, RealFileSystem  # noqa: E402
 from scripts.utils.logger import setup_logging  # noqa: E402
 
 # Configure logging com separação automática de streams
@@ -61,7 +68,12 @@ class CodeAuditor:
     external dependencies, and potential CI/CD issues.
     """
 
-    def __init__(self, workspace_root: Path, config_path: Path | None = None) -> None:
+    def __init__(
+        self,
+        workspace_root: Path,
+        config_path: Path | None = None,
+        fs: FileSystemAdapter | None = None,
+    ) -> None:
         """Initialize the instance."""
         self.workspace_root = workspace_root.resolve()
         self.config = self._load_config(config_path)
@@ -69,7 +81,7 @@ class CodeAuditor:
         self.patterns = self._load_security_patterns()
 
         # Initialize filesystem adapter for dependency injection
-        self.fs = RealFileSystem()
+        self.fs = fs or RealFileSystem()
 
         # Initialize analyzer with loaded patterns and config
         self.analyzer = CodeAnalyzer(
@@ -221,33 +233,100 @@ class CodeAuditor:
         results = simulate_ci(self.workspace_root, self.config["ci_timeout"])
         return dict(results)  # Cast to ensure dict[str, Any] type
 
-    def run_audit(self, files_to_audit: list[Path] | None = None) -> dict[str, Any]:
-        """Run complete security and quality audit."""
-        logger.info("Starting comprehensive code audit...")
-        start_time = datetime.now(timezone.utc)
-
+    def _select_files(self, files_to_audit: list[Path] | None) -> list[Path]:
+        """Return the files of this audit (explicit list or configured scan)."""
         # IF a file list is passed (by pre-commit),
         # use it. ELSE, do complete scan (old behavior).
-        if files_to_audit:
-            logger.info(
-                f"Auditing specific file list (Delta Audit): "
-                f"{len(files_to_audit)} files",
-            )
-            # Filter out excluded files
-            python_files = [f for f in files_to_audit if not self._should_exclude(f)]
-            if len(python_files) < len(files_to_audit):
-                logger.info(
-                    f"Excluded {len(files_to_audit) - len(python_files)} files "
-                    f"based on exclude_paths configuration",
-                )
-        else:
+        if not files_to_audit:
             logger.info("No specific files provided, scanning paths from config...")
             # Scan all Python files (Comportamento antigo)
-            python_files = self._get_python_files()
+            return self._get_python_files()
+
+        logger.info(
+            f"Auditing specific file list (Delta Audit): {len(files_to_audit)} files",
+        )
+        # Filter out excluded files
+        python_files = [f for f in files_to_audit if not self._should_exclude(f)]
+        if len(python_files) < len(files_to_audit):
+            logger.info(
+                f"Excluded {len(files_to_audit) - len(python_files)} files "
+                f"based on exclude_paths configuration",
+            )
+        return python_files
 
-        for file_path in python_files:
-            file_findings = self._analyze_file(file_path)
-            self.findings.extend(file_findings)
+    def _analyze_incremental(
+        self,
+        python_files: list[Path],
+        base_ref: str | None,
+        staged: bool,
+    ) -> dict[str, Any] | None:
+        """Analyze only changed files, reusing cached findings for the rest.
+
+        Args:
+            python_files: Every file of the full audit, in scan order
+            base_ref: Git ref to diff the working tree against
+            staged: Diff the index against HEAD instead (pre-commit)
+
+        Returns:
+            Incremental metadata for the report, or None if git could not
+            describe the changes (the caller falls back to a full audit)
+        """
+        changes = collect_changes(
+            self.workspace_root,
+            base_ref=base_ref,
+            staged=staged,
+        )
+        if changes is None:
+            logger.warning(
+                "Could not list changed files with git - running a full audit",
+            )
+            return None
+
+        cache = FindingsCache(
+            self.workspace_root / CACHE_PATH,
+            self.workspace_root,
+            self.patterns,
+            {"max_findings_per_file": self.config["max_findings_per_file"]},
+        )
+        result = IncrementalAudit(self._analyze_file, cache).run(
+            python_files,
+            changes,
+        )
+        self.findings.extend(result.findings)
+        return {
+            "base": "INDEX" if staged else base_ref,
+            "files_analyzed": len(result.analyzed),
+            "files_from_cache": len(result.reused),
+        }
+
+    def run_audit(
+        self,
+        files_to_audit: list[Path] | None = None,
+        *,
+        changed_since: str | None = None,
+        staged: bool = False,
+    ) -> dict[str, Any]:
+        """Run complete security and quality audit.
+
+        Args:
+            files_to_audit: Audit only these files (Delta Audit)
+            changed_since: Incremental mode - analyze only files changed
+                against this git ref and reuse cached findings for the
+                others, so the report still covers every scanned file
+            staged: Incremental mode against the git index (pre-commit)
+        """
+        logger.info("Starting comprehensive code audit...")
+        start_time = datetime.now(timezone.utc)
+
+        python_files = self._select_files(files_to_audit)
+
+        incremental = None
+        if (changed_since or staged) and not files_to_audit:
+            incremental = self._analyze_incremental(python_files, changed_since, staged)
+        if incremental is None:
+            for file_path in python_files:
+                file_findings = self._analyze_file(file_path)
+                self.findings.extend(file_findings)
 
         # Check mock coverage
         mock_coverage = self._check_mock_coverage()
@@ -292,6 +371,7 @@ class CodeAuditor:
                 "duration_seconds": duration,
                 "files_scanned": len(python_files),
                 "auditor_version": "2.1.2-delta",  # Updated version
+                "incremental": incremental,
             },
             "findings": [finding.to_dict() for finding in self.findings],
             "mock_coverage": mock_coverage,
@@ -332,6 +412,7 @@ Examples:
   python scripts/code_audit.py --output yaml       # YAML output
   python scripts/code_audit.py --config audit_yaml   # Custom config
   python scripts/code_audit.py file1.py file2.py   # Delta audit (pre-commit)
+  python scripts/code_audit.py --changed-since origin/main  # Incremental audit
         """,
     )
 
@@ -377,6 +458,32 @@ Examples:
         action="store_true",
         help="Open HTML dashboard in browser (requires --html)",
     )
+    parser.add_argument(
+        "--fs-cache",
+        action="store_true",
+        help="Serve repeated reads and listings from a bounded in-memory LRU cache",
+    )
+    parser.add_argument(
+        "--fs-cache-mb",
+        type=int,
+        default=64,
+        help="Memory budget of --fs-cache in MiB (default: 64)",
+    )
+
+    incremental = parser.add_mutually_exclusive_group()
+    incremental.add_argument(
+        "--changed-since",
+        metavar="REF",
+        help=(
+            "Incremental audit: analyze only files changed against this git ref "
+            "(e.g. HEAD, origin/main) and reuse cached findings for the rest"
+        ),
+    )
+    incremental.add_argument(
+        "--staged",
+        action="store_true",
+        help="Incremental audit against the git index (pre-commit)",
+    )
 
     parser.add_argument(
         "files",
@@ -386,6 +493,8 @@ Examples:
     )
 
     args = parser.parse_args()
+    if args.files and (args.changed_since or args.staged):
+        parser.error("--changed-since/--staged cannot be combined with a file list")
 
     # Configure logging based on quiet flag
     if args.quiet:
@@ -403,10 +512,17 @@ Examples:
             logger.info("Using default config file: %s", config_path)
 
     # Initialize auditor
-    auditor = CodeAuditor(workspace_root, config_path)
+    fs = CachingFileSystem(max_bytes=args.fs_cache_mb * MIB) if args.fs_cache else None
+    auditor = CodeAuditor(workspace_root, config_path, fs=fs)
 
     # Run audit
-    report = auditor.run_audit(files_to_audit=args.files)
+    report = auditor.run_audit(
+        files_to_audit=args.files,
+        changed_since=args.changed_since,
+        staged=args.staged,
+    )
+    if fs is not None:
+        logger.info("Filesystem cache: %s", fs.stats.summary())
 
     # Determine output file
     if args.report_file:
@@ -1,16 +1,25 @@
 """Dev Doctor - Environment Health Diagnostics."""
 
+import argparse
+import io
 import os
 import shutil
 import sys
+import threading
+import time
+from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, TextIO
 
 from rich.console import Console
 
 # Initialize Rich console
 console = Console()
 
+# Seconds a single check may run (lockfile sync may need a full pip-compile)
+DEFAULT_CHECK_TIMEOUT = 120.0
+
 
 @dataclass
 class DiagnosticResult:
@@ -20,6 +29,7 @@ class DiagnosticResult:
     passed: bool
     details: str
     critical: bool = False
+    duration: float = 0.0
 
     @property
     def message(self) -> str:
@@ -27,15 +37,58 @@ class DiagnosticResult:
         return self.details
 
 
+class _ThreadRoutedStdout:
+    """sys.stdout proxy that buffers writes made by check threads.
+
+    Checks run concurrently; whatever a check prints (e.g. verify_deps
+    progress) is kept in its own buffer and shown next to its result
+    instead of interleaving with the report.
+    """
+
+    def __init__(self, stream: TextIO) -> None:
+        """Wrap ``stream``; threads not capturing keep writing to it."""
+        self.stream = stream
+        self._local = threading.local()
+
+    def capture(self) -> io.StringIO:
+        """Start buffering writes of the calling thread."""
+        buffer = io.StringIO()
+        self._local.buffer = buffer
+        return buffer
+
+    def write(self, text: str) -> int:
+        """Write to the thread's buffer, or to the real stream."""
+        buffer = getattr(self._local, "buffer", None)
+        return (self.stream if buffer is None else buffer).write(text)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.stream, name)
+
+
+def _check_label(check: Callable[[], DiagnosticResult]) -> str:
+    """Human-readable name of a check method (for timeouts/crashes)."""
+    name = getattr(check, "__name__", "check")
+    return name.removeprefix("check_").replace("_", " ").title()
+
+
 class DevDoctor:
     """Diagnoses development environment health."""
 
-    def __init__(self, project_root: Path | None = None) -> None:
+    def __init__(
+        self,
+        project_root: Path | None = None,
+        refresh_lockfile: bool = False,
+        check_timeout: float = DEFAULT_CHECK_TIMEOUT,
+    ) -> None:
         """Initialize the doctor.
 
         Args:
             project_root: Optional project root path. If None,
                 auto-detects from script location.
+            refresh_lockfile: Recompile the lockfile instead of reusing the
+                cached pip-compile resolution.
+            check_timeout: Seconds each check may run before it is reported
+                as a critical failure.
         """
         if project_root is None:
             self.project_root = Path(__file__).parent.parent.parent
@@ -43,6 +96,8 @@ class DevDoctor:
             self.project_root = project_root
         self.venv_path = self.project_root / ".venv"
         self.venv_bin = self.venv_path / "bin"
+        self.refresh_lockfile = refresh_lockfile
+        self.check_timeout = check_timeout
         self.results: list[DiagnosticResult] = []
 
     def check_platform(self) -> DiagnosticResult:
@@ -290,7 +345,7 @@ class DevDoctor:
             from scripts.ci.verify_deps import check_sync
 
             # Check dev requirements (primary lockfile)
-            if check_sync("dev"):
+            if check_sync("dev", refresh=self.refresh_lockfile):
                 return DiagnosticResult(
                     "Lockfile Sync",
                     True,
@@ -326,6 +381,116 @@ class DevDoctor:
                 critical=True,
             )
 
+    def diagnostic_checks(self) -> list[Callable[[], DiagnosticResult]]:
+        """Checks executed by run_diagnostics, in report order."""
+        return [
+            self.check_platform,
+            self.check_python_version,
+            self.check_virtual_environment,
+            self.check_tool_paths,
+            self.check_vital_dependencies,
+            self.check_type_stubs,
+            self.check_git_hooks,
+            self.check_lockfile_sync,  # CRITICAL: Dependency autoimmunity
+        ]
+
+    def _run_check(
+        self,
+        check: Callable[[], DiagnosticResult],
+        stdout: _ThreadRoutedStdout,
+        outcomes: list[tuple[DiagnosticResult, str] | None],
+        index: int,
+    ) -> None:
+        """Run one check in a worker thread, timing it and capturing output.
+
+        The outcome is stored in ``outcomes[index]``.
+        """
+        output = stdout.capture()
+        start = time.perf_counter()
+        try:
+            result = check()
+        except Exception as e:
+            result = DiagnosticResult(_check_label(check), False, str(e), critical=True)
+        result.duration = time.perf_counter() - start
+        outcomes[index] = (result, output.getvalue())
+
+    def run_checks(
+        self,
+        on_result: Callable[[DiagnosticResult, str], None] | None = None,
+    ) -> list[DiagnosticResult]:
+        """Run all checks concurrently, one thread per check.
+
+        Results are delivered in the order of diagnostic_checks() as soon as
+        a check and all checks before it are done, so the total time is
+        bounded by the slowest check instead of the sum. A check still
+        running after check_timeout seconds is reported as a critical
+        failure. Checks run on daemon threads: an abandoned check cannot
+        be killed, but it does not keep the process alive at exit either.
+
+        Args:
+            on_result: Called with (result, captured stdout) in stable order
+
+        Returns:
+            list[DiagnosticResult]: One result per check, in order
+        """
+        checks = self.diagnostic_checks()
+        stdout = _ThreadRoutedStdout(sys.stdout)
+        outcomes: list[tuple[DiagnosticResult, str] | None] = [None] * len(checks)
+        threads = [
+            threading.Thread(
+                target=self._run_check,
+                args=(check, stdout, outcomes, index),
+                name=f"dev-doctor-{index}",
+                daemon=True,
+            )
+            for index, check in enumerate(checks)
+        ]
+        deadline = time.monotonic() + self.check_timeout
+        self.results = []
+
+        sys.stdout = stdout
+        try:
+            for thread in threads:
+                thread.start()
+            for index, (check, thread) in enumerate(zip(checks, threads, strict=True)):
+                thread.join(timeout=max(0.0, deadline - time.monotonic()))
+                outcome = outcomes[index]
+                result, output = outcome or (self._timeout_result(check), "")
+                self.results.append(result)
+                if on_result is not None:
+                    on_result(result, output)
+        finally:
+            sys.stdout = stdout.stream
+
+        return self.results
+
+    def _timeout_result(
+        self,
+        check: Callable[[], DiagnosticResult],
+    ) -> DiagnosticResult:
+        """Critical failure for a check that exceeded check_timeout."""
+        return DiagnosticResult(
+            _check_label(check),
+            False,
+            f"Check excedeu o timeout de {self.check_timeout:.0f}s",
+            critical=True,
+            duration=self.check_timeout,
+        )
+
+    @staticmethod
+    def _print_result(result: DiagnosticResult, output: str) -> None:
+        """Print one check result (preceded by anything the check printed)."""
+        if output.strip():
+            print(output.rstrip())
+        icon = "✓" if result.passed else "✗"
+        color = "green" if result.passed else "red"
+
+        console.print(
+            f"[{color}]{icon} {result.name}[/] [dim]({result.duration:.2f}s)[/]",
+        )
+        if result.details:
+            console.print(f"  {result.details}\n")
+
     def run_diagnostics(self) -> bool:
         """Run all diagnostic checks.
 
@@ -335,31 +500,19 @@ class DevDoctor:
         print("🔍 Dev Doctor - Diagnóstico de Ambiente\n")
         print(f"Projeto: {self.project_root}\n")
 
-        checks = [
-            self.check_platform(),
-            self.check_python_version(),
-            self.check_virtual_environment(),
-            self.check_tool_paths(),
-            self.check_vital_dependencies(),
-            self.check_type_stubs(),
-            self.check_git_hooks(),
-            self.check_lockfile_sync(),  # CRITICAL: Dependency autoimmunity
-        ]
-
-        critical_failure = False
+        start = time.perf_counter()
+        checks = self.run_checks(on_result=self._print_result)
+        elapsed = time.perf_counter() - start
 
-        for result in checks:
-            icon = "✓" if result.passed else "✗"
-            color = "green" if result.passed else "red"
-
-            console.print(f"[{color}]{icon} {result.name}[/]")
-            if result.details:
-                console.print(f"  {result.details}\n")
-
-            if not result.passed and result.critical:
-                critical_failure = True
+        critical_failure = any(
+            not result.passed and result.critical for result in checks
+        )
 
         console.print("────────────────────────────────────────────────────────────")
+        console.print(
+            f"[dim]⏱  {elapsed:.2f}s "
+            f"(soma dos checks: {sum(r.duration for r in checks):.2f}s)[/]",
+        )
         if critical_failure:
             console.print(
                 "[red bold]✗ Ambiente DOENTE - 1 problema(s) crítico(s) "
@@ -375,7 +528,23 @@ class DevDoctor:
 
 def main() -> None:
     """CLI Entrypoint."""
-    doctor = DevDoctor()
+    parser = argparse.ArgumentParser(
+        description="Dev Doctor - Environment Health Diagnostics",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore the cached pip-compile resolution in the lockfile check",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=DEFAULT_CHECK_TIMEOUT,
+        help=f"Seconds per check (default: {DEFAULT_CHECK_TIMEOUT:.0f})",
+    )
+    args = parser.parse_args()
+
+    doctor = DevDoctor(refresh_lockfile=args.refresh, check_timeout=args.timeout)
     success = doctor.run_diagnostics()
     sys.exit(0 if success else 1)
 
@@ -8,6 +8,8 @@ Usage:
     toml-fusion template.toml target.toml                # Merge files
     toml-fusion template.toml target.toml --dry-run      # Preview changes
     toml-fusion template.toml target.toml --strategy=template  # Force template
+    toml-fusion template.toml --fleet "repos/*" --dry-run  # Preview a fleet
+    toml-fusion template.toml --fleet a --fleet b -j 4   # Merge many projects
     toml-fusion --help                                   # Show help
 
 Author: Engineering Team
@@ -31,6 +33,13 @@ if str(_project_root) not in sys.path:
 
 from scripts.utils.banner import print_startup_banner  # noqa: E402
 from scripts.utils.logger import setup_logging  # noqa: E402
+from scripts.utils.toml_fleet import (  # noqa: E402
+    DEFAULT_TARGET_NAME,
+    FleetMerger,
+    FleetReport,
+    FleetTargetResult,
+    resolve_project_roots,
+)
 from scripts.utils.toml_merger import (  # noqa: E402
     ConflictDecision,
     MergeResult,
@@ -75,16 +84,16 @@ def main(
         ),
     ],
     target: Annotated[
-        Path,
+        Path | None,
         typer.Argument(
-            help="Target TOML file (project file to merge into)",
+            help="Target TOML file (project file to merge into; omit with --fleet)",
             exists=True,
             file_okay=True,
             dir_okay=False,
             readable=True,
             writable=True,
         ),
-    ],
+    ] = None,
     output: Annotated[
         Path | None,
         typer.Option(
@@ -124,6 +133,36 @@ def main(
             help="Prompt user to resolve conflicts interactively (requires rich)",
         ),
     ] = False,
+    fleet: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--fleet",
+            "-f",
+            help="Project root or glob to merge into (repeatable; fleet mode)",
+        ),
+    ] = None,
+    target_name: Annotated[
+        str,
+        typer.Option(
+            "--target-name",
+            help="TOML file merged in each fleet project",
+        ),
+    ] = DEFAULT_TARGET_NAME,
+    workers: Annotated[
+        int | None,
+        typer.Option(
+            "--workers",
+            "-j",
+            help="Worker processes for fleet mode (default: CPU count, at most 8)",
+        ),
+    ] = None,
+    report: Annotated[
+        Path | None,
+        typer.Option(
+            "--report",
+            help="Write the consolidated fleet report (JSON) to this file",
+        ),
+    ] = None,
 ) -> int:
     """Merge TOML files intelligently while preserving comments.
 
@@ -140,6 +179,11 @@ def main(
     - template: Template values overwrite user values
     - user: User values take priority (template fills gaps)
 
+    Fleet mode (--fleet) parses the template once and merges it into
+    <root>/pyproject.toml of every project root or glob match, in worker
+    processes, reporting per-project diffs, conflicts and merge times. A root
+    or glob that matches no project fails the run before anything is merged.
+
     Examples:
         # Preview merge (dry run)
         $ toml-fusion template/pyproject.toml pyproject.toml --dry-run
@@ -152,6 +196,9 @@ def main(
 
         # Merge to different output file
         $ toml-fusion template/pyproject.toml pyproject.toml -o merged.toml
+
+        # Preview the template across every repository, with a JSON report
+        $ toml-fusion template/pyproject.toml --fleet "repos/*" -n --report r.json
     """
     print_startup_banner(
         tool_name="TOML Fusion",
@@ -160,6 +207,22 @@ def main(
         script_path=Path(__file__),
     )
 
+    if fleet or target is None:
+        # Typer ignores the command's return value: exit with the fleet status
+        raise typer.Exit(
+            code=_run_fleet(
+                source=source,
+                patterns=fleet or [],
+                strategy=strategy,
+                target_name=target_name,
+                dry_run=dry_run,
+                backup=not no_backup,
+                workers=workers,
+                report_path=report,
+                invalid=target is not None or output is not None or interactive,
+            )
+        )
+
     logger.info(
         "Starting TOML merge",
         extra={
@@ -209,11 +272,7 @@ def main(
             return 1
         typer.echo(f"🎯 Strategy: {merge_strategy.value}")
 
-    if dry_run:
-        typer.secho(
-            "\n🔍 DRY RUN MODE - No files will be modified",
-            fg=typer.colors.CYAN,
-        )
+    _print_dry_run_banner(dry_run)
 
     result: MergeResult = merge_toml(
         source_path=source,
@@ -272,6 +331,126 @@ def main(
     return 0
 
 
+def _run_fleet(
+    *,
+    source: Path,
+    patterns: list[str],
+    strategy: str,
+    target_name: str,
+    dry_run: bool,
+    backup: bool,
+    workers: int | None,
+    report_path: Path | None,
+    invalid: bool,
+) -> int:
+    """Merge the template into every project of the fleet.
+
+    Returns:
+        Exit code (0 = every merge succeeded)
+    """
+    if not patterns:
+        typer.secho(
+            "❌ Error: TARGET is required (or use --fleet)",
+            fg=typer.colors.RED,
+            err=True,
+        )
+        return 1
+    if invalid:
+        typer.secho(
+            "❌ Error: --fleet cannot be combined with TARGET, --output "
+            "or --interactive",
+            fg=typer.colors.RED,
+            err=True,
+        )
+        return 1
+
+    try:
+        merger = FleetMerger(source, MergeStrategy(strategy.lower()), target_name)
+    except ValueError as e:
+        typer.secho(f"❌ Invalid strategy: {strategy} ({e})", fg=typer.colors.RED)
+        return 1
+    except Exception as e:
+        typer.secho(f"❌ Failed to parse template: {e}", fg=typer.colors.RED)
+        return 1
+
+    projects, unmatched = resolve_project_roots(patterns)
+    if unmatched:
+        # A mistyped root must not pass as a smaller fleet
+        for pattern in unmatched:
+            typer.secho(
+                f"❌ --fleet {pattern} matched no project root",
+                fg=typer.colors.RED,
+                err=True,
+            )
+        return 1
+
+    typer.echo(
+        f"🎯 Strategy: {merger.strategy.value} | 🚢 Fleet: {len(projects)} projects",
+    )
+    _print_dry_run_banner(dry_run)
+
+    logger.info(
+        "Starting fleet TOML merge",
+        extra={"source": str(source), "projects": len(projects), "dry_run": dry_run},
+    )
+    fleet_report = merger.merge(
+        projects,
+        dry_run=dry_run,
+        backup=backup,
+        workers=workers,
+        on_result=_print_fleet_result if dry_run else None,
+    )
+    _print_fleet_summary(fleet_report)
+
+    if report_path:
+        fleet_report.export_to_json(report_path)
+        typer.echo(f"\n📄 Report: {report_path}")
+
+    logger.info("Fleet merge completed", extra=fleet_report.to_dict()["summary"])
+    return 0 if fleet_report.failed == 0 else 1
+
+
+def _print_dry_run_banner(dry_run: bool) -> None:
+    """Announce dry-run mode."""
+    if dry_run:
+        typer.secho(
+            "\n🔍 DRY RUN MODE - No files will be modified",
+            fg=typer.colors.CYAN,
+        )
+
+
+def _print_fleet_result(result: FleetTargetResult) -> None:
+    """Print the diff (or errors) of one fleet project."""
+    typer.secho(f"\n📦 {result.project}", bold=True)
+    if not result.success:
+        for error in result.errors:
+            typer.secho(f"   • {error}", fg=typer.colors.RED)
+    elif result.diff:
+        _print_colored_diff(result.diff)
+    else:
+        typer.secho("   No changes detected.", fg=typer.colors.CYAN)
+
+
+def _print_fleet_summary(report: FleetReport) -> None:
+    """Print one line per project and the fleet totals."""
+    typer.echo("\n" + "─" * 70)
+    typer.echo(f"{'project':<40}{'status':>9}{'lines':>7}{'conflicts':>10}{'ms':>8}")
+    for result in report.results:
+        status = ("changed" if result.changed else "ok") if result.success else "FAILED"
+        typer.echo(
+            f"{str(result.project)[-40:]:<40}{status:>9}{result.lines_changed:>7}"
+            f"{len(result.conflict_keys):>10}{result.duration * 1e3:>8.1f}",
+        )
+    typer.echo("─" * 70)
+    color = typer.colors.GREEN if report.failed == 0 else typer.colors.RED
+    typer.secho(
+        f"✅ {report.succeeded} succeeded, ❌ {report.failed} failed, "
+        f"✏️  {report.changed} changed, ⚔️  {report.total_conflicts} conflicts "
+        f"in {report.duration:.2f}s",
+        fg=color,
+    )
+
+
 def _print_colored_diff(diff: str) -> None:
     """Print diff with colored syntax.
 
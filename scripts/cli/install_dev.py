@@ -31,6 +31,7 @@ if str(PROJECT_ROOT) not in sys.path:
 # -------------------------------------------------------------------
 
 # Standard library imports (continued after sys.path fix)
+import argparse  # noqa: E402
 import contextlib  # noqa: E402
 import gettext  # noqa: E402
 import os  # noqa: E402
@@ -376,6 +377,11 @@ def main() -> int:
         script_path=Path(__file__),
     )
 
+    parser = argparse.ArgumentParser(
+        description="Development Dependencies Installation and Setup",
+    )
+    parser.parse_args()
+
     # Detect workspace root (parent directory of scripts/)
     workspace_root = Path(__file__).parent.parent.parent.resolve()
 
@@ -0,0 +1,546 @@
+"""CLI Introspect - Import-free extraction of CLI metadata for doc generation.
+
+``CLIDocGenerator`` used to import every CLI module and introspect the live
+objects, which executes module-level code and pulls in every dependency of
+every CLI (Rich, Pydantic, the neural stack...). ``StaticCLIExtractor``
+reads the same information from the source with ``ast`` instead:
+
+- module docstring
+- ``app = typer.Typer(...)`` and the commands registered on it with
+  ``@app.command(...)`` or ``app.command(...)(callback)``
+- command parameters: ``Annotated[T, typer.Option(help=...)]`` annotations
+  and defaults, formatted like ``CLIDocGenerator._extract_params``
+- ``main()`` signature (formatted by ``inspect.Signature``) and docstring
+
+Names imported from other project modules (an ``app`` or a command
+callback defined elsewhere) are followed through their source files.
+Results are cached in ``IntrospectionCache`` under the SHA-256 of every
+source file they were read from, so unchanged CLIs are not parsed again.
+
+Static extraction matches live introspection for literal defaults and
+postponed annotations (``from __future__ import annotations``, used by every
+CLI module). Other annotations and computed defaults are rendered from
+their source text.
+
+Usage:
+    extractor = StaticCLIExtractor(PROJECT_ROOT)
+    info = extractor.extract("scripts.cli.audit")
+    print(info.main_signature)  # () -> 'None'
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import inspect
+import json
+import logging
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from scripts.utils.atomic import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+#: Cache directory, relative to the project root
+CACHE_DIR = Path(".cache") / "cli-docs"
+
+#: Bump when the extracted data or its formatting changes
+CACHE_FORMAT = 1
+
+#: Import hops followed to find an ``app``, ``main`` or command callback
+MAX_IMPORT_DEPTH = 4
+
+_EMPTY = inspect.Parameter.empty
+
+
+@dataclass(frozen=True)
+class CLICommandInfo:
+    """A command registered on a Typer app."""
+
+    name: str
+    help: str
+    doc: str | None
+    params: list[dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class CLIModuleInfo:
+    """What the documentation needs from one CLI module.
+
+    Attributes:
+        doc: Module docstring
+        commands: Commands of the module's Typer app (None: no Typer app)
+        main_signature: ``str(inspect.signature(main))`` (None: no main)
+        main_doc: ``main.__doc__``
+    """
+
+    doc: str | None
+    commands: dict[str, CLICommandInfo] | None = None
+    main_signature: str | None = None
+    main_doc: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CLIModuleInfo:
+        """Rebuild from to_dict() output."""
+        commands = data.get("commands")
+        return cls(
+            doc=data.get("doc"),
+            commands=(
+                None
+                if commands is None
+                else {name: CLICommandInfo(**cmd) for name, cmd in commands.items()}
+            ),
+            main_signature=data.get("main_signature"),
+            main_doc=data.get("main_doc"),
+        )
+
+
+class _Source:
+    """Value whose repr is a source snippet (for inspect.Signature)."""
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+    def __repr__(self) -> str:
+        return self.text
+
+
+@dataclass
+class _ParsedModule:
+    """Top-level names of a parsed source file."""
+
+    path: Path
+    tree: ast.Module
+    postponed: bool
+    functions: dict[str, ast.FunctionDef | ast.AsyncFunctionDef] = field(
+        default_factory=dict,
+    )
+    assignments: dict[str, ast.expr] = field(default_factory=dict)
+    imports: dict[str, tuple[str, str]] = field(default_factory=dict)
+
+
+def _parse_module(path: Path) -> _ParsedModule:
+    """Parse a file and index its top-level definitions and imports."""
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    module = _ParsedModule(path=path, tree=tree, postponed=False)
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            module.functions[node.name] = node
+        elif isinstance(node, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    module.assignments[target.id] = node.value
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            if node.module == "__future__":
+                module.postponed |= any(a.name == "annotations" for a in node.names)
+            for alias in node.names:
+                module.imports[alias.asname or alias.name] = (node.module, alias.name)
+    return module
+
+
+def _is_typer_call(node: ast.expr | None, names: tuple[str, ...]) -> bool:
+    """Check for a call to ``typer.<name>(...)`` or ``<name>(...)``."""
+    if not isinstance(node, ast.Call):
+        return False
+    func = node.func
+    if isinstance(func, ast.Attribute):
+        return func.attr in names and ast.unparse(func.value) == "typer"
+    return isinstance(func, ast.Name) and func.id in names
+
+
+def _constant(node: ast.expr | None) -> Any:
+    """Return a literal's value, or _EMPTY if the node is not a literal."""
+    if node is None:
+        return _EMPTY
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return _EMPTY
+
+
+def _keyword(call: ast.Call, name: str) -> Any:
+    """Return the literal value of keyword ``name`` (or _EMPTY)."""
+    for keyword in call.keywords:
+        if keyword.arg == name:
+            return _constant(keyword.value)
+    return _EMPTY
+
+
+def format_default(default: Any) -> str:
+    """Format a parameter default like CLIDocGenerator's documentation table."""
+    if default is _EMPTY:
+        return "-"
+    if default is None:
+        return "None"
+    if isinstance(default, str):
+        return f'"{default}"'
+    if isinstance(default, bool):
+        return str(default)
+
+    class_name = getattr(type(default), "__name__", "")
+    if "Option" in class_name or "Argument" in class_name:
+        return "CLI Option"
+    return str(default)
+
+
+def _format_default_node(node: ast.expr | None) -> str:
+    """Format a default expression without evaluating it."""
+    if node is None:
+        return "-"
+    if _is_typer_call(node, ("Option", "Argument")):
+        return "CLI Option"
+
+    value = _constant(node)
+    if value is not _EMPTY:
+        return format_default(value)
+
+    # Path("docs") renders as its str() at runtime
+    if (
+        isinstance(node, ast.Call)
+        and ast.unparse(node.func) in ("Path", "pathlib.Path")
+        and not node.keywords
+        and all(isinstance(_constant(arg), str) for arg in node.args)
+    ):
+        return str(Path(*(_constant(arg) for arg in node.args)))
+    return ast.unparse(node)
+
+
+def _annotation_help(annotation: ast.expr | None) -> str:
+    """Return ``help=`` of the typer.Option/Argument in ``Annotated[...]``."""
+    if not isinstance(annotation, ast.Subscript):
+        return ""
+    if ast.unparse(annotation.value).rpartition(".")[2] != "Annotated":
+        return ""
+    elements = annotation.slice
+    metadata = elements.elts[1:] if isinstance(elements, ast.Tuple) else []
+    for item in metadata:
+        if isinstance(item, ast.Call):
+            help_text = _keyword(item, "help")
+            if isinstance(help_text, str) and help_text:
+                return help_text
+    return ""
+
+
+def _arguments(
+    args: ast.arguments,
+) -> list[tuple[ast.arg, inspect._ParameterKind, ast.expr | None]]:
+    """Flatten ``ast.arguments`` into (arg, kind, default) in signature order."""
+    positional = [*args.posonlyargs, *args.args]
+    defaults: list[ast.expr | None] = [None] * (len(positional) - len(args.defaults))
+    defaults.extend(args.defaults)
+
+    result: list[tuple[ast.arg, inspect._ParameterKind, ast.expr | None]] = []
+    for index, (arg, default) in enumerate(zip(positional, defaults, strict=True)):
+        kind = (
+            inspect.Parameter.POSITIONAL_ONLY
+            if index < len(args.posonlyargs)
+            else inspect.Parameter.POSITIONAL_OR_KEYWORD
+        )
+        result.append((arg, kind, default))
+    if args.vararg:
+        result.append((args.vararg, inspect.Parameter.VAR_POSITIONAL, None))
+    for arg, kw_default in zip(args.kwonlyargs, args.kw_defaults, strict=True):
+        result.append((arg, inspect.Parameter.KEYWORD_ONLY, kw_default))
+    if args.kwarg:
+        result.append((args.kwarg, inspect.Parameter.VAR_KEYWORD, None))
+    return result
+
+
+def _signature(
+    func: ast.FunctionDef | ast.AsyncFunctionDef,
+    postponed: bool,
+) -> str:
+    """Format a function's signature like ``str(inspect.signature(func))``."""
+
+    def annotation(node: ast.expr | None) -> Any:
+        """Render an annotation as inspect would (``_EMPTY`` if absent)."""
+        if node is None:
+            return _EMPTY
+        # Postponed annotations are strings at runtime (shown quoted)
+        return ast.unparse(node) if postponed else _Source(ast.unparse(node))
+
+    parameters = []
+    for arg, kind, default in _arguments(func.args):
+        value = _constant(default)
+        if default is None:
+            shown: Any = _EMPTY
+        elif value is _EMPTY:
+            shown = _Source(ast.unparse(default))
+        else:
+            shown = _Source(repr(value))
+        parameters.append(
+            inspect.Parameter(
+                arg.arg,
+                kind,
+                default=shown,
+                annotation=annotation(arg.annotation),
+            ),
+        )
+    signature = inspect.Signature(
+        parameters,
+        return_annotation=annotation(func.returns),
+    )
+    return str(signature)
+
+
+def _params(func: ast.FunctionDef | ast.AsyncFunctionDef) -> list[dict[str, Any]]:
+    """Describe command parameters like ``CLIDocGenerator._extract_params``."""
+    params: list[dict[str, Any]] = []
+    for arg, _, default in _arguments(func.args):
+        if arg.arg in ("self", "cls"):
+            continue
+        params.append(
+            {
+                "name": arg.arg,
+                "type": ast.unparse(arg.annotation) if arg.annotation else "Any",
+                "default": _format_default_node(default),
+                "required": default is None,
+                "help": _annotation_help(arg.annotation),
+            },
+        )
+    return params
+
+
+class StaticCLIExtractor:
+    """Extract CLIModuleInfo from source files, without importing them.
+
+    Attributes:
+        project_root: Root that dotted module paths are resolved against
+        sources: Files read by the last extract() call
+    """
+
+    def __init__(self, project_root: Path) -> None:
+        """Initialize the extractor.
+
+        Args:
+            project_root: Root that dotted module paths are resolved against
+        """
+        self.project_root = project_root
+        self.sources: list[Path] = []
+        self._modules: dict[Path, _ParsedModule] = {}
+
+    def module_file(self, module_path: str) -> Path | None:
+        """Locate the source of a project module (None if not in the project)."""
+        base = self.project_root.joinpath(*module_path.split("."))
+        for candidate in (base.with_suffix(".py"), base / "__init__.py"):
+            if candidate.is_file():
+                return candidate
+        return None
+
+    def extract(self, module_path: str) -> CLIModuleInfo | None:
+        """Describe a CLI module.
+
+        Args:
+            module_path: Dotted module path (e.g. 'scripts.cli.audit')
+
+        Returns:
+            CLIModuleInfo, or None if the module has neither a Typer app
+            nor a main() function
+
+        Raises:
+            ModuleNotFoundError: If the module is not a project source file
+            SyntaxError: If the source cannot be parsed
+        """
+        self.sources = []
+        module = self._load(module_path)
+
+        app = self._resolve(module, "app", MAX_IMPORT_DEPTH)
+        if app is not None:
+            app_module, value = app
+            if isinstance(value, ast.expr) and _is_typer_call(value, ("Typer",)):
+                return CLIModuleInfo(
+                    doc=ast.get_docstring(module.tree, clean=False),
+                    commands=self._commands(app_module, "app"),
+                )
+
+        main = self._resolve(module, "main", MAX_IMPORT_DEPTH)
+        if main is not None:
+            main_module, func = main
+            if isinstance(func, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                return CLIModuleInfo(
+                    doc=ast.get_docstring(module.tree, clean=False),
+                    main_signature=_signature(func, main_module.postponed),
+                    main_doc=ast.get_docstring(func, clean=False),
+                )
+        return None
+
+    def _load(self, module_path: str) -> _ParsedModule:
+        """Parse a project module once per extractor."""
+        path = self.module_file(module_path)
+        if path is None:
+            msg = f"No module named '{module_path}' in {self.project_root}"
+            raise ModuleNotFoundError(msg)
+        if path not in self.sources:
+            self.sources.append(path)
+        if path not in self._modules:
+            self._modules[path] = _parse_module(path)
+        return self._modules[path]
+
+    def _resolve(
+        self,
+        module: _ParsedModule,
+        name: str,
+        depth: int,
+    ) -> tuple[_ParsedModule, ast.expr | ast.FunctionDef | ast.AsyncFunctionDef] | None:
+        """Find the definition of a top-level name, following project imports."""
+        if name in module.functions:
+            return module, module.functions[name]
+        if name in module.assignments:
+            return module, module.assignments[name]
+        if name in module.imports and depth > 0:
+            source, original = module.imports[name]
+            if self.module_file(source) is not None:
+                return self._resolve(self._load(source), original, depth - 1)
+        return None
+
+    def _commands(
+        self,
+        module: _ParsedModule,
+        app_name: str,
+    ) -> dict[str, CLICommandInfo]:
+        """Collect commands registered on ``app_name`` in ``module``."""
+        commands: dict[str, CLICommandInfo] = {}
+
+        def register(
+            call: ast.Call,
+            func: ast.FunctionDef | ast.AsyncFunctionDef,
+        ) -> None:
+            """Record ``func`` as the command declared by decorator ``call``."""
+            name = _constant(call.args[0]) if call.args else _EMPTY
+            if name is _EMPTY:
+                name = _keyword(call, "name")
+            help_text = _keyword(call, "help")
+            command = CLICommandInfo(
+                name=name if isinstance(name, str) else func.name,
+                help=help_text if isinstance(help_text, str) else "",
+                doc=ast.get_docstring(func, clean=False),
+                params=_params(func),
+            )
+            commands[command.name] = command
+
+        for node in module.tree.body:
+            # @app.command(...) def callback(...)
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                for decorator in node.decorator_list:
+                    if self._is_command_call(decorator, app_name):
+                        assert isinstance(decorator, ast.Call)  # nosec B101
+                        register(decorator, node)
+
+            # app.command(...)(callback)
+            elif isinstance(node, ast.Expr) and isinstance(node.value, ast.Call):
+                outer = node.value
+                if (
+                    self._is_command_call(outer.func, app_name)
+                    and len(outer.args) == 1
+                    and isinstance(outer.args[0], ast.Name)
+                ):
+                    found = self._resolve(module, outer.args[0].id, MAX_IMPORT_DEPTH)
+                    if found is not None and isinstance(
+                        found[1],
+                        (ast.FunctionDef, ast.AsyncFunctionDef),
+                    ):
+                        assert isinstance(outer.func, ast.Call)  # nosec B101
+                        register(outer.func, found[1])
+        return commands
+
+    @staticmethod
+    def _is_command_call(node: ast.expr, app_name: str) -> bool:
+        """Check for ``<app_name>.command(...)``."""
+        return (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr == "command"
+            and isinstance(node.func.value, ast.Name)
+            and node.func.value.id == app_name
+        )
+
+
+def _sha256(path: Path) -> str:
+    """Hash a source file."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+class IntrospectionCache:
+    """CLIModuleInfo per module, valid while its source files are unchanged.
+
+    Every entry records the SHA-256 of each file it was extracted from (the
+    CLI module plus modules that its app, main or callbacks came from).
+
+    Attributes:
+        path: JSON cache file
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the cache (loaded on first use).
+
+        Args:
+            path: JSON cache file
+        """
+        self.path = path
+        self._entries: dict[str, Any] | None = None
+        self._dirty = False
+
+    def _version(self) -> str:
+        """Format and Python version (docstrings and annotations render per version)."""
+        return f"{CACHE_FORMAT}/py{sys.version_info.major}.{sys.version_info.minor}"
+
+    def _load(self) -> dict[str, Any]:
+        """Read the cache once; another version or a corrupt file starts empty."""
+        if self._entries is None:
+            self._entries = {}
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                data = {}
+            if isinstance(data, dict) and data.get("version") == self._version():
+                self._entries = data.get("modules", {})
+        return self._entries
+
+    def get(self, module_path: str, root: Path) -> CLIModuleInfo | None:
+        """Return the cached info if none of its sources changed."""
+        entry = self._load().get(module_path)
+        if entry is None:
+            return None
+        for relative, digest in entry["sources"].items():
+            source = root / relative
+            if not source.is_file() or _sha256(source) != digest:
+                return None
+        return CLIModuleInfo.from_dict(entry["info"])
+
+    def put(
+        self,
+        module_path: str,
+        root: Path,
+        info: CLIModuleInfo | None,
+        sources: list[Path],
+    ) -> None:
+        """Store the info extracted from ``sources``."""
+        if info is None:
+            return
+        self._load()[module_path] = {
+            "sources": {
+                source.relative_to(root).as_posix(): _sha256(source)
+                for source in sources
+            },
+            "info": info.to_dict(),
+        }
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache if it changed."""
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_json(
+            self.path,
+            {"version": self._version(), "modules": self._load()},
+            fsync=False,
+        )
+        self._dirty = False
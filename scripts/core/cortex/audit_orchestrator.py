@@ -10,6 +10,9 @@ Features:
 - Knowledge Graph link validation
 - Health report generation
 - Configurable fail-on-error and strict modes
+- Process-parallel metadata audit with per-file timings
+- One ScanSession per full audit: each file's frontmatter is parsed once and
+  shared by the metadata audit and the Knowledge Graph scan
 
 This orchestrator follows the Thin CLI pattern, extracting business logic
 from cli.py and delegating to specialized auditors (MetadataAuditor,
@@ -58,6 +61,7 @@ from scripts.core.cortex.models import (
     KnowledgeAuditResult,
     MetadataAuditResult,
 )
+from scripts.core.cortex.scan_session import ScanSession
 from scripts.cortex.core.knowledge_auditor import KnowledgeAuditor
 from scripts.cortex.core.metadata_auditor import MetadataAuditor
 from scripts.utils.filesystem import FileSystemAdapter, RealFileSystem
@@ -177,6 +181,8 @@ class AuditOrchestrator:
         path: Path | None = None,
         *,
         fail_on_error: bool = False,
+        workers: int | None = None,
+        session: ScanSession | None = None,
     ) -> MetadataAuditResult:
         """Run metadata audit on documentation files.
 
@@ -186,6 +192,9 @@ class AuditOrchestrator:
         Args:
             path: Path to audit (default: docs/)
             fail_on_error: If True, result.should_fail will be True on errors
+            workers: Worker processes for large trees (default: CPU count)
+            session: ScanSession shared with other audits of the same run
+                (default: a new session over self.fs)
 
         Returns:
             MetadataAuditResult with detailed audit information
@@ -207,8 +216,11 @@ class AuditOrchestrator:
         md_files = self.collect_markdown_files(path)
 
         # Instantiate and run MetadataAuditor
-        auditor = MetadataAuditor(workspace_root=self.workspace_root)
-        report = auditor.audit(md_files)
+        auditor = MetadataAuditor(
+            workspace_root=self.workspace_root,
+            fs=session or ScanSession(self.fs),
+        )
+        report = auditor.audit(md_files, workers=workers)
 
         # Determine if audit should trigger failure
         should_fail = fail_on_error and report.total_errors > 0
@@ -235,6 +247,7 @@ class AuditOrchestrator:
         *,
         strict: bool = False,
         output_path: Path | None = None,
+        session: ScanSession | None = None,
     ) -> KnowledgeAuditResult:
         """Run Knowledge Graph audit and generate health report.
 
@@ -245,6 +258,8 @@ class AuditOrchestrator:
             strict: If True, broken links trigger failure
             output_path: Path for health report
                 (default: docs/reports/KNOWLEDGE_HEALTH.md)
+            session: ScanSession shared with the metadata audit of the same
+                run (default: self.fs)
 
         Returns:
             KnowledgeAuditResult with validation report and metrics
@@ -265,6 +280,7 @@ class AuditOrchestrator:
         auditor = KnowledgeAuditor(
             workspace_root=self.workspace_root,
             knowledge_dir=self.knowledge_dir,
+            fs=session or self.fs,
         )
         validation_report, resolved_entries = auditor.validate()
 
@@ -316,11 +332,13 @@ class AuditOrchestrator:
         fail_on_error: bool = False,
         strict: bool = False,
         output_path: Path | None = None,
+        workers: int | None = None,
     ) -> FullAuditResult:
         """Run combined metadata and Knowledge Graph audit.
 
         Performs both metadata validation and Knowledge Graph validation
-        in a single operation.
+        in a single operation, over one ScanSession so that files in both
+        scopes are read and parsed once.
 
         Args:
             path: Path to audit for metadata (default: docs/)
@@ -328,6 +346,7 @@ class AuditOrchestrator:
             fail_on_error: If True, metadata errors trigger failure
             strict: If True, broken links trigger failure
             output_path: Path for Knowledge Graph health report
+            workers: Worker processes for the metadata audit
 
         Returns:
             FullAuditResult combining both audit results
@@ -342,6 +361,7 @@ class AuditOrchestrator:
         """
         metadata_result: MetadataAuditResult | None = None
         knowledge_result: KnowledgeAuditResult | None = None
+        session = ScanSession(self.fs)
 
         # Run metadata audit unless ONLY check_links is requested with no path
         # If path is provided, always run metadata audit
@@ -350,6 +370,8 @@ class AuditOrchestrator:
             metadata_result = self.run_metadata_audit(
                 path=path,
                 fail_on_error=fail_on_error,
+                workers=workers,
+                session=session,
             )
 
         # Run Knowledge Graph audit if requested
@@ -357,6 +379,7 @@ class AuditOrchestrator:
             knowledge_result = self.run_knowledge_audit(
                 strict=strict,
                 output_path=output_path,
+                session=session,
             )
 
         # Aggregate failure status
@@ -18,6 +18,12 @@ Responsibilities:
     - Manage dry-run mode behavior
     - Return structured results for UI presentation
 
+Performance:
+    Batch operations collect the template data once for all documents.
+    With a fingerprint file, drift checks skip rendering a document whose
+    template, template data and file content are unchanged since it was
+    last found in sync (or written).
+
 Author: Engineering Team
 License: MIT
 """
@@ -25,9 +31,11 @@ License: MIT
 from __future__ import annotations
 
 import difflib
+import hashlib
+import json
 from enum import Enum
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from scripts.core.cortex.models import (
@@ -35,17 +43,25 @@ if TYPE_CHECKING:
         DriftCheckResult,
         SingleGenerationResult,
     )
+    from scripts.core.cortex.readme_generator import ReadmeData
 
 from scripts.core.cortex.models import (
     BatchGenerationResult,
     DriftCheckResult,
     SingleGenerationResult,
 )
-from scripts.core.cortex.readme_generator import DocumentGenerator
+from scripts.core.cortex.readme_generator import (
+    DocumentGenerator,
+    normalize_timestamps,
+)
+from scripts.utils.atomic import atomic_write_json
 from scripts.utils.logger import setup_logging
 
 logger = setup_logging(__name__)
 
+#: Default fingerprint file, relative to the project root
+FINGERPRINT_PATH = Path(".cache") / "cortex-generate" / "fingerprints.json"
+
 
 class GenerationTarget(Enum):
     """Supported document generation targets.
@@ -61,6 +77,65 @@ class GenerationTarget(Enum):
     ALL = "all"
 
 
+class DriftFingerprints:
+    """Documents last known to be in sync with their template.
+
+    Maps each output path to the template fingerprint it was generated
+    from (see ``DocumentGenerator.template_fingerprint``) and the SHA-256 of
+    its content at that time. A document whose fingerprint and content
+    both still match cannot have drifted.
+
+    Attributes:
+        path: JSON file holding the fingerprints
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize (loaded on first use).
+
+        Args:
+            path: JSON file holding the fingerprints
+        """
+        self.path = path
+        self._entries: dict[str, dict[str, str]] | None = None
+
+    def _load(self) -> dict[str, dict[str, str]]:
+        """Read the fingerprints once; a missing or corrupt file starts empty."""
+        if self._entries is None:
+            try:
+                data: Any = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                data = {}
+            self._entries = data if isinstance(data, dict) else {}
+        return self._entries
+
+    @staticmethod
+    def _digest(content: str) -> str:
+        """SHA-256 of a rendered output, to detect edits made after rendering."""
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def in_sync(self, output_path: Path, fingerprint: str, content: str) -> bool:
+        """Check whether ``content`` is what ``fingerprint`` last rendered."""
+        entry = self._load().get(str(output_path))
+        return (
+            entry is not None
+            and entry.get("fingerprint") == fingerprint
+            and entry.get("content_sha256") == self._digest(content)
+        )
+
+    def record(self, output_path: Path, fingerprint: str, content: str) -> None:
+        """Remember that ``content`` is the rendering of ``fingerprint``."""
+        entries = self._load()
+        entry = {"fingerprint": fingerprint, "content_sha256": self._digest(content)}
+        if entries.get(str(output_path)) == entry:
+            return
+        entries[str(output_path)] = entry
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_json(self.path, entries, fsync=False)
+        except OSError as e:
+            logger.warning(f"Could not save drift fingerprints: {e}")
+
+
 class GenerationOrchestrator:
     """Orchestrates document generation with business logic separation.
 
@@ -86,15 +161,21 @@ class GenerationOrchestrator:
         self,
         project_root: Path | None = None,
         generator: DocumentGenerator | None = None,
+        fingerprint_path: Path | None = None,
     ) -> None:
         """Initialize the Generation Orchestrator.
 
         Args:
             project_root: Root directory of the project (default: cwd)
             generator: DocumentGenerator instance (injected for testing)
+            fingerprint_path: File for drift fingerprints (None: always render;
+                the CLI uses ``project_root / FINGERPRINT_PATH``)
         """
         self.project_root = project_root or Path.cwd()
         self.generator = generator or DocumentGenerator(project_root=self.project_root)
+        self.fingerprints = (
+            DriftFingerprints(fingerprint_path) if fingerprint_path else None
+        )
 
     # =========================================================================
     # PUBLIC API - Thin CLI Pattern
@@ -105,6 +186,7 @@ class GenerationOrchestrator:
         target: GenerationTarget,
         output_path: Path | None = None,
         dry_run: bool = False,
+        data: ReadmeData | None = None,
     ) -> SingleGenerationResult:
         """Generate a single document (README or CONTRIBUTING).
 
@@ -120,6 +202,7 @@ class GenerationOrchestrator:
             target: Document to generate (README or CONTRIBUTING)
             output_path: Custom output path (None = use default)
             dry_run: If True, generate content without writing to disk
+            data: Template data shared by a batch (None = collect it)
 
         Returns:
             SingleGenerationResult with status, content, and metadata
@@ -150,10 +233,14 @@ class GenerationOrchestrator:
                 f"dry_run={dry_run}",
             )
 
+            if self.fingerprints is not None and data is None:
+                data = self.generator.collect_all_data()
+
             # Generate content using DocumentGenerator
             content = self.generator.generate_document(
                 template_name=template_name,
                 output_path=None,  # Always generate in-memory first
+                data=data,
             )
 
             # Write to disk if not dry-run
@@ -163,6 +250,12 @@ class GenerationOrchestrator:
                 final_output_path.write_text(content, encoding="utf-8")
                 was_written = True
                 logger.info(f"Wrote {len(content)} bytes to {final_output_path}")
+                if self.fingerprints is not None and data is not None:
+                    self.fingerprints.record(
+                        final_output_path,
+                        self.generator.template_fingerprint(template_name, data),
+                        content,
+                    )
 
             return SingleGenerationResult(
                 success=True,
@@ -215,7 +308,8 @@ class GenerationOrchestrator:
         """Generate all supported documents in batch mode.
 
         Equivalent to calling generate_single for each supported document
-        type (README, CONTRIBUTING). Results are aggregated for reporting.
+        type (README, CONTRIBUTING), with the template data collected once
+        for all of them. Results are aggregated for reporting.
 
         This method is idempotent and safe to run multiple times.
 
@@ -236,9 +330,10 @@ class GenerationOrchestrator:
         # Generate all documents (README and CONTRIBUTING)
         targets = [GenerationTarget.README, GenerationTarget.CONTRIBUTING]
         results: list[SingleGenerationResult] = []
+        data = self.collect_data()
 
         for target in targets:
-            result = self.generate_single(target=target, dry_run=dry_run)
+            result = self.generate_single(target=target, dry_run=dry_run, data=data)
             results.append(result)
 
         # Aggregate statistics
@@ -267,15 +362,22 @@ class GenerationOrchestrator:
     def check_drift(
         self,
         target: GenerationTarget,
+        data: ReadmeData | None = None,
     ) -> DriftCheckResult:
         """Check if a document is in sync with its template (drift detection).
 
         Compares the current file content with what would be generated
-        from the template and live data. Used for CI/CD governance to
+        from the template and live data, ignoring generation timestamps
+        (see normalize_timestamps). Used for CI/CD governance to
         detect manual edits or outdated generated files.
 
+        With fingerprints enabled, a file whose template, template data and
+        content are unchanged since it was last in sync is reported as such
+        without rendering the template.
+
         Args:
             target: Document to check (README or CONTRIBUTING)
+            data: Template data shared by a batch (None = collect it)
 
         Returns:
             DriftCheckResult with drift status, diff, and metadata
@@ -300,12 +402,6 @@ class GenerationOrchestrator:
 
             logger.info(f"Checking drift for {target.value}: {output_path}")
 
-            # Generate expected content (what SHOULD be in the file)
-            expected_content = self.generator.generate_document(
-                template_name=template_name,
-                output_path=None,  # Generate in-memory
-            )
-
             # Read current content (what IS in the file)
             current_content = ""
             if output_path.exists():
@@ -313,40 +409,47 @@ class GenerationOrchestrator:
             else:
                 logger.warning(f"File does not exist: {output_path}")
 
-            # Compare contents
-            has_drift = current_content != expected_content
+            fingerprint = None
+            if self.fingerprints is not None:
+                if data is None:
+                    data = self.generator.collect_all_data()
+                fingerprint = self.generator.template_fingerprint(template_name, data)
+                if self.fingerprints.in_sync(output_path, fingerprint, current_content):
+                    logger.info(f"No drift detected in {target.value} (fingerprint)")
+                    return DriftCheckResult(
+                        has_drift=False,
+                        target=target.value,
+                        output_path=output_path,
+                        current_content=current_content,
+                        expected_content=current_content,
+                    )
+
+            # Generate expected content (what SHOULD be in the file)
+            expected_content = self.generator.generate_document(
+                template_name=template_name,
+                output_path=None,  # Generate in-memory
+                data=data,
+            )
+
+            # Compare contents (the generation timestamp is not drift)
+            expected = normalize_timestamps(expected_content)
+            has_drift = normalize_timestamps(current_content) != expected
 
             # Generate unified diff if there's drift
-            diff = ""
-            line_changes = 0
+            diff, line_changes = "", 0
             if has_drift:
-                current_lines = current_content.splitlines(keepends=True)
-                expected_lines = expected_content.splitlines(keepends=True)
-
-                diff_lines = list(
-                    difflib.unified_diff(
-                        current_lines,
-                        expected_lines,
-                        fromfile=f"current/{output_path.name}",
-                        tofile=f"expected/{output_path.name}",
-                        lineterm="",
-                    ),
-                )
-                diff = "".join(diff_lines)
-
-                # Count line changes (lines starting with + or -, excluding headers)
-                line_changes = sum(
-                    1
-                    for line in diff_lines
-                    if line.startswith(("+", "-"))
-                    and not line.startswith(("+++", "---"))
+                diff, line_changes = self._unified_diff(
+                    current_content,
+                    expected_content,
+                    output_path.name,
                 )
-
                 logger.info(
                     f"Drift detected in {target.value}: {line_changes} line changes",
                 )
             else:
                 logger.info(f"No drift detected in {target.value}")
+                if self.fingerprints is not None and fingerprint is not None:
+                    self.fingerprints.record(output_path, fingerprint, current_content)
 
             return DriftCheckResult(
                 has_drift=has_drift,
@@ -378,8 +481,8 @@ class GenerationOrchestrator:
     def check_batch_drift(self) -> list[DriftCheckResult]:
         """Check drift for all supported documents.
 
-        Convenience method that calls check_drift for each document type
-        and returns aggregated results.
+        Convenience method that calls check_drift for each document type,
+        with the template data collected once, and returns aggregated results.
 
         Returns:
             List of DriftCheckResult, one per document type
@@ -394,9 +497,10 @@ class GenerationOrchestrator:
 
         targets = [GenerationTarget.README, GenerationTarget.CONTRIBUTING]
         results = []
+        data = self.collect_data()
 
         for target in targets:
-            result = self.check_drift(target)
+            result = self.check_drift(target, data=data)
             results.append(result)
 
         drifted_count = sum(1 for r in results if r.has_drift)
@@ -404,10 +508,48 @@ class GenerationOrchestrator:
 
         return results
 
+    def collect_data(self) -> ReadmeData | None:
+        """Collect the template data once for several documents.
+
+        Returns:
+            ReadmeData, or None if collection failed (each document then
+            collects on its own and reports the error in its result)
+        """
+        try:
+            return self.generator.collect_all_data()
+        except Exception as e:
+            logger.warning(f"Could not collect template data for the batch: {e}")
+            return None
+
     # =========================================================================
     # PRIVATE HELPERS - Internal Logic
     # =========================================================================
 
+    @staticmethod
+    def _unified_diff(current: str, expected: str, name: str) -> tuple[str, int]:
+        """Diff current vs expected content.
+
+        Returns:
+            Tuple of (unified diff, number of added + removed lines)
+        """
+        diff_lines = list(
+            difflib.unified_diff(
+                current.splitlines(keepends=True),
+                expected.splitlines(keepends=True),
+                fromfile=f"current/{name}",
+                tofile=f"expected/{name}",
+                lineterm="",
+            ),
+        )
+
+        # Count line changes (lines starting with + or -, excluding headers)
+        line_changes = sum(
+            1
+            for line in diff_lines
+            if line.startswith(("+", "-")) and not line.startswith(("+++", "---"))
+        )
+        return "".join(diff_lines), line_changes
+
     def _resolve_template_name(self, target: GenerationTarget) -> str:
         """Resolve template filename from target enum.
 
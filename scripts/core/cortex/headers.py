@@ -0,0 +1,127 @@
+"""Header Readers - Bounded prefix reads for titles and docstrings.
+
+``ProjectMapper`` needs only the first Markdown heading of each document and
+the module docstring of each CLI script, and ``DocumentMigrator`` only the
+leading frontmatter to decide whether a file is skipped. Reading whole files
+for that adds up on large repositories. :func:`read_header` reads the first
+``max_bytes`` of a file (``FileSystemAdapter.read_prefix``), runs a finder on
+the complete lines and falls back to a full read only when the answer is not
+in the prefix.
+
+A finder receives ``(text, complete)`` and returns ``None`` when the text
+does not determine the answer and more of the file is needed.
+
+Usage:
+    title = read_header(fs, path, markdown_title) or path.stem
+
+Author: Engineering Team
+License: MIT
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable
+from pathlib import Path
+from typing import TypeVar
+
+from scripts.utils.filesystem import FileSystemAdapter
+
+T = TypeVar("T")
+
+DEFAULT_HEADER_BYTES = 8 * 1024
+"""Default prefix size: covers the frontmatter and first heading of typical docs."""
+
+DOCSTRING_SCAN_LINES = 20
+"""Module docstrings are only searched in the first lines of a script."""
+
+_HEADING = re.compile(r"#\s+(\S.*)")
+_FRONTMATTER_DELIMITER = "---"
+
+
+def read_header(
+    fs: FileSystemAdapter,
+    path: Path,
+    find: Callable[[str, bool], T | None],
+    max_bytes: int | None = DEFAULT_HEADER_BYTES,
+) -> T | None:
+    """Run ``find`` on the start of a file, reading more only if needed.
+
+    Args:
+        fs: Filesystem adapter
+        path: File to read
+        find: Finder called with (text, complete)
+        max_bytes: Prefix size (None reads the whole file)
+
+    Returns:
+        The finder result on the prefix, or on the full file as fallback
+    """
+    if max_bytes is not None:
+        text, complete = fs.read_prefix(path, max_bytes)
+        if complete:
+            return find(text, True)
+        # The last line may be cut at the limit: keep complete lines only
+        found = find(text[: text.rfind("\n") + 1], False)
+        if found is not None:
+            return found
+    return find(fs.read_text(path), True)
+
+
+def _skip_frontmatter(lines: list[str], complete: bool) -> list[str] | None:
+    """Drop a leading ``---`` block (None if it is not closed in ``lines``)."""
+    if not lines or lines[0].strip() != _FRONTMATTER_DELIMITER:
+        return lines
+    for index, line in enumerate(lines[1:], start=1):
+        if line.strip() == _FRONTMATTER_DELIMITER:
+            return lines[index + 1 :]
+    # Unclosed block: the full file has no frontmatter, only a rule
+    return lines if complete else None
+
+
+def markdown_title(text: str, complete: bool = True) -> str | None:
+    """Return the first level-1 heading outside the leading frontmatter.
+
+    Args:
+        text: Markdown content (or a prefix made of complete lines)
+        complete: Whether ``text`` is the whole file
+
+    Returns:
+        Heading text, or None if not found
+    """
+    lines = _skip_frontmatter(text.splitlines(), complete)
+    if lines is None:
+        return None
+    for line in lines:
+        match = _HEADING.match(line.strip())
+        if match:
+            return match.group(1).strip()
+    return None
+
+
+def module_docstring(text: str, complete: bool = True) -> str | None:
+    """Return the first line of the module docstring of a Python file.
+
+    Only the first ``DOCSTRING_SCAN_LINES`` lines are searched.
+
+    Args:
+        text: Python source (or a prefix made of complete lines)
+        complete: Whether ``text`` is the whole file
+
+    Returns:
+        Docstring summary, "" if there is none, None if more text is needed
+    """
+    lines = text.splitlines()[:DOCSTRING_SCAN_LINES]
+    in_docstring = False
+    for line in lines:
+        if '"""' not in line and "'''" not in line:
+            continue
+        # Closing line of a multi-line docstring, or a single-line docstring
+        if in_docstring or line.count('"""') == 2 or line.count("'''") == 2:
+            cleaned = line.strip()
+            for delim in ['"""', "'''"]:
+                cleaned = cleaned.replace(delim, "")
+            return cleaned.strip()
+        in_docstring = True
+    if complete or len(lines) == DOCSTRING_SCAN_LINES:
+        return ""
+    return None
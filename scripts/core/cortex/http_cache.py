@@ -0,0 +1,214 @@
+"""Local HTTP response cache for knowledge source synchronization.
+
+This module provides the HttpResponseCache class, which stores the validators
+(ETag, Last-Modified) and body of every successfully fetched knowledge source
+under ``.cortex/http_cache/``. KnowledgeSyncer uses it to:
+
+- Skip the request entirely while a response is younger than ``max_age``
+- Send conditional requests (If-None-Match / If-Modified-Since) even when the
+  entry frontmatter has no ETag, so unchanged sources cost a cheap 304
+- Recover the body on 304 when the local file is behind the cache
+
+Each URL is stored in its own JSON file (named by the SHA-256 of the URL), so
+concurrent fetch workers never contend for a shared index file.
+
+Author: Engineering Team
+License: MIT
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+
+from scripts.utils.filesystem import FileSystemAdapter, RealFileSystem
+from scripts.utils.logger import setup_logging
+
+logger = setup_logging(__name__)
+
+# Default cache location, relative to the workspace root
+DEFAULT_HTTP_CACHE_DIR = Path(".cortex") / "http_cache"
+
+# Seconds a cached response is served without contacting the server
+DEFAULT_MAX_AGE = 300
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A cached 200 response for one URL.
+
+    Attributes:
+        url: Source URL
+        body: Response body
+        etag: ETag header of the response, if any
+        last_modified: Last-Modified header of the response, if any
+        fetched_at: Unix timestamp of the last successful (re)validation
+    """
+
+    url: str
+    body: str
+    etag: str | None
+    last_modified: str | None
+    fetched_at: float
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Build the revalidation headers for this response.
+
+        Returns:
+            Dictionary with If-None-Match and/or If-Modified-Since
+        """
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HttpResponseCache:
+    """On-disk cache of HTTP responses keyed by URL.
+
+    Attributes:
+        cache_dir: Directory holding one JSON file per cached URL
+        max_age: Freshness window in seconds (0 = always revalidate)
+        fs: Filesystem adapter for I/O operations
+
+    Example:
+        >>> cache = HttpResponseCache(Path("/project/.cortex/http_cache"))
+        >>> cached = cache.get("https://example.com/doc.md")
+        >>> if cached and cache.is_fresh(cached):
+        ...     print("served from cache")
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_age: float = DEFAULT_MAX_AGE,
+        fs: FileSystemAdapter | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize the response cache.
+
+        Args:
+            cache_dir: Directory holding the cached responses
+            max_age: Freshness window in seconds (0 = always revalidate)
+            fs: Filesystem adapter (defaults to RealFileSystem)
+            clock: Time source returning Unix timestamps (injectable for tests)
+
+        Raises:
+            ValueError: If max_age is negative
+        """
+        if max_age < 0:
+            raise ValueError("max_age must be >= 0")
+
+        self.cache_dir = cache_dir
+        self.max_age = max_age
+        self.fs = fs or RealFileSystem()
+        self._clock = clock
+        self._write_lock = threading.Lock()
+
+    def _path_for(self, url: str) -> Path:
+        """Return the cache file path for ``url``."""
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+
+    def get(self, url: str) -> CachedResponse | None:
+        """Load the cached response for ``url``.
+
+        Corrupt or unreadable cache files are treated as a miss.
+
+        Args:
+            url: Source URL
+
+        Returns:
+            Cached response, or None if not cached
+        """
+        path = self._path_for(url)
+        if not self.fs.exists(path):
+            return None
+
+        try:
+            data = json.loads(self.fs.read_text(path))
+            cached = CachedResponse(
+                url=data["url"],
+                body=data["body"],
+                etag=data.get("etag"),
+                last_modified=data.get("last_modified"),
+                fetched_at=float(data["fetched_at"]),
+            )
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Ignoring corrupt HTTP cache file %s: %s", path, e)
+            return None
+
+        # Guard against (astronomically unlikely) digest collisions
+        return cached if cached.url == url else None
+
+    def is_fresh(self, cached: CachedResponse) -> bool:
+        """Check whether a cached response is inside the freshness window.
+
+        Args:
+            cached: Cached response
+
+        Returns:
+            True if the response can be used without contacting the server
+        """
+        return self._clock() - cached.fetched_at < self.max_age
+
+    def store(
+        self,
+        url: str,
+        body: str,
+        etag: str | None,
+        last_modified: str | None,
+    ) -> CachedResponse:
+        """Store a 200 response for ``url``.
+
+        Args:
+            url: Source URL
+            body: Response body
+            etag: ETag header, if any
+            last_modified: Last-Modified header, if any
+
+        Returns:
+            The stored cache entry
+        """
+        cached = CachedResponse(
+            url=url,
+            body=body,
+            etag=etag,
+            last_modified=last_modified,
+            fetched_at=self._clock(),
+        )
+        self._write(cached)
+        return cached
+
+    def touch(self, cached: CachedResponse) -> CachedResponse:
+        """Mark a cached response as revalidated (after a 304).
+
+        Args:
+            cached: Cached response confirmed by the server
+
+        Returns:
+            The refreshed cache entry
+        """
+        refreshed = replace(cached, fetched_at=self._clock())
+        self._write(refreshed)
+        return refreshed
+
+    def _write(self, cached: CachedResponse) -> None:
+        """Persist a cache entry; failures are logged, never raised."""
+        path = self._path_for(cached.url)
+        try:
+            with self._write_lock:
+                self.fs.mkdir(self.cache_dir, parents=True, exist_ok=True)
+                self.fs.write_text(
+                    path,
+                    json.dumps(asdict(cached), ensure_ascii=False),
+                )
+        except OSError as e:
+            logger.warning("Could not write HTTP cache file %s: %s", path, e)
@@ -0,0 +1,130 @@
+"""JSON Export - Streaming writers for CORTEX JSON artifacts.
+
+``.cortex/knowledge.json`` and ``context.json`` used to be produced by
+dumping every model into one list and building the whole indented string
+before writing it. The writers here serialize one entry at a time into
+``FileSystemAdapter.open_atomic`` (temporary file + atomic rename on the
+real filesystem), so peak memory is bounded by the largest entry.
+
+Layouts:
+- ``indent``: indented JSON, byte-identical to the previous
+  ``json.dumps(..., indent=2, ensure_ascii=False)`` output (default)
+- ``compact``: the same document without whitespace
+- ``jsonl``: JSON Lines, one entry per line (no envelope)
+
+Author: Engineering Team
+License: MIT
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, Literal
+
+from pydantic import BaseModel
+
+from scripts.utils.filesystem import FileSystemAdapter
+
+ExportLayout = Literal["indent", "compact", "jsonl"]
+
+EXPORT_LAYOUTS: tuple[ExportLayout, ...] = ("indent", "compact", "jsonl")
+
+_INDENT = 2
+
+
+def layout_path(path: Path, layout: ExportLayout) -> Path:
+    """Return the file name used for ``layout`` (``.jsonl`` for JSON Lines).
+
+    Args:
+        path: Path of the ``.json`` artifact
+        layout: Export layout
+
+    Returns:
+        Path with the suffix matching the layout
+    """
+    return path.with_suffix(".jsonl") if layout == "jsonl" else path
+
+
+def _encode(data: Any, layout: ExportLayout) -> str:
+    """Encode one value for ``layout`` (indent=2 or compact separators)."""
+    if layout == "indent":
+        return json.dumps(data, indent=_INDENT, ensure_ascii=False)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+def write_json_entries(
+    fs: FileSystemAdapter,
+    path: Path,
+    entries: Iterable[BaseModel],
+    layout: ExportLayout = "indent",
+) -> int:
+    """Stream models into ``{"entries": [...], "count": N}`` (or JSON Lines).
+
+    Each entry is dumped with ``model_dump(mode="json")`` and written before
+    the next one is converted. ``count`` is written last, so ``entries`` may
+    be any iterable.
+
+    Args:
+        fs: Filesystem adapter
+        path: Output file
+        entries: Models to export
+        layout: Export layout
+
+    Returns:
+        Number of entries written
+    """
+    count = 0
+    with fs.open_atomic(path) as stream:
+        if layout == "jsonl":
+            for entry in entries:
+                stream.write(_encode(entry.model_dump(mode="json"), layout))
+                stream.write("\n")
+                count += 1
+            return count
+
+        if layout == "indent":
+            # Entries sit two levels deep: re-indent their lines by 4 spaces
+            # (JSON strings never contain raw newlines)
+            item_sep, open_list, close_list = ",\n    ", '{\n  "entries": [', "\n  ]"
+            count_field = ',\n  "count": {count}\n}}'
+        else:
+            item_sep, open_list, close_list = ",", '{"entries":[', "]"
+            count_field = ',"count":{count}}}'
+
+        stream.write(open_list)
+        for entry in entries:
+            encoded = _encode(entry.model_dump(mode="json"), layout)
+            if layout == "indent":
+                encoded = encoded.replace("\n", "\n    ")
+            stream.write(item_sep if count else item_sep.lstrip(","))
+            stream.write(encoded)
+            count += 1
+        stream.write(close_list if count else "]")
+        stream.write(count_field.format(count=count))
+    return count
+
+
+def write_json_document(
+    fs: FileSystemAdapter,
+    path: Path,
+    document: BaseModel,
+    layout: ExportLayout = "indent",
+) -> None:
+    """Write a single model as JSON (``jsonl``: one compact line).
+
+    Args:
+        fs: Filesystem adapter
+        path: Output file
+        document: Model to export
+        layout: Export layout
+    """
+    data = document.model_dump(mode="json")
+    with fs.open_atomic(path) as stream:
+        if layout == "indent":
+            json.dump(data, stream, indent=_INDENT, ensure_ascii=False, default=str)
+            return
+        json.dump(data, stream, separators=(",", ":"), ensure_ascii=False, default=str)
+        if layout == "jsonl":
+            stream.write("\n")
@@ -24,7 +24,13 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from scripts.core.cortex.models import KnowledgeEntry
+    from scripts.utils.filesystem import FileSystemAdapter
 
+from scripts.core.cortex.http_cache import (
+    DEFAULT_HTTP_CACHE_DIR,
+    DEFAULT_MAX_AGE,
+    HttpResponseCache,
+)
 from scripts.core.cortex.knowledge_scanner import KnowledgeScanner
 from scripts.core.cortex.knowledge_sync import KnowledgeSyncer, SyncResult
 from scripts.core.cortex.sync_aggregator import SyncAggregator
@@ -102,19 +108,34 @@ class KnowledgeOrchestrator:
         >>> summary = orchestrator.sync_multiple(entry_id="kno-001")
     """
 
-    def __init__(self, workspace_root: Path, force_parallel: bool = False) -> None:
+    def __init__(
+        self,
+        workspace_root: Path,
+        force_parallel: bool = False,
+        http_cache_max_age: float = DEFAULT_MAX_AGE,
+        fs: FileSystemAdapter | None = None,
+    ) -> None:
         """Initialize the Knowledge Orchestrator.
 
         Args:
             workspace_root: Root directory of the workspace
             force_parallel: Force parallel processing in scanner (experimental)
+            http_cache_max_age: Seconds a cached source response is reused
+                without contacting the server (0 = always revalidate)
+            fs: FileSystemAdapter for the scanner (default: RealFileSystem)
         """
         self.workspace_root = workspace_root
         self.scanner = KnowledgeScanner(
             workspace_root=workspace_root,
+            fs=fs,
             force_parallel=force_parallel,
         )
-        self.syncer = KnowledgeSyncer()
+        self.syncer = KnowledgeSyncer(
+            response_cache=HttpResponseCache(
+                workspace_root / DEFAULT_HTTP_CACHE_DIR,
+                max_age=http_cache_max_age,
+            ),
+        )
 
         logger.debug(
             "KnowledgeOrchestrator initialized for workspace: %s",
@@ -170,6 +191,7 @@ class KnowledgeOrchestrator:
         self,
         entry_id: str | None = None,
         dry_run: bool = False,
+        max_workers: int = 1,
     ) -> SyncSummary:
         """Synchronize multiple knowledge entries with their external sources.
 
@@ -186,6 +208,8 @@ class KnowledgeOrchestrator:
         Args:
             entry_id: Optional specific entry ID to sync. If None, syncs all entries.
             dry_run: If True, simulates sync without writing to disk
+            max_workers: Concurrent source fetches (1 = sequential). Merges
+                are always applied serially, in entry order.
 
         Returns:
             SyncSummary with aggregated results and statistics
@@ -259,7 +283,11 @@ class KnowledgeOrchestrator:
         # Step 4: Execute sync for each entry
         logger.info("Processing %d entries with sources", len(entries_with_sources))
 
-        executor = SyncExecutor(self.syncer, dry_run=dry_run)
+        executor = SyncExecutor(
+            self.syncer,
+            dry_run=dry_run,
+            max_workers=max_workers,
+        )
         results = executor.execute_batch(entries_with_sources)
 
         # Step 5: Aggregate results into summary
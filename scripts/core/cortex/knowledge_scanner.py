@@ -25,7 +25,7 @@ from typing import Any
 from pydantic import ValidationError
 
 from scripts.core.cortex.link_analyzer import LinkAnalyzer
-from scripts.core.cortex.metadata import FrontmatterParser
+from scripts.core.cortex.metadata import FrontmatterParser, load_frontmatter
 from scripts.core.cortex.models import DocStatus, KnowledgeEntry, KnowledgeSource
 from scripts.utils.filesystem import FileSystemAdapter, RealFileSystem
 
@@ -260,11 +260,8 @@ class KnowledgeScanner:
             ValidationError: If frontmatter data doesn't match KnowledgeEntry schema
             ValueError: If frontmatter parsing fails
         """
-        # Read file content for cached_content extraction
-        import frontmatter
-
-        content = self.fs.read_text(file_path)
-        post = frontmatter.loads(content)
+        # Read file content for cached_content extraction (shared per session)
+        post = load_frontmatter(self.fs, file_path)
         metadata: dict[str, Any] = post.metadata
 
         # Extract required fields
@@ -6,9 +6,13 @@ knowledge content from external sources while preserving local customizations
 
 Key Features:
 - HTTP ETag-based caching to avoid unnecessary downloads
+- Optional on-disk response cache (ETag, Last-Modified, body) with a
+  freshness window, so unchanged sources cost a 304 or no request at all
 - Temporal caching via last_synced timestamps
 - Golden Path preservation during merge
 - Timeout protection for HTTP requests
+- Fetch/apply split so network I/O can run concurrently while merges stay
+  serial (see SyncExecutor)
 
 Author: Engineering Team
 License: MIT
@@ -17,17 +21,20 @@ License: MIT
 from __future__ import annotations
 
 import re
+import threading
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
 from typing import TYPE_CHECKING, Protocol
 
 import requests
+import requests.adapters
 import requests.exceptions
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from scripts.core.cortex.http_cache import CachedResponse, HttpResponseCache
     from scripts.core.cortex.models import KnowledgeEntry, KnowledgeSource
 
 from scripts.utils.filesystem import FileSystemAdapter, RealFileSystem
@@ -40,6 +47,9 @@ logger = setup_logging(__name__)
 HTTP_OK = 200
 HTTP_NOT_MODIFIED = 304
 
+# Connections kept alive per host by the shared session (urllib3 default: 10)
+DEFAULT_POOL_MAXSIZE = 10
+
 
 class SyncStatus(Enum):
     """Status of knowledge entry synchronization operation.
@@ -80,6 +90,21 @@ class SyncResult:
     error_message: str | None = None
 
 
+@dataclass(frozen=True)
+class FetchedSource:
+    """Outcome of fetching one knowledge source (network phase only).
+
+    Attributes:
+        source: The source that was fetched
+        content: New remote content, or None if not modified / fetch failed
+        etag: ETag returned with the new content, if any
+    """
+
+    source: KnowledgeSource
+    content: str | None
+    etag: str | None
+
+
 class HttpClient(Protocol):
     """Protocol for HTTP client abstraction (enables testing with mocks)."""
 
@@ -103,7 +128,50 @@ class HttpClient(Protocol):
 
 
 class RealHttpClient:
-    """Production HTTP client using requests library."""
+    """Production HTTP client using a shared, pooled ``requests.Session``.
+
+    The session keeps connections alive between requests, so consecutive
+    sources on the same host reuse the TCP/TLS connection. It is created
+    lazily and is safe to share between the worker threads of SyncExecutor
+    (urllib3 connection pools are thread-safe).
+    """
+
+    def __init__(
+        self,
+        session: requests.Session | None = None,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    ) -> None:
+        """Initialize the client.
+
+        Args:
+            session: Pre-configured session (defaults to a new pooled session)
+            pool_maxsize: Connections kept alive per host
+        """
+        self._session = session
+        self._pool_maxsize = pool_maxsize
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """Shared session, created on first use."""
+        with self._lock:
+            if self._session is None:
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(
+                    pool_connections=self._pool_maxsize,
+                    pool_maxsize=self._pool_maxsize,
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._session = session
+            return self._session
+
+    def close(self) -> None:
+        """Close pooled connections (the session is recreated on next use)."""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
 
     def get(
         self,
@@ -124,7 +192,7 @@ class RealHttpClient:
         Raises:
             requests.RequestException: On network or HTTP errors
         """
-        return requests.get(url, headers=headers or {}, timeout=timeout)
+        return self.session.get(url, headers=headers or {}, timeout=timeout)
 
 
 class KnowledgeSyncer:
@@ -185,6 +253,7 @@ class KnowledgeSyncer:
     Attributes:
         fs: Filesystem adapter for I/O operations
         http_client: HTTP client for fetching remote content
+        response_cache: Optional local HTTP response cache (None = disabled)
 
     Example:
         >>> from pathlib import Path
@@ -213,15 +282,18 @@ class KnowledgeSyncer:
         self,
         fs: FileSystemAdapter | None = None,
         http_client: HttpClient | None = None,
+        response_cache: HttpResponseCache | None = None,
     ) -> None:
         """Initialize the knowledge syncer.
 
         Args:
             fs: Filesystem adapter (defaults to RealFileSystem)
             http_client: HTTP client (defaults to RealHttpClient)
+            response_cache: Local HTTP response cache (defaults to no cache)
         """
         self.fs = fs or RealFileSystem()
         self.http_client = http_client or RealHttpClient()
+        self.response_cache = response_cache
 
     def sync_entry(
         self,
@@ -257,6 +329,53 @@ class KnowledgeSyncer:
                 error_message=None,
             )
 
+        return self.apply_fetched(entry, file_path, self.fetch_entry(entry))
+
+    def fetch_entry(
+        self,
+        entry: KnowledgeEntry,
+        http_client: HttpClient | None = None,
+    ) -> list[FetchedSource]:
+        """Fetch all sources of an entry without touching the filesystem.
+
+        This is the network phase of sync_entry. It is safe to run for many
+        entries concurrently; the results are then applied serially with
+        apply_fetched.
+
+        Args:
+            entry: Knowledge entry whose sources should be fetched
+            http_client: Client override (e.g. a per-host throttled wrapper);
+                defaults to the syncer's own client
+
+        Returns:
+            One FetchedSource per source, in source order
+        """
+        fetched: list[FetchedSource] = []
+        for source in entry.sources:
+            content, etag = self._fetch_source(source, http_client=http_client)
+            fetched.append(FetchedSource(source=source, content=content, etag=etag))
+        return fetched
+
+    def apply_fetched(
+        self,
+        entry: KnowledgeEntry,
+        file_path: Path,
+        fetched: list[FetchedSource],
+    ) -> SyncResult:
+        """Merge fetched content into the local file and update metadata.
+
+        This is the filesystem phase of sync_entry: it reads the local file,
+        merges every modified source (preserving Golden Paths) in source
+        order, and writes the file back only if the content changed.
+
+        Args:
+            entry: Knowledge entry being synchronized
+            file_path: Path to the local knowledge file
+            fetched: Output of fetch_entry for this entry
+
+        Returns:
+            SyncResult containing updated entry, status, and optional error
+        """
         # Read current local content
         local_content = ""
         if self.fs.exists(file_path):
@@ -266,29 +385,26 @@ class KnowledgeSyncer:
         merged_content = local_content
         content_changed = False
 
-        for source in entry.sources:
-            # Fetch remote content with cache validation
-            new_content, new_etag = self._fetch_source(source)
-
-            if new_content is not None:
+        for item in fetched:
+            if item.content is not None:
                 # Content has changed - merge it
                 merged_content = self._merge_content(
                     local_content=merged_content,
-                    remote_content=new_content,
+                    remote_content=item.content,
                 )
 
                 # Update source metadata
-                updated_source = source.model_copy(
+                updated_source = item.source.model_copy(
                     update={
                         "last_synced": datetime.now(timezone.utc),
-                        "etag": new_etag,
+                        "etag": item.etag,
                     },
                 )
                 updated_sources.append(updated_source)
                 content_changed = True
             else:
                 # No changes (304 Not Modified)
-                updated_sources.append(source)
+                updated_sources.append(item.source)
 
         # Write merged content back to disk if changed
         if merged_content != local_content:
@@ -314,15 +430,23 @@ class KnowledgeSyncer:
     def _fetch_source(
         self,
         source: KnowledgeSource,
+        http_client: HttpClient | None = None,
     ) -> tuple[str | None, str | None]:
         """Fetch content from a remote source with ETag caching.
 
+        When a response cache is configured, a cached response younger than
+        its freshness window is used without any request, and stale cached
+        validators (ETag / Last-Modified) are sent so the server can answer
+        with a 304. If the local file is behind the cache (its ETag differs),
+        the cached body is returned as new content.
+
         This method is resilient to network failures and will never crash
         the application. All network errors are caught, logged, and handled
         gracefully by returning (None, None) to preserve local content.
 
         Args:
             source: Knowledge source with URL and cache metadata
+            http_client: Client override (defaults to self.http_client)
 
         Returns:
             Tuple of (content, etag) if modified, or (None, None) if not modified
@@ -338,24 +462,34 @@ class KnowledgeSyncer:
         errors, error for permanent failures) and the method returns (None, None)
         to signal that the local content should be preserved.
         """
+        url = str(source.url)
+        cached = self._cached_response(source)
+        if cached is not None and self._is_fresh(cached):
+            logger.debug("HTTP cache hit (fresh): %s", url)
+            return self._from_cache(source, cached)
+
         try:
             headers = {}
-            if source.etag:
+            if cached is not None:
+                headers = cached.conditional_headers()
+            elif source.etag:
                 headers["If-None-Match"] = source.etag
 
-            response = self.http_client.get(
-                str(source.url),
+            client = http_client or self.http_client
+            response = client.get(
+                url,
                 headers=headers,
                 timeout=10,
             )
 
             # 304 Not Modified - content hasn't changed
             if response.status_code == HTTP_NOT_MODIFIED:
-                return None, None
+                return self._revalidated(source, cached)
 
             # 200 OK - new content available
             if response.status_code == HTTP_OK:
                 new_etag = response.headers.get("ETag")
+                self._store_response(url, response)
                 return response.text, new_etag
 
             # Other status codes - raise error to be caught below
@@ -394,6 +528,78 @@ class KnowledgeSyncer:
             )
             return None, None
 
+    def _cached_response(self, source: KnowledgeSource) -> CachedResponse | None:
+        """Return the cached response usable for ``source``, if any.
+
+        Cached validators are only usable if the local file does not carry a
+        different version (ETag) than the cache.
+
+        Args:
+            source: Knowledge source with the local cache metadata
+
+        Returns:
+            Cached response, or None if there is no cache or no usable entry
+        """
+        if self.response_cache is None:
+            return None
+        cached = self.response_cache.get(str(source.url))
+        if cached is None or source.etag not in (None, cached.etag):
+            return None
+        return cached
+
+    def _is_fresh(self, cached: CachedResponse) -> bool:
+        """Check whether a cached response can be used without a request."""
+        return self.response_cache is not None and self.response_cache.is_fresh(
+            cached,
+        )
+
+    def _store_response(self, url: str, response: requests.Response) -> None:
+        """Save a 200 response in the response cache (if one is configured)."""
+        if self.response_cache is not None:
+            self.response_cache.store(
+                url,
+                response.text,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+
+    def _revalidated(
+        self,
+        source: KnowledgeSource,
+        cached: CachedResponse | None,
+    ) -> tuple[str | None, str | None]:
+        """Handle a 304 response, renewing the cached entry if one was used.
+
+        Args:
+            source: Knowledge source that was requested
+            cached: Cached response whose validators were sent, if any
+
+        Returns:
+            Same contract as _fetch_source
+        """
+        if cached is None or self.response_cache is None:
+            return None, None
+        return self._from_cache(source, self.response_cache.touch(cached))
+
+    @staticmethod
+    def _from_cache(
+        source: KnowledgeSource,
+        cached: CachedResponse,
+    ) -> tuple[str | None, str | None]:
+        """Resolve a valid cached response against the local source metadata.
+
+        Args:
+            source: Knowledge source with the local cache metadata
+            cached: Cached response known to match the remote content
+
+        Returns:
+            (None, None) if the local file already has this version, otherwise
+            (body, etag) from the cache
+        """
+        if source.last_synced is not None and source.etag == cached.etag:
+            return None, None
+        return cached.body, cached.etag
+
     def _merge_content(
         self,
         local_content: str,
@@ -17,7 +17,6 @@ License: MIT
 
 from __future__ import annotations
 
-import json
 import sys
 from pathlib import Path
 from typing import Any
@@ -36,6 +35,19 @@ _project_root = _script_dir.parent.parent  # pragma: no mutate
 if str(_project_root) not in sys.path:  # pragma: no mutate
     sys.path.insert(0, str(_project_root))  # pragma: no mutate
 
+from scripts.core.cortex.headers import (  # noqa: E402
+    DEFAULT_HEADER_BYTES,
+    markdown_title,
+    module_docstring,
+    read_header,
+)
+from scripts.core.cortex.json_export import (  # noqa: E402
+    ExportLayout,
+    layout_path,
+    write_json_document,
+    write_json_entries,
+)
+from scripts.core.cortex.scan_session import ScanSession  # noqa: E402
 from scripts.utils.filesystem import FileSystemAdapter, RealFileSystem  # noqa: E402
 from scripts.utils.logger import setup_logging  # noqa: E402
 
@@ -103,21 +115,33 @@ class ProjectMapper:
         self,
         project_root: Path,
         fs: FileSystemAdapter | None = None,
+        export_layout: ExportLayout = "indent",
+        session: ScanSession | None = None,
+        header_bytes: int | None = DEFAULT_HEADER_BYTES,
     ) -> None:
         """Initialize the mapper.
 
         Args:
             project_root: Root directory of the project
             fs: FileSystemAdapter for I/O operations (default: RealFileSystem)
+            export_layout: Layout of the JSON artifacts: "indent" (default),
+                "compact" or "jsonl" (knowledge export as .jsonl)
+            session: ScanSession shared with other consumers of the same run
+                (default: a fresh session per map_project() call)
+            header_bytes: Prefix read for titles and docstrings before
+                falling back to the whole file (None: always read it all)
         """
         if fs is None:
-            fs = RealFileSystem()
+            fs = session.fs if session is not None else RealFileSystem()
         self.fs = fs
+        self.export_layout: ExportLayout = export_layout
         self.project_root = project_root
         self.pyproject_path = project_root / "pyproject.toml"
         self.docs_path = project_root / "docs"
         self.scripts_cli_path = project_root / "scripts" / "cli"
-        self._knowledge_scanner: KnowledgeScanner | None = None
+        self.header_bytes = header_bytes
+        self._owns_session = session is None
+        self.session = session or ScanSession(fs)
 
     def map_project(self, include_knowledge: bool = True) -> ProjectContext:
         """Generate a complete project context map.
@@ -131,6 +155,10 @@ class ProjectMapper:
         """
         logger.info("Starting project mapping...")
 
+        # Every phase reads through one session: each file is read once
+        if self._owns_session:
+            self.session = ScanSession(self.fs)
+
         # Load pyproject.toml
         config = self._load_pyproject()
 
@@ -173,6 +201,7 @@ class ProjectMapper:
         logger.info(f"Found {len(context.architecture_docs)} architecture documents")
         if include_knowledge:
             logger.info(f"Extracted {len(context.golden_paths)} golden paths")
+        logger.debug(f"Scan session: {self.session.stats}")
 
         return context
 
@@ -182,13 +211,13 @@ class ProjectMapper:
         Returns:
             Parsed TOML configuration
         """
-        if not self.fs.exists(self.pyproject_path):
+        if not self.session.exists(self.pyproject_path):
             logger.warning("pyproject.toml not found")
             return {}
 
         try:
             # tomllib.loads espera string, então read_text é suficiente
-            content = self.fs.read_text(self.pyproject_path)
+            content = self.session.read_text(self.pyproject_path)
             result: dict[str, Any] = tomllib.loads(content)
             return result
         except Exception as e:
@@ -203,11 +232,11 @@ class ProjectMapper:
         """
         commands: list[CLICommand] = []
 
-        if not self.scripts_cli_path.exists():
+        if not self.session.exists(self.scripts_cli_path):
             logger.warning(f"CLI directory not found: {self.scripts_cli_path}")
             return commands
 
-        for script_file in self.scripts_cli_path.glob("*.py"):
+        for script_file in self.session.glob(self.scripts_cli_path, "*.py"):
             if script_file.name.startswith("_"):
                 continue
 
@@ -232,11 +261,11 @@ class ProjectMapper:
         """
         documents: list[Document] = []
 
-        if not self.docs_path.exists():
+        if not self.session.exists(self.docs_path):
             logger.warning(f"Docs directory not found: {self.docs_path}")
             return documents
 
-        for doc_file in self.docs_path.rglob("*.md"):
+        for doc_file in self.session.rglob(self.docs_path, "*.md"):
             # Skip architecture docs (handled separately)
             if "architecture" in doc_file.parts:
                 continue
@@ -266,11 +295,11 @@ class ProjectMapper:
         documents: list[Document] = []
         arch_path = self.docs_path / "architecture"
 
-        if not arch_path.exists():
+        if not self.session.exists(arch_path):
             logger.warning("Architecture directory not found")
             return documents
 
-        for doc_file in arch_path.glob("*.md"):
+        for doc_file in self.session.glob(arch_path, "*.md"):
             rel_path = str(doc_file.relative_to(self.project_root))
             title = self._extract_title(doc_file)
 
@@ -287,6 +316,8 @@ class ProjectMapper:
     def _extract_module_docstring(self, file_path: Path) -> str:
         """Extract the module-level docstring from a Python file.
 
+        Only the head of the file is read (see ``header_bytes``).
+
         Args:
             file_path: Path to Python file
 
@@ -294,23 +325,13 @@ class ProjectMapper:
             First line of module docstring or empty string
         """
         try:
-            content = self.fs.read_text(file_path)
-            lines = content.splitlines(keepends=True)
-            in_docstring = False
-            for line in lines[:20]:  # Only check first 20 lines
-                if '"""' in line or "'''" in line:
-                    if in_docstring:
-                        cleaned = line.strip()
-                        for delim in ['"""', "'''"]:
-                            cleaned = cleaned.replace(delim, "")
-                        return cleaned.strip()
-                    in_docstring = True
-                    # Check if single-line docstring
-                    if line.count('"""') == 2 or line.count("'''") == 2:
-                        cleaned = line.strip()
-                        for delim in ['"""', "'''"]:
-                            cleaned = cleaned.replace(delim, "")
-                        return cleaned.strip()
+            docstring = read_header(
+                self.session,
+                file_path,
+                module_docstring,
+                self.header_bytes,
+            )
+            return docstring or ""
         except Exception as e:
             logger.debug(f"Could not extract docstring from {file_path}: {e}")
 
@@ -319,6 +340,8 @@ class ProjectMapper:
     def _extract_title(self, file_path: Path) -> str:
         """Extract title from markdown file (first # heading).
 
+        Only the head of the file is read (see ``header_bytes``).
+
         Args:
             file_path: Path to markdown file
 
@@ -326,16 +349,35 @@ class ProjectMapper:
             Title or filename if not found
         """
         try:
-            content = self.fs.read_text(file_path)
-            for line in content.splitlines():
-                line = line.strip()
-                if line.startswith("# "):
-                    return line[2:].strip()
+            title = read_header(
+                self.session,
+                file_path,
+                markdown_title,
+                self.header_bytes,
+            )
+            if title:
+                return title
         except Exception as e:
             logger.debug(f"Could not extract title from {file_path}: {e}")
 
         return file_path.stem
 
+    def _scan_knowledge(self) -> list[KnowledgeEntry]:
+        """Scan docs/knowledge/ once per session.
+
+        Link processing and rule extraction both consume the same scan.
+
+        Returns:
+            Knowledge entries (links unresolved)
+        """
+        knowledge_dir = self.docs_path / "knowledge"
+        scanner = KnowledgeScanner(workspace_root=self.project_root, fs=self.session)
+        return self.session.memo(
+            knowledge_dir,
+            "knowledge-scan",
+            lambda: scanner.scan(knowledge_dir),
+        )
+
     def _process_knowledge_entries(self, context: ProjectContext) -> None:
         """Process knowledge entries: scan and resolve links.
 
@@ -346,8 +388,7 @@ class ProjectMapper:
         """
         try:
             # Scan knowledge entries
-            scanner = KnowledgeScanner(workspace_root=self.project_root, fs=self.fs)
-            entries = scanner.scan()
+            entries = self._scan_knowledge()
 
             if not entries:
                 logger.debug("No knowledge entries found")
@@ -386,26 +427,19 @@ class ProjectMapper:
             logger.warning(f"Failed to process knowledge entries: {e}")
 
     def _save_knowledge_entries(self, entries: list[KnowledgeEntry]) -> None:
-        """Save knowledge entries to JSON file.
+        """Stream knowledge entries to .cortex/knowledge.json (or .jsonl).
 
         Args:
             entries: List of KnowledgeEntry objects
         """
         try:
-            import json
-
-            output_path = self.project_root / ".cortex" / "knowledge.json"
-            self.fs.mkdir(output_path.parent, parents=True, exist_ok=True)
-
-            # Convert Pydantic models to dict
-            entries_data = [entry.model_dump(mode="json") for entry in entries]
-
-            json_content = json.dumps(
-                {"entries": entries_data, "count": len(entries)},
-                indent=2,
-                ensure_ascii=False,
+            output_path = layout_path(
+                self.project_root / ".cortex" / "knowledge.json",
+                self.export_layout,
             )
-            self.fs.write_text(output_path, json_content)
+            self.session.mkdir(output_path.parent, parents=True, exist_ok=True)
+
+            write_json_entries(self.session, output_path, entries, self.export_layout)
 
             logger.debug(f"Knowledge entries saved to {output_path}")
 
@@ -421,15 +455,8 @@ class ProjectMapper:
                 - knowledge_rules_markdown: Formatted Markdown for LLMs
         """
         try:
-            # Initialize scanner if not cached
-            if self._knowledge_scanner is None:
-                self._knowledge_scanner = KnowledgeScanner(
-                    workspace_root=self.project_root,
-                    fs=self.fs,
-                )
-
-            # Scan knowledge entries
-            entries = self._knowledge_scanner.scan()
+            # Reuse the scan made by _process_knowledge_entries()
+            entries = self._scan_knowledge()
 
             if not entries:
                 logger.debug("No knowledge entries found for rule extraction")
@@ -540,15 +567,9 @@ class ProjectMapper:
             context: Project context to save
             output_path: Path to output JSON file
         """
-        self.fs.mkdir(output_path.parent, parents=True, exist_ok=True)
+        self.session.mkdir(output_path.parent, parents=True, exist_ok=True)
 
-        json_content = json.dumps(
-            context.model_dump(mode="json"),
-            indent=2,
-            ensure_ascii=False,
-            default=str,
-        )
-        self.fs.write_text(output_path, json_content)
+        write_json_document(self.session, output_path, context, self.export_layout)
 
         logger.info(f"Context saved to {output_path}")
 
@@ -557,6 +578,8 @@ def generate_context_map(
     project_root: Path,
     output_path: Path,
     include_knowledge: bool = True,
+    export_layout: ExportLayout = "indent",
+    fs: FileSystemAdapter | None = None,
 ) -> ProjectContext:
     """Generate and save project context map.
 
@@ -564,11 +587,13 @@ def generate_context_map(
         project_root: Root directory of the project
         output_path: Path to save JSON output
         include_knowledge: Whether to include Knowledge Node rules (default: True)
+        export_layout: JSON layout: "indent", "compact" or "jsonl"
+        fs: FileSystemAdapter for I/O operations (default: RealFileSystem)
 
     Returns:
         Generated ProjectContext
     """
-    mapper = ProjectMapper(project_root)
+    mapper = ProjectMapper(project_root, fs=fs, export_layout=export_layout)
     context = mapper.map_project(include_knowledge=include_knowledge)
     mapper.save_context(context, output_path)
     return context
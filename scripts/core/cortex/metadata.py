@@ -10,6 +10,7 @@ License: MIT
 from __future__ import annotations
 
 import logging
+import os
 from datetime import date, datetime
 from pathlib import Path
 from typing import Any
@@ -39,10 +40,49 @@ from scripts.core.cortex.models import (
     DocumentMetadata,
     ValidationResult,
 )
+from scripts.core.cortex.scan_session import ScanSession
 from scripts.utils.filesystem import FileSystemAdapter, RealFileSystem
 
 logger = logging.getLogger(__name__)
 
+FRONTMATTER_MEMO = "frontmatter"
+"""ScanSession.memo() name of a file's parsed frontmatter."""
+
+
+def load_frontmatter(
+    fs: FileSystemAdapter,
+    path: Path,
+    *,
+    parsed: frontmatter.Post | None = None,
+) -> frontmatter.Post:
+    """Read and parse a Markdown file's frontmatter, once per ScanSession.
+
+    With a ScanSession, every consumer in the same run (metadata audit,
+    knowledge scan) shares a single parse of each file.
+
+    Args:
+        fs: Adapter to read from (memoized if it is a ScanSession)
+        path: Markdown file
+        parsed: Post already parsed elsewhere (e.g. in a worker process),
+            used to seed the session instead of parsing again
+
+    Returns:
+        Parsed post (treat as read-only: it may be shared)
+
+    Raises:
+        OSError: If the file cannot be read
+        yaml.YAMLError: If the frontmatter is not valid YAML
+    """
+
+    def parse() -> frontmatter.Post:
+        """Use the given post, or read and parse the file."""
+        return parsed if parsed is not None else frontmatter.loads(fs.read_text(path))
+
+    if isinstance(fs, ScanSession):
+        scope = Path(os.path.abspath(path))
+        return fs.memo(scope, FRONTMATTER_MEMO, parse)
+    return parse()
+
 
 class FrontmatterParseError(Exception):
     """Raised when frontmatter cannot be parsed from a file."""
@@ -93,18 +133,21 @@ class FrontmatterParser:
             >>> print(metadata.id)
             'testing-guide'
         """
-        # Validate file exists
-        if not self.fs.exists(path):
-            raise FrontmatterParseError(f"File does not exist: {path}")
-
-        # Validate file is readable
-        if not self.fs.is_file(path):
-            raise FrontmatterParseError(f"Path is not a file: {path}")
-
         try:
             # Read file and parse frontmatter
-            content = self.fs.read_text(path)
-            post = frontmatter.loads(content)
+            try:
+                post = load_frontmatter(self.fs, path)
+            except OSError:
+                # Diagnose only on failure: the happy path is a single read
+                if not self.fs.exists(path):
+                    raise FrontmatterParseError(
+                        f"File does not exist: {path}",
+                    ) from None
+                if not self.fs.is_file(path):
+                    raise FrontmatterParseError(
+                        f"Path is not a file: {path}",
+                    ) from None
+                raise
 
             # Check if frontmatter exists
             if not post.metadata:
@@ -25,14 +25,21 @@ from __future__ import annotations
 
 import logging
 import re
+import time
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from datetime import date
+from functools import partial
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+from scripts.core.cortex.headers import DEFAULT_HEADER_BYTES, markdown_title
+from scripts.core.cortex.migration_journal import JOURNAL_DIR, MigrationJournal
 from scripts.utils.filesystem import FileSystemAdapter, RealFileSystem
+from scripts.utils.parallel import process_map, worker_count
+from scripts.utils.read_through import is_real_filesystem
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +56,33 @@ class MigrationResult:
     error: str | None = None
 
 
+@dataclass(frozen=True)
+class MigrationProgress:
+    """Progress of a bulk migration phase ("analyze" or "commit")."""
+
+    phase: str
+    done: int
+    total: int
+    elapsed: float
+
+    @property
+    def rate(self) -> float:
+        """Throughput in files per second."""
+        return self.done / self.elapsed if self.elapsed > 0 else 0.0
+
+
+ProgressCallback = Callable[[MigrationProgress], None]
+
+
+@dataclass
+class _FilePlan:
+    """Analysis of one file: its result and, if it changes, both contents."""
+
+    result: MigrationResult
+    original: str | None = None
+    content: str | None = None
+
+
 class DocumentMigrator:
     """Migrates Markdown documentation to CORTEX format.
 
@@ -75,16 +109,24 @@ class DocumentMigrator:
         self,
         workspace_root: Path,
         fs: FileSystemAdapter | None = None,
+        header_bytes: int | None = DEFAULT_HEADER_BYTES,
     ) -> None:
         """Initialize the migrator.
 
         Args:
             workspace_root: Root directory of the workspace
             fs: FileSystemAdapter for I/O operations (default: RealFileSystem)
+            header_bytes: Prefix read to detect existing frontmatter before
+                reading the whole file (None: always read it all)
         """
         if fs is None:
             fs = RealFileSystem()
         self.fs = fs
+        self.header_bytes = header_bytes
+        self.journal = MigrationJournal(
+            workspace_root.resolve() / JOURNAL_DIR,
+            fs=fs,
+        )
         self.workspace_root = workspace_root.resolve()
         logger.debug(
             "Initialized DocumentMigrator with root: %s",
@@ -143,13 +185,9 @@ class DocumentMigrator:
         Returns:
             Extracted title or None if no heading found
         """
-        # Remove existing frontmatter if present
-        content = self.FRONTMATTER_PATTERN.sub("", content)
-
-        # Look for first level-1 heading
-        match = re.search(r"^#\s+(.+)$", content, re.MULTILINE)
-        if match:
-            title = match.group(1).strip()
+        # First level-1 heading after the frontmatter (shared with the mapper)
+        title = markdown_title(content)
+        if title:
             # Clean up any emoji or extra formatting
             return re.sub(r"[🧪🔧📚🚀🎯✅🚫⚠️🟢🔴]", "", title).strip()
 
@@ -261,91 +299,150 @@ class DocumentMigrator:
 
         return final_content
 
-    # TODO: Refactor God Function - extract validation, generation,
-    # and writing into separate methods
-    def migrate_file(
+    def _read_unless_skipped(self, file_path: Path, *, force: bool) -> str | None:
+        """Read a file, or return None if its head shows it will be skipped.
+
+        Without ``force``, files that already have frontmatter are skipped;
+        that is decided from the first ``header_bytes`` of the file.
+
+        Args:
+            file_path: Path to the markdown file
+            force: If True, the file is never skipped
+
+        Returns:
+            Full content, or None if the file has frontmatter
+        """
+        if force or self.header_bytes is None:
+            return self.fs.read_text(file_path)
+
+        head, complete = self.fs.read_prefix(file_path, self.header_bytes)
+        if self._has_frontmatter(head):
+            return None
+        return head if complete else self.fs.read_text(file_path)
+
+    def _plan_file(
         self,
         file_path: Path,
         *,
-        dry_run: bool = True,
-        force: bool = False,
-    ) -> MigrationResult:
-        """Migrate a single markdown file to CORTEX format.
+        dry_run: bool,
+        force: bool,
+    ) -> _FilePlan:
+        """Analyze a file and build its migrated content without writing.
 
         Args:
             file_path: Path to the markdown file
-            dry_run: If True, don't write changes to disk
+            dry_run: Only affects the result message
             force: If True, overwrite existing frontmatter
 
         Returns:
-            MigrationResult with operation details
+            _FilePlan with the result and, if the file changes, its contents
         """
         try:
             # Validate file exists and is readable
             if not file_path.exists():
-                return MigrationResult(
-                    file_path=file_path,
-                    success=False,
-                    action="error",
-                    message="File not found",
-                    error="File does not exist",
+                return _FilePlan(
+                    MigrationResult(
+                        file_path=file_path,
+                        success=False,
+                        action="error",
+                        message="File not found",
+                        error="File does not exist",
+                    ),
                 )
 
             if not file_path.is_file():
-                return MigrationResult(
-                    file_path=file_path,
-                    success=False,
-                    action="error",
-                    message="Not a file",
-                    error="Path is not a file",
+                return _FilePlan(
+                    MigrationResult(
+                        file_path=file_path,
+                        success=False,
+                        action="error",
+                        message="Not a file",
+                        error="Path is not a file",
+                    ),
                 )
 
-            # Read content
-            content = self.fs.read_text(file_path)
+            # Read content (files with frontmatter are skipped from the head)
+            content = self._read_unless_skipped(file_path, force=force)
 
             # Generate frontmatter
-            metadata, action = self._generate_frontmatter(
-                file_path,
-                content,
-                force=force,
+            metadata, action = (
+                self._generate_frontmatter(file_path, content, force=force)
+                if content is not None
+                else ({}, "skipped")
             )
 
             # If skipped (has frontmatter and not forced)
-            if not metadata:
-                return MigrationResult(
-                    file_path=file_path,
-                    success=True,
-                    action="skipped",
-                    message="Already has frontmatter (use --force to overwrite)",
-                    inferred_metadata=None,
+            if content is None or not metadata:
+                return _FilePlan(
+                    MigrationResult(
+                        file_path=file_path,
+                        success=True,
+                        action="skipped",
+                        message="Already has frontmatter (use --force to overwrite)",
+                        inferred_metadata=None,
+                    ),
                 )
 
-            # Inject frontmatter
-            new_content = self._inject_frontmatter(content, metadata)
-
-            # Write to disk if not dry-run
-            if not dry_run:
-                self.fs.write_text(file_path, new_content)
-                logger.info("Migrated file: %s", file_path)
-
-            return MigrationResult(
-                file_path=file_path,
-                success=True,
-                action=action,
-                message=f"Frontmatter {action}" + (" (dry-run)" if dry_run else ""),
-                inferred_metadata=metadata,
+            return _FilePlan(
+                MigrationResult(
+                    file_path=file_path,
+                    success=True,
+                    action=action,
+                    message=f"Frontmatter {action}" + (" (dry-run)" if dry_run else ""),
+                    inferred_metadata=metadata,
+                ),
+                original=content,
+                content=self._inject_frontmatter(content, metadata),
             )
 
         except Exception as e:
             logger.exception("Error migrating %s", file_path)
-            return MigrationResult(
-                file_path=file_path,
-                success=False,
-                action="error",
-                message="Migration failed",
-                error=str(e),
+            return _FilePlan(
+                MigrationResult(
+                    file_path=file_path,
+                    success=False,
+                    action="error",
+                    message="Migration failed",
+                    error=str(e),
+                ),
             )
 
+    def migrate_file(
+        self,
+        file_path: Path,
+        *,
+        dry_run: bool = True,
+        force: bool = False,
+    ) -> MigrationResult:
+        """Migrate a single markdown file to CORTEX format.
+
+        Args:
+            file_path: Path to the markdown file
+            dry_run: If True, don't write changes to disk
+            force: If True, overwrite existing frontmatter
+
+        Returns:
+            MigrationResult with operation details
+        """
+        plan = self._plan_file(file_path, dry_run=dry_run, force=force)
+
+        # Write to disk if not dry-run
+        if not dry_run and plan.content is not None:
+            try:
+                self.fs.write_text(file_path, plan.content)
+                logger.info("Migrated file: %s", file_path)
+            except Exception as e:
+                logger.exception("Error migrating %s", file_path)
+                return MigrationResult(
+                    file_path=file_path,
+                    success=False,
+                    action="error",
+                    message="Migration failed",
+                    error=str(e),
+                )
+
+        return plan.result
+
     def migrate_directory(
         self,
         directory: Path,
@@ -353,19 +450,35 @@ class DocumentMigrator:
         dry_run: bool = True,
         force: bool = False,
         recursive: bool = True,
+        workers: int | None = None,
+        on_progress: ProgressCallback | None = None,
     ) -> list[MigrationResult]:
         """Migrate all markdown files in a directory.
 
+        Large trees are analyzed by a pool of worker processes (see
+        scripts.utils.parallel.worker_count); the migrated contents are then
+        committed by this process as one journaled batch: either every file
+        is rewritten or none is (see MigrationJournal).
+
         Args:
             directory: Directory containing markdown files
             dry_run: If True, don't write changes to disk
             force: If True, overwrite existing frontmatter
             recursive: If True, process subdirectories
+            workers: Analysis processes (default: CPU count, at most
+                MAX_DEFAULT_WORKERS; 1 disables)
+            on_progress: Called with MigrationProgress as files are analyzed
+                and committed
 
         Returns:
             List of MigrationResult for all processed files
+
+        Raises:
+            MigrationJournalError: If an interrupted migration is pending
         """
-        results = []
+        # Refuse early instead of after analyzing the whole tree
+        if not dry_run:
+            self.journal.ensure_clear()
 
         # Find all markdown files
         pattern = "**/*.md" if recursive else "*.md"
@@ -377,11 +490,88 @@ class DocumentMigrator:
             directory,
         )
 
-        for md_file in md_files:
-            result = self.migrate_file(md_file, dry_run=dry_run, force=force)
-            results.append(result)
+        plans = self._plan_files(
+            md_files,
+            dry_run=dry_run,
+            force=force,
+            workers=workers,
+            on_progress=on_progress,
+        )
+
+        if not dry_run:
+            changes = [
+                (plan.result.file_path, plan.original, plan.content)
+                for plan in plans
+                if plan.original is not None and plan.content is not None
+            ]
+            start = time.perf_counter()
 
-        return results
+            def report(done: int, total: int) -> None:
+                """Forward commit progress to ``on_progress``."""
+                if on_progress is not None:
+                    elapsed = time.perf_counter() - start
+                    on_progress(MigrationProgress("commit", done, total, elapsed))
+
+            self.journal.commit(changes, report)
+
+        return [plan.result for plan in plans]
+
+    def _plan_files(
+        self,
+        md_files: list[Path],
+        *,
+        dry_run: bool,
+        force: bool,
+        workers: int | None,
+        on_progress: ProgressCallback | None,
+    ) -> list[_FilePlan]:
+        """Analyze files in order, in worker processes for large real trees.
+
+        Workers build their own migrator over the real filesystem, so other
+        adapters (e.g. MemoryFileSystem in tests) are analyzed in-process;
+        caches over the real filesystem (``--fs-cache``) are looked through.
+        """
+        total = len(md_files)
+        workers = worker_count(total, workers) if is_real_filesystem(self.fs) else 1
+        start = time.perf_counter()
+        plans: list[_FilePlan] = []
+
+        def collect(results: Iterable[_FilePlan]) -> None:
+            """Append plans in order and report analysis progress."""
+            for plan in results:
+                plans.append(plan)
+                if on_progress is not None:
+                    elapsed = time.perf_counter() - start
+                    on_progress(
+                        MigrationProgress("analyze", len(plans), total, elapsed)
+                    )
+
+        plan = partial(DocumentMigrator._plan_file, dry_run=dry_run, force=force)
+        if workers == 1:
+            collect(plan(self, md_file) for md_file in md_files)
+        else:
+            logger.info("Analyzing %d files with %d processes", total, workers)
+            collect(
+                process_map(
+                    plan,
+                    md_files,
+                    context=partial(
+                        DocumentMigrator,
+                        self.workspace_root,
+                        header_bytes=self.header_bytes,
+                    ),
+                    workers=workers,
+                ),
+            )
+
+        elapsed = time.perf_counter() - start
+        logger.info(
+            "Analyzed %d files in %.2fs (%.0f files/s)",
+            total,
+            elapsed,
+            total / elapsed if elapsed > 0 else 0.0,
+        )
+        return plans
 
     def print_summary(
         self,
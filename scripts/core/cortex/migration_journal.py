@@ -0,0 +1,219 @@
+"""Migration Journal - All-or-nothing commit of bulk migrations.
+
+``DocumentMigrator.migrate_directory`` used to write each file as soon as
+it was analyzed, so a crash halfway left a half-migrated tree. The journal
+turns the write phase into a transaction:
+
+1. Stage: the original and the new content of every file are written to
+   ``.cortex/migration/`` (undo and redo logs) as one batch.
+2. Intent: ``journal.json`` listing the staged entries is written
+   atomically. From here on the migration can always be completed or
+   undone, because both operations only replay staged files.
+3. Apply: targets are replaced in batches of ``APPLY_CHUNK`` files.
+4. Clear: the journal directory is removed.
+
+Every step goes through ``FileSystemAdapter.write_many``, which on the real
+filesystem is an ``AtomicBatch``: files are fsynced together and each
+directory is fsynced once per batch, so the staged data is on disk before
+the manifest that references it.
+
+An exception while applying rolls the batch back immediately. After a
+crash, the remaining journal blocks new migrations until it is resumed
+(``cortex migrate --resume``) or rolled back (``cortex migrate --rollback``).
+
+Usage:
+    journal = MigrationJournal(workspace_root / JOURNAL_DIR)
+    journal.commit([(path, original, migrated)])
+
+Author: Engineering Team
+License: MIT
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Callable, Sequence
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from scripts.utils.filesystem import FileSystemAdapter, RealFileSystem
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_DIR = Path(".cortex") / "migration"
+"""Journal location relative to the workspace root."""
+
+MANIFEST_NAME = "journal.json"
+
+APPLY_CHUNK = 256
+"""Targets replaced per write_many() batch (progress is reported per batch)."""
+
+# (target, original content, new content)
+FileChange = tuple[Path, str, str]
+
+# (files applied, total files)
+ApplyProgress = Callable[[int, int], None]
+
+
+class MigrationJournalError(RuntimeError):
+    """An unfinished migration journal blocks a new migration."""
+
+
+class MigrationJournal:
+    """Undo/redo journal for a batch of file rewrites.
+
+    Attributes:
+        journal_dir: Directory holding the manifest and staged contents
+        fs: FileSystemAdapter for I/O operations
+    """
+
+    def __init__(
+        self,
+        journal_dir: Path,
+        fs: FileSystemAdapter | None = None,
+    ) -> None:
+        """Initialize the journal.
+
+        Args:
+            journal_dir: Directory holding the manifest and staged contents
+            fs: FileSystemAdapter for I/O operations (default: RealFileSystem)
+        """
+        self.journal_dir = journal_dir
+        self.fs = fs or RealFileSystem()
+
+    @property
+    def manifest_path(self) -> Path:
+        """Path of the intent manifest."""
+        return self.journal_dir / MANIFEST_NAME
+
+    def pending(self) -> bool:
+        """Return True if an interrupted migration left a journal behind."""
+        return self.fs.exists(self.manifest_path)
+
+    def ensure_clear(self) -> None:
+        """Raise MigrationJournalError if an unfinished journal exists."""
+        if self.pending():
+            msg = (
+                f"Unfinished migration journal in {self.journal_dir}: "
+                "run 'cortex migrate <dir> --resume' or '--rollback'"
+            )
+            raise MigrationJournalError(msg)
+
+    def commit(
+        self,
+        changes: Sequence[FileChange],
+        on_progress: ApplyProgress | None = None,
+    ) -> int:
+        """Apply all changes as one batch.
+
+        Args:
+            changes: Files to rewrite with their original and new contents
+            on_progress: Called after each applied batch
+
+        Returns:
+            Number of files written
+
+        Raises:
+            MigrationJournalError: If an unfinished journal exists
+        """
+        self.ensure_clear()
+        if not changes:
+            return 0
+
+        # Staged files without a manifest come from a crash before step 2
+        self.fs.remove(self.journal_dir)
+        entries = self._stage(changes)
+
+        try:
+            self._apply([(path, new) for path, _, new in changes], on_progress)
+        except Exception:
+            logger.exception("Migration commit failed; rolling back")
+            self._replay(entries, "original", None)
+            self.fs.remove(self.journal_dir)
+            raise
+
+        self.fs.remove(self.journal_dir)
+        logger.info("Committed migration of %d files", len(entries))
+        return len(entries)
+
+    def resume(self, on_progress: ApplyProgress | None = None) -> int:
+        """Finish an interrupted migration from the staged new contents.
+
+        Returns:
+            Number of files written (0 if there is no journal)
+        """
+        return self._finish("staged", on_progress)
+
+    def rollback(self, on_progress: ApplyProgress | None = None) -> int:
+        """Undo an interrupted migration from the staged original contents.
+
+        Returns:
+            Number of files restored (0 if there is no journal)
+        """
+        return self._finish("original", on_progress)
+
+    def _stage(self, changes: Sequence[FileChange]) -> list[dict[str, str]]:
+        """Write the undo/redo contents, then the manifest (steps 1-2)."""
+        entries: list[dict[str, str]] = []
+        staged: dict[Path, str] = {}
+        for index, (path, original, new) in enumerate(changes):
+            entry = {
+                "path": str(path),
+                "original": f"{index:06d}.orig",
+                "staged": f"{index:06d}.new",
+            }
+            staged[self.journal_dir / entry["original"]] = original
+            staged[self.journal_dir / entry["staged"]] = new
+            entries.append(entry)
+        self.fs.write_many(staged)
+
+        manifest: dict[str, Any] = {
+            "version": 1,
+            "created_at": datetime.now(tz=timezone.utc).isoformat(),
+            "entries": entries,
+        }
+        self.fs.write_many(
+            {self.manifest_path: json.dumps(manifest, indent=2, ensure_ascii=False)},
+        )
+        return entries
+
+    def _apply(
+        self,
+        contents: Sequence[tuple[Path, str]],
+        on_progress: ApplyProgress | None,
+    ) -> None:
+        """Replace the targets, APPLY_CHUNK files per batch."""
+        for start in range(0, len(contents), APPLY_CHUNK):
+            chunk = contents[start : start + APPLY_CHUNK]
+            self.fs.write_many(dict(chunk))
+            if on_progress is not None:
+                on_progress(start + len(chunk), len(contents))
+
+    def _replay(
+        self,
+        entries: Sequence[dict[str, str]],
+        source: str,
+        on_progress: ApplyProgress | None,
+    ) -> None:
+        """Write the staged ``source`` ("original" or "staged") of each entry."""
+        contents = [
+            (Path(entry["path"]), self.fs.read_text(self.journal_dir / entry[source]))
+            for entry in entries
+        ]
+        self._apply(contents, on_progress)
+
+    def _finish(self, source: str, on_progress: ApplyProgress | None) -> int:
+        """Replay the journal from ``source`` and clear it."""
+        if not self.pending():
+            return 0
+
+        manifest = json.loads(self.fs.read_text(self.manifest_path))
+        entries: list[dict[str, str]] = manifest["entries"]
+        self._replay(entries, source, on_progress)
+        self.fs.remove(self.journal_dir)
+
+        action = "Resumed" if source == "staged" else "Rolled back"
+        logger.info("%s migration of %d files", action, len(entries))
+        return len(entries)
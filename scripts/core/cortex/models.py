@@ -345,6 +345,7 @@ class MigrationSummary(BaseModel):
         updated: Number of files with updated frontmatter
         errors: Number of files that failed to migrate
         results: Detailed list of MigrationResult for each file
+        duration: Wall-clock seconds of the migration (analysis + commit)
 
     Example:
         >>> from scripts.core.cortex.migrate import MigrationResult
@@ -365,6 +366,7 @@ class MigrationSummary(BaseModel):
     errors: int
     # list[MigrationResult] - avoiding circular import
     results: list[Any] = Field(default_factory=list)
+    duration: float = 0.0
 
 
 # ============================================================================
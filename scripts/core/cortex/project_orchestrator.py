@@ -35,12 +35,17 @@ from __future__ import annotations
 
 import logging
 import os
+import time
 from pathlib import Path
 
 import frontmatter
 
 from scripts.core.cortex.metadata import FrontmatterParser
-from scripts.core.cortex.migrate import DocumentMigrator, MigrationResult
+from scripts.core.cortex.migrate import (
+    DocumentMigrator,
+    MigrationResult,
+    ProgressCallback,
+)
 from scripts.core.cortex.models import InitResult, MigrationSummary
 from scripts.cortex.core.frontmatter_helpers import generate_default_frontmatter
 from scripts.utils.filesystem import FileSystemAdapter, RealFileSystem
@@ -228,6 +233,8 @@ class ProjectOrchestrator:
         dry_run: bool = True,
         force: bool = False,
         recursive: bool = True,
+        workers: int | None = None,
+        on_progress: ProgressCallback | None = None,
     ) -> MigrationSummary:
         """Migrate an entire project directory to CORTEX format.
 
@@ -240,10 +247,15 @@ class ProjectOrchestrator:
             dry_run: If True, preview changes without writing (default: True)
             force: If True, overwrite existing frontmatter (default: False)
             recursive: If True, process subdirectories (default: True)
+            workers: Analysis processes (default: CPU count; 1 disables)
+            on_progress: Called with MigrationProgress during analysis/commit
 
         Returns:
             MigrationSummary with aggregated statistics and detailed results
 
+        Raises:
+            MigrationJournalError: If an interrupted migration is pending
+
         Example:
             >>> orchestrator = ProjectOrchestrator(Path("/project"))
             >>> summary = orchestrator.migrate_project(
@@ -283,12 +295,16 @@ class ProjectOrchestrator:
             )
 
         # Delegate to DocumentMigrator
+        start = time.perf_counter()
         results: list[MigrationResult] = self.migrator.migrate_directory(
             directory=directory,
             dry_run=dry_run,
             force=force,
             recursive=recursive,
+            workers=workers,
+            on_progress=on_progress,
         )
+        duration = time.perf_counter() - start
 
         # Aggregate statistics
         total = len(results)
@@ -297,11 +313,12 @@ class ProjectOrchestrator:
         errors = sum(1 for r in results if r.action == "error")
 
         logger.info(
-            "Migration complete: %d total, %d created, %d updated, %d errors",
+            "Migration complete: %d total, %d created, %d updated, %d errors in %.2fs",
             total,
             created,
             updated,
             errors,
+            duration,
         )
 
         return MigrationSummary(
@@ -310,4 +327,21 @@ class ProjectOrchestrator:
             updated=updated,
             errors=errors,
             results=results,
+            duration=duration,
         )
+
+    def resume_migration(self) -> int:
+        """Finish a migration interrupted during its commit.
+
+        Returns:
+            Number of files written (0 if nothing was pending)
+        """
+        return self.migrator.journal.resume()
+
+    def rollback_migration(self) -> int:
+        """Undo a migration interrupted during its commit.
+
+        Returns:
+            Number of files restored (0 if nothing was pending)
+        """
+        return self.migrator.journal.rollback()
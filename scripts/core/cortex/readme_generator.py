@@ -8,7 +8,10 @@ from live project data:
 - docs/reports/KNOWLEDGE_HEALTH.md (health score)
 - CLI introspection (command help texts)
 
-Supports drift detection for CI/CD governance.
+Supports drift detection for CI/CD governance. Templates are compiled once
+per generator, and ``template_fingerprint`` hashes a template together with
+the data it uses, so callers can tell an up-to-date document without
+rendering it.
 
 Author: Engineering Team
 License: MIT
@@ -17,11 +20,14 @@ License: MIT
 from __future__ import annotations
 
 import difflib
+import hashlib
 import json
-from dataclasses import dataclass
+import re
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
+from typing import Any
 
 import frontmatter
 
@@ -30,7 +36,30 @@ try:
 except ImportError:
     import tomli as tomllib
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemLoader, meta, select_autoescape
+
+from scripts.core.cortex.scan_session import ScanSession
+
+# Format of ReadmeData.generated_at (datetime.isoformat, with offset)
+_GENERATED_AT = re.compile(
+    r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:[+-]\d{2}:\d{2}|Z)?",
+)
+
+
+def normalize_timestamps(content: str) -> str:
+    """Replace generation timestamps with a placeholder.
+
+    Generated documents print ``generated_at``, which changes on every
+    render without the document being out of date; compare documents
+    after normalizing both.
+
+    Args:
+        content: Rendered or committed document
+
+    Returns:
+        Content with every ``generated_at``-style timestamp as "TIMESTAMP"
+    """
+    return _GENERATED_AT.sub("TIMESTAMP", content)
 
 
 class DocumentType(Enum):
@@ -111,14 +140,25 @@ class DocumentGenerator:
     and drift detection for CI/CD governance.
     """
 
-    def __init__(self, project_root: Path | None = None) -> None:
+    def __init__(
+        self,
+        project_root: Path | None = None,
+        session: ScanSession | None = None,
+    ) -> None:
         """Initialize generator.
 
         Args:
             project_root: Root directory of the project. If None, auto-detects.
+            session: ScanSession shared with the run that produced the inputs
+                (e.g. ProjectMapper). If None, each collect_all_data() call
+                uses its own session.
         """
         self.project_root = project_root or self._detect_project_root()
         self.template_dir = self.project_root / "docs" / "templates"
+        self.session = session
+        self._env: Environment | None = None
+        # template name -> (source, variables it references, templates it loads)
+        self._template_refs: dict[str, tuple[str, set[str], list[str]]] = {}
 
     @staticmethod
     def _detect_project_root() -> Path:
@@ -127,20 +167,44 @@ class DocumentGenerator:
         # Navigate up from scripts/core/cortex/readme_generator.py to project root
         return current_file.parent.parent.parent.parent
 
-    def extract_project_metadata(self) -> ProjectMetadata:
+    def _session(self, session: ScanSession | None) -> ScanSession:
+        """Return the session to read through (explicit, shared or new)."""
+        return session or self.session or ScanSession()
+
+    def _load_context(self, session: ScanSession) -> dict[str, Any] | None:
+        """Parse .cortex/context.json once per session (None if missing)."""
+        context_path = self.project_root / ".cortex" / "context.json"
+
+        if not session.exists(context_path):
+            return None
+
+        data: dict[str, Any] = session.memo(
+            context_path,
+            "json",
+            lambda: json.loads(session.read_text(context_path)),
+        )
+        return data
+
+    def extract_project_metadata(
+        self,
+        session: ScanSession | None = None,
+    ) -> ProjectMetadata:
         """Extract metadata from pyproject.toml.
 
+        Args:
+            session: ScanSession to read through (default: shared or new)
+
         Returns:
             ProjectMetadata with name, version, python_version, etc.
         """
+        io = self._session(session)
         pyproject_path = self.project_root / "pyproject.toml"
 
-        if not pyproject_path.exists():
+        if not io.exists(pyproject_path):
             msg = f"pyproject.toml not found: {pyproject_path}"
             raise FileNotFoundError(msg)
 
-        with pyproject_path.open("rb") as f:
-            data = tomllib.load(f)
+        data = tomllib.loads(io.read_text(pyproject_path))
 
         project = data.get("project", {})
 
@@ -170,15 +234,21 @@ class DocumentGenerator:
             author_email=author_email,
         )
 
-    def extract_graph_statistics(self) -> GraphStatistics:
+    def extract_graph_statistics(
+        self,
+        session: ScanSession | None = None,
+    ) -> GraphStatistics:
         """Extract statistics from .cortex/context.json.
 
+        Args:
+            session: ScanSession to read through (default: shared or new)
+
         Returns:
             GraphStatistics with metrics like total_nodes, broken_links, etc.
         """
-        context_path = self.project_root / ".cortex" / "context.json"
+        data = self._load_context(self._session(session))
 
-        if not context_path.exists():
+        if data is None:
             # Return default values if context doesn't exist yet
             return GraphStatistics(
                 total_nodes=0,
@@ -189,9 +259,6 @@ class DocumentGenerator:
                 link_health_score=100.0,
             )
 
-        with open(context_path, encoding="utf-8") as f:
-            data = json.load(f)
-
         # Extract graph metrics if available
         graph_metrics = data.get("knowledge_graph", {}).get("metrics", {})
 
@@ -204,15 +271,19 @@ class DocumentGenerator:
             link_health_score=graph_metrics.get("link_health_score", 100.0),
         )
 
-    def extract_health_score(self) -> HealthScore:
+    def extract_health_score(self, session: ScanSession | None = None) -> HealthScore:
         """Extract health score from KNOWLEDGE_HEALTH.md.
 
+        Args:
+            session: ScanSession to read through (default: shared or new)
+
         Returns:
             HealthScore with score, status, and generation timestamp.
         """
+        io = self._session(session)
         health_path = self.project_root / "docs" / "reports" / "KNOWLEDGE_HEALTH.md"
 
-        if not health_path.exists():
+        if not io.exists(health_path):
             return HealthScore(
                 score=0.0,
                 status="unknown",
@@ -220,7 +291,7 @@ class DocumentGenerator:
             )
 
         # Parse frontmatter using python-frontmatter
-        doc = frontmatter.load(str(health_path))
+        doc = frontmatter.loads(io.read_text(health_path))
 
         score = doc.get("health_score", 0.0)
         status = doc.get("status", "unknown")
@@ -235,20 +306,23 @@ class DocumentGenerator:
             generated_at=str(generated_at),
         )
 
-    def extract_cli_commands(self) -> list[CLICommand]:
+    def extract_cli_commands(
+        self,
+        session: ScanSession | None = None,
+    ) -> list[CLICommand]:
         """Extract CLI commands from .cortex/context.json.
 
+        Args:
+            session: ScanSession to read through (default: shared or new)
+
         Returns:
             List of CLICommand objects.
         """
-        context_path = self.project_root / ".cortex" / "context.json"
+        data = self._load_context(self._session(session))
 
-        if not context_path.exists():
+        if data is None:
             return []
 
-        with context_path.open(encoding="utf-8") as f:
-            data = json.load(f)
-
         commands_data = data.get("cli_commands", [])
 
         return [
@@ -263,45 +337,123 @@ class DocumentGenerator:
     def collect_all_data(self) -> ReadmeData:
         """Collect all data needed for README generation.
 
+        All sources are read through one session, so context.json is read
+        and parsed once.
+
         Returns:
             ReadmeData with complete project information.
         """
+        session = self._session(None)
         return ReadmeData(
-            project=self.extract_project_metadata(),
-            graph=self.extract_graph_statistics(),
-            health=self.extract_health_score(),
-            cli_commands=self.extract_cli_commands(),
+            project=self.extract_project_metadata(session),
+            graph=self.extract_graph_statistics(session),
+            health=self.extract_health_score(session),
+            cli_commands=self.extract_cli_commands(session),
             generated_at=datetime.now(tz=timezone.utc).isoformat(),
         )
 
+    def _environment(self) -> Environment:
+        """Return the Jinja2 environment, created once per generator.
+
+        The environment caches compiled templates (reloaded only when the
+        template file changes), so batch generation compiles each once.
+        """
+        if self._env is None:
+            self._env = Environment(
+                loader=FileSystemLoader(self.template_dir),
+                autoescape=select_autoescape(["html", "xml"]),
+                trim_blocks=True,
+                lstrip_blocks=False,  # Preserve indentation and final lines
+                keep_trailing_newline=True,
+            )
+        return self._env
+
+    def _template_references(
+        self,
+        template_name: str,
+    ) -> tuple[str, set[str], list[str]]:
+        """Return a template's source, the variables and templates it references."""
+        env = self._environment()
+        loader = env.loader
+        assert loader is not None  # nosec B101 - set in _environment()
+        source, _, _ = loader.get_source(env, template_name)
+
+        cached = self._template_refs.get(template_name)
+        if cached is None or cached[0] != source:
+            parsed = env.parse(source)
+            referenced = list(meta.find_referenced_templates(parsed))
+            if None in referenced:
+                # Dynamic include/extends: any template may be loaded
+                referenced = list(env.list_templates())
+            cached = (
+                source,
+                meta.find_undeclared_variables(parsed),
+                [name for name in referenced if name],
+            )
+            self._template_refs[template_name] = cached
+        return cached
+
+    def template_fingerprint(self, template_name: str, data: ReadmeData) -> str:
+        """Hash a template (and its includes) with the data it references.
+
+        Only the variables the template uses are hashed, with timestamps
+        normalized: ``generated_at`` changes on every collection, and drift
+        checks compare documents the same way (see normalize_timestamps).
+
+        Args:
+            template_name: Name of the Jinja2 template (e.g., "README.md.j2")
+            data: Data the template would be rendered with
+
+        Returns:
+            SHA-256 hex digest
+        """
+        values = asdict(data)
+        sources: dict[str, str] = {}
+        used: set[str] = set()
+        pending = [template_name]
+        while pending:
+            name = pending.pop()
+            if name in sources:
+                continue
+            sources[name], variables, referenced = self._template_references(name)
+            used |= variables
+            pending.extend(referenced)
+
+        payload = json.dumps(
+            {
+                "templates": sources,
+                "data": {key: values[key] for key in sorted(used) if key in values},
+            },
+            sort_keys=True,
+            default=str,
+        )
+        # Timestamps (generated_at, health.generated_at) change on every
+        # collection; documents are compared with them normalized too
+        payload = normalize_timestamps(payload)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
     def generate_document(
         self,
         template_name: str,
         output_path: Path | None = None,
+        data: ReadmeData | None = None,
     ) -> str:
         """Generate a document from template and live data.
 
         Args:
             template_name: Name of the Jinja2 template (e.g., "README.md.j2")
             output_path: Where to write the document. If None, returns string only.
+            data: Data collected once for several documents. If None, collects it.
 
         Returns:
             Generated document content as string.
         """
         # Collect data
-        data = self.collect_all_data()
-
-        # Setup Jinja2 environment
-        env = Environment(
-            loader=FileSystemLoader(self.template_dir),
-            autoescape=select_autoescape(["html", "xml"]),
-            trim_blocks=True,
-            lstrip_blocks=False,  # Preserve indentation and final lines
-            keep_trailing_newline=True,
-        )
+        if data is None:
+            data = self.collect_all_data()
 
-        # Load template
-        template = env.get_template(template_name)
+        # Load template (compiled once per generator)
+        template = self._environment().get_template(template_name)
 
         # Render (str() for mypy; Jinja2 types template.render as Any)
         content = str(
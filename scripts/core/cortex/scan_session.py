@@ -0,0 +1,114 @@
+"""Scan Session - Per-invocation memoization of filesystem work.
+
+A single ``cortex map`` touches the same files from several phases: the
+document scan reads ``docs/**/*.md`` for titles, the knowledge scan reads
+``docs/knowledge/*.md`` for frontmatter, and rule extraction used to scan
+the knowledge directory a second time. ``ScanSession`` is a
+``FileSystemAdapter`` that wraps the real adapter for the duration of one
+run and memoizes:
+
+- ``read_text`` (each file is read once per encoding)
+- ``exists`` / ``is_file`` / ``is_dir``
+- ``glob`` / ``rglob`` walks
+- derived results through :meth:`ScanSession.memo` (parsed JSON, scans)
+
+Reads, the path index and the write-through invalidation are shared with
+``CachingFileSystem`` (see scripts/utils/read_through.py). Writes made
+through the session invalidate what they can affect: the file itself, walks
+rooted above it and memoized results scoped to it or to one of its parents;
+copies and removals also drop everything below the path. Unlike the bounded
+cache, the session never evicts and assumes nothing else modifies the tree
+while it is alive, so create one per invocation rather than keeping it
+around.
+
+Usage:
+    session = ScanSession(RealFileSystem())
+    mapper = ProjectMapper(project_root, fs=fs, session=session)
+    context = mapper.map_project()
+    print(session.stats)  # {"reads": 42, "read_hits": 40, ...}
+
+Author: Engineering Team
+License: MIT
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+from pathlib import Path
+from typing import Any, TypeVar
+
+from scripts.utils.filesystem import FileSystemAdapter
+from scripts.utils.read_through import CacheKey, ReadThroughFileSystem
+
+T = TypeVar("T")
+
+# Entry kind -> (hit counter, miss counter) in ScanSession.stats
+_COUNTERS = {
+    "text": ("read_hits", "reads"),
+    "glob": ("walk_hits", "walks"),
+    "rglob": ("walk_hits", "walks"),
+}
+
+
+class ScanSession(ReadThroughFileSystem):
+    """Memoizing view over a FileSystemAdapter for one run.
+
+    Attributes:
+        fs: Underlying adapter
+        stats: Counters of underlying reads and cache hits
+    """
+
+    def __init__(self, fs: FileSystemAdapter | None = None) -> None:
+        """Initialize an empty session.
+
+        Args:
+            fs: Adapter to read from (default: RealFileSystem)
+        """
+        super().__init__(fs)
+        self.stats = {"reads": 0, "read_hits": 0, "walks": 0, "walk_hits": 0}
+        self._entries: dict[CacheKey, Any] = {}
+
+    def _get(self, key: CacheKey) -> tuple[bool, Any]:
+        """Return (True, value) if ``key`` is cached, else (False, None)."""
+        if key in self._entries:
+            return True, self._entries[key]
+        return False, None
+
+    def _put(self, key: CacheKey, value: Any) -> bool:
+        """Keep ``value`` for the rest of the session."""
+        self._entries[key] = value
+        return True
+
+    def _discard(self, key: CacheKey) -> bool:
+        """Drop one entry (caller holds the lock)."""
+        if key not in self._entries:
+            return False
+        del self._entries[key]
+        self._unindex(key)
+        return True
+
+    def _count(self, key: CacheKey, hit: bool) -> None:
+        """Count text reads and walks (probes and memo lookups are not)."""
+        counters = _COUNTERS.get(key[0])
+        if counters is not None:
+            self.stats[counters[0] if hit else counters[1]] += 1
+
+    def memo(self, scope: str | Path, name: Hashable, factory: Callable[[], T]) -> T:
+        """Compute a derived result once per session (e.g. a parsed file).
+
+        Args:
+            scope: File or directory the result is derived from; a write to
+                it (or below it) drops the result
+            name: Identity of the result within the scope
+            factory: Called on the first request only
+
+        Returns:
+            The memoized result
+        """
+        key = ("memo", Path(scope), name)
+        found, cached = self._lookup(key)
+        if found:
+            result: T = cached
+            return result
+        stored: T = self._store(key, factory(), cached)
+        return stored
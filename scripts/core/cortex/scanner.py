@@ -176,10 +176,10 @@ class CodeLinkScanner:
             full_path = self.workspace_root / relative_path
 
             # Check if file exists and is a file (not directory)
-            if not full_path.exists():
+            if not self.fs.exists(full_path):
                 errors.append(f"Python file not found: {relative_path}")
                 logger.warning("Missing Python file: %s", full_path)
-            elif not full_path.is_file():
+            elif not self.fs.is_file(full_path):
                 errors.append(f"Path is not a file: {relative_path}")
                 logger.warning("Path is not a file: %s", full_path)
             elif not (
@@ -226,10 +226,10 @@ class CodeLinkScanner:
             full_path = self.workspace_root / relative_path
 
             # Check if file exists and is a file (not directory)
-            if not full_path.exists():
+            if not self.fs.exists(full_path):
                 errors.append(f"Documentation file not found: {relative_path}")
                 logger.warning("Missing doc file: %s", full_path)
-            elif not full_path.is_file():
+            elif not self.fs.is_file(full_path):
                 errors.append(f"Path is not a file: {relative_path}")
                 logger.warning("Path is not a file: %s", full_path)
             elif not relative_path.endswith((".md", ".markdown")):
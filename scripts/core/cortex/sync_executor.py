@@ -8,6 +8,8 @@ Following the Pipeline Pattern and Single Responsibility Principle:
 - Validates entry prerequisites (file_path)
 - Manages dry-run mode
 - Captures and wraps exceptions into ERROR results
+- Optionally fetches sources concurrently (bounded thread pool with a
+  per-host concurrency limit) while applying merges serially, in input order
 
 This extraction reduces the complexity of KnowledgeOrchestrator and makes
 sync execution logic testable in isolation.
@@ -18,16 +20,94 @@ License: MIT
 
 from __future__ import annotations
 
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
+    import requests
+
     from scripts.core.cortex.models import KnowledgeEntry
 
-from scripts.core.cortex.knowledge_sync import KnowledgeSyncer, SyncResult, SyncStatus
+from scripts.core.cortex.knowledge_sync import (
+    FetchedSource,
+    HttpClient,
+    KnowledgeSyncer,
+    SyncResult,
+    SyncStatus,
+)
 from scripts.utils.logger import setup_logging
 
 logger = setup_logging(__name__)
 
+# Concurrency defaults for network fetches (merges are always serial)
+DEFAULT_SYNC_WORKERS = 8
+DEFAULT_MAX_PER_HOST = 4
+
+
+class HostThrottledClient:
+    """HttpClient decorator limiting concurrent requests per host.
+
+    Wraps the syncer's client so that no more than ``max_per_host`` requests
+    are in flight against the same ``scheme://host:port`` at any time, even
+    when the thread pool has more workers than that.
+
+    Attributes:
+        inner: Wrapped HTTP client (usually the syncer's pooled client)
+        max_per_host: Maximum concurrent requests per host
+    """
+
+    def __init__(self, inner: HttpClient, max_per_host: int) -> None:
+        """Initialize the throttled client.
+
+        Args:
+            inner: HTTP client performing the actual requests
+            max_per_host: Maximum concurrent requests per host (>= 1)
+
+        Raises:
+            ValueError: If max_per_host is lower than 1
+        """
+        if max_per_host < 1:
+            raise ValueError("max_per_host must be >= 1")
+
+        self.inner = inner
+        self.max_per_host = max_per_host
+        self._semaphores: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _semaphore_for(self, url: str) -> threading.BoundedSemaphore:
+        """Return the semaphore guarding the host of ``url``."""
+        parts = urlsplit(url)
+        host_key = f"{parts.scheme}://{parts.netloc}".lower()
+        with self._lock:
+            semaphore = self._semaphores.get(host_key)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.max_per_host)
+                self._semaphores[host_key] = semaphore
+            return semaphore
+
+    def get(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        timeout: int = 10,
+    ) -> requests.Response:
+        """Perform HTTP GET through the inner client, throttled per host.
+
+        Args:
+            url: URL to fetch
+            headers: Optional HTTP headers
+            timeout: Request timeout in seconds
+
+        Returns:
+            HTTP response object
+        """
+        with self._semaphore_for(url):
+            return self.inner.get(url, headers=headers, timeout=timeout)
+
 
 class SyncExecutor:
     """Pipeline pattern executor for batch knowledge entry synchronization.
@@ -39,9 +119,17 @@ class SyncExecutor:
     Extracted from KnowledgeOrchestrator.sync_multiple to reduce complexity
     and improve testability.
 
+    With ``max_workers > 1`` the network phase (KnowledgeSyncer.fetch_entry)
+    runs in a bounded thread pool, throttled per host, while the filesystem
+    phase (KnowledgeSyncer.apply_fetched) is applied on the calling thread in
+    input order. Results are therefore deterministic and keep the same
+    ordering contract as the sequential mode.
+
     Attributes:
         syncer: KnowledgeSyncer instance for performing actual sync operations
         dry_run: If True, simulates sync without I/O (returns NOT_MODIFIED)
+        max_workers: Concurrent fetches (1 = sequential, the default)
+        max_per_host: Concurrent fetches allowed against a single host
 
     Example:
         >>> syncer = KnowledgeSyncer()
@@ -50,25 +138,42 @@ class SyncExecutor:
         >>> print(f"Synced {len(results)} entries")
     """
 
-    def __init__(self, syncer: KnowledgeSyncer, dry_run: bool = False) -> None:
+    def __init__(
+        self,
+        syncer: KnowledgeSyncer,
+        dry_run: bool = False,
+        max_workers: int = 1,
+        max_per_host: int = DEFAULT_MAX_PER_HOST,
+    ) -> None:
         """Initialize the SyncExecutor.
 
         Args:
             syncer: KnowledgeSyncer instance for sync operations
             dry_run: If True, simulates sync without actual I/O
+            max_workers: Maximum concurrent fetches (1 = sequential)
+            max_per_host: Maximum concurrent fetches per host
 
         Raises:
             TypeError: If syncer is None or not a KnowledgeSyncer instance
+            ValueError: If max_workers or max_per_host is lower than 1
         """
         if syncer is None:
             raise TypeError("syncer cannot be None")
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        if max_per_host < 1:
+            raise ValueError("max_per_host must be >= 1")
 
         self.syncer = syncer
         self.dry_run = dry_run
+        self.max_workers = max_workers
+        self.max_per_host = max_per_host
 
         logger.debug(
-            "SyncExecutor initialized (dry_run=%s)",
+            "SyncExecutor initialized (dry_run=%s, max_workers=%d, max_per_host=%d)",
             dry_run,
+            max_workers,
+            max_per_host,
         )
 
     def execute_batch(
@@ -101,17 +206,17 @@ class SyncExecutor:
             logger.debug("execute_batch called with empty list")
             return []
 
-        results: list[SyncResult] = []
-
         logger.info(
-            "Executing batch sync for %d entries (dry_run=%s)",
+            "Executing batch sync for %d entries (dry_run=%s, workers=%d)",
             len(entries),
             self.dry_run,
+            self.max_workers,
         )
 
-        for entry in entries:
-            result = self._sync_single_entry(entry)
-            results.append(result)
+        if self.max_workers > 1 and not self.dry_run and len(entries) > 1:
+            results = self._execute_concurrent(entries)
+        else:
+            results = [self._sync_single_entry(entry) for entry in entries]
 
         logger.debug(
             "Batch sync complete: %d results",
@@ -120,6 +225,92 @@ class SyncExecutor:
 
         return results
 
+    def _execute_concurrent(self, entries: list[KnowledgeEntry]) -> list[SyncResult]:
+        """Fetch entries in a thread pool and apply them serially, in order.
+
+        Fetches are submitted for every valid entry up front; the calling
+        thread then walks the futures in input order and applies each one as
+        soon as it is ready, so merging overlaps with the remaining fetches
+        but file writes never run concurrently.
+
+        Args:
+            entries: Entries to synchronize (dry_run is False here)
+
+        Returns:
+            List of SyncResult objects, one per entry (same order)
+        """
+        client = HostThrottledClient(self.syncer.http_client, self.max_per_host)
+        workers = min(self.max_workers, len(entries))
+
+        with ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="cortex-sync",
+        ) as pool:
+            futures: list[Future[list[FetchedSource]] | None] = [
+                pool.submit(self.syncer.fetch_entry, entry, client)
+                if entry.file_path and entry.sources
+                else None
+                for entry in entries
+            ]
+
+            results: list[SyncResult] = []
+            for entry, future in zip(entries, futures, strict=True):
+                if future is None or entry.file_path is None:
+                    # Missing file_path / no sources: same path as sequential
+                    results.append(self._sync_single_entry(entry))
+                    continue
+                results.append(self._apply_future(entry, entry.file_path, future))
+
+        return results
+
+    def _apply_future(
+        self,
+        entry: KnowledgeEntry,
+        file_path: Path,
+        future: Future[list[FetchedSource]],
+    ) -> SyncResult:
+        """Wait for an entry's fetch and merge it, converting errors to results.
+
+        Args:
+            entry: Entry whose sources were fetched
+            file_path: Local file the fetched content is merged into
+            future: Pending fetch_entry result
+
+        Returns:
+            SyncResult for the entry
+        """
+        try:
+            fetched = future.result()
+            sync_result = self.syncer.apply_fetched(entry, file_path, fetched)
+        except Exception as e:
+            logger.error(
+                "Exception syncing entry %s: %s",
+                entry.id,
+                str(e),
+                exc_info=True,
+            )
+            return SyncResult(
+                entry=entry,
+                status=SyncStatus.ERROR,
+                error_message=str(e),
+            )
+
+        self._log_result(entry, sync_result)
+        return sync_result
+
+    def _log_result(self, entry: KnowledgeEntry, sync_result: SyncResult) -> None:
+        """Log the outcome of a single entry sync."""
+        if sync_result.status == SyncStatus.UPDATED:
+            logger.info("Entry %s synchronized successfully", entry.id)
+        elif sync_result.status == SyncStatus.NOT_MODIFIED:
+            logger.debug("Entry %s: no changes (304)", entry.id)
+        else:
+            logger.error(
+                "Entry %s sync failed: %s",
+                entry.id,
+                sync_result.error_message,
+            )
+
     def _sync_single_entry(self, entry: KnowledgeEntry) -> SyncResult:
         """Synchronize a single knowledge entry with error handling.
 
@@ -159,18 +350,7 @@ class SyncExecutor:
             )
 
             sync_result = self.syncer.sync_entry(entry, entry.file_path)
-
-            if sync_result.status == SyncStatus.UPDATED:
-                logger.info("Entry %s synchronized successfully", entry.id)
-            elif sync_result.status == SyncStatus.NOT_MODIFIED:
-                logger.debug("Entry %s: no changes (304)", entry.id)
-            else:
-                logger.error(
-                    "Entry %s sync failed: %s",
-                    entry.id,
-                    sync_result.error_message,
-                )
-
+            self._log_result(entry, sync_result)
             return sync_result
 
         except Exception as e:
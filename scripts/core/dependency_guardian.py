@@ -13,6 +13,7 @@ Protocol v2.3 (Enhanced):
 3. Validate seal on every critical operation (pre-push, CI) - v2.2
 4. Deep consistency check: pip-compile in memory + byte comparison - v2.3 NEW
 5. Atomic write with file locking to prevent editor corruption - v2.3 NEW
+6. Resolution cache: reuse pip-compile output while its inputs are unchanged
 
 Security Model:
 - Hash is comment-agnostic (robust against documentation changes)
@@ -49,6 +50,19 @@ import sys
 import tempfile
 from pathlib import Path
 
+from scripts.core.resolution_cache import (
+    COMPILE_FLAGS,
+    DEFAULT_CACHE_DIR,
+    ResolutionCache,
+    probe_interpreter,
+)
+
+PIPTOOLS_NOT_READY = (
+    "❌ Environment Not Ready: pip-tools not found.\n"
+    "   Install with: pip install pip-tools\n"
+    "   Or use: make install-dev"
+)
+
 
 class DependencyGuardian:
     """Cryptographic guardian for dependency integrity.
@@ -58,18 +72,26 @@ class DependencyGuardian:
 
     Attributes:
         requirements_dir: Path to directory containing .in/.txt files
+        cache: Resolution cache reused by deep consistency checks
     """
 
     SEAL_MARKER = "# INTEGRITY_SEAL:"
     SEAL_PATTERN = re.compile(r"^# INTEGRITY_SEAL:\s+([0-9a-f]{64})\s*$")
 
-    def __init__(self, requirements_dir: Path) -> None:
+    def __init__(
+        self,
+        requirements_dir: Path,
+        cache: ResolutionCache | None = None,
+    ) -> None:
         """Initialize the guardian with requirements directory.
 
         Args:
             requirements_dir: Path to directory containing requirements files
+            cache: Optional pip-compile resolution cache for deep checks
+                (None compiles on every call)
         """
         self.requirements_dir = Path(requirements_dir)
+        self.cache = cache
 
     def compute_input_hash(self, req_name: str) -> str:
         """Compute SHA-256 hash of .in file content (comment-agnostic).
@@ -376,6 +398,7 @@ class DependencyGuardian:
         self,
         req_name: str,
         python_exec: str | None = None,
+        refresh: bool = False,
     ) -> tuple[bool, str]:
         """Validate lockfile against in-memory pip-compile (deep check).
 
@@ -392,6 +415,8 @@ class DependencyGuardian:
         Args:
             req_name: Requirements file name (e.g., 'dev')
             python_exec: Path to Python interpreter (uses sys.executable if None)
+            refresh: Ignore a cached resolution and recompile (only relevant
+                when the guardian has a ``cache``)
 
         Returns:
             tuple[bool, str]: (is_valid, diff_report)
@@ -422,20 +447,51 @@ class DependencyGuardian:
         # RESILIÊNCIA v2.4.1: Validar python_exec e fallback se inválido
         python_exec = self._validate_python_executable(python_exec)
 
-        # RESILIÊNCIA: Verificar se piptools está disponível
-        check_piptools = subprocess.run(
-            [python_exec, "-m", "pip", "show", "pip-tools"],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        if check_piptools.returncode != 0:
-            return False, (
-                "❌ Environment Not Ready: pip-tools not found.\n"
-                "   Install with: pip install pip-tools\n"
-                "   Or use: make install-dev"
+        if self.cache is None:
+            # RESILIÊNCIA: Verificar se piptools está disponível
+            check_piptools = subprocess.run(
+                [python_exec, "-m", "pip", "show", "pip-tools"],
+                capture_output=True,
+                text=True,
+                check=False,
             )
+            if check_piptools.returncode != 0:
+                return False, PIPTOOLS_NOT_READY
+            return self._compile_and_compare(in_file, txt_file, python_exec)
+
+        # Cache: a single interpreter probe replaces `pip show`
+        interpreter = probe_interpreter(python_exec)
+        if interpreter is None or interpreter.piptools_version is None:
+            return False, PIPTOOLS_NOT_READY
+
+        cache_key = self.cache.key(
+            in_file,
+            self.compute_input_hash(req_name),
+            interpreter,
+        )
+        cached = None if refresh else self.cache.lookup(cache_key)
+        if cached is not None:
+            return self._compare_compiled(txt_file, cached)
+        return self._compile_and_compare(in_file, txt_file, python_exec, cache_key)
+
+    def _compile_and_compare(
+        self,
+        in_file: Path,
+        txt_file: Path,
+        python_exec: str,
+        cache_key: str | None = None,
+    ) -> tuple[bool, str]:
+        """Run pip-compile into a temporary file and compare with the lockfile.
+
+        Args:
+            in_file: Requirements input file
+            txt_file: Lockfile under validation
+            python_exec: Python interpreter running pip-compile
+            cache_key: Resolution cache key to store the output under
 
+        Returns:
+            tuple[bool, str]: (is_valid, diff_report)
+        """
         # Compile in memory to temporary file
         with tempfile.NamedTemporaryFile(
             mode="w+",
@@ -455,10 +511,7 @@ class DependencyGuardian:
                     str(in_file),
                     "--output-file",
                     str(tmp_path),
-                    "--resolver=backtracking",
-                    "--strip-extras",
-                    "--allow-unsafe",
-                    "--quiet",
+                    *COMPILE_FLAGS,
                 ],
                 capture_output=True,
                 text=True,
@@ -468,18 +521,32 @@ class DependencyGuardian:
             if result.returncode != 0:
                 return False, f"pip-compile failed: {result.stderr}"
 
-            # Compare content (comment-agnostic, like verify_deps.py)
-            is_match, diff_lines = self._compare_content_deep(txt_file, tmp_path)
+            if self.cache is not None and cache_key is not None:
+                self.cache.store(cache_key, tmp_path)
 
-            if is_match:
-                return True, ""
-            diff_report = self._format_diff_report(diff_lines, txt_file, tmp_path)
-            return False, diff_report
+            return self._compare_compiled(txt_file, tmp_path)
 
         finally:
             if tmp_path.exists():
                 tmp_path.unlink()
 
+    def _compare_compiled(self, txt_file: Path, compiled: Path) -> tuple[bool, str]:
+        """Compare the lockfile with a pip-compile output.
+
+        Args:
+            txt_file: Lockfile under validation
+            compiled: Fresh or cached pip-compile output
+
+        Returns:
+            tuple[bool, str]: (is_valid, diff_report)
+        """
+        # Compare content (comment-agnostic, like verify_deps.py)
+        is_match, diff_lines = self._compare_content_deep(txt_file, compiled)
+
+        if is_match:
+            return True, ""
+        return False, self._format_diff_report(diff_lines, txt_file, compiled)
+
     def _read_non_comment_lines(self, file_path: Path) -> list[str]:
         """Extract non-comment, non-blank lines from a lockfile.
 
@@ -659,6 +726,9 @@ Examples:
   # Deep consistency check (pip-compile in-memory - v2.3)
   python -m scripts.core.dependency_guardian validate-deep dev
 
+  # Ignore the cached resolution (e.g. to pick up a PyPI release now)
+  python -m scripts.core.dependency_guardian validate-deep dev --refresh
+
 Exit Codes:
   0 - Success / Validation passed
   1 - Failure / Validation failed
@@ -685,10 +755,22 @@ Exit Codes:
         type=str,
         help="Path to Python interpreter for pip-compile (default: sys.executable)",
     )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Recompile even if a cached resolution exists (validate-deep)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the pip-compile resolution cache",
+    )
 
     args = parser.parse_args()
 
-    guardian = DependencyGuardian(args.requirements_dir)
+    cache_dir = args.requirements_dir.parent / DEFAULT_CACHE_DIR
+    cache = None if args.no_cache else ResolutionCache(cache_dir)
+    guardian = DependencyGuardian(args.requirements_dir, cache=cache)
 
     try:
         if args.action == "compute":
@@ -719,6 +801,7 @@ Exit Codes:
             is_valid, diff_report = guardian.validate_deep_consistency(
                 args.req_name,
                 python_exec=args.python_exec,
+                refresh=args.refresh,
             )
 
             if is_valid:
@@ -2,18 +2,22 @@
 """Automatic CLI Documentation Generator.
 
 This script automatically generates comprehensive Markdown documentation
-from Typer CLI applications. It uses introspection to extract commands,
-arguments, options, and docstrings without manual maintenance.
+from Typer CLI applications. It reads commands, arguments, options, and
+docstrings straight from the CLI sources (see ``scripts.core.cli_introspect``)
+without manual maintenance.
 
 Features:
 - Auto-discovery of all CLI commands
+- Static extraction: CLI modules are parsed, never imported or executed
+- Per-source-hash cache of the extracted metadata (.cache/cli-docs/)
 - Idempotent operation (no file changes if docs unchanged)
 - Automatic Table of Contents generation
 - Type-safe parameter extraction
-- Support for subcommands and nested command groups
 
 Usage:
     python scripts/core/doc_gen.py
+    python scripts/core/doc_gen.py --live      # import modules and introspect
+    python scripts/core/doc_gen.py --no-cache  # re-parse every CLI module
 
 Integration:
     Designed to run automatically via pre-commit hook when CLI files change.
@@ -25,6 +29,7 @@ Version: 1.1.0
 
 from __future__ import annotations
 
+import argparse
 import hashlib
 import inspect
 import os
@@ -34,36 +39,58 @@ from collections.abc import Callable
 from datetime import datetime, timezone
 from pathlib import Path
 from types import ModuleType
-from typing import Any, cast
-
-import click
+from typing import TYPE_CHECKING, Any
 
 # Add project root to sys.path
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-import typer  # noqa: E402
-
+from scripts.core.cli_introspect import (  # noqa: E402
+    CACHE_DIR,
+    CLICommandInfo,
+    CLIModuleInfo,
+    IntrospectionCache,
+    StaticCLIExtractor,
+    format_default,
+)
 from scripts.utils.logger import setup_logging  # noqa: E402
 
+if TYPE_CHECKING:
+    import typer
+
 logger = setup_logging(__name__, log_file="doc_gen.log")
 
+#: Default cache of statically extracted CLI metadata
+DEFAULT_CACHE_PATH = PROJECT_ROOT / CACHE_DIR / "introspection.json"
+
 
 class CLIDocGenerator:
     """Generator for CLI documentation from Typer applications.
 
-    Introspects Typer apps to extract commands, parameters, and metadata,
-    then generates well-formatted Markdown documentation.
+    Extracts commands, parameters, and metadata from the CLI sources (or,
+    with ``static=False``, from the imported Typer apps), then generates
+    well-formatted Markdown documentation.
     """
 
-    def __init__(self, output_path: Path) -> None:
+    def __init__(
+        self,
+        output_path: Path,
+        *,
+        static: bool = True,
+        cache_path: Path | None = DEFAULT_CACHE_PATH,
+    ) -> None:
         """Initialize documentation generator.
 
         Args:
             output_path: Path where CLI_COMMANDS.md will be written
+            static: Parse CLI sources instead of importing the modules
+            cache_path: Cache of static extraction results (None disables it)
         """
         self.output_path = output_path
+        self.static = static
+        self.extractor = StaticCLIExtractor(PROJECT_ROOT)
+        self.cache = IntrospectionCache(cache_path) if static and cache_path else None
         self.cli_modules = [
             ("cortex", "scripts.cli.cortex"),
             ("audit", "scripts.cli.audit"),
@@ -96,24 +123,17 @@ class CLIDocGenerator:
         # Process each CLI module
         for cli_name, module_path in self.cli_modules:
             try:
-                module = self._import_module(module_path)
+                info = self._module_info(module_path)
 
                 # Check if it's a Typer app or simple main() function
-                if hasattr(module, "app") and isinstance(module.app, typer.Typer):
+                if info is not None and info.commands is not None:
                     # Typer app with commands
-                    cli_section, toc_items = self._process_typer_app(
-                        cli_name,
-                        module.app,
-                        module,
-                    )
+                    cli_section, toc_items = self._process_typer_app(cli_name, info)
                     toc_entries.extend(toc_items)
                     command_sections.append(cli_section)
-                elif hasattr(module, "main"):
+                elif info is not None and info.main_signature is not None:
                     # Simple CLI with main() function
-                    cli_section, toc_item = self._process_simple_cli(
-                        cli_name,
-                        module,
-                    )
+                    cli_section, toc_item = self._process_simple_cli(cli_name, info)
                     toc_entries.append(toc_item)
                     command_sections.append(cli_section)
                 else:
@@ -123,6 +143,9 @@ class CLIDocGenerator:
                 logger.error(f"Failed to process {cli_name}: {e}", exc_info=True)
                 continue
 
+        if self.cache is not None:
+            self.cache.save()
+
         # Assemble final document
         sections.append(self._generate_toc(toc_entries))
         sections.extend(command_sections)
@@ -232,6 +255,52 @@ python scripts/core/doc_gen.py
 **Última Atualização:** {generation_date}
 **Gerado por:** `scripts/core/doc_gen.py` v1.1.0"""
 
+    def _module_info(self, module_path: str) -> CLIModuleInfo | None:
+        """Describe a CLI module, statically (cached) or by importing it.
+
+        Args:
+            module_path: Dotted module path (e.g., 'scripts.cli.audit')
+
+        Returns:
+            CLIModuleInfo, or None if the module has no app nor main()
+        """
+        if not self.static:
+            return self._live_module_info(self._import_module(module_path))
+
+        if self.cache is not None:
+            cached = self.cache.get(module_path, PROJECT_ROOT)
+            if cached is not None:
+                return cached
+
+        info = self.extractor.extract(module_path)
+        if self.cache is not None:
+            self.cache.put(module_path, PROJECT_ROOT, info, self.extractor.sources)
+        return info
+
+    def _live_module_info(self, module: ModuleType) -> CLIModuleInfo | None:
+        """Describe an imported CLI module.
+
+        Args:
+            module: Imported CLI module
+
+        Returns:
+            CLIModuleInfo, or None if the module has no app nor main()
+        """
+        import typer
+
+        if hasattr(module, "app") and isinstance(module.app, typer.Typer):
+            return CLIModuleInfo(
+                doc=module.__doc__,
+                commands=self._extract_commands(module.app),
+            )
+        if hasattr(module, "main"):
+            return CLIModuleInfo(
+                doc=module.__doc__,
+                main_signature=str(inspect.signature(module.main)),
+                main_doc=module.main.__doc__,
+            )
+        return None
+
     def _import_module(self, module_path: str) -> ModuleType:
         """Dynamically import a module by path.
 
@@ -248,18 +317,14 @@ python scripts/core/doc_gen.py
     def _process_typer_app(
         self,
         cli_name: str,
-        app: typer.Typer,
-        module: ModuleType,
-        parent_path: str = "",
+        info: CLIModuleInfo,
         level: int = 2,
     ) -> tuple[str, list[tuple[str, str]]]:
-        """Process a Typer application and extract commands recursively.
+        """Process a Typer application and its commands.
 
         Args:
             cli_name: Name of the CLI (e.g., 'cortex')
-            app: Typer application instance
-            module: Module containing the app
-            parent_path: Full command path for nested commands
+            info: Module description with the app's commands
             level: Heading level for Markdown (2=##, 3=###, 4=####)
 
         Returns:
@@ -271,67 +336,45 @@ python scripts/core/doc_gen.py
         # CLI Header
         cli_anchor = cli_name.replace("-", "")
         heading = "#" * level
-        sections.append(f"{heading} `{cli_name}` - {self._get_cli_description(module)}")
+        sections.append(
+            f"{heading} `{cli_name}` - {self._get_cli_description(info.doc)}",
+        )
         toc_entries.append((cli_name, cli_anchor))
 
         # Module docstring
-        if module.__doc__:
-            desc = module.__doc__.split("Usage:")[0].strip()
+        if info.doc:
+            desc = info.doc.split("Usage:")[0].strip()
             sections.append(f"**Descrição:** {desc}")
 
-        # Extract commands from Typer app
-        commands = self._extract_commands(app)
-
-        if not commands:
+        if not info.commands:
             sections.append("*Nenhum comando encontrado via introspecção.*")
             return "\n\n".join(sections), toc_entries
 
-        # Process each command (with recursive subcommand support)
-        for cmd_name, cmd_info in sorted(commands.items()):
-            full_path = f"{parent_path} {cmd_name}".strip() if parent_path else cmd_name
-
+        for cmd_name, cmd_info in sorted(info.commands.items()):
             # Add edge to Mermaid graph
-            parent_for_mermaid = parent_path.split()[-1] if parent_path else cli_name
-            self.mermaid_edges.append((parent_for_mermaid, cmd_name))
-
-            # Check if this command is actually a Typer group (nested subcommands)
-            is_subgroup = isinstance(cmd_info.get("callback"), typer.Typer)
-
-            if is_subgroup:
-                # Recursively process subcommands
-                sub_app = cmd_info["callback"]
-                sub_section, sub_toc = self._process_typer_app(
-                    cmd_name,
-                    sub_app,
-                    module,
-                    parent_path=full_path,
-                    level=level + 1,
-                )
-                sections.append(sub_section)
-                toc_entries.extend(sub_toc)
-            else:
-                # Regular command - process normally
-                cmd_section, cmd_anchor = self._process_command(
-                    cli_name,
-                    cmd_name,
-                    cmd_info,
-                    level=level + 1,
-                )
-                sections.append(cmd_section)
-                toc_entries.append((f"{cli_name} - {cmd_name}", cmd_anchor))
+            self.mermaid_edges.append((cli_name, cmd_name))
+
+            cmd_section, cmd_anchor = self._process_command(
+                cli_name,
+                cmd_name,
+                cmd_info,
+                level=level + 1,
+            )
+            sections.append(cmd_section)
+            toc_entries.append((f"{cli_name} - {cmd_name}", cmd_anchor))
 
         return "\n\n".join(sections), toc_entries
 
     def _process_simple_cli(
         self,
         cli_name: str,
-        module: ModuleType,
+        info: CLIModuleInfo,
     ) -> tuple[str, tuple[str, str]]:
         """Process a simple CLI with main() function.
 
         Args:
             cli_name: Name of the CLI
-            module: Module containing main()
+            info: Module description with the main() signature
 
         Returns:
             Tuple of (markdown_section, toc_entry)
@@ -340,25 +383,24 @@ python scripts/core/doc_gen.py
         cli_anchor = cli_name.replace("-", "")
 
         # CLI Header
-        sections.append(f"## `{cli_name}` - {self._get_cli_description(module)}")
+        sections.append(f"## `{cli_name}` - {self._get_cli_description(info.doc)}")
 
         # Module docstring
-        if module.__doc__:
-            desc = module.__doc__.split("Usage:")[0].strip()
+        if info.doc:
+            desc = info.doc.split("Usage:")[0].strip()
             sections.append(f"**Descrição:** {desc}")
 
         # main() function signature
-        if hasattr(module, "main"):
-            main_func = module.main
+        if info.main_signature is not None:
             sections.append("### Função Principal")
-            sections.append(f"```python\n{inspect.signature(main_func)}\n```")
+            sections.append(f"```python\n{info.main_signature}\n```")
 
-            if main_func.__doc__:
-                sections.append(f"**Documentação:**\n\n{main_func.__doc__}")
+            if info.main_doc:
+                sections.append(f"**Documentação:**\n\n{info.main_doc}")
 
         return "\n\n".join(sections), (cli_name, cli_anchor)
 
-    def _extract_commands(self, app: typer.Typer) -> dict[str, dict[str, Any]]:
+    def _extract_commands(self, app: typer.Typer) -> dict[str, CLICommandInfo]:
         """Extract commands from Typer app using introspection.
 
         Args:
@@ -367,7 +409,7 @@ python scripts/core/doc_gen.py
         Returns:
             Dictionary mapping command names to their metadata
         """
-        commands: dict[str, dict[str, Any]] = {}
+        commands: dict[str, CLICommandInfo] = {}
 
         # Access Typer's internal registered_commands
         registered_commands = getattr(app, "registered_commands", None)
@@ -389,11 +431,12 @@ python scripts/core/doc_gen.py
                 # Safe extraction of help text
                 help_text = getattr(cmd, "help", None) or ""
 
-                commands[cmd_name] = {
-                    "callback": cmd.callback,
-                    "help": help_text,
-                    "params": self._extract_params(cmd.callback),
-                }
+                commands[cmd_name] = CLICommandInfo(
+                    name=cmd_name,
+                    help=help_text,
+                    doc=cmd.callback.__doc__,
+                    params=self._extract_params(cmd.callback),
+                )
 
         # Fallback: try to access via click conversion
         else:
@@ -404,11 +447,12 @@ python scripts/core/doc_gen.py
                     callback = getattr(cmd_obj, "callback", None)
                     help_text = getattr(cmd_obj, "help", None) or ""
 
-                    commands[cmd_name] = {
-                        "callback": callback,
-                        "help": help_text,
-                        "params": [],
-                    }
+                    commands[cmd_name] = CLICommandInfo(
+                        name=cmd_name,
+                        help=help_text,
+                        doc=getattr(callback, "__doc__", None),
+                        params=[],
+                    )
 
         return commands
 
@@ -497,6 +541,8 @@ python scripts/core/doc_gen.py
         Returns:
             Dictionary mapping parameter names to their Click metadata
         """
+        import click
+
         click_params: dict[str, dict[str, Any]] = {}
 
         # Check if function has __click_params__ attribute (from Typer/Click decorators)
@@ -519,7 +565,7 @@ python scripts/core/doc_gen.py
         self,
         cli_name: str,
         cmd_name: str,
-        cmd_info: dict[str, Any],
+        cmd_info: CLICommandInfo,
         level: int = 3,
     ) -> tuple[str, str]:
         """Process individual command and generate documentation.
@@ -541,25 +587,21 @@ python scripts/core/doc_gen.py
         sections.append(f"{heading} `{cli_name} {cmd_name}`")
 
         # Help text
-        help_text = cmd_info.get("help", "")
-        if help_text:
-            sections.append(f"**Descrição:** {help_text}")
-
-        # Docstring from callback with guard
-        callback = cmd_info.get("callback")
-        if callback is not None:
-            callback_doc = getattr(callback, "__doc__", None)
-            if callback_doc:
-                docstring = inspect.cleandoc(callback_doc)
-                sections.append(f"\n{docstring}\n")
+        if cmd_info.help:
+            sections.append(f"**Descrição:** {cmd_info.help}")
+
+        # Docstring from callback
+        if cmd_info.doc:
+            docstring = inspect.cleandoc(cmd_info.doc)
+            sections.append(f"\n{docstring}\n")
 
         # Parameters table with enhanced columns
-        if cmd_info["params"]:
+        if cmd_info.params:
             sections.append("**Parâmetros:**\n")
             sections.append("| Nome | Tipo | Obrigatório | Default | Descrição |")
             sections.append("|:-----|:-----|:------------|:--------|:----------|")
 
-            for param in cmd_info["params"]:
+            for param in cmd_info.params:
                 required = "✅ Sim" if param["required"] else "❌ Não"
                 help_text = param.get("help", "-")
                 sections.append(
@@ -568,7 +610,7 @@ python scripts/core/doc_gen.py
                 )
 
         # Usage example
-        param_names = [p["name"] for p in cmd_info["params"] if p["required"]]
+        param_names = [p["name"] for p in cmd_info.params if p["required"]]
         if param_names:
             example_args = " ".join(f"<{name}>" for name in param_names)
             example = f"{cli_name} {cmd_name} {example_args}"
@@ -578,24 +620,21 @@ python scripts/core/doc_gen.py
 
         return "\n\n".join(sections), anchor
 
-    def _get_cli_description(self, module: ModuleType) -> str:
+    def _get_cli_description(self, module_doc: str | None) -> str:
         """Extract CLI description from module docstring.
 
         Args:
-            module: CLI module
+            module_doc: CLI module docstring
 
         Returns:
             Short description string
         """
         # Guard against None docstring
-        module_doc = getattr(module, "__doc__", None)
-        if not module_doc or not isinstance(module_doc, str):
+        if not module_doc:
             return "CLI Tool"
 
-        # Cast to str after isinstance check to satisfy mypy strict mode
-        doc_str = cast("str", module_doc)
         # Get first line of docstring
-        first_line = doc_str.strip().split("\n")[0]
+        first_line = module_doc.strip().split("\n")[0]
         return first_line.strip("# ").strip()
 
     def _format_type(self, annotation: Any) -> str:
@@ -630,27 +669,7 @@ python scripts/core/doc_gen.py
         Returns:
             Formatted default string
         """
-        if default == inspect.Parameter.empty:
-            return "-"
-
-        if default is None:
-            return "None"
-
-        if isinstance(default, str):
-            return f'"{default}"'
-
-        if isinstance(default, bool):
-            return str(default)
-
-        # Handle Typer special types
-        if hasattr(default, "__class__"):
-            default_class = getattr(default, "__class__", None)
-            if default_class is not None:
-                class_name = getattr(default_class, "__name__", "")
-                if "Option" in class_name or "Argument" in class_name:
-                    return "CLI Option"
-
-        return str(default)
+        return format_default(default)
 
     def write_documentation(self, force: bool = False) -> bool:
         """Write documentation to file with idempotency check.
@@ -698,17 +717,37 @@ python scripts/core/doc_gen.py
         return True
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     """Main entry point for documentation generator.
 
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+
     Returns:
         Exit code (0 = success, 1 = failure)
     """
+    parser = argparse.ArgumentParser(description="Generate CLI_COMMANDS.md")
+    parser.add_argument(
+        "--live",
+        action="store_true",
+        help="Import the CLI modules instead of parsing their sources",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore the static extraction cache",
+    )
+    args = parser.parse_args(argv)
+
     try:
         output_path = PROJECT_ROOT / "docs" / "reference" / "CLI_COMMANDS.md"
 
         logger.info("Starting CLI documentation generation...")
-        generator = CLIDocGenerator(output_path)
+        generator = CLIDocGenerator(
+            output_path,
+            static=not args.live,
+            cache_path=None if args.no_cache else DEFAULT_CACHE_PATH,
+        )
 
         was_written = generator.write_documentation()
 
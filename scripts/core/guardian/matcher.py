@@ -12,6 +12,7 @@ import time
 from pathlib import Path
 
 from scripts.core.guardian.models import ConfigFinding
+from scripts.utils.filesystem import FileSystemAdapter, RealFileSystem
 
 logger = logging.getLogger(__name__)
 
@@ -22,16 +23,22 @@ class DocumentationMatcher:
     Um ConfigFinding é considerado órfão se:
     - A chave (nome da variável) não aparece em nenhum documento .md
     - Busca é case-sensitive para evitar falsos positivos
+
+    Cada documento é lido uma única vez (via ``map_bytes``) e descartado
+    em seguida: todas as chaves são procuradas nos bytes UTF-8 e o texto
+    só é decodificado, para a busca com fronteira de palavra, quando ao
+    menos uma chave aparece. A memória fica limitada a um documento.
     """
 
-    def __init__(self, docs_path: Path) -> None:
+    def __init__(self, docs_path: Path, fs: FileSystemAdapter | None = None) -> None:
         """Inicializa o matcher.
 
         Args:
             docs_path: Caminho para o diretório de documentação (docs/)
+            fs: Adaptador de filesystem (padrão: RealFileSystem)
         """
         self.docs_path = docs_path
-        self._doc_content_cache: dict[Path, str] = {}
+        self.fs = fs or RealFileSystem()
 
     def find_orphans(
         self,
@@ -49,14 +56,14 @@ class DocumentationMatcher:
         """
         start_time = time.time()
 
-        # Carrega toda a documentação
-        self._load_documentation()
+        # Uma passada pela documentação para todas as chaves
+        locations = self._scan_documentation({finding.key for finding in findings})
 
         orphans: list[ConfigFinding] = []
         documented: dict[str, list[Path]] = {}
 
         for finding in findings:
-            doc_files = self._find_in_documentation(finding.key)
+            doc_files = locations.get(finding.key)
 
             if not doc_files:
                 # Não encontrado em nenhum documento -> órfão
@@ -70,41 +77,52 @@ class DocumentationMatcher:
 
         return orphans, documented
 
-    def _load_documentation(self) -> None:
-        """Carrega todo o conteúdo de arquivos .md no cache."""
-        if not self.docs_path.exists():
-            return
-
-        for md_file in self.docs_path.rglob("*.md"):
-            try:
-                self._doc_content_cache[md_file] = md_file.read_text(
-                    encoding="utf-8",
-                )
-            except (OSError, UnicodeDecodeError) as e:
-                # Ignora erros de leitura silenciosamente
-                # (pode haver arquivos binários ou corrompidos)
-                logger.warning("Erro ao ler %s: %s", md_file, e)
-
-    def _find_in_documentation(self, key: str) -> list[Path]:
-        """Procura uma chave de configuração na documentação.
+    def _scan_documentation(self, keys: set[str]) -> dict[str, list[Path]]:
+        """Procura as chaves em cada arquivo .md, um documento por vez.
 
         Args:
-            key: Nome da variável (ex: "DB_HOST")
+            keys: Nomes das variáveis (ex: "DB_HOST")
 
         Returns:
-            Lista de arquivos onde a chave foi encontrada
+            Dict mapeando chave -> arquivos onde aparece (só chaves achadas)
         """
-        found_in: list[Path] = []
+        locations: dict[str, list[Path]] = {}
+        if not keys or not self.fs.exists(self.docs_path):
+            return locations
 
         # Busca exata (case-sensitive) para evitar falsos positivos
         # Exemplo: "DB_HOST" não deve casar com "db_hostname"
-        pattern = re.compile(rf"\b{re.escape(key)}\b")
-
-        for doc_file, content in self._doc_content_cache.items():
-            if pattern.search(content):
-                found_in.append(doc_file)
+        searches = [
+            (key, key.encode("utf-8"), re.compile(rf"\b{re.escape(key)}\b"))
+            for key in sorted(keys)
+        ]
 
-        return found_in
+        for md_file in self.fs.rglob(self.docs_path, "*.md"):
+            try:
+                with self.fs.map_bytes(md_file) as data:
+                    # Pré-filtro em bytes: sem a chave literal não há match
+                    hits = [item for item in searches if data.find(item[1]) != -1]
+                    content = self._decode(md_file, data[:]) if hits else None
+            except OSError as e:
+                # Ignora erros de leitura silenciosamente
+                # (pode haver arquivos binários ou corrompidos)
+                logger.warning("Erro ao ler %s: %s", md_file, e)
+                continue
+            if content is None:
+                continue
+            for key, _, pattern in hits:
+                if pattern.search(content):
+                    locations.setdefault(key, []).append(md_file)
+
+        return locations
+
+    def _decode(self, doc_file: Path, data: bytes) -> str | None:
+        """Decodifica um documento como UTF-8 (None se não for UTF-8)."""
+        try:
+            return data.decode("utf-8")
+        except UnicodeDecodeError as e:
+            logger.warning("Erro ao ler %s: %s", doc_file, e)
+            return None
 
     def _log_match_summary(
         self,
@@ -9,11 +9,13 @@ from __future__ import annotations
 import logging
 import subprocess
 import time
+from collections.abc import Sequence
 from pathlib import Path
 from subprocess import TimeoutExpired
 
 from scripts.core.mock_ci.config import format_commit_message
 from scripts.core.mock_ci.models import GitInfo
+from scripts.utils.git_state import GitStateProbe
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +33,7 @@ class GitOperations:
 
     Attributes:
         workspace_root: Diretório raiz do workspace/repositório
+        state_probe: Snapshot do estado git, coletado uma única vez por execução
 
     """
 
@@ -42,6 +45,15 @@ class GitOperations:
 
         """
         self.workspace_root = workspace_root.resolve()
+        self.state_probe = GitStateProbe(
+            self.workspace_root,
+            runner=self._probe_runner,
+        )
+
+    def _probe_runner(self, command: Sequence[str]) -> str | None:
+        """Executa o comando do GitStateProbe via run_command (timeout/retry)."""
+        success, output = self.run_command(list(command))
+        return output if success else None
 
     # TODO: Refactor God Function - split retry logic and error handling
     def run_command(self, command: list[str]) -> tuple[bool, str]:  # noqa: C901
@@ -170,13 +182,20 @@ class GitOperations:
         )
         return False, ""
 
-    def get_status(self) -> GitInfo:
+    def get_status(self, refresh: bool = False) -> GitInfo:
         """Coleta informações completas do repositório git.
 
         Verifica se o diretório é um repositório git válido e coleta
         informações sobre o estado atual: branch, commit hash, mudanças
         pendentes, etc.
 
+        Tudo vem de uma única chamada ``git status --porcelain=v2 --branch``
+        (via ``state_probe``), reaproveitada nas chamadas seguintes até que
+        ``add_all``/``commit`` alterem o repositório.
+
+        Args:
+            refresh: Se True, ignora o snapshot em cache e consulta o git
+
         Returns:
             GitInfo com todas as informações coletadas. Se não for um
             repositório git, retorna GitInfo com is_git_repo=False.
@@ -189,39 +208,16 @@ class GitOperations:
             ...     print(f"Commit: {info.commit_hash}")
 
         """
-        # Verifica se é repositório git
-        success, _ = self.run_command(["git", "status", "--porcelain"])
-        if not success:
+        state = self.state_probe.get(refresh=refresh)
+        if state is None:
             # Não é um repositório git válido
             return GitInfo()
 
-        # Coleta todas as informações antes de instanciar (GitInfo é imutável)
-        is_git_repo = True
-        has_changes = False
-        current_branch = None
-        commit_hash = None
-
-        # Verifica mudanças pendentes
-        success, output = self.run_command(["git", "status", "--porcelain"])
-        if success:
-            has_changes = bool(output.strip())
-
-        # Branch atual
-        success, branch = self.run_command(["git", "branch", "--show-current"])
-        if success and branch:
-            current_branch = branch
-
-        # Hash do commit atual (8 primeiros caracteres)
-        success, commit = self.run_command(["git", "rev-parse", "HEAD"])
-        if success and commit:
-            commit_hash = commit[:8]
-
-        # Instancia GitInfo uma única vez com todos os valores coletados
         return GitInfo(
-            is_git_repo=is_git_repo,
-            has_changes=has_changes,
-            current_branch=current_branch,
-            commit_hash=commit_hash,
+            is_git_repo=True,
+            has_changes=not state.is_clean,
+            current_branch=state.branch,
+            commit_hash=state.short_head,
         )
 
     def add_all(self) -> bool:
@@ -237,6 +233,7 @@ class GitOperations:
 
         """
         success, _ = self.run_command(["git", "add", "."])
+        self.state_probe.invalidate()
         if not success:
             logger.error("Erro ao adicionar arquivos ao git")
         return success
@@ -266,6 +263,7 @@ class GitOperations:
             command.append("--allow-empty")
 
         success, _ = self.run_command(command)
+        self.state_probe.invalidate()
 
         if success:
             logger.info("Commit criado com sucesso")
@@ -317,5 +315,6 @@ class GitOperations:
             ...     print("Há mudanças pendentes")
 
         """
-        info = self.get_status()
+        # Consulta sempre o estado atual: o chamador pode ter alterado arquivos
+        info = self.get_status(refresh=True)
         return info.is_git_repo and info.has_changes
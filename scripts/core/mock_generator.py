@@ -401,6 +401,11 @@ class TestMockGenerator:
         # Aplica apenas sugestões de alta prioridade por segurança
         high_priority = [s for s in self.suggestions if s["severity"] == "HIGH"]
 
+        # Conteúdo modificado por arquivo, gravado em um único lote atômico
+        pending: dict[Path, str] = {}
+        # Sugestões aplicadas em cada arquivo do lote
+        applied_by_file: dict[Path, int] = {}
+
         for suggestion in high_priority:
             try:
                 file_path = self.workspace_root / suggestion["file"]
@@ -410,8 +415,14 @@ class TestMockGenerator:
                     skipped += 1
                     continue
 
-                if self._apply_single_suggestion(suggestion, file_path, dry_run):
+                if self._apply_single_suggestion(
+                    suggestion,
+                    file_path,
+                    dry_run,
+                    pending=pending,
+                ):
                     applied += 1
+                    applied_by_file[file_path] = applied_by_file.get(file_path, 0) + 1
                 else:
                     skipped += 1
 
@@ -419,6 +430,11 @@ class TestMockGenerator:
                 logger.error(f"Erro ao aplicar sugestão em {suggestion['file']}: {e}")
                 failed += 1
 
+        if pending:
+            lost = self._write_pending(pending, applied_by_file)
+            applied -= lost
+            failed += lost
+
         result = {
             "applied": applied,
             "failed": failed,
@@ -434,11 +450,52 @@ class TestMockGenerator:
 
         return result
 
+    def _write_pending(
+        self,
+        pending: dict[Path, str],
+        applied_by_file: dict[Path, int],
+    ) -> int:
+        """Grava o lote de arquivos modificados.
+
+        O lote não tem journal: uma falha durante as renomeações deixa os
+        arquivos já renomeados com o conteúdo novo. Em caso de erro, cada
+        arquivo é relido para contar como falha apenas o que não foi gravado.
+
+        Args:
+            pending: Conteúdo modificado por arquivo
+            applied_by_file: Sugestões aplicadas em cada arquivo
+
+        Returns:
+            Número de sugestões cujos arquivos não foram gravados
+        """
+        try:
+            self.fs.write_many(pending, encoding="utf-8")
+        except OSError as e:
+            unwritten = [
+                path
+                for path, content in pending.items()
+                if not self._has_content(path, content)
+            ]
+            logger.error(
+                f"Erro ao gravar o lote: {len(unwritten)} de {len(pending)} "
+                f"arquivos não foram gravados: {e}",
+            )
+            return sum(applied_by_file.get(path, 0) for path in unwritten)
+        return 0
+
+    def _has_content(self, path: Path, content: str) -> bool:
+        """Verifica se o arquivo já contém ``content``."""
+        try:
+            return self.fs.read_text(path, encoding="utf-8") == content
+        except OSError:
+            return False
+
     def _apply_single_suggestion(
         self,
         suggestion: dict[str, Any],
         file_path: Path,
         dry_run: bool,
+        pending: dict[Path, str] | None = None,
     ) -> bool:
         """Aplica uma sugestão específica em um arquivo.
 
@@ -446,6 +503,8 @@ class TestMockGenerator:
             suggestion: Dicionário com dados da sugestão
             file_path: Caminho do arquivo
             dry_run: Se True, apenas simula
+            pending: Lote de gravações pendentes; se informado, o conteúdo
+                modificado é acumulado nele em vez de gravado imediatamente
 
         Returns:
             True se aplicada com sucesso
@@ -455,8 +514,12 @@ class TestMockGenerator:
             Usa self.fs para leitura e escrita de arquivos.
         """
         try:
-            # Lê arquivo atual
-            content = self.fs.read_text(file_path, encoding="utf-8")
+            # Lê arquivo atual (ou a versão já modificada no lote)
+            batched = pending.get(file_path) if pending is not None else None
+            if batched is not None:
+                content = batched
+            else:
+                content = self.fs.read_text(file_path, encoding="utf-8")
 
             # Verifica se mock já existe
             if self._has_existing_mock(content, suggestion["pattern"]):
@@ -469,14 +532,18 @@ class TestMockGenerator:
                 logger.info(msg)
                 return True
 
-            # Cria backup
-            self._create_backup(file_path)
+            # Cria backup (apenas do original, antes da primeira modificação)
+            if batched is None:
+                self._create_backup(file_path)
 
             # Aplica modificações
             modified_content = self._inject_mock_code(content, suggestion)
 
-            # Salva arquivo modificado
-            self.fs.write_text(file_path, modified_content, encoding="utf-8")
+            # Salva arquivo modificado (ou acumula no lote)
+            if pending is None:
+                self.fs.write_text(file_path, modified_content, encoding="utf-8")
+            else:
+                pending[file_path] = modified_content
 
             logger.info(f"Mock aplicado: {file_path.name}:{suggestion['function']}")
             return True
@@ -0,0 +1,294 @@
+"""Resolution Cache - Reuse pip-compile output across drift checks.
+
+Deep consistency checks (``DependencyGuardian.validate_deep_consistency``,
+``scripts/ci/verify_deps.check_sync`` and, through it, ``dev-doctor``)
+resolve the ``.in`` file with ``piptools compile`` on every run. Resolution
+only changes when one of its inputs changes, so the compiled lockfile is
+cached under a key built from:
+
+- the normalized ``.in`` hash (``DependencyGuardian.compute_input_hash``)
+  plus the raw content of files included with ``-r``/``-c``
+- the target interpreter (Python version, platform, machine, pip-tools)
+- the pip-compile flags
+- the index configuration (``PIP_*`` index variables and pip config files)
+
+Upstream releases on PyPI do not change any of these inputs, so entries
+expire after ``max_age`` seconds (24h by default). ``refresh`` bypasses
+the cache explicitly.
+
+Usage:
+    from scripts.core.resolution_cache import ResolutionCache, probe_interpreter
+
+    cache = ResolutionCache(project_root / DEFAULT_CACHE_DIR)
+    interpreter = probe_interpreter(sys.executable)
+    key = cache.key(in_file, input_hash, interpreter)
+    compiled = cache.lookup(key)
+    if compiled is None:
+        ...  # run pip-compile into tmp_path
+        cache.store(key, tmp_path)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.metadata
+import json
+import os
+import platform
+import subprocess  # nosec B404 - interpreter probe with shell=False
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+#: Cache directory, relative to the project root
+DEFAULT_CACHE_DIR = Path(".cache") / "pip-compile"
+
+#: Seconds a cached resolution stays valid (PyPI drift window)
+DEFAULT_MAX_AGE = 24 * 60 * 60
+
+#: Flags shared by every pip-compile invocation in the project
+COMPILE_FLAGS = (
+    "--resolver=backtracking",
+    "--strip-extras",
+    "--allow-unsafe",
+    "--quiet",
+)
+
+#: Environment variables that change which distributions pip can see
+INDEX_ENV_VARS = (
+    "PIP_INDEX_URL",
+    "PIP_EXTRA_INDEX_URL",
+    "PIP_FIND_LINKS",
+    "PIP_NO_INDEX",
+    "PIP_TRUSTED_HOST",
+    "PIP_PRE",
+    "PIP_CONFIG_FILE",
+)
+
+_INCLUDE_OPTIONS = ("-r", "-c", "--requirement", "--constraint")
+
+_PROBE_SCRIPT = """\
+import importlib.metadata, json, platform, sys
+try:
+    piptools = importlib.metadata.version("pip-tools")
+except importlib.metadata.PackageNotFoundError:
+    piptools = None
+print(json.dumps([platform.python_version(), sys.platform,
+                  platform.machine(), piptools]))
+"""
+
+
+@dataclass(frozen=True)
+class InterpreterInfo:
+    """Interpreter facts that influence dependency resolution."""
+
+    python_version: str
+    platform: str
+    machine: str
+    piptools_version: str | None
+
+
+def _piptools_version() -> str | None:
+    """Return the pip-tools version of the running interpreter."""
+    try:
+        return importlib.metadata.version("pip-tools")
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+def probe_interpreter(python_exec: str) -> InterpreterInfo | None:
+    """Describe the interpreter used for pip-compile.
+
+    The running interpreter is described in-process; any other interpreter
+    is probed with a single ``python -c`` (cheaper than ``pip show``).
+
+    Args:
+        python_exec: Path to the Python interpreter
+
+    Returns:
+        InterpreterInfo, or None if the interpreter cannot be probed
+    """
+    if python_exec == sys.executable:
+        return InterpreterInfo(
+            python_version=platform.python_version(),
+            platform=sys.platform,
+            machine=platform.machine(),
+            piptools_version=_piptools_version(),
+        )
+
+    try:
+        result = subprocess.run(  # nosec B603 - shell=False, fixed script
+            [python_exec, "-c", _PROBE_SCRIPT],
+            capture_output=True,
+            text=True,
+            check=False,
+            timeout=30,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0:
+        return None
+
+    try:
+        version, system, machine, piptools = json.loads(result.stdout)
+    except (TypeError, ValueError):
+        return None
+    return InterpreterInfo(version, system, machine, piptools)
+
+
+def _pip_config_files() -> list[Path]:
+    """Return the pip configuration files that may define indexes."""
+    home = Path.home()
+    candidates = [
+        Path("/etc/pip.conf"),
+        Path(os.environ.get("XDG_CONFIG_HOME", home / ".config")) / "pip" / "pip.conf",
+        home / ".pip" / "pip.conf",
+    ]
+    virtual_env = os.environ.get("VIRTUAL_ENV")
+    if virtual_env:
+        candidates.append(Path(virtual_env) / "pip.conf")
+    config_file = os.environ.get("PIP_CONFIG_FILE")
+    if config_file:
+        candidates.append(Path(config_file))
+    return candidates
+
+
+def index_fingerprint() -> dict[str, str]:
+    """Capture the index configuration visible to pip.
+
+    Returns:
+        Mapping of index variables and config file digests
+    """
+    fingerprint = {
+        name: os.environ[name] for name in INDEX_ENV_VARS if name in os.environ
+    }
+    for config in _pip_config_files():
+        if config.is_file():
+            digest = hashlib.sha256(config.read_bytes()).hexdigest()
+            fingerprint[str(config)] = digest
+    return fingerprint
+
+
+def _included_files(in_file: Path, seen: set[Path] | None = None) -> list[Path]:
+    """Return files pulled in by ``-r``/``-c`` lines, recursively.
+
+    Args:
+        in_file: Requirements input file
+        seen: Files already visited (cycle guard)
+
+    Returns:
+        Included files in discovery order
+    """
+    seen = set() if seen is None else seen
+    included: list[Path] = []
+    for line in in_file.read_text(encoding="utf-8").splitlines():
+        parts = line.split("#", 1)[0].split()
+        if len(parts) < 2 or parts[0] not in _INCLUDE_OPTIONS:  # noqa: PLR2004
+            continue
+        target = (in_file.parent / parts[1]).resolve()
+        if target in seen or not target.is_file():
+            continue
+        seen.add(target)
+        included.append(target)
+        included.extend(_included_files(target, seen))
+    return included
+
+
+class ResolutionCache:
+    """File cache of compiled lockfiles keyed by resolution inputs.
+
+    Attributes:
+        cache_dir: Directory holding one ``<key>.txt`` per resolution
+        max_age: Seconds after which an entry is considered stale
+    """
+
+    def __init__(self, cache_dir: Path, max_age: float = DEFAULT_MAX_AGE) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cached lockfiles (created on first store)
+            max_age: Seconds an entry stays valid
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_age = max_age
+
+    def key(
+        self,
+        in_file: Path,
+        input_hash: str,
+        interpreter: InterpreterInfo,
+    ) -> str:
+        """Build the cache key of a resolution.
+
+        Args:
+            in_file: Requirements input file (for ``-r``/``-c`` includes)
+            input_hash: Normalized hash of ``in_file``
+            interpreter: Interpreter running pip-compile
+
+        Returns:
+            64-character hexadecimal key
+        """
+        includes = {
+            str(path): hashlib.sha256(path.read_bytes()).hexdigest()
+            for path in _included_files(in_file)
+        }
+        payload = {
+            "input_hash": input_hash,
+            "includes": includes,
+            "interpreter": asdict(interpreter),
+            "flags": COMPILE_FLAGS,
+            "index": index_fingerprint(),
+        }
+        encoded = json.dumps(payload, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _entry(self, key: str) -> Path:
+        """Cached lockfile path for ``key`` (may not exist)."""
+        return self.cache_dir / f"{key}.txt"
+
+    def lookup(self, key: str) -> Path | None:
+        """Return the cached lockfile for ``key`` if present and fresh.
+
+        Args:
+            key: Key returned by :meth:`key`
+
+        Returns:
+            Path to the cached lockfile, or None on miss/expiry
+        """
+        entry = self._entry(key)
+        try:
+            age = time.time() - entry.stat().st_mtime
+        except OSError:
+            return None
+        return entry if age <= self.max_age else None
+
+    def store(self, key: str, compiled: Path) -> Path | None:
+        """Copy a fresh pip-compile output into the cache atomically.
+
+        Empty outputs are not cached: pip-compile always writes a header,
+        so an empty file means the compilation did not really run.
+
+        Args:
+            key: Key returned by :meth:`key`
+            compiled: pip-compile output file
+
+        Returns:
+            Path to the cache entry, or None if nothing was stored
+        """
+        content = compiled.read_bytes()
+        if not content:
+            return None
+
+        entry = self._entry(key)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as tmp:
+                tmp.write(content)
+            os.replace(tmp_name, entry)
+        except OSError:
+            # A read-only checkout must not break the drift check itself
+            return None
+        return entry
@@ -11,23 +11,26 @@ Architecture: Adapter Layer (Hexagonal Architecture)
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import typer
 
-from scripts.core.cortex.knowledge_orchestrator import SyncSummary
-from scripts.core.cortex.mapper import ProjectContext
-from scripts.core.cortex.models import (
-    DriftCheckResult,
-    KnowledgeEntry,
-    MigrationSummary,
-    SingleGenerationResult,
-)
-from scripts.core.guardian.hallucination_probe import ProbeResult
-from scripts.core.guardian.models import ConfigFinding
-from scripts.cortex.core.knowledge_auditor import ValidationReport
-from scripts.cortex.core.metadata_auditor import AuditReport
-from scripts.utils.toml_merger import MergeResult
+if TYPE_CHECKING:
+    # Annotation-only imports: keep the CLI startup free of the core stack
+    from scripts.core.cortex.knowledge_orchestrator import SyncSummary
+    from scripts.core.cortex.mapper import ProjectContext
+    from scripts.core.cortex.migrate import MigrationProgress
+    from scripts.core.cortex.models import (
+        DriftCheckResult,
+        KnowledgeEntry,
+        MigrationSummary,
+        SingleGenerationResult,
+    )
+    from scripts.core.guardian.hallucination_probe import ProbeResult
+    from scripts.core.guardian.models import ConfigFinding
+    from scripts.cortex.core.knowledge_auditor import ValidationReport
+    from scripts.cortex.core.metadata_auditor import AuditReport
+    from scripts.utils.toml_merger import MergeResult
 
 
 class UIPresenter:
@@ -281,6 +284,27 @@ class UIPresenter:
             )
             UIPresenter.show_error(msg, bold=True)
 
+    @staticmethod
+    def display_audit_timings(report: AuditReport, count: int = 5) -> None:
+        """Display total audit time and the slowest files.
+
+        Args:
+            report: The audit report to display.
+            count: Number of slowest files to list (0 to hide the list).
+        """
+        if not report.file_results:
+            return
+
+        average = report.duration / report.files_scanned
+        typer.echo(
+            f"⏱️  Audit time: {report.duration:.2f}s "
+            f"({average * 1000:.1f} ms/file on average)",
+        )
+        if count > 0:
+            typer.echo("   Slowest files:")
+        for result in report.slowest(count):
+            typer.echo(f"     {result.duration * 1000:8.1f} ms  {result.file_path}")
+
     @staticmethod
     def display_knowledge_graph_header() -> None:
         """Display header for Knowledge Graph validation."""
@@ -635,6 +659,41 @@ class UIPresenter:
         typer.echo()
         typer.echo("💡 Test it: git checkout - (to switch back and forth)")
 
+    @staticmethod
+    def display_migration_progress(progress: MigrationProgress) -> None:
+        """Display migration progress on one line (about every 5%).
+
+        Args:
+            progress: Phase, files done/total and elapsed time
+        """
+        step = max(1, progress.total // 20)
+        if progress.done % step and progress.done != progress.total:
+            return
+
+        label = "🔎 Analyzing" if progress.phase == "analyze" else "💾 Committing"
+        typer.echo(
+            f"\r{label} {progress.done}/{progress.total} ({progress.rate:.0f} files/s)",
+            nl=progress.done == progress.total,
+        )
+
+    @staticmethod
+    def display_migration_journal(action: str, count: int) -> None:
+        """Display the outcome of --resume / --rollback.
+
+        Args:
+            action: "resume" or "rollback"
+            count: Files written from the journal
+        """
+        if count == 0:
+            typer.secho("ℹ️  No interrupted migration to recover.", fg=typer.colors.CYAN)
+            return
+
+        verb = "Completed" if action == "resume" else "Rolled back"
+        typer.secho(
+            f"✅ {verb} interrupted migration ({count} files)",
+            fg=typer.colors.GREEN,
+        )
+
     @staticmethod
     def display_migration_summary(
         summary: MigrationSummary,
@@ -684,6 +743,11 @@ class UIPresenter:
                     f"  ❌ Errors:  {summary.errors}",
                     fg=typer.colors.RED,
                 )
+            if summary.duration > 0:
+                rate = summary.total / summary.duration
+                typer.echo(
+                    f"  ⏱️  {summary.duration:.2f}s ({rate:.0f} files/s)",
+                )
             typer.echo("=" * 70)
 
             # Show sample of results
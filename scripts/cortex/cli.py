@@ -8,6 +8,7 @@ Usage:
     cortex init <file>              # Add frontmatter to a markdown file
     cortex map                      # Generate project context map
     cortex audit docs/              # Audit documentation integrity
+    cortex --fs-cache audit docs/   # ... reading through an LRU file cache
     cortex --help                   # Show help
 
 Author: Engineering Team
@@ -29,12 +30,11 @@ _project_root_for_path = _script_dir.parent.parent
 if str(_project_root_for_path) not in sys.path:
     sys.path.insert(0, str(_project_root_for_path))
 
-# Import command sub-modules (atomized by domain)
-from scripts.cortex.commands import config as config_commands  # noqa: E402
-from scripts.cortex.commands import docs as docs_commands  # noqa: E402
-from scripts.cortex.commands import guardian as guardian_commands  # noqa: E402
-from scripts.cortex.commands import knowledge as knowledge_commands  # noqa: E402
-from scripts.cortex.commands import setup as setup_commands  # noqa: E402
+from scripts.cortex.lazy import (  # noqa: E402
+    LazyCommand,
+    LazyTyperGroup,
+    declare_lazy_commands,
+)
 from scripts.utils.banner import print_startup_banner  # noqa: E402
 from scripts.utils.context import trace_context  # noqa: E402
 from scripts.utils.logger import setup_logging  # noqa: E402
@@ -42,11 +42,43 @@ from scripts.utils.logger import setup_logging  # noqa: E402
 # Configure logging
 logger = setup_logging(__name__, log_file="cortex.log")
 
+_COMMANDS = "scripts.cortex.commands"
+
+
+class CortexGroup(LazyTyperGroup):
+    """Root command group: command modules are imported only when invoked.
+
+    Git hooks call cortex several times per commit, so startup must not pay
+    for every command module. Measure with
+    ``scripts/benchmark_startup.py --entry cortex --scenarios``.
+    """
+
+    lazy_commands = declare_lazy_commands(
+        # Setup commands (init, migrate, setup-hooks)
+        LazyCommand("init", f"{_COMMANDS}.setup:init"),
+        LazyCommand("migrate", f"{_COMMANDS}.setup:migrate"),
+        LazyCommand("setup-hooks", f"{_COMMANDS}.setup:setup_hooks"),
+        # Config commands (config, map)
+        LazyCommand("config", f"{_COMMANDS}.config:config_manager"),
+        LazyCommand("map", f"{_COMMANDS}.config:project_map"),
+        # Knowledge commands (knowledge-scan, knowledge-sync, guardian-probe)
+        LazyCommand("knowledge-scan", f"{_COMMANDS}.knowledge:knowledge_scan"),
+        LazyCommand("knowledge-sync", f"{_COMMANDS}.knowledge:knowledge_sync"),
+        LazyCommand("guardian-probe", f"{_COMMANDS}.knowledge:guardian_probe"),
+        # Docs commands (audit, generate)
+        LazyCommand("audit", f"{_COMMANDS}.docs:audit"),
+        LazyCommand("generate", f"{_COMMANDS}.docs:generate_docs"),
+        # Guardian commands (guardian check)
+        LazyCommand("guardian-check", f"{_COMMANDS}.guardian:guardian_check"),
+    )
+
+
 # Create Typer app
 app = typer.Typer(
     name="cortex",
     help="CORTEX - Documentation as Code Manager",
     add_completion=False,
+    cls=CortexGroup,
 )
 
 
@@ -70,6 +102,24 @@ def setup_context(
             help="Show version and exit",
         ),
     ] = False,
+    fs_cache: Annotated[
+        bool,
+        typer.Option(
+            "--fs-cache",
+            help=(
+                "Serve repeated reads, stats and listings from a bounded "
+                "in-memory LRU cache"
+            ),
+        ),
+    ] = False,
+    fs_cache_mb: Annotated[
+        int,
+        typer.Option(
+            "--fs-cache-mb",
+            min=1,
+            help="Memory budget of --fs-cache in MiB",
+        ),
+    ] = 64,
 ) -> None:
     """CORTEX: Advanced Project Governance & Observability System.
 
@@ -94,28 +144,15 @@ def setup_context(
     # Store in context for dependency injection
     ctx.ensure_object(dict)
     ctx.obj["project_root"] = project_root
-
-
-# Register setup commands (init, migrate, setup-hooks)
-app.command()(setup_commands.init)
-app.command()(setup_commands.migrate)
-app.command(name="setup-hooks")(setup_commands.setup_hooks)
-
-# Register config commands (config, map)
-app.command(name="config")(config_commands.config_manager)
-app.command(name="map")(config_commands.project_map)
-
-# Register knowledge commands (knowledge-scan, knowledge-sync, guardian-probe)
-app.command(name="knowledge-scan")(knowledge_commands.knowledge_scan)
-app.command(name="knowledge-sync")(knowledge_commands.knowledge_sync)
-app.command(name="guardian-probe")(knowledge_commands.guardian_probe)
-
-# Register docs commands (audit, generate)
-app.command(name="audit")(docs_commands.audit)
-app.command(name="generate")(docs_commands.generate_docs)
-
-# Register guardian commands (guardian check)
-app.command(name="guardian-check")(guardian_commands.guardian_check)
+    ctx.obj["fs"] = None
+    if fs_cache:
+        from scripts.utils.caching_filesystem import MIB, CachingFileSystem
+
+        cached_fs = CachingFileSystem(max_bytes=fs_cache_mb * MIB)
+        ctx.obj["fs"] = cached_fs
+        ctx.call_on_close(
+            lambda: logger.info("Filesystem cache: %s", cached_fs.stats.summary()),
+        )
 
 
 def main() -> None:
@@ -11,6 +11,7 @@ from typing import Annotated
 
 import typer
 
+from scripts.core.cortex.json_export import ExportLayout
 from scripts.cortex.adapters.ui import UIPresenter
 from scripts.utils.logger import setup_logging
 
@@ -159,6 +160,16 @@ def project_map(
             help="Path to template TOML (default: templates/pyproject.toml)",
         ),
     ] = None,
+    json_layout: Annotated[
+        ExportLayout,
+        typer.Option(
+            "--json-layout",
+            help=(
+                "JSON layout: indent (default), compact, or jsonl "
+                "(knowledge export as .cortex/knowledge.jsonl)"
+            ),
+        ),
+    ] = "indent",
 ) -> None:
     """Generate project context map for introspection.
 
@@ -181,6 +192,7 @@ def project_map(
         cortex map -o custom/path.json     # Custom output location
         cortex map --update-config         # Map + sync config from template
         cortex map --update-config --template=custom.toml  # Custom template
+        cortex map --json-layout jsonl     # Machine-friendly JSON Lines export
     """
     try:
         from scripts.cortex.core.context_mapper import ContextMapper
@@ -197,7 +209,7 @@ def project_map(
                 ui.show_info("🧠 Including Knowledge Node rules...")
 
         # Generate context map
-        mapper = ContextMapper(project_root=project_root)
+        mapper = ContextMapper(project_root=project_root, fs=ctx.obj.get("fs"))
 
         if update_config:
             # Map + Config Sync
@@ -205,6 +217,7 @@ def project_map(
                 output=output,
                 include_knowledge=include_knowledge,
                 template_path=template_path,
+                export_layout=json_layout,
             )
 
             # Display context summary
@@ -243,6 +256,7 @@ def project_map(
             result = mapper.map_project(
                 output=output,
                 include_knowledge=include_knowledge,
+                export_layout=json_layout,
             )
 
             ui.display_context_summary(result.context, output, include_knowledge)
@@ -57,9 +57,26 @@ def audit(
         typer.Option(
             "--output",
             "-o",
-            help="Export results to JSON file (optional)",
+            help="Export results (with per-file timings) to JSON file (optional)",
         ),
     ] = None,
+    workers: Annotated[
+        int | None,
+        typer.Option(
+            "--workers",
+            "-j",
+            min=1,
+            help="Worker processes for large trees (default: CPU count, at most 8)",
+        ),
+    ] = None,
+    slowest: Annotated[
+        int,
+        typer.Option(
+            "--slowest",
+            min=0,
+            help="Show the N slowest files to audit (0 to hide)",
+        ),
+    ] = 5,
 ) -> None:
     """Audit Markdown files for metadata and link integrity.
 
@@ -68,10 +85,14 @@ def audit(
     - Proper link relationships (requires → provides)
     - Optional: Knowledge Graph validation (when --links is enabled)
 
+    Large trees are audited in parallel processes (--workers); each file's
+    frontmatter is parsed once and shared with the Knowledge Graph scan.
+
     Examples:
         cortex audit docs/
         cortex audit docs/architecture/ --strict --fail-on-error
         cortex audit . --no-links --output results.json
+        cortex audit docs/ -j 8 --slowest 10
     """
     try:
         from scripts.core.cortex.audit_orchestrator import AuditOrchestrator
@@ -83,12 +104,16 @@ def audit(
         ui.display_audit_header()
 
         # Execute audit - use correct parameter name and method
-        orchestrator = AuditOrchestrator(workspace_root=project_root)
+        orchestrator = AuditOrchestrator(
+            workspace_root=project_root,
+            fs=ctx.obj.get("fs"),
+        )
         results = orchestrator.run_full_audit(
             path=path,
             check_links=links,
             fail_on_error=fail_on_error,
             strict=strict,
+            workers=workers,
         )
 
         # Export results if requested
@@ -100,6 +125,7 @@ def audit(
         # Display results using existing UIPresenter method
         if results.metadata_result:
             ui.display_audit_results(results.metadata_result.report)
+            ui.display_audit_timings(results.metadata_result.report, slowest)
 
         # Show Knowledge Health report path if it was generated
         if results.knowledge_result and results.knowledge_result.output_path:
@@ -175,6 +201,7 @@ def generate_docs(  # noqa: C901
     """
     try:
         from scripts.core.cortex.generation_orchestrator import (
+            FINGERPRINT_PATH,
             GenerationOrchestrator,
             GenerationTarget,
         )
@@ -211,7 +238,10 @@ def generate_docs(  # noqa: C901
             )
 
         # Execute generation
-        orchestrator = GenerationOrchestrator(project_root=project_root)
+        orchestrator = GenerationOrchestrator(
+            project_root=project_root,
+            fingerprint_path=project_root / FINGERPRINT_PATH,
+        )
 
         targets_to_generate = []
         if target_enum == GenerationTarget.ALL:
@@ -222,6 +252,9 @@ def generate_docs(  # noqa: C901
         else:
             targets_to_generate = [target_enum]
 
+        # Template data is collected once for all targets
+        data = orchestrator.collect_data()
+
         for gen_target in targets_to_generate:
             # Show processing
             ui.display_generate_processing(target=gen_target.value, dry_run=dry_run)
@@ -234,7 +267,7 @@ def generate_docs(  # noqa: C901
 
             # Check mode: detect drift only
             if check:
-                drift_result = orchestrator.check_drift(target=gen_target)
+                drift_result = orchestrator.check_drift(target=gen_target, data=data)
 
                 # Display drift result
                 ui.display_drift_result(
@@ -250,6 +283,7 @@ def generate_docs(  # noqa: C901
                     target=gen_target,
                     output_path=file_path,
                     dry_run=True,
+                    data=data,
                 )
                 ui.display_generation_result(gen_result=result, dry_run=True)
                 continue  # Skip actual write
@@ -259,6 +293,7 @@ def generate_docs(  # noqa: C901
                 target=gen_target,
                 output_path=file_path,
                 dry_run=False,
+                data=data,
             )
 
             # Display result
@@ -11,7 +11,9 @@ from typing import Annotated
 
 import typer
 
+from scripts.core.cortex.http_cache import DEFAULT_MAX_AGE
 from scripts.core.cortex.knowledge_orchestrator import KnowledgeOrchestrator
+from scripts.core.cortex.sync_executor import DEFAULT_SYNC_WORKERS
 from scripts.core.guardian.hallucination_probe import HallucinationProbe
 from scripts.cortex.adapters.ui import UIPresenter
 from scripts.utils.logger import setup_logging
@@ -20,6 +22,7 @@ logger = setup_logging(__name__, log_file="cortex.log")
 
 
 def knowledge_scan(
+    ctx: typer.Context,
     verbose: Annotated[
         bool,
         typer.Option(
@@ -71,6 +74,7 @@ def knowledge_scan(
         orchestrator = KnowledgeOrchestrator(
             workspace_root=workspace_root,
             force_parallel=parallel,
+            fs=ctx.obj.get("fs"),
         )
         result = orchestrator.scan(verbose=verbose)
 
@@ -110,6 +114,25 @@ def knowledge_sync(
             help="Preview sync operations without writing to disk",
         ),
     ] = False,
+    workers: Annotated[
+        int,
+        typer.Option(
+            "--workers",
+            "-j",
+            min=1,
+            help="Concurrent source downloads (merges are always sequential). "
+            "Use 1 for fully sequential sync.",
+        ),
+    ] = DEFAULT_SYNC_WORKERS,
+    max_age: Annotated[
+        int,
+        typer.Option(
+            "--max-age",
+            min=0,
+            help="Seconds a cached source (.cortex/http_cache) is reused "
+            "without any request. Use 0 to always revalidate.",
+        ),
+    ] = DEFAULT_MAX_AGE,
 ) -> None:
     """Synchronize knowledge entries with external sources.
 
@@ -122,18 +145,34 @@ def knowledge_sync(
 
     Use --dry-run to preview what would be synced without making changes.
 
+    Sources are downloaded concurrently (--workers, at most a few requests
+    per host at once); local files are still merged one at a time, in order.
+
+    Responses are cached under .cortex/http_cache: sources fetched less than
+    --max-age seconds ago are not requested again, older ones are revalidated
+    with If-None-Match / If-Modified-Since (cheap 304 when unchanged).
+
     Examples:
         cortex knowledge-sync                    # Sync all entries
         cortex knowledge-sync --entry-id kno-001 # Sync specific entry
         cortex knowledge-sync --dry-run          # Preview sync operations
+        cortex knowledge-sync -j 1               # Sequential downloads
+        cortex knowledge-sync --max-age 0        # Revalidate every source
     """
     try:
         workspace_root = Path.cwd()
         logger.info("Starting knowledge synchronization...")
 
         # Use orchestrator to handle scan, filter, and sync logic
-        orchestrator = KnowledgeOrchestrator(workspace_root=workspace_root)
-        summary = orchestrator.sync_multiple(entry_id=entry_id, dry_run=dry_run)
+        orchestrator = KnowledgeOrchestrator(
+            workspace_root=workspace_root,
+            http_cache_max_age=max_age,
+        )
+        summary = orchestrator.sync_multiple(
+            entry_id=entry_id,
+            dry_run=dry_run,
+            max_workers=workers,
+        )
 
         # Display results
         ui = UIPresenter()
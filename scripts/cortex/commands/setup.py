@@ -188,6 +188,29 @@ def migrate(
             help="Process subdirectories recursively",
         ),
     ] = True,
+    workers: Annotated[
+        int | None,
+        typer.Option(
+            "--workers",
+            "-j",
+            min=1,
+            help="Analysis processes (default: CPU count, at most 8; 1 disables)",
+        ),
+    ] = None,
+    resume: Annotated[
+        bool,
+        typer.Option(
+            "--resume",
+            help="Finish a migration interrupted while writing files",
+        ),
+    ] = False,
+    rollback: Annotated[
+        bool,
+        typer.Option(
+            "--rollback",
+            help="Undo a migration interrupted while writing files",
+        ),
+    ] = False,
 ) -> None:
     """Migrate documentation files to CORTEX format.
 
@@ -198,30 +221,50 @@ def migrate(
     - Detecting code references automatically
 
     By default runs in dry-run mode (shows what would be changed).
-    Use --apply to actually modify files.
+    Use --apply to actually modify files. Files are analyzed in parallel and
+    written as one journaled batch: if the process dies while writing,
+    --resume completes the batch and --rollback restores the originals.
 
     Examples:
         cortex migrate docs/ --dry-run      # Preview changes (default)
         cortex migrate docs/ --apply         # Apply changes to files
         cortex migrate docs/ --apply --force # Overwrite existing frontmatter
         cortex migrate docs/guides/ --apply  # Migrate specific directory
+        cortex migrate docs/ --rollback      # Undo an interrupted --apply
     """
     try:
         workspace_root = Path.cwd()
         dry_run = not apply
 
-        logger.info("Starting migration of %s (dry_run=%s)", path, dry_run)
-
         # Initialize orchestrator
         orchestrator = ProjectOrchestrator(workspace_root=workspace_root)
         ui = UIPresenter()
 
+        if resume and rollback:
+            ui.show_error("--resume and --rollback are mutually exclusive")
+            raise typer.Exit(code=2)
+
+        if resume or rollback:
+            action = "resume" if resume else "rollback"
+            logger.info("Recovering interrupted migration (%s)", action)
+            count = (
+                orchestrator.resume_migration()
+                if resume
+                else orchestrator.rollback_migration()
+            )
+            ui.display_migration_journal(action, count)
+            return
+
+        logger.info("Starting migration of %s (dry_run=%s)", path, dry_run)
+
         # Perform migration
         summary = orchestrator.migrate_project(
             directory=path,
             dry_run=dry_run,
             force=force,
             recursive=recursive,
+            workers=workers,
+            on_progress=ui.display_migration_progress,
         )
 
         # Display results
@@ -13,10 +13,12 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 
+from scripts.core.cortex.json_export import ExportLayout
 from scripts.core.cortex.mapper import (
     ProjectContext,
     generate_context_map,
 )
+from scripts.utils.filesystem import FileSystemAdapter
 from scripts.utils.toml_merger import MergeResult, MergeStrategy, merge_toml
 
 
@@ -62,18 +64,25 @@ class ContextMapper:
             print(f"Mapped {result.context.project_name}")
     """
 
-    def __init__(self, project_root: Path) -> None:
+    def __init__(
+        self,
+        project_root: Path,
+        fs: FileSystemAdapter | None = None,
+    ) -> None:
         """Initialize the context mapper.
 
         Args:
             project_root: Root directory of the project.
+            fs: FileSystemAdapter for I/O operations (default: RealFileSystem).
         """
         self.project_root = project_root
+        self.fs = fs
 
     def map_project(
         self,
         output: Path,
         include_knowledge: bool = True,
+        export_layout: ExportLayout = "indent",
     ) -> MappingResult:
         """Generate project context map.
 
@@ -82,6 +91,7 @@ class ContextMapper:
         Args:
             output: Path where to save the context JSON.
             include_knowledge: Whether to include Knowledge Node golden paths.
+            export_layout: JSON layout ("indent", "compact" or "jsonl").
 
         Returns:
             MappingResult containing the project context.
@@ -94,6 +104,8 @@ class ContextMapper:
             self.project_root,
             output,
             include_knowledge=include_knowledge,
+            export_layout=export_layout,
+            fs=self.fs,
         )
 
         return MappingResult(context=context)
@@ -103,6 +115,7 @@ class ContextMapper:
         output: Path,
         include_knowledge: bool = True,
         template_path: Path | None = None,
+        export_layout: ExportLayout = "indent",
     ) -> MappingResult:
         """Generate context map and synchronize configuration from template.
 
@@ -111,6 +124,7 @@ class ContextMapper:
             include_knowledge: Whether to include Knowledge Node golden paths.
             template_path: Path to template TOML file
                 (default: project_root/templates/pyproject.toml).
+            export_layout: JSON layout ("indent", "compact" or "jsonl").
 
         Returns:
             MappingResult with both context and config sync result.
@@ -120,6 +134,8 @@ class ContextMapper:
             self.project_root,
             output,
             include_knowledge=include_knowledge,
+            export_layout=export_layout,
+            fs=self.fs,
         )
 
         # Then, sync configuration
@@ -22,6 +22,7 @@ from scripts.core.cortex.knowledge_validator import (
 from scripts.core.cortex.link_analyzer import LinkAnalyzer
 from scripts.core.cortex.link_resolver import LinkResolver
 from scripts.core.cortex.models import KnowledgeEntry
+from scripts.utils.filesystem import FileSystemAdapter
 
 
 class KnowledgeAuditor:
@@ -43,6 +44,7 @@ class KnowledgeAuditor:
         self,
         workspace_root: Path,
         knowledge_dir: Path | None = None,
+        fs: FileSystemAdapter | None = None,
     ) -> None:
         """Initialize the Knowledge Graph auditor.
 
@@ -50,9 +52,12 @@ class KnowledgeAuditor:
             workspace_root: Root directory of the workspace/project.
             knowledge_dir: Directory containing knowledge nodes
                 (default: workspace_root/docs/knowledge).
+            fs: FileSystemAdapter for the scan (default: RealFileSystem).
+                A ScanSession reuses frontmatter parsed by the metadata audit.
         """
         self.workspace_root = workspace_root
         self.knowledge_dir = knowledge_dir or (workspace_root / "docs/knowledge")
+        self.fs = fs
 
     def validate(self) -> tuple[ValidationReport, list[KnowledgeEntry]]:
         """Validate the Knowledge Graph and generate health report.
@@ -69,7 +74,7 @@ class KnowledgeAuditor:
             ValueError: If scanning or validation fails.
         """
         # Load Knowledge Entries using KnowledgeScanner
-        scanner = KnowledgeScanner(workspace_root=self.workspace_root)
+        scanner = KnowledgeScanner(workspace_root=self.workspace_root, fs=self.fs)
         entries = scanner.scan(knowledge_dir=self.knowledge_dir)
 
         if not entries:
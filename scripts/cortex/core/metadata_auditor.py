@@ -6,17 +6,39 @@ verifies that linked code/documentation files exist.
 
 Extracted from cli.py as part of Iteration 3: God Function Elimination.
 
+Large trees are audited in worker processes (YAML parsing is CPU-bound, so
+threads would serialize on the GIL). Each file is timed so that outliers
+show up in the report.
+
 Architecture: Core Domain Logic (Hexagonal Architecture)
 """
 
 from __future__ import annotations
 
+import logging
+import time
+from collections.abc import Sequence
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
+from typing import Any
+
+import frontmatter
+import yaml
 
-from scripts.core.cortex.metadata import FrontmatterParseError, FrontmatterParser
+from scripts.core.cortex.metadata import (
+    FrontmatterParseError,
+    FrontmatterParser,
+    load_frontmatter,
+)
 from scripts.core.cortex.models import DocumentMetadata
+from scripts.core.cortex.scan_session import ScanSession
 from scripts.core.cortex.scanner import CodeLinkScanner
+from scripts.utils.filesystem import FileSystemAdapter, RealFileSystem
+from scripts.utils.parallel import TimedReport, process_map, worker_count
+from scripts.utils.read_through import is_real_filesystem
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass(frozen=True)
@@ -35,6 +57,9 @@ class FileAuditResult:
     metadata: DocumentMetadata | None
     """Parsed metadata if successful, None if parsing failed."""
 
+    duration: float = 0.0
+    """Seconds spent auditing this file."""
+
     @property
     def has_errors(self) -> bool:
         """Check if this file has any errors."""
@@ -52,7 +77,7 @@ class FileAuditResult:
 
 
 @dataclass(frozen=True)
-class AuditReport:
+class AuditReport(TimedReport[FileAuditResult]):
     """Complete audit report for all files."""
 
     files_scanned: int
@@ -64,6 +89,9 @@ class AuditReport:
     root_violations: list[str]
     """Files in project root that violate Root Lockdown policy."""
 
+    duration: float = 0.0
+    """Wall-clock seconds of the whole audit."""
+
     @property
     def total_errors(self) -> int:
         """Calculate total number of errors across all files."""
@@ -89,6 +117,30 @@ class AuditReport:
         """Check if audit passed (no errors)."""
         return self.total_errors == 0
 
+    @property
+    def timed_results(self) -> Sequence[FileAuditResult]:
+        """Per-file results, for slowest() and export_to_json()."""
+        return self.file_results
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the report to a JSON-serializable dictionary."""
+        return {
+            "files_scanned": self.files_scanned,
+            "total_errors": self.total_errors,
+            "total_warnings": self.total_warnings,
+            "duration": round(self.duration, 6),
+            "root_violations": self.root_violations,
+            "files": [
+                {
+                    "file": r.file_path.as_posix(),
+                    "errors": r.errors,
+                    "warnings": r.warnings,
+                    "duration": round(r.duration, 6),
+                }
+                for r in self.file_results
+            ],
+        }
+
 
 class MetadataAuditor:
     """Auditor for documentation metadata and links.
@@ -99,21 +151,30 @@ class MetadataAuditor:
 
     Usage:
         auditor = MetadataAuditor(workspace_root=Path.cwd())
-        report = auditor.audit(md_files)
+        report = auditor.audit(md_files, workers=4)
 
         if not report.is_successful:
             print(f"Found {report.total_errors} errors")
     """
 
-    def __init__(self, workspace_root: Path) -> None:
+    def __init__(
+        self,
+        workspace_root: Path,
+        fs: FileSystemAdapter | None = None,
+    ) -> None:
         """Initialize the auditor.
 
         Args:
             workspace_root: Root directory of the workspace/project.
+            fs: FileSystemAdapter for I/O operations (default: RealFileSystem).
+                Pass a ScanSession to share parsed frontmatter and link
+                checks with other consumers of the same run.
         """
         self.workspace_root = workspace_root
-        self.parser = FrontmatterParser()
-        self.code_scanner = CodeLinkScanner(workspace_root=workspace_root)
+        self._resolved_root = workspace_root.resolve()
+        self.fs = fs or RealFileSystem()
+        self.parser = FrontmatterParser(fs=self.fs)
+        self.code_scanner = CodeLinkScanner(workspace_root=workspace_root, fs=self.fs)
 
     def check_root_lockdown(self) -> list[str]:
         """Check for unauthorized .md files in project root.
@@ -132,7 +193,8 @@ class MetadataAuditor:
         Returns:
             FileAuditResult containing errors, warnings, and metadata.
         """
-        relative_path = md_file.resolve().relative_to(self.workspace_root.resolve())
+        start = time.perf_counter()
+        relative_path = md_file.resolve().relative_to(self._resolved_root)
         errors: list[str] = []
         warnings: list[str] = []
         metadata: DocumentMetadata | None = None
@@ -163,27 +225,97 @@ class MetadataAuditor:
             errors=errors,
             warnings=warnings,
             metadata=metadata,
+            duration=time.perf_counter() - start,
         )
 
-    def audit(self, md_files: list[Path]) -> AuditReport:
+    def audit(
+        self,
+        md_files: list[Path],
+        *,
+        workers: int | None = None,
+    ) -> AuditReport:
         """Audit multiple Markdown files.
 
         This is the main entry point for metadata auditing.
 
         Args:
             md_files: List of Markdown files to audit.
+            workers: Worker processes (default: CPU count, at most
+                MAX_DEFAULT_WORKERS). Used only for at least
+                PARALLEL_THRESHOLD files on the real filesystem (see
+                scripts.utils.parallel).
 
         Returns:
-            AuditReport containing results for all files.
+            AuditReport containing results for all files, in input order.
         """
+        start = time.perf_counter()
+
         # Check Root Lockdown violations
         root_violations = self.check_root_lockdown()
 
         # Audit each file
-        file_results = [self.audit_single_file(md_file) for md_file in md_files]
+        workers = (
+            worker_count(len(md_files), workers) if is_real_filesystem(self.fs) else 1
+        )
+        if workers > 1:
+            file_results = self._audit_in_processes(md_files, workers)
+        else:
+            file_results = [self.audit_single_file(md_file) for md_file in md_files]
 
+        elapsed = time.perf_counter() - start
+        logger.info("Audited %d files in %.2fs", len(md_files), elapsed)
         return AuditReport(
             files_scanned=len(md_files),
             file_results=file_results,
             root_violations=root_violations,
+            duration=elapsed,
+        )
+
+    def _audit_in_processes(
+        self,
+        md_files: list[Path],
+        workers: int,
+    ) -> list[FileAuditResult]:
+        """Audit files in worker processes, sharing their parses with the session.
+
+        Workers build their own auditor over the real filesystem. When this
+        auditor runs on a ScanSession, workers also return the parsed
+        frontmatter so later consumers of the session (e.g. the knowledge
+        scan) do not parse the same files again.
+        """
+        share = isinstance(self.fs, ScanSession)
+        logger.info("Auditing %d files with %d processes", len(md_files), workers)
+        file_results: list[FileAuditResult] = []
+        outcomes = process_map(
+            partial(_audit_in_worker, share),
+            md_files,
+            context=partial(_worker_auditor, self.workspace_root),
+            workers=workers,
         )
+        for md_file, (result, post) in zip(md_files, outcomes, strict=True):
+            if post is not None:
+                load_frontmatter(self.fs, md_file, parsed=post)
+            file_results.append(result)
+        return file_results
+
+
+def _worker_auditor(workspace_root: Path) -> MetadataAuditor:
+    """Create the auditor of a worker process."""
+    return MetadataAuditor(workspace_root, fs=ScanSession())
+
+
+def _audit_in_worker(
+    share: bool,
+    auditor: MetadataAuditor,
+    md_file: Path,
+) -> tuple[FileAuditResult, frontmatter.Post | None]:
+    """Audit one file in a worker process; also return its parsed frontmatter."""
+    result = auditor.audit_single_file(md_file)
+    post = None
+    if share:
+        try:
+            # Memoized by the audit above, unless the file failed to parse
+            post = load_frontmatter(auditor.fs, md_file)
+        except (OSError, ValueError, yaml.YAMLError):
+            post = None
+    return result, post
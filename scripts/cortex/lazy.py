@@ -0,0 +1,123 @@
+"""Lazy command registration for the CORTEX CLI.
+
+Commands are declared by name and import path, and their modules are only
+imported when Click resolves the command being invoked. This keeps
+``cortex --version`` and single-command invocations from the git hooks
+from paying the import cost of every command module (Pydantic models,
+Rich, frontmatter, YAML and the whole ``scripts.core.cortex`` stack).
+
+Usage:
+    class CortexGroup(LazyTyperGroup):
+        lazy_commands = declare_lazy_commands(
+            LazyCommand("audit", "scripts.cortex.commands.docs:audit"),
+        )
+
+    app = typer.Typer(cls=CortexGroup)
+
+Architecture: Adapter Layer (presentation concern only)
+"""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, ClassVar
+
+import typer
+from typer.core import TyperGroup
+
+
+@dataclass(frozen=True)
+class LazyCommand:
+    """Declaration of a command whose module is imported on demand.
+
+    Attributes:
+        name: Command name as typed on the command line
+        target: Import path in ``"package.module:function"`` format
+    """
+
+    name: str
+    target: str
+
+    def load_callback(self) -> Callable[..., Any]:
+        """Import the target module and return the command callback.
+
+        Raises:
+            ValueError: If ``target`` is not in ``module:attribute`` format
+            ImportError: If the module cannot be imported
+            AttributeError: If the module does not define the attribute
+        """
+        module_name, sep, attr = self.target.partition(":")
+        if not sep or not module_name or not attr:
+            msg = f"Invalid lazy command target for '{self.name}': {self.target}"
+            raise ValueError(msg)
+
+        module = importlib.import_module(module_name)
+        callback: Callable[..., Any] = getattr(module, attr)
+        return callback
+
+
+def declare_lazy_commands(*commands: LazyCommand) -> dict[str, LazyCommand]:
+    """Build an ordered name -> declaration mapping, rejecting duplicates.
+
+    Args:
+        *commands: Command declarations in the order they should be listed
+
+    Returns:
+        Mapping preserving declaration order
+
+    Raises:
+        ValueError: If two declarations share the same name
+    """
+    registry: dict[str, LazyCommand] = {}
+    for command in commands:
+        if command.name in registry:
+            msg = f"Duplicate lazy command name: {command.name}"
+            raise ValueError(msg)
+        registry[command.name] = command
+    return registry
+
+
+class LazyTyperGroup(TyperGroup):
+    """TyperGroup that materializes declared commands on first lookup.
+
+    Subclasses set ``lazy_commands``; Typer instantiates the group itself,
+    so the registry cannot be passed through ``__init__``. Resolved
+    commands are cached in ``self.commands`` so each module is imported
+    at most once per process.
+    """
+
+    lazy_commands: ClassVar[dict[str, LazyCommand]] = {}
+
+    def list_commands(self, ctx: Any) -> list[str]:
+        """List eager commands followed by lazy ones, without importing."""
+        names = list(super().list_commands(ctx))
+        names.extend(name for name in self.lazy_commands if name not in names)
+        return names
+
+    def get_command(self, ctx: Any, cmd_name: str) -> Any:
+        """Return the command, importing its module on first access."""
+        command = super().get_command(ctx, cmd_name)
+        if command is not None:
+            return command
+
+        spec = self.lazy_commands.get(cmd_name)
+        if spec is None:
+            return None
+
+        command = self._build_command(spec)
+        self.add_command(command, cmd_name)
+        return command
+
+    @staticmethod
+    def _build_command(spec: LazyCommand) -> Any:
+        """Convert a lazily imported callback into a Click command.
+
+        Uses a throwaway single-command Typer app so that parameter parsing
+        (``Annotated`` options, ``typer.Context`` injection, rich help) goes
+        through exactly the same code path as ``app.command()``.
+        """
+        single = typer.Typer(add_completion=False)
+        single.command(name=spec.name)(spec.load_callback())
+        return typer.main.get_command(single)
@@ -17,6 +17,8 @@ def load_config(config_path: Path | None = None) -> dict[str, Any]:
         "audit_enabled": True,
         "audit_timeout": 300,
         "audit_fail_threshold": "HIGH",
+        # Incremental audit: analyze only files changed against this ref
+        "audit_changed_since": "HEAD",
         "strict_audit": True,
         "auto_fix_enabled": True,
         "lint_timeout": 180,
@@ -8,6 +8,7 @@ import os
 import re
 import subprocess
 import sys
+from collections.abc import Sequence
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -15,6 +16,7 @@ from typing import Any
 from scripts.git_sync.exceptions import AuditError, GitOperationError, SyncError
 from scripts.git_sync.models import SyncStep
 from scripts.utils.atomic import atomic_write_json
+from scripts.utils.git_state import GitState, GitStateProbe
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +46,12 @@ class SyncOrchestrator:
         # Validate workspace is a Git repository
         self._validate_git_repository()
 
+        # One `git status --porcelain=v2 --branch` per run, shared by all phases
+        self._git_state_probe = GitStateProbe(
+            self.workspace_root,
+            runner=self._git_state_output,
+        )
+
         logger.info("Initialized SyncOrchestrator (ID: %s)", self.sync_id)
         logger.info("Workspace: %s", self.workspace_root)
         logger.info("Dry run mode: %s", self.dry_run)
@@ -72,17 +80,10 @@ class SyncOrchestrator:
             current_time = datetime.now(timezone.utc)
             duration_seconds = (current_time - self.start_time).total_seconds()
 
-            # Get current branch if possible
+            # Get current branch if possible (cached state, no extra spawn)
             try:
-                branch_result = self._run_command(
-                    ["git", "branch", "--show-current"],
-                    timeout=5,
-                    check=False,
-                )
-                if branch_result.returncode == 0:
-                    current_branch = branch_result.stdout.strip()
-                else:
-                    current_branch = "unknown"
+                state = self._git_state()
+                current_branch = state.branch or "unknown"
             except GitOperationError:
                 current_branch = "unknown"
 
@@ -116,6 +117,7 @@ class SyncOrchestrator:
         capture_output: bool = True,
         check: bool = True,
         env: dict[str, str] | None = None,
+        read_only: bool = False,
     ) -> subprocess.CompletedProcess[str]:
         """Execute command with security best practices.
 
@@ -125,6 +127,8 @@ class SyncOrchestrator:
             capture_output: Whether to capture stdout/stderr
             check: Whether to raise on non-zero exit
             env: Optional environment variables
+            read_only: Command does not modify the repository, so it runs
+                even in dry-run mode
 
         Returns:
             CompletedProcess instance
@@ -133,7 +137,7 @@ class SyncOrchestrator:
             GitOperationError: On command execution failure
 
         """
-        if self.dry_run:
+        if self.dry_run and not read_only:
             logger.info("[DRY RUN] Would execute: %s", " ".join(command))
             return subprocess.CompletedProcess(
                 args=command,
@@ -175,6 +179,22 @@ class SyncOrchestrator:
             error_msg = f"Command timed out after {timeout}s: {' '.join(command)}"
             raise GitOperationError(error_msg) from e
 
+    def _git_state_output(self, command: Sequence[str]) -> str:
+        """Run the read-only state probe command (also in dry-run mode)."""
+        return self._run_command(list(command), timeout=60, read_only=True).stdout
+
+    def _git_state(self) -> GitState:
+        """Return the repository state, collected once per sync run.
+
+        Raises:
+            GitOperationError: If `git status` fails
+
+        """
+        state = self._git_state_probe.get()
+        if state is None:
+            raise GitOperationError("Could not read Git repository status")
+        return state
+
     def _check_git_status(self) -> dict[str, Any]:
         """Check Git repository status."""
         step = SyncStep("git_status", "Checking Git repository status")
@@ -182,26 +202,18 @@ class SyncOrchestrator:
         self.steps.append(step)
 
         try:
-            # Check for uncommitted changes
-            result = self._run_command(["git", "status", "--porcelain"])
-            changed_files = [
-                line.strip()
-                for line in result.stdout.strip().split("\n")
-                if line.strip()
-            ]
-
-            # Check current branch
-            branch_result = self._run_command(["git", "branch", "--show-current"])
-            current_branch = branch_result.stdout.strip()
-
-            # Check if repository is clean
-            is_clean = len(changed_files) == 0
+            state = self._git_state()
+            changed_files = state.porcelain_lines()
 
             status_info = {
-                "is_clean": is_clean,
+                "is_clean": state.is_clean,
                 "changed_files": changed_files,
                 "total_changes": len(changed_files),
-                "current_branch": current_branch,
+                "current_branch": state.branch or "",
+                "head": state.head,
+                "upstream": state.upstream,
+                "ahead": state.ahead,
+                "behind": state.behind,
             }
 
             step.complete(status_info)
@@ -234,6 +246,11 @@ class SyncOrchestrator:
                 "--fail-on",
                 self.config.get("audit_fail_threshold", "HIGH"),
             ]
+            # Incremental: only changed files are analyzed, cached findings
+            # cover the rest of the workspace
+            changed_since = self.config.get("audit_changed_since")
+            if changed_since:
+                audit_command += ["--changed-since", changed_since]
 
             result = self._run_command(
                 audit_command,
@@ -8,6 +8,11 @@ This module contains reusable utility functions for:
 
 from __future__ import annotations
 
-from scripts.utils.atomic import AtomicFileWriter, atomic_write_json
+from scripts.utils.atomic import (
+    AtomicBatch,
+    AtomicFileWriter,
+    atomic_write_json,
+    recover_batch,
+)
 
-__all__ = ["AtomicFileWriter", "atomic_write_json"]
+__all__ = ["AtomicBatch", "AtomicFileWriter", "atomic_write_json", "recover_batch"]
@@ -8,6 +8,8 @@ Key Features:
 - Optional fsync() for durability guarantees
 - Automatic cleanup of temporary files on failure
 - Context manager interface for safe resource management
+- Batched multi-file commit (AtomicBatch): one transaction for many files,
+  with an optional intent journal for crash recovery
 
 Usage:
     # Using context manager
@@ -16,6 +18,11 @@ Usage:
 
     # Using convenience function
     atomic_write_json(target_path, {"key": "value"})
+
+    # Rewriting many files together
+    with AtomicBatch(journal=root / ".batch.journal") as batch:
+        for path, content in changes.items():
+            batch.write(path, content)
 """
 
 from __future__ import annotations
@@ -42,6 +49,7 @@ class AtomicFileWriter:
         target: Destination file path
         fsync: If True, force write to physical disk before atomic replace
         mode: File open mode (default: "w" for text)
+        encoding: Text encoding (default: "utf-8")
 
     Example:
         >>> with AtomicFileWriter(Path("config.json")) as f:
@@ -58,6 +66,7 @@ class AtomicFileWriter:
         *,
         fsync: bool = True,
         mode: str = "w",
+        encoding: str = "utf-8",
     ) -> None:
         """Initialize atomic writer.
 
@@ -65,10 +74,12 @@ class AtomicFileWriter:
             target: Destination file path
             fsync: If True, call os.fsync() before atomic replace
             mode: File open mode ("w" for text, "wb" for binary)
+            encoding: Text encoding of the temporary file
         """
         self.target = Path(target)
         self.fsync = fsync
         self.mode = mode
+        self.encoding = encoding
         # Use PID in temp filename to avoid race conditions
         self.temp_path = target.with_suffix(f".tmp.{os.getpid()}")
         self._file: IO[str] | None = None
@@ -79,7 +90,7 @@ class AtomicFileWriter:
         self.target.parent.mkdir(parents=True, exist_ok=True)
 
         # Open temporary file
-        self._file = self.temp_path.open(self.mode, encoding="utf-8")
+        self._file = self.temp_path.open(self.mode, encoding=self.encoding)
         return self._file
 
     def __exit__(
@@ -148,3 +159,203 @@ def atomic_write_json(
     with AtomicFileWriter(target, fsync=fsync) as f:
         json.dump(data, f, indent=2, ensure_ascii=False)
         f.write("\n")  # Add trailing newline for POSIX compliance
+
+
+def _fsync_path(path: Path) -> None:
+    """Flush a file already written and closed to disk."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _fsync_dir(directory: Path) -> None:
+    """Persist renames in ``directory`` (no-op where unsupported, e.g. Windows)."""
+    with contextlib.suppress(OSError):
+        _fsync_path(directory)
+
+
+class AtomicBatch:
+    """Transaction that atomically replaces many files together.
+
+    ``AtomicFileWriter`` pays fsync + rename per file and a crash between two
+    files leaves a mix of old and new contents. A batch instead:
+
+    1. Stages every file into a temporary sibling (``write()``)
+    2. fsyncs all temporary files back to back
+    3. Writes the intent journal (if ``journal`` is set), listing every
+       temporary file and its target
+    4. Renames every temporary file over its target
+    5. fsyncs each parent directory once, then removes the journal
+
+    A crash before step 3 leaves the targets untouched (only temporary
+    files). A crash after it is completed by :func:`recover_batch`, which
+    renames the remaining temporary files: the batch ends up all-or-nothing.
+    Without a journal, an error during step 4 leaves the files renamed so
+    far replaced (each one atomically) and removes the other temporaries.
+
+    Args:
+        fsync: If True, fsync files, journal and directories
+        journal: Intent journal path (None: no crash recovery)
+        encoding: Text encoding of staged files
+
+    Example:
+        >>> with AtomicBatch() as batch:
+        ...     batch.write(Path("a.md"), "# A")
+        ...     batch.write(Path("b.md"), "# B")
+    """
+
+    def __init__(
+        self,
+        *,
+        fsync: bool = True,
+        journal: Path | None = None,
+        encoding: str = "utf-8",
+    ) -> None:
+        """Initialize an empty batch.
+
+        Args:
+            fsync: If True, fsync files, journal and directories
+            journal: Intent journal path (None: no crash recovery)
+            encoding: Text encoding of staged files
+        """
+        self.fsync = fsync
+        self.journal = journal
+        self.encoding = encoding
+        self._staged: dict[Path, Path] = {}
+
+    def __len__(self) -> int:
+        """Number of staged files."""
+        return len(self._staged)
+
+    def write(self, target: Path, content: str | bytes) -> None:
+        """Stage the new content of ``target`` (written on commit()).
+
+        Staging the same target twice keeps the last content.
+
+        Args:
+            target: Destination file path
+            content: Text (encoded with ``encoding``) or bytes
+        """
+        target = Path(target)
+        temp = self._staged.get(target) or target.with_name(
+            f"{target.name}.tmp.{os.getpid()}.{len(self._staged)}",
+        )
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(content, bytes):
+            temp.write_bytes(content)
+        else:
+            temp.write_text(content, encoding=self.encoding)
+        self._staged[target] = temp
+
+    def commit(self) -> int:
+        """Replace every staged target.
+
+        If fsync or the journal fails, every temporary file is removed and
+        the targets are untouched. If a rename fails, the targets renamed so
+        far keep their new content; with a journal, the remaining temporary
+        files and the journal are kept so :func:`recover_batch` can finish
+        the batch, without one they are removed.
+
+        Returns:
+            Number of files written
+
+        Raises:
+            OSError: If a file could not be synced, journaled or renamed
+        """
+        try:
+            self._sync_and_journal()
+        except BaseException:
+            self.rollback()
+            if self.journal is not None:
+                with contextlib.suppress(OSError):
+                    self.journal.unlink(missing_ok=True)
+            raise
+
+        try:
+            for target, temp in self._staged.items():
+                temp.replace(target)
+        except BaseException:
+            if self.journal is None:
+                self.rollback()  # temporaries already renamed are skipped
+            else:
+                self._staged.clear()  # left for recover_batch()
+            raise
+
+        if self.fsync:
+            for directory in {target.parent for target in self._staged}:
+                _fsync_dir(directory)
+
+        if self.journal is not None:
+            self.journal.unlink()
+
+        count = len(self._staged)
+        self._staged.clear()
+        return count
+
+    def _sync_and_journal(self) -> None:
+        """Sync the staged files and write the intent journal (steps 2-3)."""
+        if self.fsync:
+            for temp in self._staged.values():
+                _fsync_path(temp)
+
+        if self.journal is not None:
+            entries = [
+                {"temp": str(temp), "target": str(target)}
+                for target, temp in self._staged.items()
+            ]
+            with AtomicFileWriter(self.journal, fsync=self.fsync) as f:
+                json.dump({"version": 1, "files": entries}, f)
+            if self.fsync:
+                _fsync_dir(self.journal.parent)
+
+    def rollback(self) -> None:
+        """Discard staged files; targets are left untouched."""
+        for temp in self._staged.values():
+            with contextlib.suppress(OSError):
+                temp.unlink()
+        self._staged.clear()
+
+    def __enter__(self) -> AtomicBatch:
+        """Start staging."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Commit on success, roll back if the block raised."""
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+
+
+def recover_batch(journal: Path) -> int:
+    """Complete a batch interrupted after its intent journal was written.
+
+    Args:
+        journal: Intent journal of the interrupted AtomicBatch
+
+    Returns:
+        Number of files renamed (0 if there is no journal)
+    """
+    if not journal.exists():
+        return 0
+
+    entries = json.loads(journal.read_text(encoding="utf-8"))["files"]
+    renamed = 0
+    for entry in entries:
+        temp = Path(entry["temp"])
+        # Missing temporary files were renamed before the crash
+        if temp.exists():
+            temp.replace(entry["target"])
+            renamed += 1
+
+    for directory in {Path(entry["target"]).parent for entry in entries}:
+        _fsync_dir(directory)
+    journal.unlink()
+    return renamed
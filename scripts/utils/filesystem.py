@@ -1,9 +1,24 @@
 """Filesystem abstraction layer for easier testing and isolation."""
 
+import codecs
+import fnmatch
+import io
+import mmap
+import os
 import shutil
 import threading
-from collections.abc import Iterator
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
 from pathlib import Path
+from typing import TextIO
+
+from scripts.utils.atomic import AtomicBatch, AtomicFileWriter
+
+MMAP_MIN_BYTES = 256 * 1024
+"""Files at least this large are memory-mapped by RealFileSystem.map_bytes."""
+
+ByteView = bytes | mmap.mmap
+"""Read-only bytes of a file: supports ``find``, slicing and ``re`` searches."""
 
 
 class FileSystemAdapter:
@@ -13,6 +28,39 @@ class FileSystemAdapter:
         """Read text from a file."""
         raise NotImplementedError
 
+    def read_prefix(
+        self,
+        path: str | Path,
+        max_bytes: int,
+        encoding: str = "utf-8",
+    ) -> tuple[str, bool]:
+        """Read at most ``max_bytes`` from the start of a file.
+
+        The default implementation reads the whole file.
+
+        Returns:
+            Tuple of (text, complete); complete is False when the file is
+            longer than the returned text.
+        """
+        return self.read_text(path, encoding=encoding), True
+
+    def read_bytes(self, path: str | Path) -> bytes:
+        """Read the raw bytes of a file.
+
+        The default implementation encodes read_text() as UTF-8.
+        """
+        return self.read_text(path).encode("utf-8")
+
+    @contextmanager
+    def map_bytes(self, path: str | Path) -> Iterator[ByteView]:
+        """Open a read-only byte view of a file for substring prefilters.
+
+        Use it to check cheaply whether a file can match before decoding it;
+        the view is only valid inside the ``with`` block. The default
+        implementation yields read_bytes().
+        """
+        yield self.read_bytes(path)
+
     def write_text(
         self,
         path: str | Path,
@@ -55,6 +103,39 @@ class FileSystemAdapter:
         """Copy a file or directory."""
         raise NotImplementedError
 
+    def remove(self, path: str | Path) -> None:
+        """Remove a file or a directory tree (no error if missing)."""
+        raise NotImplementedError
+
+    @contextmanager
+    def open_atomic(
+        self,
+        path: str | Path,
+        encoding: str = "utf-8",
+    ) -> Iterator[TextIO]:
+        """Open a text stream whose content replaces ``path`` on success.
+
+        The default implementation buffers in memory and commits through
+        write_text(); nothing is written if the block raises.
+        """
+        buffer = io.StringIO()
+        yield buffer
+        self.write_text(path, buffer.getvalue(), encoding=encoding)
+
+    def write_many(
+        self,
+        files: Mapping[Path, str],
+        encoding: str = "utf-8",
+    ) -> None:
+        """Write several files as one batch.
+
+        The default implementation calls write_text() per file; adapters
+        override it to batch the work (see RealFileSystem.write_many for
+        the guarantees on disk).
+        """
+        for path, content in files.items():
+            self.write_text(path, content, encoding=encoding)
+
 
 class RealFileSystem(FileSystemAdapter):
     """Concrete implementation using the real OS filesystem."""
@@ -63,6 +144,37 @@ class RealFileSystem(FileSystemAdapter):
         """Read text from real filesystem."""
         return Path(path).read_text(encoding=encoding)
 
+    def read_prefix(
+        self,
+        path: str | Path,
+        max_bytes: int,
+        encoding: str = "utf-8",
+    ) -> tuple[str, bool]:
+        """Read at most ``max_bytes`` from a real file (newlines translated)."""
+        with Path(path).open("rb") as f:
+            data = f.read(max_bytes + 1)
+        complete = len(data) <= max_bytes
+        # Incremental decoding drops a multi-byte character cut at the limit
+        text = codecs.getincrementaldecoder(encoding)().decode(
+            data[:max_bytes],
+            final=complete,
+        )
+        return text.replace("\r\n", "\n").replace("\r", "\n"), complete
+
+    def read_bytes(self, path: str | Path) -> bytes:
+        """Read bytes from real filesystem."""
+        return Path(path).read_bytes()
+
+    @contextmanager
+    def map_bytes(self, path: str | Path) -> Iterator[ByteView]:
+        """Memory-map files of at least MMAP_MIN_BYTES; read smaller ones."""
+        with Path(path).open("rb") as f:
+            if os.fstat(f.fileno()).st_size < MMAP_MIN_BYTES:
+                yield f.read()
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                yield view
+
     def write_text(
         self,
         path: str | Path,
@@ -109,23 +221,79 @@ class RealFileSystem(FileSystemAdapter):
         dst_path.parent.mkdir(parents=True, exist_ok=True)
         shutil.copy2(src, dst)
 
+    def remove(self, path: str | Path) -> None:
+        """Remove real file or directory tree."""
+        p = Path(path)
+        if p.is_dir():
+            shutil.rmtree(p)
+        else:
+            p.unlink(missing_ok=True)
+
+    @contextmanager
+    def open_atomic(
+        self,
+        path: str | Path,
+        encoding: str = "utf-8",
+    ) -> Iterator[TextIO]:
+        """Stream into a temporary sibling file, renamed over ``path`` on success."""
+        with AtomicFileWriter(Path(path), fsync=False, encoding=encoding) as stream:
+            yield stream
+
+    def write_many(
+        self,
+        files: Mapping[Path, str],
+        encoding: str = "utf-8",
+    ) -> None:
+        """Write real files through one durable AtomicBatch.
+
+        Every file is replaced atomically and an error while staging or
+        syncing leaves all targets untouched, but the batch has no intent
+        journal: an error (or crash) during the final renames can leave
+        some files replaced. Use AtomicBatch(journal=...) with
+        recover_batch() when the whole set must be all-or-nothing.
+        """
+        with AtomicBatch(encoding=encoding) as batch:
+            for path, content in files.items():
+                batch.write(Path(path), content)
+
 
 class MemoryFileSystem(FileSystemAdapter):
-    """In-memory filesystem implementation for testing."""
+    """In-memory filesystem implementation for testing.
+
+    Files are indexed by directory (parent -> children), so glob() costs the
+    size of one directory and rglob() and remove() the size of the subtree,
+    not of the whole filesystem. Writers serialize on a lock; reads and scans
+    take no lock and see each index dict through GIL-atomic operations
+    (``dict.get``, ``tuple(dict)``), so concurrent scans never wait on each
+    other. Scan results keep file creation order.
+    """
 
     def __init__(self) -> None:
         """Initialize empty memory filesystem."""
         self._files: dict[Path, str] = {}
         self._dirs: set[Path] = set()
+        # Directory -> {file: creation sequence} of its direct files
+        self._dir_files: dict[Path, dict[Path, int]] = {}
+        # Directory -> direct subdirectories (linked up to the root)
+        self._subdirs: dict[Path, dict[Path, None]] = {}
+        self._seq = 0
         self._lock = threading.RLock()
 
     def read_text(self, path: str | Path, encoding: str = "utf-8") -> str:
         """Read from memory."""
         path = Path(path)
-        with self._lock:
-            if path not in self._files:
-                raise FileNotFoundError(f"File not found: {path}")
+        try:
             return self._files[path]
+        except KeyError:
+            raise FileNotFoundError(f"File not found: {path}") from None
+
+    def read_bytes(self, path: str | Path) -> bytes:
+        """Read from memory, encoded as UTF-8."""
+        path = Path(path)
+        try:
+            return self._files[path].encode("utf-8")
+        except KeyError:
+            raise FileNotFoundError(f"File not found: {path}") from None
 
     def write_text(
         self,
@@ -134,28 +302,31 @@ class MemoryFileSystem(FileSystemAdapter):
         encoding: str = "utf-8",
     ) -> None:
         """Write to memory."""
-        path = Path(path)
         with self._lock:
-            self._ensure_parent_dirs(path)
-            self._files[path] = content
+            self._store(Path(path), content)
+
+    def write_many(
+        self,
+        files: Mapping[Path, str],
+        encoding: str = "utf-8",
+    ) -> None:
+        """Write several files to memory under one lock acquisition."""
+        with self._lock:
+            for path, content in files.items():
+                self._store(Path(path), content)
 
     def exists(self, path: str | Path) -> bool:
         """Check memory existence."""
         path = Path(path)
-        with self._lock:
-            return path in self._files or path in self._dirs
+        return path in self._files or path in self._dirs
 
     def is_file(self, path: str | Path) -> bool:
         """Check if memory path is file."""
-        path = Path(path)
-        with self._lock:
-            return path in self._files
+        return Path(path) in self._files
 
     def is_dir(self, path: str | Path) -> bool:
         """Check if memory path is directory."""
-        path = Path(path)
-        with self._lock:
-            return path in self._dirs
+        return Path(path) in self._dirs
 
     def mkdir(
         self,
@@ -174,6 +345,7 @@ class MemoryFileSystem(FileSystemAdapter):
                 self._ensure_parent_dirs(path / "placeholder")
 
             self._dirs.add(path)
+            self._index_dir(path)
 
     def glob(self, path: str | Path, pattern: str) -> Iterator[Path]:
         """Glob search in memory filesystem.
@@ -185,20 +357,16 @@ class MemoryFileSystem(FileSystemAdapter):
         Returns:
             Iterator of matching Path objects
         """
-        import fnmatch
-
-        path = Path(path)
-        with self._lock:
-            # Find all files that start with the base path
-            for file_path in self._files:
-                # Check if file is direct child of path
-                if file_path.parent == path:
-                    if fnmatch.fnmatch(file_path.name, pattern):
-                        yield file_path
+        files = tuple(self._dir_files.get(Path(path), {}))
+        for file_path in files:
+            if fnmatch.fnmatch(file_path.name, pattern):
+                yield file_path
 
     def rglob(self, path: str | Path, pattern: str) -> Iterator[Path]:
         """Recursive glob search in memory filesystem.
 
+        Only the subtree under ``path`` is visited.
+
         Args:
             path: Base directory to search in
             pattern: Glob pattern (e.g., "*.md", "*.py")
@@ -206,20 +374,21 @@ class MemoryFileSystem(FileSystemAdapter):
         Returns:
             Iterator of matching Path objects (recursively)
         """
-        import fnmatch
-
         path = Path(path)
-        with self._lock:
-            # Find all files recursively under path
-            for file_path in self._files:
-                # Check if file is under path (or equal to path)
-                try:
-                    file_path.relative_to(path)
-                    if fnmatch.fnmatch(file_path.name, pattern):
-                        yield file_path
-                except ValueError:
-                    # file_path is not relative to path, skip it
-                    continue
+        matches: list[tuple[int, Path]] = []
+        seq = self._dir_files.get(path.parent, {}).get(path)
+        if seq is not None and fnmatch.fnmatch(path.name, pattern):
+            matches.append((seq, path))
+        for directory in self._walk(path):
+            files = tuple(self._dir_files.get(directory, {}).items())
+            matches.extend(
+                (seq, file_path)
+                for file_path, seq in files
+                if fnmatch.fnmatch(file_path.name, pattern)
+            )
+        matches.sort()
+        for _, file_path in matches:
+            yield file_path
 
     def copy(self, src: str | Path, dst: str | Path) -> None:
         """Copy in memory."""
@@ -230,6 +399,51 @@ class MemoryFileSystem(FileSystemAdapter):
         content = self.read_text(src)
         self.write_text(dst, content)
 
+    def remove(self, path: str | Path) -> None:
+        """Remove file or directory tree from memory."""
+        path = Path(path)
+        with self._lock:
+            if path in self._files:
+                del self._files[path]
+                del self._dir_files[path.parent][path]
+            for directory in list(self._walk(path)):
+                for file_path in self._dir_files.pop(directory, {}):
+                    del self._files[file_path]
+                self._subdirs.pop(directory, None)
+                self._dirs.discard(directory)
+            self._subdirs.get(path.parent, {}).pop(path, None)
+
+    def _store(self, path: Path, content: str) -> None:
+        """Write one file and index it (caller holds the lock)."""
+        parent = path.parent
+        siblings = self._dir_files.get(parent)
+        if siblings is None:
+            # First file here: every ancestor still has to be created
+            self._ensure_parent_dirs(path)
+            self._index_dir(parent)
+            siblings = self._dir_files[parent] = {}
+        if path not in siblings:
+            self._seq += 1
+            siblings[path] = self._seq
+        self._files[path] = content
+
+    def _index_dir(self, directory: Path) -> None:
+        """Link ``directory`` and its ancestors into the tree index."""
+        while directory != directory.parent:
+            siblings = self._subdirs.setdefault(directory.parent, {})
+            if directory in siblings:
+                return
+            siblings[directory] = None
+            directory = directory.parent
+
+    def _walk(self, root: Path) -> Iterator[Path]:
+        """Yield ``root`` and every indexed directory below it."""
+        stack = [root]
+        while stack:
+            directory = stack.pop()
+            yield directory
+            stack.extend(tuple(self._subdirs.get(directory, {})))
+
     def _ensure_parent_dirs(self, path: Path) -> None:
         """Ensure parent directories exist recursively."""
         path = Path(path)
@@ -0,0 +1,214 @@
+"""Single-shot Git working tree state probe.
+
+Collects branch, HEAD, upstream tracking (ahead/behind) and changed files
+from ONE ``git status --porcelain=v2 --branch -z`` call and caches the
+result for the lifetime of the probe (one run of git-sync or mock-CI).
+
+On large repositories every ``git status`` costs hundreds of milliseconds,
+so callers share a probe instead of spawning ``git status``, ``git branch``
+and ``git rev-parse`` separately.
+
+Example Usage:
+    >>> from scripts.utils.git_state import GitStateProbe
+    >>>
+    >>> probe = GitStateProbe(Path("/project"))
+    >>> state = probe.get()
+    >>> if state is not None and not state.is_clean:
+    ...     print(f"{state.branch}: {len(state.changes)} changes")
+"""
+
+from __future__ import annotations
+
+import subprocess
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+# Command producing everything GitState needs in one process spawn
+GIT_STATE_COMMAND = ["git", "status", "--porcelain=v2", "--branch", "-z"]
+
+# Runs a git command and returns its stdout, or None if it failed
+GitRunner = Callable[[Sequence[str]], str | None]
+
+# Number of space-separated fields before the path in porcelain v2 records
+_ORDINARY_FIELDS = 8  # "1 XY sub mH mI mW hH hI <path>"
+_RENAME_FIELDS = 9  # "2 XY sub mH mI mW hH hI Xscore <path>"
+_UNMERGED_FIELDS = 10  # "u XY sub m1 m2 m3 mW h1 h2 h3 <path>"
+
+
+@dataclass(frozen=True)
+class FileChange:
+    """One changed path in the working tree.
+
+    Attributes:
+        xy: Two-letter porcelain v1 status (e.g. "M ", " M", "??")
+        path: Path relative to the repository root
+        orig_path: Source path for renames/copies, None otherwise
+    """
+
+    xy: str
+    path: str
+    orig_path: str | None = None
+
+    def porcelain(self) -> str:
+        """Format as a ``git status --porcelain`` (v1) line."""
+        if self.orig_path is not None:
+            return f"{self.xy} {self.orig_path} -> {self.path}"
+        return f"{self.xy} {self.path}"
+
+
+@dataclass(frozen=True)
+class GitState:
+    """Snapshot of the repository state.
+
+    Attributes:
+        branch: Current branch (None if HEAD is detached)
+        head: Full commit hash of HEAD (None before the first commit)
+        upstream: Upstream branch (e.g. "origin/main"), if configured
+        ahead: Commits ahead of upstream (0 without upstream)
+        behind: Commits behind upstream (0 without upstream)
+        changes: Changed, staged, unmerged and untracked paths
+    """
+
+    branch: str | None = None
+    head: str | None = None
+    upstream: str | None = None
+    ahead: int = 0
+    behind: int = 0
+    changes: tuple[FileChange, ...] = ()
+
+    @property
+    def is_clean(self) -> bool:
+        """True when there is nothing to commit."""
+        return not self.changes
+
+    @property
+    def short_head(self) -> str | None:
+        """First 8 characters of HEAD, as shown in reports."""
+        return self.head[:8] if self.head else None
+
+    def porcelain_lines(self) -> list[str]:
+        """Changed paths formatted as ``git status --porcelain`` (v1) lines."""
+        return [change.porcelain() for change in self.changes]
+
+
+def _v1_xy(xy: str) -> str:
+    """Convert a porcelain v2 XY code ("." = unmodified) to v1 (space)."""
+    return xy.replace(".", " ")
+
+
+def parse_porcelain_v2(output: str) -> GitState:
+    """Parse the output of :data:`GIT_STATE_COMMAND`.
+
+    Args:
+        output: NUL-separated ``git status --porcelain=v2 --branch -z`` output
+
+    Returns:
+        Parsed GitState (unknown record types are ignored)
+    """
+    headers: dict[str, str] = {}
+    changes: list[FileChange] = []
+
+    records = iter(output.split("\0"))
+    for record in records:
+        if not record:
+            continue
+        kind = record[0]
+        if kind == "#":
+            key, _, value = record[2:].partition(" ")
+            headers[key] = value
+        elif kind == "1":
+            parts = record.split(" ", _ORDINARY_FIELDS)
+            changes.append(FileChange(_v1_xy(parts[1]), parts[-1]))
+        elif kind == "2":
+            parts = record.split(" ", _RENAME_FIELDS)
+            # The rename source follows as its own NUL-terminated record
+            changes.append(
+                FileChange(_v1_xy(parts[1]), parts[-1], next(records, "")),
+            )
+        elif kind == "u":
+            parts = record.split(" ", _UNMERGED_FIELDS)
+            changes.append(FileChange(parts[1], parts[-1]))
+        elif kind == "?":
+            changes.append(FileChange("??", record[2:]))
+
+    ahead, _, behind = headers.get("branch.ab", "+0 -0").partition(" ")
+    branch = headers.get("branch.head")
+    head = headers.get("branch.oid")
+    return GitState(
+        branch=None if branch == "(detached)" else branch,
+        head=None if head == "(initial)" else head,
+        upstream=headers.get("branch.upstream"),
+        ahead=abs(int(ahead)),
+        behind=abs(int(behind)),
+        changes=tuple(changes),
+    )
+
+
+class GitStateProbe:
+    """Collects and caches the Git state of a workspace.
+
+    The first call to :meth:`get` runs :data:`GIT_STATE_COMMAND`; later calls
+    return the cached snapshot until :meth:`invalidate` is called (e.g. after
+    ``git add`` / ``git commit``).
+
+    Attributes:
+        workspace_root: Repository root the command runs in
+    """
+
+    def __init__(
+        self,
+        workspace_root: Path,
+        runner: GitRunner | None = None,
+        timeout: int = 30,
+    ) -> None:
+        """Initialize the probe.
+
+        Args:
+            workspace_root: Repository root
+            runner: Callable running a git command and returning stdout or
+                None on failure (defaults to a plain ``subprocess.run``)
+            timeout: Timeout in seconds for the default runner
+        """
+        self.workspace_root = workspace_root
+        self._runner = runner or self._run
+        self._timeout = timeout
+        self._state: GitState | None = None
+        self._loaded = False
+
+    def _run(self, command: Sequence[str]) -> str | None:
+        """Default runner: execute ``command`` in the workspace."""
+        try:
+            result = subprocess.run(  # noqa: S603
+                list(command),
+                cwd=self.workspace_root,
+                shell=False,  # Security: prevent shell injection
+                capture_output=True,
+                text=True,
+                check=False,
+                timeout=self._timeout,
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+        return result.stdout if result.returncode == 0 else None
+
+    def get(self, refresh: bool = False) -> GitState | None:
+        """Return the repository state, running git at most once per run.
+
+        Args:
+            refresh: Discard the cached snapshot and query git again
+
+        Returns:
+            GitState, or None if the workspace is not a Git repository
+            (or git could not be executed)
+        """
+        if refresh or not self._loaded:
+            output = self._runner(GIT_STATE_COMMAND)
+            self._state = parse_porcelain_v2(output) if output is not None else None
+            self._loaded = True
+        return self._state
+
+    def invalidate(self) -> None:
+        """Forget the cached snapshot (call after mutating the repository)."""
+        self._state = None
+        self._loaded = False
@@ -24,11 +24,20 @@ Versão: 1.0.0
 
 from __future__ import annotations
 
+import importlib
 import json
 import logging
+import logging.handlers
+import math
 import os
+import queue
+import re
 import sys
+import threading
+import weakref
+from collections.abc import Callable, Sequence
 from datetime import datetime, timezone
+from typing import Any, Literal
 
 try:
     from scripts.utils.context import get_trace_id
@@ -172,20 +181,59 @@ class SensitiveDataFilter(logging.Filter):
         "AUTH",
     ]
 
-    def __init__(self) -> None:
-        """Initialize the sensitive data filter with regex patterns."""
-        super().__init__()
-        # Pre-compile regex patterns for performance
-        import re
+    REDACTION = "[REDACTED]"
 
-        self._patterns = [
-            (re.compile(pattern), replacement)
-            for pattern, replacement in self.SENSITIVE_PATTERNS
-        ]
+    # Minimum length of an environment value worth redacting
+    MIN_ENV_VALUE_LENGTH = 4
+
+    # Record attribute marking records already redacted by any filter instance
+    _REDACTED_ATTR = "_sensitive_redacted"
+
+    # Single alternation of token patterns + env values, shared by all filters
+    _engine: re.Pattern[str] | None = None
+    _engine_lock = threading.Lock()
+
+    @classmethod
+    def _sensitive_env_values(cls) -> list[str]:
+        """Snapshot the values of sensitive environment variables."""
+        values = {
+            value
+            for env_var, value in os.environ.items()
+            if len(value) >= cls.MIN_ENV_VALUE_LENGTH
+            and any(key in env_var.upper() for key in cls.SENSITIVE_ENV_KEYS)
+        }
+        # Longest first so a value containing another one is redacted whole
+        return sorted(values, key=len, reverse=True)
+
+    @classmethod
+    def refresh(cls) -> re.Pattern[str]:
+        """Re-snapshot sensitive environment values and recompile the engine.
+
+        Call after secrets are added to ``os.environ`` at runtime; otherwise
+        the snapshot taken on first use is reused for every record.
+
+        Returns:
+            The compiled redaction pattern
+        """
+        alternatives = [pattern for pattern, _ in cls.SENSITIVE_PATTERNS]
+        alternatives.extend(re.escape(value) for value in cls._sensitive_env_values())
+        engine = re.compile("|".join(alternatives))
+        with cls._engine_lock:
+            cls._engine = engine
+        return engine
+
+    @classmethod
+    def _get_engine(cls) -> re.Pattern[str]:
+        """Return the compiled redaction pattern, building it on first use."""
+        engine = cls._engine
+        return engine if engine is not None else cls.refresh()
 
     def _redact_text(self, text: str) -> str:
         """Redact sensitive data from a text string.
 
+        Token patterns and sensitive environment values are matched in a
+        single pass of one precompiled alternation.
+
         Args:
             text: Text to redact
 
@@ -195,28 +243,24 @@ class SensitiveDataFilter(logging.Filter):
         if not isinstance(text, str):
             return text
 
-        result = text
-        for pattern, replacement in self._patterns:
-            result = pattern.sub(replacement, result)
-
-        # Redact environment variable values if they match sensitive keys
-        for key in self.SENSITIVE_ENV_KEYS:
-            for env_var, value in os.environ.items():
-                if key in env_var.upper() and value and len(value) > 3:
-                    # Only redact non-trivial values
-                    result = result.replace(value, "[REDACTED]")
-
-        return result
+        return self._get_engine().sub(self.REDACTION, text)
 
     def filter(self, record: logging.LogRecord) -> bool:
         """Redact sensitive data from log record.
 
+        The filter is attached to every handler, but a record is redacted
+        only once: later handlers see the marker attribute and skip it.
+
         Args:
             record: Log record to filter
 
         Returns:
             Always True (record is always processed)
         """
+        if getattr(record, self._REDACTED_ATTR, False):
+            return True
+        setattr(record, self._REDACTED_ATTR, True)
+
         # Redact the message
         if isinstance(record.msg, str):
             record.msg = self._redact_text(record.msg)
@@ -242,6 +286,45 @@ class SensitiveDataFilter(logging.Filter):
 # ============================================================
 
 
+# JSON encoders accepted by JSONFormatter ("json" = stdlib, byte-stable)
+JsonEncoderName = Literal["json", "orjson", "msgspec"]
+
+# Entries kept in each JSONFormatter fragment cache before it is reset
+_FRAGMENT_CACHE_SIZE = 4096
+
+# Stdlib string encoder used by json.dumps(..., ensure_ascii=False)
+_encode_json_str: Callable[[str], str] = (
+    getattr(
+        json.encoder,
+        "c_encode_basestring",
+        None,
+    )
+    or json.encoder.py_encode_basestring
+)
+
+
+def _load_json_encoder(name: str) -> Callable[[dict[str, Any]], str] | None:
+    """Resolve an optional third-party JSON encoder.
+
+    Args:
+        name: "orjson" or "msgspec"
+
+    Returns:
+        Function encoding a log entry to str, or None if the package is
+        not installed
+    """
+    try:
+        if name == "orjson":
+            orjson = importlib.import_module("orjson")
+            return lambda entry: str(orjson.dumps(entry).decode("utf-8"))
+        if name == "msgspec":
+            encoder = importlib.import_module("msgspec.json").Encoder()
+            return lambda entry: str(encoder.encode(entry).decode("utf-8"))
+    except ImportError:
+        return None
+    raise ValueError(f"Unknown JSON encoder: {name!r}")
+
+
 class JSONFormatter(logging.Formatter):
     """Formats log records as JSON for structured logging.
 
@@ -258,9 +341,16 @@ class JSONFormatter(logging.Formatter):
         - location: File and line number
         - extra: Any additional context fields
 
+    With the default ``encoder="json"`` the output is byte-identical to
+    ``json.dumps(entry, ensure_ascii=False)``, but built from cached
+    fragments: the timestamp prefix is computed once per second and the
+    encoded level, logger and location strings are reused across records.
+    ``encoder="orjson"``/``"msgspec"`` use the optional package when it is
+    installed (compact separators, falling back to the stdlib otherwise).
+
     Example Output:
         {
-            "timestamp": "2025-12-03T21:45:00.123456Z",
+            "timestamp": "2025-12-03T21:45:00.123456+00:00",
             "level": "INFO",
             "logger": "scripts.cli.audit",
             "message": "Starting audit",
@@ -269,21 +359,61 @@ class JSONFormatter(logging.Formatter):
         }
     """
 
-    def format(self, record: logging.LogRecord) -> str:
-        """Format log record as JSON string.
+    def __init__(self, encoder: JsonEncoderName = "json") -> None:
+        """Initialize the formatter.
 
         Args:
-            record: Log record to format
+            encoder: JSON backend ("json", "orjson" or "msgspec")
+
+        Raises:
+            ValueError: If the encoder name is unknown
+        """
+        super().__init__()
+        self._fast_encode = None if encoder == "json" else _load_json_encoder(encoder)
+        self.encoder = encoder if self._fast_encode is not None else "json"
+        # (whole second, "YYYY-MM-DDTHH:MM:SS") of the last record seen
+        self._second_cache: tuple[float, str] = (float("nan"), "")
+        self._fragments: dict[object, str] = {}
+
+    def _timestamp(self, created: float) -> str:
+        """Same result as ``datetime.fromtimestamp(created, utc).isoformat()``.
+
+        Args:
+            created: Record creation time (Unix timestamp)
 
         Returns:
-            JSON-formatted log string
+            ISO8601 timestamp with "+00:00" offset
         """
-        # Build base log entry
-        log_entry = {
-            "timestamp": datetime.fromtimestamp(
-                record.created,
-                tz=timezone.utc,
-            ).isoformat(),
+        # Round to microseconds exactly like datetime.fromtimestamp
+        frac, whole = math.modf(created)
+        micros = round(frac * 1e6)
+        if micros >= 1_000_000:
+            whole, micros = whole + 1, micros - 1_000_000
+        elif micros < 0:
+            whole, micros = whole - 1, micros + 1_000_000
+
+        second, prefix = self._second_cache
+        if whole != second:
+            prefix = datetime.fromtimestamp(whole, tz=timezone.utc).isoformat()[:19]
+            self._second_cache = (whole, prefix)
+
+        if micros:
+            return f"{prefix}.{micros:06d}+00:00"
+        return f"{prefix}+00:00"
+
+    def _fragment(self, key: object, value: str) -> str:
+        """Return the cached JSON encoding of a low-cardinality string."""
+        encoded = self._fragments.get(key)
+        if encoded is None:
+            if len(self._fragments) >= _FRAGMENT_CACHE_SIZE:
+                self._fragments.clear()
+            encoded = self._fragments[key] = _encode_json_str(value)
+        return encoded
+
+    def _build_entry(self, record: logging.LogRecord) -> dict[str, Any]:
+        """Build the log entry dict (used by the third-party encoders)."""
+        log_entry: dict[str, Any] = {
+            "timestamp": self._timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -300,7 +430,277 @@ class JSONFormatter(logging.Formatter):
         if extra:
             log_entry["extra"] = extra
 
-        return json.dumps(log_entry, ensure_ascii=False)
+        return log_entry
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format log record as JSON string.
+
+        Args:
+            record: Log record to format
+
+        Returns:
+            JSON-formatted log string
+        """
+        if self._fast_encode is not None:
+            return self._fast_encode(self._build_entry(record))
+
+        trace_id = getattr(record, "trace_id", "no-trace-id")
+        parts = [
+            '{"timestamp": "',
+            self._timestamp(record.created),
+            '", "level": ',
+            self._fragment(("level", record.levelname), record.levelname),
+            ', "logger": ',
+            self._fragment(("logger", record.name), record.name),
+            ', "message": ',
+            _encode_json_str(record.getMessage()),
+            ', "trace_id": ',
+            (
+                _encode_json_str(trace_id)
+                if isinstance(trace_id, str)
+                else json.dumps(trace_id, ensure_ascii=False)
+            ),
+            ', "location": ',
+            self._fragment(
+                (record.filename, record.lineno),
+                f"{record.filename}:{record.lineno}",
+            ),
+        ]
+
+        # Add exception info if present
+        if record.exc_info:
+            parts += [
+                ', "exception": ',
+                _encode_json_str(self.formatException(record.exc_info)),
+            ]
+
+        # Add extra fields (custom context)
+        extra = getattr(record, "extra", None)
+        if extra:
+            parts += [', "extra": ', json.dumps(extra, ensure_ascii=False)]
+
+        parts.append("}")
+        return "".join(parts)
+
+
+# ============================================================
+# 2.7. ASYNC (QUEUE) LOGGING
+# ============================================================
+
+# Records buffered between producers and the background writer thread
+DEFAULT_LOG_QUEUE_SIZE = 10_000
+
+# What producers do when the queue is full
+OverflowPolicy = Literal["block", "drop"]
+
+
+def _deliver(handlers: Sequence[logging.Handler], record: logging.LogRecord) -> None:
+    """Hand ``record`` to each handler whose level accepts it."""
+    for handler in handlers:
+        if record.levelno >= handler.level:
+            handler.handle(record)
+
+
+class _DrainingQueueListener(logging.handlers.QueueListener):
+    """QueueListener routing each record to the handlers of its producer.
+
+    Queue items are ``(handlers, record)`` pairs, so one queue and one
+    thread serve every BoundedQueueHandler attached to them. A
+    ``threading.Event`` item is set once everything queued before it was
+    handled (used to drain without stopping the thread).
+
+    The stdlib listener enqueues the stop sentinel with ``put_nowait``,
+    which raises ``queue.Full`` when producers filled a bounded queue.
+    """
+
+    def enqueue_sentinel(self) -> None:
+        """Block until the sentinel fits (the listener keeps draining)."""
+        self.queue.put(self._sentinel)  # type: ignore[attr-defined]
+
+    def handle(self, record: Any) -> None:
+        """Deliver a routed record, or acknowledge a drain marker."""
+        if isinstance(record, threading.Event):
+            record.set()
+            return
+        handlers, routed = record
+        _deliver(handlers, routed)
+
+
+# Process-wide queue and listener shared by setup_logging's async handlers
+_shared_pipeline: tuple[queue.Queue[Any], _DrainingQueueListener] | None = None
+_shared_pipeline_lock = threading.Lock()
+
+# Live async handlers, switched to synchronous delivery in forked children
+_async_handlers: weakref.WeakSet[BoundedQueueHandler] = weakref.WeakSet()
+
+
+def _get_shared_pipeline(
+    queue_size: int,
+) -> tuple[queue.Queue[Any], _DrainingQueueListener]:
+    """Return the process-wide queue and listener, starting them once.
+
+    The queue grows to the largest ``queue_size`` requested so far.
+    """
+    global _shared_pipeline  # noqa: PLW0603
+    with _shared_pipeline_lock:
+        if _shared_pipeline is None:
+            log_queue: queue.Queue[Any] = queue.Queue(maxsize=queue_size)
+            listener = _DrainingQueueListener(log_queue)
+            listener.start()
+            _shared_pipeline = (log_queue, listener)
+        log_queue = _shared_pipeline[0]
+        with log_queue.mutex:
+            log_queue.maxsize = max(log_queue.maxsize, queue_size)
+        return _shared_pipeline
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """Hands records to a background thread through a bounded queue.
+
+    Producers only enqueue the record; the handlers passed in (formatting,
+    redaction and I/O) run on the listener thread. When the queue is full
+    the ``overflow`` policy decides whether the producer waits ("block") or
+    the record is discarded and counted in ``dropped`` ("drop").
+
+    With ``shared=True`` the handler uses the process-wide queue and
+    listener, so any number of loggers cost one thread (setup_logging does
+    this); otherwise it owns a private queue and listener.
+
+    Records are not pre-formatted: message arguments are rendered on the
+    listener thread, so pass values that are not mutated after the call.
+
+    Fork safety: a forked child inherits the queue but not the listener
+    thread, so after ``fork()`` every handler delivers records synchronously
+    on the producer thread (see _after_fork_in_child).
+
+    Attributes:
+        overflow: Policy applied when the queue is full
+        dropped: Records discarded because the queue was full
+        listener: Background listener feeding the downstream handlers
+        shared: Whether the listener is the process-wide one
+
+    Example:
+        >>> handler = BoundedQueueHandler([logging.FileHandler("app.log")])
+        >>> logger.addHandler(handler)
+        >>> handler.close()  # drains the queue and stops the thread
+    """
+
+    def __init__(
+        self,
+        handlers: Sequence[logging.Handler],
+        queue_size: int = DEFAULT_LOG_QUEUE_SIZE,
+        overflow: OverflowPolicy = "block",
+        *,
+        shared: bool = False,
+    ) -> None:
+        """Attach to a queue and its background listener.
+
+        Args:
+            handlers: Handlers that format and write records
+            queue_size: Maximum buffered records (>= 1)
+            overflow: "block" to wait for room, "drop" to discard the record
+            shared: Use the process-wide queue and listener
+
+        Raises:
+            ValueError: If queue_size < 1 or overflow is unknown
+        """
+        if queue_size < 1:
+            raise ValueError("queue_size must be >= 1")
+        if overflow not in ("block", "drop"):
+            raise ValueError(f"Unknown overflow policy: {overflow!r}")
+
+        if shared:
+            log_queue, listener = _get_shared_pipeline(queue_size)
+        else:
+            log_queue = queue.Queue(maxsize=queue_size)
+            listener = _DrainingQueueListener(log_queue)
+            listener.start()
+        super().__init__(log_queue)
+        self._log_queue = log_queue
+        self.listener = listener
+        self.shared = shared
+        self.overflow = overflow
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+        self._targets = tuple(handlers)
+        self._synchronous = False
+        self._running = True
+        _async_handlers.add(self)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Pass the record through untouched (same process, no pickling)."""
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Put the record on the queue according to the overflow policy."""
+        if self._synchronous:
+            _deliver(self._targets, record)
+            return
+        item = (self._targets, record)
+        if self.overflow == "block":
+            self._log_queue.put(item)
+            return
+        try:
+            self._log_queue.put_nowait(item)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += 1
+
+    def run_synchronously(self) -> None:
+        """Deliver records on the producer thread from now on.
+
+        Called in a forked child, where no listener thread drains the queue.
+        """
+        self._synchronous = True
+        self._dropped_lock = threading.Lock()
+
+    def _drain(self) -> None:
+        """Wait until every record queued so far was handled."""
+        marker = threading.Event()
+        self._log_queue.put(marker)
+        marker.wait()
+
+    def close(self) -> None:
+        """Drain pending records, detach from the listener and close the targets.
+
+        A private listener is stopped; the shared one keeps serving the
+        other handlers.
+        """
+        self.acquire()
+        try:
+            running, self._running = self._running, False
+        finally:
+            self.release()
+
+        if running:
+            if self._synchronous:
+                pass  # forked child: nothing queued by this process
+            elif self.shared:
+                self._drain()
+            else:
+                self.listener.stop()
+            for handler in self._targets:
+                handler.close()
+        _async_handlers.discard(self)
+        super().close()
+
+
+def _after_fork_in_child() -> None:
+    """Fall back to synchronous logging in a forked child.
+
+    The child inherits the queues (possibly holding the parent's records)
+    but not the listener threads: without this, records are silently lost
+    and "block" producers hang once the queue fills.
+    """
+    global _shared_pipeline, _shared_pipeline_lock  # noqa: PLW0603
+    _shared_pipeline = None
+    _shared_pipeline_lock = threading.Lock()
+    for handler in list(_async_handlers):
+        handler.run_synchronously()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
 
 
 # ============================================================
@@ -413,6 +813,51 @@ def get_colors(*, force: bool = False) -> TerminalColors:
 # ============================================================
 
 
+def _reset_handlers(logger: logging.Logger) -> None:
+    """Remove os handlers do logger, drenando filas assíncronas anteriores.
+
+    Args:
+        logger: Logger sendo (re)configurado
+    """
+    for handler in logger.handlers:
+        if isinstance(handler, BoundedQueueHandler):
+            handler.close()
+    logger.handlers.clear()
+
+
+def _create_formatter(
+    use_json: bool | None,
+    format_string: str | None,
+) -> logging.Formatter:
+    """Cria o formatter (JSON ou texto) usado por setup_logging.
+
+    Args:
+        use_json: Força JSON. Se None, usa a variável LOG_FORMAT
+            (o backend JSON vem de LOG_JSON_ENCODER)
+        format_string: String de formatação customizada (modo texto)
+
+    Returns:
+        Formatter configurado
+    """
+    # Determine format (JSON or text)
+    if use_json is None:
+        log_format = os.environ.get("LOG_FORMAT", "text").lower()
+        use_json = log_format == "json"
+
+    if use_json:
+        encoder = os.environ.get("LOG_JSON_ENCODER", "json").lower()
+        if encoder not in ("json", "orjson", "msgspec"):
+            encoder = "json"
+        return JSONFormatter(encoder=encoder)  # type: ignore[arg-type]
+
+    # Formato padrão com Trace ID
+    if format_string is None:
+        format_string = (
+            "%(asctime)s - [%(trace_id)s] - %(name)s - %(levelname)s - %(message)s"
+        )
+    return logging.Formatter(format_string)
+
+
 def setup_logging(
     name: str = "__main__",
     level: int = logging.INFO,
@@ -420,6 +865,9 @@ def setup_logging(
     format_string: str | None = None,
     *,
     use_json: bool | None = None,
+    async_mode: bool | None = None,
+    queue_size: int = DEFAULT_LOG_QUEUE_SIZE,
+    overflow: OverflowPolicy = "block",
 ) -> logging.Logger:
     """Configura logging com separação correta de streams e Trace ID.
 
@@ -428,6 +876,7 @@ def setup_logging(
     - WARNING/ERROR/CRITICAL → stderr (diagnósticos)
     - Trace ID automático para correlação de logs
     - Suporte a JSON structured logging
+    - Modo assíncrono opcional: formatação, redação e I/O em thread dedicada
 
     Args:
         name: Nome do logger (geralmente __name__)
@@ -435,6 +884,12 @@ def setup_logging(
         log_file: Caminho opcional para arquivo de log
         format_string: String de formatação customizada
         use_json: Force JSON format. If None, uses LOG_FORMAT env var
+        async_mode: Send records through a BoundedQueueHandler so the caller
+            only pays an enqueue. Every logger shares one process-wide queue
+            and listener thread. If None, uses LOG_ASYNC env var
+        queue_size: Maximum buffered records in async mode (the shared queue
+            grows to the largest size requested)
+        overflow: Async mode policy when the queue is full ("block"/"drop")
 
     Returns:
         Logger configurado
@@ -442,6 +897,8 @@ def setup_logging(
     Environment Variables:
         LOG_FORMAT: "json" para JSON logs, "text" para formato texto (padrão)
         LOG_LEVEL: Nível de log (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        LOG_ASYNC: "1"/"true" ativa o modo assíncrono (padrão: síncrono)
+        LOG_JSON_ENCODER: "json" (padrão), "orjson" ou "msgspec" (se instalados)
 
     Exemplo:
         >>> logger = setup_logging(__name__)
@@ -454,6 +911,9 @@ def setup_logging(
         >>> # Via environment variable
         >>> # export LOG_FORMAT=json
         >>> logger = setup_logging(__name__)
+
+        >>> # Escrita em background (descarta registros se a fila encher)
+        >>> logger = setup_logging(__name__, async_mode=True, overflow="drop")
     """
     logger = logging.getLogger(name)
 
@@ -465,48 +925,48 @@ def setup_logging(
     logger.setLevel(level)
 
     # Remove handlers existentes para evitar duplicação
-    logger.handlers.clear()
+    _reset_handlers(logger)
 
-    # Determine format (JSON or text)
-    if use_json is None:
-        log_format = os.environ.get("LOG_FORMAT", "text").lower()
-        use_json = log_format == "json"
+    if async_mode is None:
+        async_mode = os.environ.get("LOG_ASYNC", "").lower() in ("1", "true", "yes")
 
-    # Create formatter
-    if use_json:
-        formatter: logging.Formatter = JSONFormatter()
-    else:
-        # Formato padrão com Trace ID
-        if format_string is None:
-            format_string = (
-                "%(asctime)s - [%(trace_id)s] - %(name)s - %(levelname)s - %(message)s"
-            )
-        formatter = logging.Formatter(format_string)
+    formatter = _create_formatter(use_json, format_string)
 
     # Create filters
     trace_filter = TraceIDFilter()
     sensitive_filter = SensitiveDataFilter()
 
+    # Trace ID vem de contextvars: precisa ser lido na thread produtora
+    handler_filters: list[logging.Filter] = [sensitive_filter]
+    if not async_mode:
+        handler_filters.insert(0, trace_filter)
+
     # Handler para INFO/DEBUG → stdout
     stdout_handler = InfoHandler()
-    stdout_handler.setFormatter(formatter)
-    stdout_handler.addFilter(trace_filter)
-    stdout_handler.addFilter(sensitive_filter)
-    logger.addHandler(stdout_handler)
-
     # Handler para WARNING/ERROR/CRITICAL → stderr
     stderr_handler = ErrorHandler()
-    stderr_handler.setFormatter(formatter)
-    stderr_handler.addFilter(trace_filter)
-    stderr_handler.addFilter(sensitive_filter)
-    logger.addHandler(stderr_handler)
+    handlers: list[logging.Handler] = [stdout_handler, stderr_handler]
 
     # Handler opcional para arquivo (todos os níveis)
     if log_file:
-        file_handler = logging.FileHandler(log_file, mode="a")
-        file_handler.setFormatter(formatter)
-        file_handler.addFilter(trace_filter)
-        file_handler.addFilter(sensitive_filter)
-        logger.addHandler(file_handler)
+        handlers.append(logging.FileHandler(log_file, mode="a"))
+
+    for handler in handlers:
+        handler.setFormatter(formatter)
+        for handler_filter in handler_filters:
+            handler.addFilter(handler_filter)
+
+    if async_mode:
+        queue_handler = BoundedQueueHandler(
+            handlers,
+            queue_size=queue_size,
+            overflow=overflow,
+            shared=True,
+        )
+        queue_handler.addFilter(trace_filter)
+        logger.addHandler(queue_handler)
+    else:
+        for handler in handlers:
+            logger.addHandler(handler)
 
     return logger
@@ -0,0 +1,157 @@
+"""Parallel - Ordered process-pool map and timed reports for batch tools.
+
+Shared by the batch tools that analyze many files or projects at once
+(``cortex migrate``, ``cortex audit``, ``fusion --fleet``):
+
+- ``worker_count`` decides how many processes a batch gets: none below a
+  threshold (starting interpreters costs more than it saves), at most
+  ``MAX_DEFAULT_WORKERS`` unless asked for more, never more than the items
+- ``process_map`` runs ``task(context, item)`` in a pool, in input order;
+  each worker builds its ``context`` once (e.g. a migrator, a parsed
+  template) instead of receiving it with every item
+- ``TimedReport`` gives reports of timed results ``slowest`` and
+  ``export_to_json``
+
+Usage:
+    workers = worker_count(len(files), requested)
+    if workers > 1:
+        results = list(process_map(task, files, context=factory, workers=workers))
+    else:
+        results = [task(local_context, path) for path in files]
+
+Author: Engineering Team
+License: MIT
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Generic, Protocol, TypeVar
+
+from scripts.utils.atomic import atomic_write_json
+
+PARALLEL_THRESHOLD = 64
+"""Below this many items, starting worker processes costs more than it saves."""
+
+MAX_DEFAULT_WORKERS = 8
+"""Processes used when none are requested, however many CPUs there are."""
+
+# Chunks handed to each worker: small enough to balance uneven items
+_CHUNKS_PER_WORKER = 8
+
+ContextT = TypeVar("ContextT")
+ItemT = TypeVar("ItemT")
+ResultT = TypeVar("ResultT")
+
+# Per-process state of the pool (see process_map)
+_worker_task: Callable[[Any, Any], Any] | None = None
+_worker_context: Any = None
+
+
+def worker_count(
+    items: int,
+    requested: int | None = None,
+    *,
+    threshold: int = PARALLEL_THRESHOLD,
+) -> int:
+    """Number of worker processes for a batch of ``items``.
+
+    Args:
+        items: Size of the batch
+        requested: Processes asked for (None or 0: CPU count, capped at
+            MAX_DEFAULT_WORKERS; 1 disables processes)
+        threshold: Smallest batch worth starting processes for
+
+    Returns:
+        Processes to use; 1 means the batch should run in-process
+    """
+    if items < threshold:
+        return 1
+    workers = requested or min(os.cpu_count() or 1, MAX_DEFAULT_WORKERS)
+    return max(1, min(workers, items))
+
+
+def process_map(
+    task: Callable[[ContextT, ItemT], ResultT],
+    items: Sequence[ItemT],
+    *,
+    context: Callable[[], ContextT],
+    workers: int,
+) -> Iterator[ResultT]:
+    """Run ``task(context, item)`` for every item in worker processes.
+
+    ``task`` and ``context`` must be picklable (module-level functions,
+    classes, or ``functools.partial`` of them). Each worker calls
+    ``context()`` once when it starts.
+
+    Args:
+        task: Function applied to each item with the worker's context
+        items: Items to process
+        context: Factory of the per-worker context
+        workers: Number of processes (see worker_count)
+
+    Yields:
+        Results in input order, as they become available
+    """
+    chunksize = max(1, len(items) // (workers * _CHUNKS_PER_WORKER))
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(task, context),
+    ) as executor:
+        yield from executor.map(_run_in_worker, items, chunksize=chunksize)
+
+
+def _init_worker(task: Callable[[Any, Any], Any], context: Callable[[], Any]) -> None:
+    """Build the context of a worker process."""
+    global _worker_task, _worker_context  # noqa: PLW0603
+    _worker_task = task
+    _worker_context = context()
+
+
+def _run_in_worker(item: Any) -> Any:
+    """Process one item in a worker process."""
+    assert _worker_task is not None  # nosec B101 - set by _init_worker
+    return _worker_task(_worker_context, item)
+
+
+class Timed(Protocol):
+    """Result carrying the seconds spent producing it."""
+
+    @property
+    def duration(self) -> float:
+        """Seconds spent on this item."""
+        ...
+
+
+TimedT = TypeVar("TimedT", bound=Timed)
+
+
+class TimedReport(Generic[TimedT]):
+    """Mixin for reports made of timed per-item results.
+
+    Subclasses provide ``timed_results`` and ``to_dict``.
+    """
+
+    @property
+    def timed_results(self) -> Sequence[TimedT]:
+        """Per-item results the report is made of."""
+        raise NotImplementedError
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the report to a JSON-serializable dictionary."""
+        raise NotImplementedError
+
+    def slowest(self, count: int = 10) -> list[TimedT]:
+        """Return the ``count`` slowest results, slowest first."""
+        return sorted(self.timed_results, key=lambda r: r.duration, reverse=True)[
+            :count
+        ]
+
+    def export_to_json(self, output_path: Path) -> None:
+        """Write the report (including per-item timings) as JSON."""
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_json(output_path, self.to_dict(), fsync=False)
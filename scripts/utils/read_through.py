@@ -0,0 +1,304 @@
+"""Read-Through FileSystem - Shared base of the caching adapters.
+
+``ScanSession`` (per-run memoization, scripts/core/cortex/scan_session.py)
+and ``CachingFileSystem`` (bounded LRU, scripts/utils/caching_filesystem.py)
+both decorate a ``FileSystemAdapter``, serve repeated reads from memory and
+forget what a write made through them may have changed.
+``ReadThroughFileSystem`` implements what they share:
+
+- ``read_text`` / ``read_prefix`` cached per path and encoding,
+  ``exists`` / ``is_file`` / ``is_dir`` probes and ``glob`` / ``rglob``
+  listings
+- an index of the cached keys by path: a write drops only the entries of
+  the written path and of its parents, plus, for directory operations
+  (``copy``, ``remove``), every entry below it
+- write-through methods that invalidate even when the write fails
+- a generation counter: a read that raced a write is returned but not
+  stored
+
+Subclasses decide where entries live (``_get``, ``_put``, ``_discard``) and
+what they count (``_count``). Reads of raw bytes are never cached.
+
+Both keep the adapter they wrap in ``fs``; ``is_real_filesystem`` looks
+through any stack of them, e.g. to decide whether worker processes opening
+files themselves would see the same tree.
+
+Author: Engineering Team
+License: MIT
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, TextIO
+
+from scripts.utils.filesystem import ByteView, FileSystemAdapter, RealFileSystem
+
+# Cache key: (kind, path, *qualifiers), e.g. ("text", path, encoding),
+# ("is_file", path) or ("rglob", path, pattern); the path is always key[1]
+CacheKey = tuple[Any, ...]
+
+
+def is_real_filesystem(fs: FileSystemAdapter) -> bool:
+    """Check whether ``fs`` reads the real filesystem, through any caches.
+
+    Args:
+        fs: Adapter, possibly a ScanSession and/or CachingFileSystem
+
+    Returns:
+        True if the innermost adapter is a RealFileSystem
+    """
+    while isinstance(fs, ReadThroughFileSystem):
+        fs = fs.fs
+    return type(fs) is RealFileSystem
+
+
+class ReadThroughFileSystem(FileSystemAdapter):
+    """Base of adapters caching the reads of another adapter.
+
+    Attributes:
+        fs: Underlying adapter
+    """
+
+    def __init__(self, fs: FileSystemAdapter | None = None) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            fs: Adapter to read from (default: RealFileSystem)
+        """
+        self.fs = fs or RealFileSystem()
+        # Path -> keys cached for it (texts, probes, listings rooted there...)
+        self._keys_by_path: dict[Path, set[CacheKey]] = {}
+        # Bumped by every invalidation: a read that raced a write is not stored
+        self._generation = 0
+        self._lock = threading.RLock()
+
+    # ---------------------------------------------------------------- storage
+
+    def _get(self, key: CacheKey) -> tuple[bool, Any]:
+        """Return (True, value) if ``key`` is cached (caller holds the lock)."""
+        raise NotImplementedError
+
+    def _put(self, key: CacheKey, value: Any) -> bool:
+        """Store a new entry; False if it was not kept (caller holds the lock)."""
+        raise NotImplementedError
+
+    def _discard(self, key: CacheKey) -> bool:
+        """Drop one entry and unindex it (caller holds the lock).
+
+        Returns:
+            Whether the entry was cached
+        """
+        raise NotImplementedError
+
+    def _count(self, key: CacheKey, hit: bool) -> None:
+        """Record the outcome of a lookup (caller holds the lock)."""
+
+    def _unindex(self, key: CacheKey) -> None:
+        """Remove ``key`` from the path index (caller holds the lock)."""
+        path = key[1]
+        keys = self._keys_by_path.get(path)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_path[path]
+
+    def _lookup(self, key: CacheKey) -> tuple[bool, Any]:
+        """Return (True, value), or (False, generation) to pass to _store."""
+        with self._lock:
+            found, value = self._get(key)
+            self._count(key, found)
+            return (True, value) if found else (False, self._generation)
+
+    def _store(self, key: CacheKey, value: Any, generation: int) -> Any:
+        """Cache ``value`` unless a write happened since the lookup that missed.
+
+        Returns:
+            The value now cached for ``key`` (the first one stored if two
+            threads raced), or ``value`` if it was not stored
+        """
+        with self._lock:
+            if generation != self._generation:
+                return value
+            found, cached = self._get(key)
+            if found:
+                return cached
+            if self._put(key, value):
+                self._keys_by_path.setdefault(key[1], set()).add(key)
+            return value
+
+    def _invalidate(self, *paths: Path, tree: bool = False) -> int:
+        """Forget everything a write to ``paths`` may have changed.
+
+        Entries are looked up by path: a file write touches only those of
+        the file and its parents, however much the cache holds.
+
+        Args:
+            paths: Written (or removed) paths
+            tree: Also drop entries below the paths (directory operations)
+
+        Returns:
+            Number of entries dropped
+        """
+        dropped = 0
+        with self._lock:
+            self._generation += 1
+            stale = {path for written in paths for path in (written, *written.parents)}
+            if tree:
+                roots = set(paths)
+                stale.update(
+                    cached
+                    for cached in self._keys_by_path
+                    if not roots.isdisjoint(cached.parents)
+                )
+            for path in stale:
+                for key in list(self._keys_by_path.get(path, ())):
+                    dropped += self._discard(key)
+        return dropped
+
+    # ------------------------------------------------------------------ reads
+
+    def read_text(self, path: str | Path, encoding: str = "utf-8") -> str:
+        """Read through the cache (one entry per path and encoding)."""
+        key = ("text", Path(path), encoding)
+        found, cached = self._lookup(key)
+        if found:
+            return str(cached)
+        text = self.fs.read_text(key[1], encoding=encoding)
+        return str(self._store(key, text, cached))
+
+    def read_prefix(
+        self,
+        path: str | Path,
+        max_bytes: int,
+        encoding: str = "utf-8",
+    ) -> tuple[str, bool]:
+        """Serve a cached whole file, or read a prefix (cached if complete)."""
+        key = ("text", Path(path), encoding)
+        found, cached = self._lookup(key)
+        if found:
+            return str(cached), True
+        prefix, complete = self.fs.read_prefix(key[1], max_bytes, encoding=encoding)
+        if complete:
+            prefix = str(self._store(key, prefix, cached))
+        return prefix, complete
+
+    def read_bytes(self, path: str | Path) -> bytes:
+        """Read raw bytes from the underlying adapter (not cached)."""
+        return self.fs.read_bytes(path)
+
+    @contextmanager
+    def map_bytes(self, path: str | Path) -> Iterator[ByteView]:
+        """Byte view from the underlying adapter (not cached)."""
+        with self.fs.map_bytes(path) as view:
+            yield view
+
+    def _probe(
+        self, kind: str, path: str | Path, check: Callable[[Path], bool]
+    ) -> bool:
+        """Answer a ``kind`` probe of ``path`` from the cache or from ``check``."""
+        key = (kind, Path(path))
+        found, cached = self._lookup(key)
+        if found:
+            return bool(cached)
+        return bool(self._store(key, check(key[1]), cached))
+
+    def exists(self, path: str | Path) -> bool:
+        """Check existence through the cache."""
+        return self._probe("exists", path, self.fs.exists)
+
+    def is_file(self, path: str | Path) -> bool:
+        """Check for a file through the cache."""
+        return self._probe("is_file", path, self.fs.is_file)
+
+    def is_dir(self, path: str | Path) -> bool:
+        """Check for a directory through the cache."""
+        return self._probe("is_dir", path, self.fs.is_dir)
+
+    def _listing(
+        self,
+        kind: str,
+        path: str | Path,
+        pattern: str,
+        walk: Callable[[Path, str], Iterator[Path]],
+    ) -> Iterator[Path]:
+        """List ``path`` from the cache, or walk it once and cache the paths."""
+        key = (kind, Path(path), pattern)
+        found, cached = self._lookup(key)
+        if found:
+            return iter(cached)
+        listing = tuple(walk(key[1], pattern))
+        return iter(self._store(key, listing, cached))
+
+    def glob(self, path: str | Path, pattern: str) -> Iterator[Path]:
+        """List a directory (non-recursive) through the cache."""
+        return self._listing("glob", path, pattern, self.fs.glob)
+
+    def rglob(self, path: str | Path, pattern: str) -> Iterator[Path]:
+        """List a directory tree through the cache."""
+        return self._listing("rglob", path, pattern, self.fs.rglob)
+
+    # ----------------------------------------------------------------- writes
+
+    def write_text(
+        self,
+        path: str | Path,
+        content: str,
+        encoding: str = "utf-8",
+    ) -> None:
+        """Write through and invalidate."""
+        try:
+            self.fs.write_text(path, content, encoding=encoding)
+        finally:
+            self._invalidate(Path(path))
+
+    def write_many(
+        self,
+        files: Mapping[Path, str],
+        encoding: str = "utf-8",
+    ) -> None:
+        """Write a batch through and invalidate every file."""
+        try:
+            self.fs.write_many(files, encoding=encoding)
+        finally:
+            self._invalidate(*(Path(path) for path in files))
+
+    def mkdir(
+        self,
+        path: str | Path,
+        parents: bool = True,
+        exist_ok: bool = True,
+    ) -> None:
+        """Create a directory through the adapter and invalidate."""
+        try:
+            self.fs.mkdir(path, parents=parents, exist_ok=exist_ok)
+        finally:
+            self._invalidate(Path(path))
+
+    def copy(self, src: str | Path, dst: str | Path) -> None:
+        """Copy through and invalidate the destination (and its tree)."""
+        try:
+            self.fs.copy(src, dst)
+        finally:
+            self._invalidate(Path(dst), tree=True)
+
+    def remove(self, path: str | Path) -> None:
+        """Remove through and invalidate the path and its tree."""
+        try:
+            self.fs.remove(path)
+        finally:
+            self._invalidate(Path(path), tree=True)
+
+    @contextmanager
+    def open_atomic(
+        self,
+        path: str | Path,
+        encoding: str = "utf-8",
+    ) -> Iterator[TextIO]:
+        """Stream through the underlying adapter, invalidating on commit."""
+        with self.fs.open_atomic(path, encoding=encoding) as stream:
+            yield stream
+        self._invalidate(Path(path))
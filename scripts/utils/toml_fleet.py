@@ -0,0 +1,337 @@
+"""TOML Fleet - Apply one template to many projects.
+
+Fleet mode for the TOML merger: the template is read and parsed once (once
+per worker process), then merged into the ``pyproject.toml`` of every
+project root given, in a process pool for larger fleets.
+
+Every target gets a FleetTargetResult with its diff, the keys in conflict
+between template and project, and its merge time. FleetReport consolidates
+them and exports to JSON.
+
+Usage:
+    from scripts.utils.toml_fleet import FleetMerger, resolve_project_roots
+
+    roots, unmatched = resolve_project_roots(["repos/*", "legacy/api"])
+    report = FleetMerger(Path("template/pyproject.toml")).merge(roots, dry_run=True)
+    print(report.changed, report.total_conflicts)
+
+Author: Engineering Team
+License: MIT
+"""
+
+from __future__ import annotations
+
+import glob
+import os
+import time
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+import tomlkit
+from tomlkit import TOMLDocument
+
+from scripts.utils.parallel import TimedReport, process_map, worker_count
+from scripts.utils.toml_merger import MergeStrategy, TOMLMerger
+
+FLEET_PARALLEL_THRESHOLD = 8
+"""Minimum number of projects before the fleet merge uses worker processes."""
+
+DEFAULT_TARGET_NAME = "pyproject.toml"
+
+
+@dataclass
+class FleetTargetResult:
+    """Outcome of merging the template into one project.
+
+    Attributes:
+        project: Project root
+        target: TOML file merged into
+        success: Whether the merge completed
+        errors: Failure descriptions (MergeResult.conflicts)
+        conflict_keys: Keys whose template and project values differed
+        diff: Unified diff of the target (empty if unchanged)
+        backup_path: Backup of the target (if written with backup)
+        duration: Merge time in seconds
+    """
+
+    project: Path
+    target: Path
+    success: bool
+    errors: list[str] = field(default_factory=list)
+    conflict_keys: list[str] = field(default_factory=list)
+    diff: str = ""
+    backup_path: Path | None = None
+    duration: float = 0.0
+
+    @property
+    def changed(self) -> bool:
+        """Whether the merge changes (or changed) the target."""
+        return bool(self.diff)
+
+    @property
+    def lines_changed(self) -> int:
+        """Number of added + removed lines in the diff."""
+        return sum(
+            1
+            for line in self.diff.splitlines()
+            if line.startswith(("+", "-")) and not line.startswith(("+++", "---"))
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "project": str(self.project),
+            "target": str(self.target),
+            "success": self.success,
+            "errors": self.errors,
+            "conflicts": len(self.conflict_keys),
+            "conflict_keys": self.conflict_keys,
+            "changed": self.changed,
+            "lines_changed": self.lines_changed,
+            "backup_path": str(self.backup_path) if self.backup_path else None,
+            "duration": round(self.duration, 6),
+            "diff": self.diff,
+        }
+
+
+@dataclass
+class FleetReport(TimedReport[FleetTargetResult]):
+    """Consolidated result of a fleet merge.
+
+    Attributes:
+        source: Template file
+        strategy: Merge strategy used
+        dry_run: Whether targets were left untouched
+        results: One result per project, in input order
+        duration: Total wall time in seconds
+    """
+
+    source: Path
+    strategy: MergeStrategy
+    dry_run: bool
+    results: list[FleetTargetResult]
+    duration: float = 0.0
+
+    @property
+    def succeeded(self) -> int:
+        """Number of successful merges."""
+        return sum(1 for r in self.results if r.success)
+
+    @property
+    def failed(self) -> int:
+        """Number of failed merges."""
+        return len(self.results) - self.succeeded
+
+    @property
+    def changed(self) -> int:
+        """Number of targets the merge changes."""
+        return sum(1 for r in self.results if r.changed)
+
+    @property
+    def total_conflicts(self) -> int:
+        """Conflicting keys across the fleet."""
+        return sum(len(r.conflict_keys) for r in self.results)
+
+    @property
+    def timed_results(self) -> Sequence[FleetTargetResult]:
+        """Per-project results, for slowest() and export_to_json()."""
+        return self.results
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "source": str(self.source),
+            "strategy": self.strategy.value,
+            "dry_run": self.dry_run,
+            "duration": round(self.duration, 6),
+            "summary": {
+                "projects": len(self.results),
+                "succeeded": self.succeeded,
+                "failed": self.failed,
+                "changed": self.changed,
+                "conflicts": self.total_conflicts,
+            },
+            "projects": [r.to_dict() for r in self.results],
+        }
+
+
+def resolve_project_roots(
+    patterns: Iterable[str],
+    base_dir: Path | None = None,
+) -> tuple[list[Path], list[str]]:
+    """Expand project roots and globs into a list of directories.
+
+    Args:
+        patterns: Directories or glob patterns (``**`` allowed); a path to a
+            TOML file stands for its directory
+        base_dir: Directory relative patterns are resolved against (default:
+            current directory)
+
+    Returns:
+        Tuple of (existing project roots, deduplicated, in pattern order
+        with glob matches sorted; patterns that matched no directory, e.g.
+        a mistyped path)
+    """
+    base = base_dir or Path.cwd()
+    roots: list[Path] = []
+    unmatched: list[str] = []
+    seen: set[Path] = set()
+    for pattern in patterns:
+        full = pattern if os.path.isabs(pattern) else str(base / pattern)
+        matched = False
+        for match in sorted(glob.glob(full, recursive=True)) or [full]:
+            path = Path(match)
+            root = path.parent if path.is_file() else path
+            if not root.is_dir():
+                continue
+            matched = True
+            key = root.resolve()
+            if key not in seen:
+                seen.add(key)
+                roots.append(root)
+        if not matched:
+            unmatched.append(pattern)
+    return roots, unmatched
+
+
+class FleetMerger:
+    """Merge one parsed template into many projects.
+
+    Example:
+        >>> fleet = FleetMerger(Path("template/pyproject.toml"))
+        >>> report = fleet.merge([Path("repos/a"), Path("repos/b")], dry_run=True)
+        >>> report.changed
+        1
+    """
+
+    def __init__(
+        self,
+        source_path: Path,
+        strategy: MergeStrategy = MergeStrategy.SMART,
+        target_name: str = DEFAULT_TARGET_NAME,
+    ) -> None:
+        """Read and parse the template.
+
+        Args:
+            source_path: Template TOML file
+            strategy: Merge strategy (INTERACTIVE is not supported)
+            target_name: File merged into, relative to each project root
+
+        Raises:
+            ValueError: If strategy is INTERACTIVE
+            OSError: If the template cannot be read
+            tomlkit.exceptions.ParseError: If the template is invalid TOML
+        """
+        if strategy == MergeStrategy.INTERACTIVE:
+            msg = "Interactive strategy is not supported in fleet mode"
+            raise ValueError(msg)
+
+        self.source_path = source_path
+        self.strategy = strategy
+        self.target_name = target_name
+        self.source_text = source_path.read_text(encoding="utf-8")
+        self.source_doc = tomlkit.parse(self.source_text)
+
+    def merge(
+        self,
+        projects: list[Path],
+        *,
+        dry_run: bool = False,
+        backup: bool = True,
+        workers: int | None = None,
+        on_result: Callable[[FleetTargetResult], None] | None = None,
+    ) -> FleetReport:
+        """Merge the template into every project.
+
+        Args:
+            projects: Project roots
+            dry_run: If True, only compute diffs
+            backup: If True, back up each target before writing it
+            workers: Worker processes (default: CPU count, at most
+                MAX_DEFAULT_WORKERS). Processes are used for at least
+                FLEET_PARALLEL_THRESHOLD projects.
+            on_result: Called with each result as it completes, in order
+
+        Returns:
+            FleetReport with one result per project, in input order
+        """
+        start = time.perf_counter()
+        workers = worker_count(
+            len(projects),
+            workers,
+            threshold=FLEET_PARALLEL_THRESHOLD,
+        )
+        merge = partial(
+            _merge_project,
+            target_name=self.target_name,
+            dry_run=dry_run,
+            backup=backup,
+        )
+
+        if workers > 1:
+            outcomes: Iterable[FleetTargetResult] = process_map(
+                merge,
+                projects,
+                context=partial(_merge_context, self.source_text, self.strategy),
+                workers=workers,
+            )
+        else:
+            context = (TOMLMerger(strategy=self.strategy), self.source_doc)
+            outcomes = (merge(context, project) for project in projects)
+
+        results: list[FleetTargetResult] = []
+        for result in outcomes:
+            results.append(result)
+            if on_result:
+                on_result(result)
+
+        return FleetReport(
+            source=self.source_path,
+            strategy=self.strategy,
+            dry_run=dry_run,
+            results=results,
+            duration=time.perf_counter() - start,
+        )
+
+
+# Merger and parsed template, built once per process (see FleetMerger.merge)
+_MergeContext = tuple[TOMLMerger, TOMLDocument]
+
+
+def _merge_context(source_text: str, strategy: MergeStrategy) -> _MergeContext:
+    """Parse the template once per worker process."""
+    return TOMLMerger(strategy=strategy), tomlkit.parse(source_text)
+
+
+def _merge_project(
+    context: _MergeContext,
+    project: Path,
+    *,
+    target_name: str,
+    dry_run: bool,
+    backup: bool,
+) -> FleetTargetResult:
+    """Merge the parsed template into one project and time it."""
+    merger, source_doc = context
+    target = project / target_name
+    start = time.perf_counter()
+    result = merger.merge_into(
+        source_doc,
+        target,
+        dry_run=dry_run,
+        backup=backup,
+        diff=True,
+    )
+    return FleetTargetResult(
+        project=project,
+        target=target,
+        success=result.success,
+        errors=result.conflicts,
+        conflict_keys=result.conflict_keys,
+        diff=result.diff,
+        backup_path=result.backup_path,
+        duration=time.perf_counter() - start,
+    )
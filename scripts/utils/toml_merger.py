@@ -10,6 +10,7 @@ Key Features:
 - Recursive dictionary merge
 - Version conflict resolution
 - Automatic backup creation
+- Parsed templates reusable across targets (``merge_into``; see toml_fleet)
 
 Author: Engineering Team
 License: MIT
@@ -20,6 +21,7 @@ License: MIT
 
 from __future__ import annotations
 
+import copy
 import re
 import shutil
 from collections.abc import Callable
@@ -65,12 +67,15 @@ class MergeResult:
         conflicts: List of conflict descriptions (if any)
         diff: Unified diff of changes (populated in dry_run)
         backup_path: Path to backup file (if created)
+        conflict_keys: Keys whose template and project values differed
+            (dotted paths, e.g. "project.dependencies.pydantic")
     """
 
     success: bool
     conflicts: list[str] = field(default_factory=list)
     diff: str = ""
     backup_path: Path | None = None
+    conflict_keys: list[str] = field(default_factory=list)
 
 
 # ======================================================================
@@ -107,6 +112,7 @@ class TOMLMerger:
         """
         self.strategy = strategy
         self.conflict_resolver = conflict_resolver
+        self._conflict_keys: list[str] = []
 
     def merge(
         self,
@@ -144,16 +150,58 @@ class TOMLMerger:
                 conflicts=[f"Source file not found: {source_path}"],
             )
 
+        # Parse the template
+        try:
+            source_doc = tomlkit.parse(source_path.read_text(encoding="utf-8"))
+        except Exception as e:
+            return MergeResult(
+                success=False,
+                conflicts=[f"Failed to parse TOML: {e}"],
+            )
+
+        return self.merge_into(
+            source_doc,
+            target_path,
+            output_path=output_path,
+            dry_run=dry_run,
+            backup=backup,
+        )
+
+    def merge_into(
+        self,
+        source_doc: TOMLDocument,
+        target_path: Path,
+        output_path: Path | None = None,
+        dry_run: bool = False,
+        backup: bool = True,
+        diff: bool = False,
+    ) -> MergeResult:
+        """Merge an already parsed template into a target TOML file.
+
+        ``source_doc`` is not modified (the merge works on a copy), so one
+        parsed template can be merged into any number of targets.
+
+        Args:
+            source_doc: Parsed template/source TOML document
+            target_path: Path to project/target TOML file
+            output_path: Optional output path (defaults to target_path)
+            dry_run: If True, don't write changes (return diff only)
+            backup: If True, create .bak file before overwrite
+            diff: If True, also return the diff when writing
+
+        Returns:
+            MergeResult with success status, conflicts, diff, and backup path
+        """
         if not target_path.exists():
             return MergeResult(
                 success=False,
                 conflicts=[f"Target file not found: {target_path}"],
             )
 
-        # Parse both files
+        # Parse the target
         try:
-            source_doc = tomlkit.parse(source_path.read_text(encoding="utf-8"))
-            target_doc = tomlkit.parse(target_path.read_text(encoding="utf-8"))
+            original_content = target_path.read_text(encoding="utf-8")
+            target_doc = tomlkit.parse(original_content)
         except Exception as e:
             return MergeResult(
                 success=False,
@@ -162,7 +210,7 @@ class TOMLMerger:
 
         # Perform merge based on strategy
         try:
-            merged_doc = self._merge_documents(source_doc, target_doc)
+            merged_doc = self._merge_documents(copy.deepcopy(source_doc), target_doc)
         except Exception as e:
             return MergeResult(
                 success=False,
@@ -171,14 +219,19 @@ class TOMLMerger:
 
         # Generate output
         merged_content = tomlkit.dumps(merged_doc)
+        conflict_keys = list(self._conflict_keys)
+        merge_diff = (
+            self._generate_diff(original_content, merged_content)
+            if dry_run or diff
+            else ""
+        )
 
         # Handle dry run
         if dry_run:
-            original_content = target_path.read_text(encoding="utf-8")
-            diff = self._generate_diff(original_content, merged_content)
             return MergeResult(
                 success=True,
-                diff=diff,
+                diff=merge_diff,
+                conflict_keys=conflict_keys,
             )
 
         # Create backup if requested
@@ -195,11 +248,14 @@ class TOMLMerger:
                 success=False,
                 conflicts=[f"Failed to write output: {e}"],
                 backup_path=backup_path,
+                conflict_keys=conflict_keys,
             )
 
         return MergeResult(
             success=True,
+            diff=merge_diff,
             backup_path=backup_path,
+            conflict_keys=conflict_keys,
         )
 
     def _merge_documents(
@@ -216,6 +272,7 @@ class TOMLMerger:
         Returns:
             Merged TOMLDocument
         """
+        self._conflict_keys = []
         if self.strategy == MergeStrategy.TEMPLATE_PRIORITY:
             return self._merge_template_priority(source, target)
         if self.strategy == MergeStrategy.USER_PRIORITY:
@@ -240,7 +297,7 @@ class TOMLMerger:
             Merged document (source overwrites target)
         """
         # Deep copy target to preserve comments
-        result = tomlkit.parse(tomlkit.dumps(target))
+        result = copy.deepcopy(target)
 
         # Recursively update with source values
         self._deep_update(result, source, prioritize_overlay=True)
@@ -262,7 +319,7 @@ class TOMLMerger:
             Merged document (target preserved, source fills gaps)
         """
         # Deep copy target to preserve comments
-        result = tomlkit.parse(tomlkit.dumps(target))
+        result = copy.deepcopy(target)
 
         # Recursively update (only add new keys from source)
         self._deep_update(result, source, prioritize_overlay=False)
@@ -284,7 +341,7 @@ class TOMLMerger:
             Intelligently merged document
         """
         # Deep copy target to preserve comments
-        result = tomlkit.parse(tomlkit.dumps(target))
+        result = copy.deepcopy(target)
 
         # Smart recursive merge
         self._smart_merge_recursive(result, source)
@@ -306,7 +363,7 @@ class TOMLMerger:
             Merged document with conflicts resolved by callback
         """
         # Deep copy target to preserve comments
-        result = tomlkit.parse(tomlkit.dumps(target))
+        result = copy.deepcopy(target)
 
         # Interactive recursive merge
         self._interactive_merge_recursive(result, source)
@@ -317,14 +374,17 @@ class TOMLMerger:
         self,
         base: dict[str, Any] | Table,
         overlay: dict[str, Any] | Table,
+        prefix: str = "",
     ) -> None:
         """Recursive merge with callback for conflict resolution.
 
         Args:
             base: Base dictionary (modified in place)
             overlay: Overlay dictionary
+            prefix: Dotted path of ``base`` (for conflict reporting)
         """
         for key, value in overlay.items():
+            key_path = f"{prefix}{key}"
             if key not in base:
                 # New key from template - add it
                 base[key] = value
@@ -333,16 +393,17 @@ class TOMLMerger:
                 (dict, Table),
             ):
                 # Both are dicts - recurse
-                self._interactive_merge_recursive(base[key], value)
+                self._interactive_merge_recursive(base[key], value, f"{key_path}.")
             elif isinstance(value, (list, Array)) and isinstance(
                 base[key],
                 (list, Array),
             ):
                 # Both are lists - use SMART merge (union)
                 # TODO: Could add callback for list conflicts in future
-                base[key] = self._merge_lists(base[key], value)
+                base[key] = self._merge_lists(base[key], value, key_path)
             # SCALAR CONFLICT - delegate to callback
             elif self.conflict_resolver:
+                self._record_conflict(key_path, base[key], value)
                 decision = self.conflict_resolver(key, base[key], value)
 
                 if decision == "template":
@@ -356,6 +417,7 @@ class TOMLMerger:
                 # "skip" -> no change
             else:
                 # No callback provided - fallback to template wins
+                self._record_conflict(key_path, base[key], value)
                 base[key] = value
 
     def _deep_update(
@@ -363,6 +425,7 @@ class TOMLMerger:
         base: dict[str, Any] | Table,
         overlay: dict[str, Any] | Table,
         prioritize_overlay: bool,
+        prefix: str = "",
     ) -> None:
         """Recursively update base dict with overlay.
 
@@ -370,8 +433,10 @@ class TOMLMerger:
             base: Base dictionary (modified in place)
             overlay: Overlay dictionary
             prioritize_overlay: If True, overlay wins; else base preserved
+            prefix: Dotted path of ``base`` (for conflict reporting)
         """
         for key, value in overlay.items():
+            key_path = f"{prefix}{key}"
             if key not in base:
                 # New key - always add
                 base[key] = value
@@ -380,24 +445,34 @@ class TOMLMerger:
                 (dict, Table),
             ):
                 # Both are dicts - recurse
-                self._deep_update(base[key], value, prioritize_overlay)
-            elif prioritize_overlay:
-                # Overlay wins
-                base[key] = value
-            # else: base preserved (user priority)
+                self._deep_update(
+                    base[key],
+                    value,
+                    prioritize_overlay,
+                    f"{key_path}.",
+                )
+            else:
+                self._record_conflict(key_path, base[key], value)
+                if prioritize_overlay:
+                    # Overlay wins
+                    base[key] = value
+                # else: base preserved (user priority)
 
     def _smart_merge_recursive(
         self,
         base: dict[str, Any] | Table,
         overlay: dict[str, Any] | Table,
+        prefix: str = "",
     ) -> None:
         """Smart recursive merge with list union.
 
         Args:
             base: Base dictionary (modified in place)
             overlay: Overlay dictionary
+            prefix: Dotted path of ``base`` (for conflict reporting)
         """
         for key, value in overlay.items():
+            key_path = f"{prefix}{key}"
             if key not in base:
                 # New key from template - add it
                 base[key] = value
@@ -406,21 +481,33 @@ class TOMLMerger:
                 (dict, Table),
             ):
                 # Both are dicts - recurse
-                self._smart_merge_recursive(base[key], value)
+                self._smart_merge_recursive(base[key], value, f"{key_path}.")
             elif isinstance(value, (list, Array)) and isinstance(
                 base[key],
                 (list, Array),
             ):
                 # Both are lists - union with deduplication
-                base[key] = self._merge_lists(base[key], value)
+                base[key] = self._merge_lists(base[key], value, key_path)
             else:
                 # Scalar values - template wins in SMART mode
+                self._record_conflict(key_path, base[key], value)
                 base[key] = value
 
+    def _record_conflict(
+        self,
+        key_path: str,
+        user_value: Any,
+        template_value: Any,
+    ) -> None:
+        """Remember a key whose project and template values differ."""
+        if user_value != template_value:
+            self._conflict_keys.append(key_path)
+
     def _merge_lists(
         self,
         base_list: list[Any] | Array,
         overlay_list: list[Any] | Array,
+        key_path: str = "",
     ) -> Array:
         """Merge two lists with union and deduplication.
 
@@ -436,6 +523,7 @@ class TOMLMerger:
         Args:
             base_list: User's list (with potential inline comments)
             overlay_list: Template's list
+            key_path: Dotted path of the list (for conflict reporting)
 
         Returns:
             Merged tomlkit Array with preserved comments
@@ -456,6 +544,7 @@ class TOMLMerger:
         for pkg, overlay_spec in overlay_packages.items():
             if pkg in base_packages:
                 idx, base_spec = base_packages[pkg]
+                self._record_conflict(f"{key_path}.{pkg}", base_spec, overlay_spec)
                 resolved = self._resolve_version(base_spec, overlay_spec)
 
                 # If version changed, update in place
@@ -0,0 +1,249 @@
+"""Tests for HttpResponseCache and its use by KnowledgeSyncer.
+
+Unit tests run against MemoryFileSystem with a fake clock; the integration
+tests sync against a local stand-in HTTP server that honours If-None-Match
+and If-Modified-Since, through the real pooled RealHttpClient.
+
+Author: Engineering Team
+License: MIT
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+from pydantic import HttpUrl
+
+from scripts.core.cortex.http_cache import HttpResponseCache
+from scripts.core.cortex.knowledge_sync import (
+    KnowledgeSyncer,
+    RealHttpClient,
+    SyncStatus,
+)
+from scripts.core.cortex.models import DocStatus, KnowledgeEntry, KnowledgeSource
+from scripts.utils.filesystem import MemoryFileSystem
+
+CACHE_DIR = Path("/workspace/.cortex/http_cache")
+URL = "https://example.com/doc.md"
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self) -> None:
+        """Start at an arbitrary fixed timestamp."""
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        """Return the current fake time."""
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Provide a fake clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock: FakeClock) -> HttpResponseCache:
+    """Provide an in-memory cache with a 60 second freshness window."""
+    return HttpResponseCache(CACHE_DIR, max_age=60, fs=MemoryFileSystem(), clock=clock)
+
+
+class TestHttpResponseCache:
+    """Unit tests for the on-disk response cache."""
+
+    def test_miss_returns_none(self, cache: HttpResponseCache) -> None:
+        """Unknown URLs are a cache miss."""
+        assert cache.get(URL) is None
+
+    def test_store_and_get_roundtrip(self, cache: HttpResponseCache) -> None:
+        """Stored body and validators are returned by get()."""
+        cache.store(URL, "# Doc", etag='"v1"', last_modified="Mon, 01 Jan 2024")
+
+        cached = cache.get(URL)
+
+        assert cached is not None
+        assert cached.body == "# Doc"
+        assert cached.conditional_headers() == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Mon, 01 Jan 2024",
+        }
+
+    def test_freshness_window(
+        self,
+        cache: HttpResponseCache,
+        clock: FakeClock,
+    ) -> None:
+        """Entries are fresh until max_age elapses; touch() renews them."""
+        cached = cache.store(URL, "# Doc", etag='"v1"', last_modified=None)
+        assert cache.is_fresh(cached)
+
+        clock.now += 61
+        assert not cache.is_fresh(cached)
+
+        assert cache.is_fresh(cache.touch(cached))
+
+    def test_corrupt_file_is_a_miss(self, cache: HttpResponseCache) -> None:
+        """Unparseable cache files are ignored instead of raising."""
+        cache.store(URL, "# Doc", etag=None, last_modified=None)
+        (path,) = cache.fs.glob(CACHE_DIR, "*.json")
+        cache.fs.write_text(path, "{not json")
+
+        assert cache.get(URL) is None
+
+    def test_negative_max_age_rejected(self) -> None:
+        """A negative freshness window is a configuration error."""
+        with pytest.raises(ValueError, match="max_age"):
+            HttpResponseCache(CACHE_DIR, max_age=-1)
+
+
+class _DocHandler(BaseHTTPRequestHandler):
+    """Serves one markdown document with ETag/Last-Modified validation."""
+
+    body = b"# Remote\n\nContent v1"
+    etag = '"v1"'
+    last_modified = "Mon, 01 Jan 2024 00:00:00 GMT"
+    requests_seen: list[dict[str, str]] = []
+
+    def do_GET(self) -> None:  # noqa: N802
+        """Answer 304 when the client's validators match, else 200."""
+        self.requests_seen.append(dict(self.headers))
+        if self.headers.get("If-None-Match") == self.etag or (
+            self.headers.get("If-None-Match") is None
+            and self.headers.get("If-Modified-Since") == self.last_modified
+        ):
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("ETag", self.etag)
+        self.send_header("Last-Modified", self.last_modified)
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        """Silence request logging."""
+
+
+@pytest.fixture
+def doc_server() -> Iterator[tuple[str, type[_DocHandler]]]:
+    """Run a local HTTP server on an ephemeral port."""
+    handler = type("DocHandler", (_DocHandler,), {"requests_seen": []})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/doc.md", handler
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _entry(url: str, file_path: Path, etag: str | None = None) -> KnowledgeEntry:
+    """Build an entry with a single source."""
+    return KnowledgeEntry(
+        id="kno-001",
+        status=DocStatus.ACTIVE,
+        tags=["test"],
+        sources=[
+            KnowledgeSource(
+                url=HttpUrl(url),
+                etag=etag,
+                last_synced=datetime.now(timezone.utc) if etag else None,
+            ),
+        ],
+        file_path=file_path,
+    )
+
+
+class TestSyncWithLocalServer:
+    """KnowledgeSyncer + RealHttpClient against a local HTTP server."""
+
+    def _syncer(
+        self,
+        tmp_path: Path,
+        clock: FakeClock,
+        client: RealHttpClient,
+    ) -> KnowledgeSyncer:
+        cache = HttpResponseCache(
+            tmp_path / ".cortex" / "http_cache",
+            max_age=60,
+            clock=clock,
+        )
+        return KnowledgeSyncer(http_client=client, response_cache=cache)
+
+    def test_fresh_cache_skips_request(
+        self,
+        tmp_path: Path,
+        clock: FakeClock,
+        doc_server: tuple[str, type[_DocHandler]],
+    ) -> None:
+        """Inside the freshness window no request is sent at all."""
+        url, handler = doc_server
+        client = RealHttpClient()
+        syncer = self._syncer(tmp_path, clock, client)
+        file_path = tmp_path / "kno-001.md"
+
+        first = syncer.sync_entry(_entry(url, file_path), file_path)
+        second = syncer.sync_entry(first.entry, file_path)
+        client.close()
+
+        assert first.status == SyncStatus.UPDATED
+        assert first.entry.sources[0].etag == '"v1"'
+        assert second.status == SyncStatus.NOT_MODIFIED
+        assert len(handler.requests_seen) == 1
+        assert "Content v1" in file_path.read_text(encoding="utf-8")
+
+    def test_stale_cache_revalidates_with_304(
+        self,
+        tmp_path: Path,
+        clock: FakeClock,
+        doc_server: tuple[str, type[_DocHandler]],
+    ) -> None:
+        """After max_age the cached validators are sent and a 304 is honoured."""
+        url, handler = doc_server
+        client = RealHttpClient()
+        syncer = self._syncer(tmp_path, clock, client)
+        file_path = tmp_path / "kno-001.md"
+
+        first = syncer.sync_entry(_entry(url, file_path), file_path)
+        clock.now += 120
+        second = syncer.sync_entry(first.entry, file_path)
+        client.close()
+
+        assert second.status == SyncStatus.NOT_MODIFIED
+        assert len(handler.requests_seen) == 2
+        assert handler.requests_seen[1]["If-None-Match"] == '"v1"'
+        assert handler.requests_seen[1]["If-Modified-Since"] == handler.last_modified
+
+    def test_304_restores_body_when_local_file_is_behind(
+        self,
+        tmp_path: Path,
+        clock: FakeClock,
+        doc_server: tuple[str, type[_DocHandler]],
+    ) -> None:
+        """A file without ETag metadata gets the cached body on 304."""
+        url, handler = doc_server
+        client = RealHttpClient()
+        syncer = self._syncer(tmp_path, clock, client)
+        first_path = tmp_path / "first.md"
+        second_path = tmp_path / "second.md"
+
+        syncer.sync_entry(_entry(url, first_path), first_path)
+        clock.now += 120
+        result = syncer.sync_entry(_entry(url, second_path), second_path)
+        client.close()
+
+        assert result.status == SyncStatus.UPDATED
+        assert result.entry.sources[0].etag == '"v1"'
+        assert "Content v1" in second_path.read_text(encoding="utf-8")
+        assert len(handler.requests_seen) == 2
@@ -11,14 +11,22 @@ License: MIT
 
 from __future__ import annotations
 
+import threading
+import time
 from pathlib import Path
 from unittest.mock import Mock
 
 import pytest
 from pydantic import HttpUrl
 
-from scripts.core.cortex.knowledge_sync import KnowledgeSyncer, SyncResult, SyncStatus
+from scripts.core.cortex.knowledge_sync import (
+    FetchedSource,
+    KnowledgeSyncer,
+    SyncResult,
+    SyncStatus,
+)
 from scripts.core.cortex.models import DocStatus, KnowledgeEntry, KnowledgeSource
+from scripts.core.cortex.sync_executor import HostThrottledClient, SyncExecutor
 
 # Module under test (will be created in implementation phase)
 # from scripts.core.cortex.sync_executor import SyncExecutor
@@ -310,3 +318,210 @@ class TestSyncExecutorEdgeCases:
         executor = SyncExecutor(syncer=mock_syncer)
 
         assert executor.dry_run is False
+
+
+def _entry(index: int, host: str = "example.com") -> KnowledgeEntry:
+    """Build an entry with one source on ``host``."""
+    return KnowledgeEntry(
+        id=f"kno-{index:03d}",
+        status=DocStatus.ACTIVE,
+        tags=["test"],
+        sources=[KnowledgeSource(url=HttpUrl(f"https://{host}/doc-{index}.md"))],
+        file_path=Path(f"/workspace/docs/kno-{index:03d}.md"),
+    )
+
+
+class _ConcurrencyProbe:
+    """HTTP client double recording the peak number of in-flight requests."""
+
+    def __init__(self, delay: float = 0.02) -> None:
+        self.delay = delay
+        self.active: dict[str, int] = {}
+        self.peak: dict[str, int] = {}
+        self.peak_total = 0
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,  # noqa: ARG002
+        timeout: int = 10,  # noqa: ARG002
+    ) -> Mock:
+        host = url.split("/")[2]
+        with self._lock:
+            self.active[host] = self.active.get(host, 0) + 1
+            self.peak[host] = max(self.peak.get(host, 0), self.active[host])
+            self.peak_total = max(self.peak_total, sum(self.active.values()))
+        time.sleep(self.delay)
+        with self._lock:
+            self.active[host] -= 1
+        return Mock()
+
+
+def _fetch_via_client(
+    entry: KnowledgeEntry,
+    client: HostThrottledClient,
+) -> list[FetchedSource]:
+    """fetch_entry double: issue one request per source through ``client``."""
+    for source in entry.sources:
+        client.get(str(source.url))
+    return [FetchedSource(source, f"# {entry.id}", None) for source in entry.sources]
+
+
+class TestSyncExecutorConcurrent:
+    """Tests for the bounded concurrent fetch mode."""
+
+    @pytest.fixture
+    def mock_syncer(self) -> Mock:
+        """Mocked syncer exposing an http_client (an instance attribute)."""
+        syncer = Mock(spec=KnowledgeSyncer)
+        syncer.http_client = Mock()
+        return syncer
+
+    def test_invalid_worker_counts_rejected(self, mock_syncer: Mock) -> None:
+        """max_workers and max_per_host must be positive."""
+        with pytest.raises(ValueError, match="max_workers"):
+            SyncExecutor(syncer=mock_syncer, max_workers=0)
+        with pytest.raises(ValueError, match="max_per_host"):
+            SyncExecutor(syncer=mock_syncer, max_per_host=0)
+
+    def test_default_is_sequential(self, mock_syncer: Mock) -> None:
+        """Without max_workers the historical sync_entry path is used."""
+        entries = [_entry(1), _entry(2)]
+        mock_syncer.sync_entry.side_effect = lambda e, _p: SyncResult(
+            e,
+            SyncStatus.UPDATED,
+        )
+
+        SyncExecutor(syncer=mock_syncer).execute_batch(entries)
+
+        assert mock_syncer.sync_entry.call_count == 2
+        mock_syncer.fetch_entry.assert_not_called()
+
+    def test_results_keep_input_order(self, mock_syncer: Mock) -> None:
+        """Slow early fetches do not reorder results or merges."""
+        entries = [_entry(i) for i in range(6)]
+        applied: list[str] = []
+
+        def fetch(entry: KnowledgeEntry, _client: object) -> list[FetchedSource]:
+            # Earlier entries finish last
+            time.sleep(0.01 * (len(entries) - int(entry.id[-3:])))
+            return [FetchedSource(entry.sources[0], entry.id, None)]
+
+        def apply(
+            entry: KnowledgeEntry,
+            _path: Path,
+            _fetched: list[FetchedSource],
+        ) -> SyncResult:
+            applied.append(entry.id)
+            return SyncResult(entry, SyncStatus.UPDATED)
+
+        mock_syncer.fetch_entry.side_effect = fetch
+        mock_syncer.apply_fetched.side_effect = apply
+        executor = SyncExecutor(syncer=mock_syncer, max_workers=4)
+
+        results = executor.execute_batch(entries)
+
+        expected = [e.id for e in entries]
+        assert [r.entry.id for r in results] == expected
+        assert applied == expected
+
+    def test_merges_never_overlap(self, mock_syncer: Mock) -> None:
+        """apply_fetched runs on a single thread, one entry at a time."""
+        entries = [_entry(i) for i in range(8)]
+        threads: set[int] = set()
+        in_apply = threading.Semaphore(1)
+
+        def apply(
+            entry: KnowledgeEntry,
+            _path: Path,
+            _fetched: list[FetchedSource],
+        ) -> SyncResult:
+            assert in_apply.acquire(blocking=False), "concurrent merge"
+            threads.add(threading.get_ident())
+            time.sleep(0.001)
+            in_apply.release()
+            return SyncResult(entry, SyncStatus.UPDATED)
+
+        mock_syncer.fetch_entry.side_effect = lambda e, _c: []
+        mock_syncer.apply_fetched.side_effect = apply
+
+        SyncExecutor(syncer=mock_syncer, max_workers=4).execute_batch(entries)
+
+        assert threads == {threading.get_ident()}
+
+    def test_per_host_limit_is_enforced(self, mock_syncer: Mock) -> None:
+        """No host sees more than max_per_host concurrent requests."""
+        probe = _ConcurrencyProbe()
+        mock_syncer.http_client = probe
+        mock_syncer.fetch_entry.side_effect = _fetch_via_client
+        mock_syncer.apply_fetched.side_effect = lambda e, _p, _f: SyncResult(
+            e,
+            SyncStatus.UPDATED,
+        )
+        entries = [_entry(i, "a.example.com") for i in range(8)] + [
+            _entry(i, "b.example.com") for i in range(8, 16)
+        ]
+        executor = SyncExecutor(syncer=mock_syncer, max_workers=8, max_per_host=2)
+
+        executor.execute_batch(entries)
+
+        assert probe.peak == {"a.example.com": 2, "b.example.com": 2}
+        assert probe.peak_total > 2
+
+    def test_fetch_error_becomes_error_result(self, mock_syncer: Mock) -> None:
+        """An exception in one fetch does not abort the batch."""
+        entries = [_entry(1), _entry(2), _entry(3)]
+
+        def fetch(entry: KnowledgeEntry, _client: object) -> list[FetchedSource]:
+            if entry.id == "kno-002":
+                msg = "boom"
+                raise RuntimeError(msg)
+            return []
+
+        mock_syncer.fetch_entry.side_effect = fetch
+        mock_syncer.apply_fetched.side_effect = lambda e, _p, _f: SyncResult(
+            e,
+            SyncStatus.NOT_MODIFIED,
+        )
+
+        results = SyncExecutor(syncer=mock_syncer, max_workers=3).execute_batch(
+            entries,
+        )
+
+        assert [r.status for r in results] == [
+            SyncStatus.NOT_MODIFIED,
+            SyncStatus.ERROR,
+            SyncStatus.NOT_MODIFIED,
+        ]
+        assert results[1].error_message == "boom"
+
+    def test_entry_without_path_is_not_fetched(
+        self,
+        mock_syncer: Mock,
+        sample_entry_no_path: KnowledgeEntry,
+    ) -> None:
+        """Invalid entries keep the sequential ERROR result, without network."""
+        mock_syncer.fetch_entry.side_effect = lambda e, _c: []
+        mock_syncer.apply_fetched.side_effect = lambda e, _p, _f: SyncResult(
+            e,
+            SyncStatus.NOT_MODIFIED,
+        )
+
+        results = SyncExecutor(syncer=mock_syncer, max_workers=2).execute_batch(
+            [sample_entry_no_path, _entry(1)],
+        )
+
+        assert results[0].status == SyncStatus.ERROR
+        assert mock_syncer.fetch_entry.call_count == 1
+
+    def test_dry_run_never_fetches(self, mock_syncer: Mock) -> None:
+        """dry_run short-circuits before any network access."""
+        results = SyncExecutor(
+            syncer=mock_syncer,
+            dry_run=True,
+            max_workers=4,
+        ).execute_batch([_entry(1), _entry(2)])
+
+        assert all(r.status == SyncStatus.NOT_MODIFIED for r in results)
+        mock_syncer.fetch_entry.assert_not_called()
@@ -17,13 +17,15 @@ License: MIT
 
 from __future__ import annotations
 
+import mmap
 from pathlib import Path
-from unittest.mock import mock_open, patch
+from unittest.mock import patch
 
 import pytest
 
 from scripts.audit.analyzer import CodeAnalyzer
 from scripts.audit.models import SecurityCategory, SecurityPattern, SecuritySeverity
+from scripts.utils.filesystem import MMAP_MIN_BYTES, MemoryFileSystem
 
 
 @pytest.fixture
@@ -67,6 +69,7 @@ def analyzer(
         patterns=security_patterns,
         workspace_root=workspace_root,
         max_findings_per_file=50,
+        fs_adapter=MemoryFileSystem(),
     )
 
 
@@ -86,8 +89,8 @@ def deploy():
 
     mock_file_path = workspace_root / "unsafe_deploy.py"
 
-    with patch("pathlib.Path.open", mock_open(read_data=unsafe_code)):
-        findings = analyzer.analyze_file(mock_file_path)
+    analyzer.fs.write_text(mock_file_path, unsafe_code)
+    findings = analyzer.analyze_file(mock_file_path)
 
     # Should detect exactly one CRITICAL finding
     assert len(findings) == 1
@@ -119,8 +122,8 @@ def bad_operations():
 
     mock_file_path = workspace_root / "multiple_issues.py"
 
-    with patch("pathlib.Path.open", mock_open(read_data=unsafe_code)):
-        findings = analyzer.analyze_file(mock_file_path)
+    analyzer.fs.write_text(mock_file_path, unsafe_code)
+    findings = analyzer.analyze_file(mock_file_path)
 
     # Should detect all three issues
     assert len(findings) == 3
@@ -154,8 +157,8 @@ def safe_deploy():
 
     mock_file_path = workspace_root / "safe_deploy.py"
 
-    with patch("pathlib.Path.open", mock_open(read_data=safe_code)):
-        findings = analyzer.analyze_file(mock_file_path)
+    analyzer.fs.write_text(mock_file_path, safe_code)
+    findings = analyzer.analyze_file(mock_file_path)
 
     # Should not detect any issues in safe code
     assert len(findings) == 0
@@ -179,8 +182,8 @@ def legacy_deploy():
 
     mock_file_path = workspace_root / "suppressed.py"
 
-    with patch("pathlib.Path.open", mock_open(read_data=suppressed_code)):
-        findings = analyzer.analyze_file(mock_file_path)
+    analyzer.fs.write_text(mock_file_path, suppressed_code)
+    findings = analyzer.analyze_file(mock_file_path)
 
     # Should detect only the non-suppressed violation
     assert len(findings) == 1
@@ -204,8 +207,8 @@ def multi_suppressed():
 
     mock_file_path = workspace_root / "multi_suppressed.py"
 
-    with patch("pathlib.Path.open", mock_open(read_data=suppressed_code)):
-        findings = analyzer.analyze_file(mock_file_path)
+    analyzer.fs.write_text(mock_file_path, suppressed_code)
+    findings = analyzer.analyze_file(mock_file_path)
 
     # Both should be suppressed
     assert len(findings) == 0
@@ -226,8 +229,8 @@ def case_test():
 
     mock_file_path = workspace_root / "case_suppressed.py"
 
-    with patch("pathlib.Path.open", mock_open(read_data=suppressed_code)):
-        findings = analyzer.analyze_file(mock_file_path)
+    analyzer.fs.write_text(mock_file_path, suppressed_code)
+    findings = analyzer.analyze_file(mock_file_path)
 
     # Both should be suppressed regardless of case
     assert len(findings) == 0
@@ -243,6 +246,7 @@ def test_max_findings_per_file_respected(
         patterns=security_patterns,
         workspace_root=workspace_root,
         max_findings_per_file=3,
+        fs_adapter=MemoryFileSystem(),
     )
 
     # Code with many violations
@@ -255,8 +259,8 @@ def test_max_findings_per_file_respected(
 
     mock_file_path = workspace_root / "many_issues.py"
 
-    with patch("pathlib.Path.open", mock_open(read_data=many_violations)):
-        findings = limited_analyzer.analyze_file(mock_file_path)
+    limited_analyzer.fs.write_text(mock_file_path, many_violations)
+    findings = limited_analyzer.analyze_file(mock_file_path)
 
     # Should stop at max_findings_per_file
     assert len(findings) == 3
@@ -280,8 +284,8 @@ def documented():
 
     mock_file_path = workspace_root / "commented.py"
 
-    with patch("pathlib.Path.open", mock_open(read_data=code_with_comments)):
-        findings = analyzer.analyze_file(mock_file_path)
+    analyzer.fs.write_text(mock_file_path, code_with_comments)
+    findings = analyzer.analyze_file(mock_file_path)
 
     # Should detect only the actual code, not comments
     assert len(findings) == 1
@@ -306,8 +310,8 @@ def with_strings():
 
     mock_file_path = workspace_root / "strings.py"
 
-    with patch("pathlib.Path.open", mock_open(read_data=code_with_strings)):
-        findings = analyzer.analyze_file(mock_file_path)
+    analyzer.fs.write_text(mock_file_path, code_with_strings)
+    findings = analyzer.analyze_file(mock_file_path)
 
     # Should detect only the actual code, not string literals
     assert len(findings) == 1
@@ -328,8 +332,8 @@ def broken(:  # Syntax error
 
     mock_file_path = workspace_root / "broken.py"
 
-    with patch("pathlib.Path.open", mock_open(read_data=invalid_code)):
-        findings = analyzer.analyze_file(mock_file_path)
+    analyzer.fs.write_text(mock_file_path, invalid_code)
+    findings = analyzer.analyze_file(mock_file_path)
 
     # Should return empty list for syntax errors
     assert len(findings) == 0
@@ -342,7 +346,12 @@ def test_file_read_error_returns_empty_list(
     """Test that file read errors return empty findings list."""
     mock_file_path = workspace_root / "unreadable.py"
 
-    with patch("pathlib.Path.open", side_effect=OSError("Permission denied")):
+    analyzer.fs.write_text(mock_file_path, "import os\nos.system('ls')\n")
+    with patch.object(
+        analyzer.fs,
+        "map_bytes",
+        side_effect=OSError("Permission denied"),
+    ):
         findings = analyzer.analyze_file(mock_file_path)
 
     # Should return empty list for read errors
@@ -356,8 +365,10 @@ def test_unicode_decode_error_returns_empty_list(
     """Test that Unicode decode errors return empty findings list."""
     mock_file_path = workspace_root / "binary.py"
 
-    with patch(
-        "pathlib.Path.open",
+    analyzer.fs.write_text(mock_file_path, "import os\nos.system('ls')\n")
+    with patch.object(
+        analyzer.fs,
+        "read_text",
         side_effect=UnicodeDecodeError(
             "utf-8",
             b"\x80\x81",
@@ -382,8 +393,8 @@ def test_relative_path_conversion(
     # Absolute path within workspace
     mock_file_path = workspace_root / "src" / "module.py"
 
-    with patch("pathlib.Path.open", mock_open(read_data=unsafe_code)):
-        findings = analyzer.analyze_file(mock_file_path)
+    analyzer.fs.write_text(mock_file_path, unsafe_code)
+    findings = analyzer.analyze_file(mock_file_path)
 
     assert len(findings) == 1
 
@@ -401,8 +412,8 @@ def test_suggestion_generation_for_shell_true(
     unsafe_code = 'subprocess.run("cmd", shell=True)'
     mock_file_path = workspace_root / "test.py"
 
-    with patch("pathlib.Path.open", mock_open(read_data=unsafe_code)):
-        findings = analyzer.analyze_file(mock_file_path)
+    analyzer.fs.write_text(mock_file_path, unsafe_code)
+    findings = analyzer.analyze_file(mock_file_path)
 
     assert len(findings) == 1
     suggestion = findings[0].suggestion
@@ -420,8 +431,8 @@ def test_suggestion_generation_for_os_system(
     unsafe_code = 'os.system("rm -rf /tmp")'
     mock_file_path = workspace_root / "test.py"
 
-    with patch("pathlib.Path.open", mock_open(read_data=unsafe_code)):
-        findings = analyzer.analyze_file(mock_file_path)
+    analyzer.fs.write_text(mock_file_path, unsafe_code)
+    findings = analyzer.analyze_file(mock_file_path)
 
     assert len(findings) == 1
     suggestion = findings[0].suggestion
@@ -438,8 +449,8 @@ def test_suggestion_generation_for_requests(
     unsafe_code = 'requests.get("http://example.com")'
     mock_file_path = workspace_root / "test.py"
 
-    with patch("pathlib.Path.open", mock_open(read_data=unsafe_code)):
-        findings = analyzer.analyze_file(mock_file_path)
+    analyzer.fs.write_text(mock_file_path, unsafe_code)
+    findings = analyzer.analyze_file(mock_file_path)
 
     assert len(findings) == 1
     suggestion = findings[0].suggestion
@@ -456,8 +467,8 @@ def test_empty_file_returns_empty_list(
     empty_code = ""
     mock_file_path = workspace_root / "empty.py"
 
-    with patch("pathlib.Path.open", mock_open(read_data=empty_code)):
-        findings = analyzer.analyze_file(mock_file_path)
+    analyzer.fs.write_text(mock_file_path, empty_code)
+    findings = analyzer.analyze_file(mock_file_path)
 
     assert len(findings) == 0
 
@@ -468,13 +479,14 @@ def test_no_patterns_returns_empty_list(workspace_root: Path) -> None:
         patterns=[],
         workspace_root=workspace_root,
         max_findings_per_file=50,
+        fs_adapter=MemoryFileSystem(),
     )
 
     unsafe_code = 'subprocess.run("cmd", shell=True)'
     mock_file_path = workspace_root / "test.py"
 
-    with patch("pathlib.Path.open", mock_open(read_data=unsafe_code)):
-        findings = analyzer_no_patterns.analyze_file(mock_file_path)
+    analyzer_no_patterns.fs.write_text(mock_file_path, unsafe_code)
+    findings = analyzer_no_patterns.analyze_file(mock_file_path)
 
     assert len(findings) == 0
 
@@ -487,8 +499,8 @@ def test_audit_result_contains_all_metadata(
     unsafe_code = 'subprocess.run("cmd", shell=True)'
     mock_file_path = workspace_root / "metadata_test.py"
 
-    with patch("pathlib.Path.open", mock_open(read_data=unsafe_code)):
-        findings = analyzer.analyze_file(mock_file_path)
+    analyzer.fs.write_text(mock_file_path, unsafe_code)
+    findings = analyzer.analyze_file(mock_file_path)
 
     assert len(findings) == 1
     finding = findings[0]
@@ -501,3 +513,45 @@ def test_audit_result_contains_all_metadata(
     assert isinstance(finding.code_snippet, str)
     assert len(finding.code_snippet) > 0
     assert finding.suggestion is not None
+
+
+def test_files_without_pattern_bytes_are_not_decoded(
+    analyzer: CodeAnalyzer,
+    workspace_root: Path,
+) -> None:
+    """Test that the byte prefilter skips decoding and parsing clean files."""
+    clean_file = workspace_root / "clean.py"
+    dirty_file = workspace_root / "dirty.py"
+    analyzer.fs.write_text(clean_file, "def broken(:\n    return 1\n" * 100)
+    analyzer.fs.write_text(dirty_file, "import os\nos.system('ls')\n")
+
+    with patch.object(
+        analyzer.fs,
+        "read_text",
+        wraps=analyzer.fs.read_text,
+    ) as read_text:
+        assert analyzer.analyze_file(clean_file) == []
+        assert len(analyzer.analyze_file(dirty_file)) == 1
+
+    read_text.assert_called_once_with(dirty_file, encoding="utf-8")
+
+
+def test_large_real_file_is_scanned_through_mmap(
+    security_patterns: list[SecurityPattern],
+    tmp_path: Path,
+) -> None:
+    """Test that memory-mapped large files produce the same findings."""
+    filler = "x = 1  # padding\n" * (MMAP_MIN_BYTES // 16)
+    large_file = tmp_path / "generated.py"
+    large_file.write_text(
+        "import requests\n" + filler + "requests.get('http://example.com')\n",
+        encoding="utf-8",
+    )
+    analyzer = CodeAnalyzer(patterns=security_patterns, workspace_root=tmp_path)
+
+    with patch("mmap.mmap", wraps=mmap.mmap) as mapped:
+        findings = analyzer.analyze_file(large_file)
+
+    mapped.assert_called_once()
+    assert [f.line_number for f in findings] == [filler.count("\n") + 2]
+    assert findings[0].file_path == Path("generated.py")
@@ -0,0 +1,155 @@
+"""Tests for the SQLite audit metrics backend.
+
+Real databases in tmp_path: the SQL aggregates must match the rolling
+aggregates of the JSON backend, keep full history, and honour time windows.
+
+Usage:
+    pytest tests/test_audit_dashboard_sqlite.py -v
+"""
+
+from __future__ import annotations
+
+# ruff: noqa: S101, PLR2004, SLF001
+# S101: Use of assert (required for pytest)
+# PLR2004: Magic value in comparison (test constants are acceptable)
+# SLF001: Private member access (necessary for unit testing internals)
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from scripts.audit_dashboard import AuditDashboard, AuditMetricsError
+from scripts.audit_dashboard.sqlite_storage import SQLiteMetricsStorage
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _audit(index: int) -> dict[str, Any]:
+    """Build an audit result with varied findings."""
+    return {
+        "external_dependencies": [
+            {
+                "severity": ("HIGH", "MEDIUM", "LOW")[index % 3],
+                "pattern": f"pattern-{index % 4}",
+                "file": f"src/mod{index % 5}.py",
+            },
+            {"pattern": "requests.get", "file": ""},
+            "malformed entry",
+        ],
+        "ci_simulation": {"tests_passed": index % 3 != 0},
+    }
+
+
+def _record(dashboard: AuditDashboard, index: int, moment: datetime) -> None:
+    """Record an audit as if it happened at ``moment``."""
+    with (
+        patch("scripts.audit_dashboard.dashboard.datetime") as dashboard_now,
+        patch("scripts.audit_dashboard.calculator.datetime") as calculator_now,
+    ):
+        dashboard_now.now.return_value = moment
+        calculator_now.now.return_value = moment
+        dashboard.record_audit(_audit(index))
+
+
+class TestSQLiteBackend:
+    """SQLiteMetricsStorage behind AuditDashboard."""
+
+    def test_json_filename_becomes_database(self, tmp_path: Path) -> None:
+        """The default .json metrics name is stored as .db."""
+        dashboard = AuditDashboard(workspace_root=tmp_path, backend="sqlite")
+
+        assert isinstance(dashboard.storage, SQLiteMetricsStorage)
+        assert dashboard.metrics_file == tmp_path / "audit_metrics.db"
+
+    def test_aggregates_match_json_backend(self, tmp_path: Path) -> None:
+        """SQL aggregation reproduces the JSON backend's rolling metrics."""
+        json_dashboard = AuditDashboard(workspace_root=tmp_path / "json")
+        sql_dashboard = AuditDashboard(
+            workspace_root=tmp_path / "sql", backend="sqlite"
+        )
+        for i in range(60):
+            moment = START + timedelta(days=i)
+            _record(json_dashboard, i, moment)
+            _record(sql_dashboard, i, moment)
+
+        expected = json_dashboard.query_metrics()
+        actual = sql_dashboard.query_metrics()
+        for pattern in actual["pattern_statistics"].values():
+            pattern.pop("files_count")
+
+        assert {**actual, "created_at": None} == {**expected, "created_at": None}
+
+    def test_history_is_not_truncated(self, tmp_path: Path) -> None:
+        """All audits stay queryable; reports show the last max records."""
+        dashboard = AuditDashboard(workspace_root=tmp_path, backend="sqlite")
+        for i in range(60):
+            _record(dashboard, i, START + timedelta(days=i))
+
+        reloaded = AuditDashboard(workspace_root=tmp_path, backend="sqlite")
+        metrics = reloaded.query_metrics()
+
+        assert metrics["audits_performed"] == 60
+        assert metrics["failures_prevented"] == 180
+        assert len(metrics["audit_history"]) == 50
+        assert reloaded.get_metrics_summary()["audits_performed"] == 60
+
+    def test_time_window(self, tmp_path: Path) -> None:
+        """since/until restrict every aggregate to the window."""
+        dashboard = AuditDashboard(workspace_root=tmp_path, backend="sqlite")
+        for i in range(60):
+            _record(dashboard, i, START + timedelta(days=i))
+
+        january = dashboard.query_metrics(
+            since=datetime(2024, 1, 1),
+            until=datetime(2024, 2, 1),
+        )
+
+        assert january["audits_performed"] == 31
+        assert list(january["monthly_stats"]) == ["2024-01"]
+        assert january["last_audit"] == (START + timedelta(days=30)).isoformat()
+        assert sum(
+            stats["count"] for stats in january["pattern_statistics"].values()
+        ) == (31 * 2)
+
+    def test_reports_read_from_queries(self, tmp_path: Path) -> None:
+        """HTML and JSON exports reflect the queried window."""
+        dashboard = AuditDashboard(workspace_root=tmp_path, backend="sqlite")
+        for i in range(10):
+            _record(dashboard, i, START + timedelta(days=i))
+
+        html = dashboard.generate_html_dashboard(since=START + timedelta(days=8))
+        export = dashboard.export_json_metrics(tmp_path / "export.json")
+
+        # Days 8 and 9 only: patterns 0 and 1
+        assert "pattern-0" in html
+        assert "pattern-2" not in html
+        data = json.loads(export.read_text(encoding="utf-8"))
+        assert data["metrics"]["audits_performed"] == 10
+        assert data["metrics"]["pattern_statistics"]["pattern-0"]["files_affected"] == [
+            "src/mod0.py",
+            "src/mod4.py",
+            "src/mod3.py",
+        ]
+
+    def test_json_backend_rejects_time_window(self, tmp_path: Path) -> None:
+        """Rolling JSON aggregates cannot answer time-window queries."""
+        dashboard = AuditDashboard(workspace_root=tmp_path)
+
+        with pytest.raises(AuditMetricsError, match="sqlite"):
+            dashboard.query_metrics(since=START)
+
+    def test_reset_backs_up_database(self, tmp_path: Path) -> None:
+        """reset_metrics() copies the database and empties it."""
+        dashboard = AuditDashboard(workspace_root=tmp_path, backend="sqlite")
+        _record(dashboard, 1, START)
+
+        dashboard.reset_metrics()
+
+        backup = SQLiteMetricsStorage(tmp_path / "audit_metrics.backup")
+        assert backup.query_metrics()["audits_performed"] == 1
+        backup.close()
+        assert dashboard.query_metrics()["audits_performed"] == 0
+        assert dashboard._metrics["audits_performed"] == 0
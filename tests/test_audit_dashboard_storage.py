@@ -0,0 +1,137 @@
+"""Tests for the append-only audit metrics store.
+
+Unlike tests/test_audit_dashboard.py these tests use real files in
+tmp_path: they validate the on-disk layout (snapshot + JSONL event log),
+compaction and crash recovery.
+
+Usage:
+    pytest tests/test_audit_dashboard_storage.py -v
+"""
+
+from __future__ import annotations
+
+# ruff: noqa: S101, PLR2004, SLF001
+# S101: Use of assert (required for pytest)
+# PLR2004: Magic value in comparison (test constants are acceptable)
+# SLF001: Private member access (necessary for unit testing internals)
+import json
+from pathlib import Path
+from typing import Any
+
+from scripts.audit_dashboard import AuditDashboard
+
+
+def _audit(index: int, passed: bool = True) -> dict[str, Any]:
+    """Build an audit result with one finding."""
+    return {
+        "external_dependencies": [
+            {"severity": "HIGH", "pattern": "requests", "file": f"mod{index}.py"},
+            "malformed entry",
+        ],
+        "ci_simulation": {"tests_passed": passed},
+    }
+
+
+def _event_lines(dashboard: AuditDashboard) -> list[dict[str, Any]]:
+    """Read the event log of a dashboard."""
+    text = dashboard.storage.event_log.read_text(encoding="utf-8")
+    return [json.loads(line) for line in text.splitlines()]
+
+
+class TestAppendOnlyStorage:
+    """Snapshot + event log persistence."""
+
+    def test_record_appends_one_line_after_snapshot(self, tmp_path: Path) -> None:
+        """After the initial snapshot, audits are appended to the log."""
+        dashboard = AuditDashboard(workspace_root=tmp_path)
+
+        dashboard.record_audit(_audit(1))
+        snapshot = dashboard.metrics_file.read_bytes()
+        dashboard.record_audit(_audit(2))
+        dashboard.record_audit(_audit(3, passed=False))
+
+        assert dashboard.metrics_file.read_bytes() == snapshot
+        events = _event_lines(dashboard)
+        assert [event["seq"] for event in events] == [2, 3]
+        assert events[0]["dependencies"][1] is None
+
+    def test_reload_replays_tail(self, tmp_path: Path) -> None:
+        """A new dashboard rebuilds identical metrics from the log."""
+        dashboard = AuditDashboard(workspace_root=tmp_path)
+        for i in range(5):
+            dashboard.record_audit(_audit(i, passed=i % 2 == 0))
+
+        reloaded = AuditDashboard(workspace_root=tmp_path)
+
+        assert reloaded._metrics == dashboard._metrics
+        assert reloaded.get_metrics_summary()["failures_prevented"] == 10
+
+    def test_compaction_writes_snapshot_and_drops_log(self, tmp_path: Path) -> None:
+        """Every compact_interval events the snapshot absorbs the log."""
+        dashboard = AuditDashboard(workspace_root=tmp_path)
+        dashboard.storage.compact_interval = 3
+
+        for i in range(4):
+            dashboard.record_audit(_audit(i))
+
+        # Snapshot at seq 1 (first audit), compacted again at seq 4
+        snapshot = json.loads(dashboard.metrics_file.read_text(encoding="utf-8"))
+        assert snapshot["event_seq"] == 4
+        assert snapshot["audits_performed"] == 4
+        assert not dashboard.storage.event_log.exists()
+
+        dashboard.record_audit(_audit(5))
+        assert [event["seq"] for event in _event_lines(dashboard)] == [5]
+
+        reloaded = AuditDashboard(workspace_root=tmp_path)
+        assert reloaded._metrics == dashboard._metrics
+        assert "event_seq" not in reloaded._metrics
+
+    def test_recovery_skips_folded_and_torn_events(self, tmp_path: Path) -> None:
+        """Events already in the snapshot and torn lines are not replayed."""
+        dashboard = AuditDashboard(workspace_root=tmp_path)
+        for i in range(3):
+            dashboard.record_audit(_audit(i))
+        log_before_compaction = dashboard.storage.event_log.read_text(
+            encoding="utf-8",
+        )
+        dashboard.storage.save_metrics(dashboard._metrics)
+
+        # Simulate a crash after the snapshot but before the log was removed,
+        # followed by an append interrupted mid-line
+        dashboard.storage.event_log.write_text(
+            log_before_compaction + '{"seq": 4, "timest',
+            encoding="utf-8",
+        )
+
+        reloaded = AuditDashboard(workspace_root=tmp_path)
+
+        assert reloaded._metrics == dashboard._metrics
+        assert reloaded._metrics["audits_performed"] == 3
+
+    def test_legacy_snapshot_without_event_seq(self, tmp_path: Path) -> None:
+        """Metrics files written before the event log still load."""
+        dashboard = AuditDashboard(workspace_root=tmp_path)
+        legacy = dict(dashboard._metrics, audits_performed=7)
+        dashboard.metrics_file.write_text(json.dumps(legacy), encoding="utf-8")
+
+        reloaded = AuditDashboard(workspace_root=tmp_path)
+        reloaded.record_audit(_audit(1))
+
+        assert reloaded._metrics["audits_performed"] == 8
+        assert AuditDashboard(workspace_root=tmp_path)._metrics == reloaded._metrics
+
+    def test_reset_backs_up_pending_events(self, tmp_path: Path) -> None:
+        """reset_metrics() folds the log into the backup before resetting."""
+        dashboard = AuditDashboard(workspace_root=tmp_path)
+        dashboard.record_audit(_audit(1))
+        dashboard.record_audit(_audit(2))
+
+        dashboard.reset_metrics()
+
+        backup = json.loads(
+            dashboard.metrics_file.with_suffix(".backup").read_text(encoding="utf-8"),
+        )
+        assert backup["audits_performed"] == 2
+        assert not dashboard.storage.event_log.exists()
+        assert AuditDashboard(workspace_root=tmp_path)._metrics["audits_performed"] == 0
@@ -0,0 +1,284 @@
+"""Tests for the incremental (changed-files-only) Code Audit.
+
+Test Coverage:
+    - Change collection: git output parsing, dirty files, git failures
+    - Findings cache: reuse by object id, fingerprint, pruning
+    - CodeAuditor: incremental report equals a full audit (real repository)
+
+Usage:
+    pytest tests/test_audit_incremental.py -v
+"""
+
+from __future__ import annotations
+
+# ruff: noqa: S101, PLR2004
+# S101: Use of assert (required for pytest)
+# PLR2004: Magic value in comparison (test constants are acceptable)
+import shutil
+import subprocess
+from collections.abc import Sequence
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from scripts.audit.incremental import (
+    CACHE_PATH,
+    ChangeSet,
+    FindingsCache,
+    IncrementalAudit,
+    audit_fingerprint,
+    collect_changes,
+)
+from scripts.audit.models import (
+    AuditResult,
+    SecurityCategory,
+    SecurityPattern,
+    SecuritySeverity,
+)
+from scripts.cli.audit import CodeAuditor
+
+PATTERN = SecurityPattern(
+    pattern="os.system(",
+    severity=SecuritySeverity.CRITICAL,
+    description="os.system() is dangerous",
+    category=SecurityCategory.SUBPROCESS,
+)
+
+
+def _fake_git(outputs: dict[str, str | None]) -> tuple[list[list[str]], object]:
+    """Runner answering by the command's joined arguments."""
+    calls: list[list[str]] = []
+
+    def runner(command: Sequence[str]) -> str | None:
+        calls.append(list(command))
+        return outputs.get(" ".join(command[1:]), "")
+
+    return calls, runner
+
+
+class TestCollectChanges:
+    """Translation of git output into a ChangeSet."""
+
+    def test_base_ref_changes_and_trusted_ids(self, tmp_path: Path) -> None:
+        """Diffed and untracked files change; dirty files lose their id."""
+        calls, runner = _fake_git(
+            {
+                "diff --name-only --relative -z origin/main": "a.py\0b.py\0",
+                "ls-files --others --exclude-standard -z": "new.py\0",
+                "diff --name-only --relative -z": "b.py\0",
+                "ls-files --stage -z": (
+                    "100644 1111 0\ta.py\x00"
+                    "100644 2222 0\tb.py\x00"
+                    "100644 3333 0\tc.py\x00"
+                ),
+            },
+        )
+
+        changes = collect_changes(tmp_path, base_ref="origin/main", runner=runner)  # type: ignore[arg-type]
+
+        root = tmp_path.resolve()
+        assert changes is not None
+        assert changes.changed == {root / "a.py", root / "b.py", root / "new.py"}
+        assert changes.object_ids == {root / "a.py": "1111", root / "c.py": "3333"}
+        assert len(calls) == 4
+
+    def test_staged_diffs_the_index(self, tmp_path: Path) -> None:
+        """Pre-commit mode compares the index with HEAD only."""
+        calls, runner = _fake_git(
+            {"diff --name-only --relative -z --cached": "a.py\0"},
+        )
+
+        changes = collect_changes(tmp_path, staged=True, runner=runner)  # type: ignore[arg-type]
+
+        assert changes is not None
+        assert changes.changed == {tmp_path.resolve() / "a.py"}
+        assert ["git", "diff", "--name-only", "--relative", "-z", "--cached"] in calls
+        assert not any("--others" in call for call in calls)
+
+    def test_git_failure_returns_none(self, tmp_path: Path) -> None:
+        """An unknown ref (or no repository) disables incremental mode."""
+        _, runner = _fake_git({"diff --name-only --relative -z bogus": None})
+
+        assert collect_changes(tmp_path, base_ref="bogus", runner=runner) is None  # type: ignore[arg-type]
+
+
+class TestIncrementalAudit:
+    """Merging of fresh and cached findings."""
+
+    @staticmethod
+    def _finding(path: Path) -> AuditResult:
+        return AuditResult(
+            file_path=path,
+            line_number=1,
+            pattern=PATTERN,
+            code_snippet="os.system('ls')",
+        )
+
+    def _run(
+        self,
+        tmp_path: Path,
+        files: list[Path],
+        changes: ChangeSet,
+        fingerprint: int = 50,
+    ) -> tuple[list[Path], list[AuditResult]]:
+        analyzed: list[Path] = []
+
+        def analyze(path: Path) -> list[AuditResult]:
+            analyzed.append(path)
+            return [self._finding(path)] if path.stem != "clean" else []
+
+        cache = FindingsCache(
+            tmp_path / "findings.json",
+            tmp_path,
+            [PATTERN],
+            {"max_findings_per_file": fingerprint},
+        )
+        result = IncrementalAudit(analyze, cache).run(files, changes)
+        assert result.analyzed == analyzed
+        return analyzed, result.findings
+
+    def test_only_changed_files_are_reanalyzed(self, tmp_path: Path) -> None:
+        """Cached findings are reused by object id; order follows the scan."""
+        a, b, clean = tmp_path / "a.py", tmp_path / "b.py", tmp_path / "clean.py"
+        ids = {a: "1", b: "2", clean: "3"}
+        self._run(tmp_path, [a, b, clean], ChangeSet(object_ids=dict(ids)))
+
+        analyzed, findings = self._run(
+            tmp_path,
+            [a, b, clean],
+            ChangeSet(changed={b}, object_ids={**ids, a: "1b"}),
+        )
+
+        assert analyzed == [a, b]
+        assert [f.file_path for f in findings] == [a, b]
+
+        with patch("scripts.audit.incremental.AtomicFileWriter") as writer:
+            analyzed, findings = self._run(
+                tmp_path,
+                [a, b, clean],
+                ChangeSet(object_ids={**ids, a: "1b"}),
+            )
+        assert analyzed == []
+        writer.assert_not_called()  # nothing new: the cache is not rewritten
+        assert [f.file_path for f in findings] == [a, b]
+        assert findings[0].to_dict() == self._finding(a).to_dict()
+
+    def test_files_without_id_are_always_analyzed(self, tmp_path: Path) -> None:
+        """Untracked and dirty files are analyzed and never cached."""
+        a = tmp_path / "a.py"
+        self._run(tmp_path, [a], ChangeSet())
+
+        analyzed, _ = self._run(tmp_path, [a], ChangeSet())
+
+        assert analyzed == [a]
+
+    def test_fingerprint_change_and_pruning(self, tmp_path: Path) -> None:
+        """New audit limits drop the cache; deleted files leave it."""
+        a, b = tmp_path / "a.py", tmp_path / "b.py"
+        changes = ChangeSet(object_ids={a: "1", b: "2"})
+        self._run(tmp_path, [a, b], changes)
+
+        analyzed, _ = self._run(tmp_path, [a, b], changes, fingerprint=5)
+        assert analyzed == [a, b]
+
+        self._run(tmp_path, [a], changes, fingerprint=5)
+        analyzed, _ = self._run(tmp_path, [a, b], changes, fingerprint=5)
+        assert analyzed == [b]
+
+    def test_fingerprint_covers_patterns_and_settings(self) -> None:
+        """Any pattern or limit change yields another fingerprint."""
+        base = audit_fingerprint([PATTERN], {"max_findings_per_file": 50})
+        other = PATTERN.model_copy(update={"severity": SecuritySeverity.LOW})
+
+        assert base == audit_fingerprint([PATTERN], {"max_findings_per_file": 50})
+        assert base != audit_fingerprint([other], {"max_findings_per_file": 50})
+        assert base != audit_fingerprint([PATTERN], {"max_findings_per_file": 5})
+
+    def test_fingerprint_covers_analyzer_source(self, tmp_path: Path) -> None:
+        """Editing the analyzer invalidates findings it produced."""
+        source = tmp_path / "analyzer.py"
+        source.write_text("v1\n", encoding="utf-8")
+        settings = {"max_findings_per_file": 50}
+
+        with patch("scripts.audit.incremental.ANALYZER_SOURCE", source):
+            before = audit_fingerprint([PATTERN], settings)
+            source.write_text("v2\n", encoding="utf-8")
+            after = audit_fingerprint([PATTERN], settings)
+
+        assert before != after
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+class TestCodeAuditorIncremental:
+    """End-to-end incremental audit against a temporary repository."""
+
+    @staticmethod
+    def _git(repo: Path, *args: str) -> None:
+        subprocess.run(  # noqa: S603
+            ["git", *args],  # noqa: S607
+            cwd=repo,
+            check=True,
+            capture_output=True,
+        )
+
+    @staticmethod
+    def _audit(repo: Path, **kwargs: object) -> tuple[dict[str, object], list[Path]]:
+        config = repo.parent / "audit_config.yaml"
+        config.write_text(
+            "scan_paths: ['src/']\nsimulate_ci: false\n",
+            encoding="utf-8",
+        )
+        auditor = CodeAuditor(repo, config)
+        with patch.object(
+            auditor,
+            "_analyze_file",
+            wraps=auditor._analyze_file,  # noqa: SLF001
+        ) as analyze:
+            report = auditor.run_audit(**kwargs)  # type: ignore[arg-type]
+        return report, [call.args[0] for call in analyze.call_args_list]
+
+    def test_report_matches_full_audit(self, tmp_path: Path) -> None:
+        """Only the edited file is analyzed; the report stays complete."""
+        repo = tmp_path / "repo"
+        src = repo / "src"
+        src.mkdir(parents=True)
+        self._git(repo, "init", "-q")
+        self._git(repo, "config", "user.email", "dev@example.com")
+        self._git(repo, "config", "user.name", "Dev")
+        for name in ("a", "b", "c"):
+            (src / f"{name}.py").write_text(
+                f"import os\nos.system('{name}')\n",
+                encoding="utf-8",
+            )
+        self._git(repo, "add", "src")
+        self._git(repo, "commit", "-q", "-m", "init")
+
+        first, analyzed = self._audit(repo, changed_since="HEAD")
+        assert len(analyzed) == 3
+        assert (repo / CACHE_PATH).is_file()
+
+        (src / "b.py").write_text("print('safe')\n", encoding="utf-8")
+        incremental, analyzed = self._audit(repo, changed_since="HEAD")
+        full, _ = self._audit(repo)
+
+        assert analyzed == [(src / "b.py").resolve()]
+        assert incremental["findings"] == full["findings"]
+        assert len(incremental["findings"]) == 2  # type: ignore[arg-type]
+        assert incremental["metadata"]["incremental"] == {  # type: ignore[index]
+            "base": "HEAD",
+            "files_analyzed": 1,
+            "files_from_cache": 2,
+        }
+        assert first["findings"] != incremental["findings"]
+
+    def test_outside_a_repository_falls_back_to_full(self, tmp_path: Path) -> None:
+        """Without git history every file is analyzed."""
+        repo = tmp_path / "plain"
+        (repo / "src").mkdir(parents=True)
+        (repo / "src" / "a.py").write_text("os.system('a')\n", encoding="utf-8")
+
+        report, analyzed = self._audit(repo, staged=True)
+
+        assert len(analyzed) == 1
+        assert report["metadata"]["incremental"] is None  # type: ignore[index]
@@ -0,0 +1,193 @@
+"""Tests for the console entry point startup benchmark and regression gate."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from scripts.benchmark_startup import (
+    EntryPoint,
+    ImportRecord,
+    StartupResult,
+    aggregate_by_package,
+    find_regressions,
+    load_baseline,
+    load_entry_points,
+    measure_entry_point,
+    measure_scenarios,
+    parse_importtime,
+    save_baseline,
+)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+SAMPLE_IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       150 |        150 |   _io
+import time:      1200 |       3400 | typer
+import time:       800 |       2200 |   typer.main
+import time:      1400 |       1400 |     typer.core
+Some unrelated warning line
+import time:       500 |       4200 | scripts.cortex.cli
+"""
+
+
+class TestParseImporttime:
+    """Parsing of ``-X importtime`` stderr."""
+
+    def test_parses_records_and_depth(self) -> None:
+        """Header and noise are skipped; indentation maps to depth."""
+        records = parse_importtime(SAMPLE_IMPORTTIME)
+
+        assert [r.module for r in records] == [
+            "_io",
+            "typer",
+            "typer.main",
+            "typer.core",
+            "scripts.cortex.cli",
+        ]
+        assert records[1] == ImportRecord("typer", 1200, 3400, 0)
+        assert records[3].depth == 2
+
+    def test_aggregate_by_top_level_package(self) -> None:
+        """Self times are summed per top-level package, excluding startup."""
+        records = parse_importtime(SAMPLE_IMPORTTIME)
+
+        totals = aggregate_by_package(records, exclude={"_io"})
+
+        assert totals == {"typer": pytest.approx(3.4), "scripts": pytest.approx(0.5)}
+
+
+class TestRegressionGate:
+    """Baseline comparison rules."""
+
+    BASELINE = {
+        "entry_points": {
+            "cortex": {"import_ms": 100.0, "packages_ms": {"scripts": 40.0}},
+            "doctor": {"import_ms": 30.0, "packages_ms": {"rich": 20.0}},
+        },
+    }
+
+    def test_growth_above_threshold_is_flagged(self) -> None:
+        """+50 ms / +50% exceeds both the relative and absolute limits."""
+        current = [StartupResult("cortex", 0.0, 150.0, {"scripts": 85.0})]
+
+        regressions = find_regressions(current, self.BASELINE, 0.2, 15.0)
+
+        assert len(regressions) == 1
+        assert regressions[0].name == "cortex"
+        assert regressions[0].growth == pytest.approx(0.5)
+        assert regressions[0].top_growth == [("scripts", 45.0)]
+
+    def test_small_absolute_growth_is_noise(self) -> None:
+        """+10 ms on a 30 ms entry point is +33% but below min_delta_ms."""
+        current = [StartupResult("doctor", 0.0, 40.0)]
+
+        assert find_regressions(current, self.BASELINE, 0.2, 15.0) == []
+
+    def test_growth_within_threshold_passes(self) -> None:
+        """+18 ms on 100 ms is below the 20% threshold."""
+        current = [StartupResult("cortex", 0.0, 118.0)]
+
+        assert find_regressions(current, self.BASELINE, 0.2, 15.0) == []
+
+    def test_new_entry_point_is_ignored(self) -> None:
+        """Entry points absent from the baseline cannot regress."""
+        current = [StartupResult("git-sync", 0.0, 999.0)]
+
+        assert find_regressions(current, self.BASELINE) == []
+
+    def test_baseline_roundtrip(self, tmp_path: Path) -> None:
+        """Saved baselines load back with the measurements."""
+        path = tmp_path / "nested" / "baseline.json"
+        save_baseline(
+            [StartupResult("cortex", 80.0, 40.0, {"typer": 25.0})],
+            path,
+            iterations=3,
+        )
+
+        data = load_baseline(path)
+
+        assert data["iterations"] == 3
+        assert data["entry_points"]["cortex"]["import_ms"] == 40.0
+        assert data["entry_points"]["cortex"]["packages_ms"] == {"typer": 25.0}
+
+    def test_missing_baseline_is_empty(self, tmp_path: Path) -> None:
+        """A missing file is reported as an empty baseline."""
+        assert load_baseline(tmp_path / "absent.json") == {}
+
+
+class TestEntryPoints:
+    """Entry point discovery and safe --help execution."""
+
+    def test_load_entry_points_from_pyproject(self, tmp_path: Path) -> None:
+        """[project.scripts] is read in declaration order."""
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text(
+            '[project]\nname = "x"\n\n[project.scripts]\n'
+            'b-tool = "pkg.b:main"\na-tool = "pkg.a:app"\n',
+            encoding="utf-8",
+        )
+
+        entries = load_entry_points(pyproject)
+
+        assert entries == [
+            EntryPoint("b-tool", "pkg.b:main"),
+            EntryPoint("a-tool", "pkg.a:app"),
+        ]
+        assert entries[1].module == "pkg.a"
+        assert entries[1].attribute == "app"
+
+    def test_project_declares_expected_entry_points(self) -> None:
+        """The benchmark covers every console script of this project."""
+        names = {entry.name for entry in load_entry_points()}
+
+        assert {"cortex", "doctor", "audit", "install-dev", "git-sync"} <= names
+
+    @pytest.mark.parametrize("name", ["doctor", "install-dev"])
+    def test_help_is_side_effect_free(self, name: str) -> None:
+        """--help must print usage and exit before diagnosing or installing."""
+        entry = next(e for e in load_entry_points() if e.name == name)
+        code = (
+            f"import sys; sys.argv = [{name!r}, '--help']\n"
+            f"from {entry.module} import {entry.attribute}\n"
+            f"{entry.attribute}()"
+        )
+
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert "usage:" in result.stdout
+
+    def test_measure_entry_point(self) -> None:
+        """A single sample yields wall time and a per-package breakdown."""
+        entry = next(e for e in load_entry_points() if e.name == "doctor")
+
+        result = measure_entry_point(entry, iterations=1, startup_modules=set())
+
+        assert result.import_ms > 0
+        assert result.wall_ms > 0
+        assert "scripts" in result.packages_ms
+
+    def test_measure_scenarios(self) -> None:
+        """Scenarios are named by command line; unknown commands are skipped."""
+        entries = [e for e in load_entry_points() if e.name == "doctor"]
+
+        results = measure_scenarios(
+            ["doctor --help", "missing --help"],
+            entries,
+            iterations=1,
+            startup_modules=set(),
+        )
+
+        assert [result.name for result in results] == ["doctor --help"]
+        assert results[0].import_ms > 0
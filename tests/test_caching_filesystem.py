@@ -0,0 +1,159 @@
+"""Tests for the bounded read-through CachingFileSystem.
+
+Usage:
+    pytest tests/test_caching_filesystem.py -v
+"""
+
+from __future__ import annotations
+
+# ruff: noqa: S101, PLR2004
+# S101: Use of assert (required for pytest)
+# PLR2004: Magic value in comparison (test constants are acceptable)
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from typer.testing import CliRunner
+
+from scripts.cortex.cli import app
+from scripts.utils.caching_filesystem import CachingFileSystem
+from scripts.utils.filesystem import MemoryFileSystem
+
+
+def _cached(files: dict[str, str], max_bytes: int = 1 << 20) -> CachingFileSystem:
+    """A cache over a MemoryFileSystem holding ``files``."""
+    backend = MemoryFileSystem()
+    backend.write_many({Path(p): c for p, c in files.items()})
+    return CachingFileSystem(backend, max_bytes=max_bytes)
+
+
+class TestReads:
+    """Read-through caching and statistics."""
+
+    def test_repeated_reads_and_probes_hit(self) -> None:
+        """Only the first read, probe and listing reach the backend."""
+        fs = _cached({"docs/a.md": "# A", "docs/b.md": "# B"})
+
+        with patch.object(fs.fs, "read_text", wraps=fs.fs.read_text) as read:
+            for _ in range(3):
+                assert fs.read_text(Path("docs/a.md")) == "# A"
+                assert fs.is_file(Path("docs/a.md"))
+                assert not fs.exists(Path("docs/missing.md"))
+                assert list(fs.rglob(Path("docs"), "*.md")) == [
+                    Path("docs/a.md"),
+                    Path("docs/b.md"),
+                ]
+
+        assert read.call_count == 1
+        assert fs.stats.misses == 4
+        assert fs.stats.hits == 8
+        assert fs.stats.hit_rate == 8 / 12
+        assert fs.stats.to_dict()["entries"] == 4
+
+    def test_lru_eviction_stays_within_budget(self) -> None:
+        """The least recently used text is evicted first; oversized ones skip."""
+        big = "x" * 600
+        fs = _cached(
+            {"a.txt": big, "b.txt": big, "c.txt": big, "huge.txt": big * 4},
+            max_bytes=2000,
+        )
+
+        fs.read_text(Path("a.txt"))
+        fs.read_text(Path("b.txt"))
+        fs.read_text(Path("a.txt"))  # b is now the least recently used
+        fs.read_text(Path("c.txt"))
+        fs.read_text(Path("huge.txt"))
+
+        assert fs.stats.evictions == 1
+        assert fs.stats.bytes <= fs.max_bytes
+        fs.read_text(Path("a.txt"))
+        fs.read_text(Path("c.txt"))
+        assert fs.stats.hits == 3
+        fs.read_text(Path("b.txt"))
+        fs.read_text(Path("huge.txt"))
+        assert fs.stats.misses == 6
+
+    def test_text_is_cached_per_encoding(self) -> None:
+        """A read in another encoding is not served the first decoding."""
+        fs = _cached({"notes.txt": "café"})
+        path = Path("notes.txt")
+
+        with patch.object(fs.fs, "read_text", wraps=fs.fs.read_text) as read:
+            fs.read_text(path)
+            assert fs.read_prefix(path, 1024) == ("café", True)
+            fs.read_text(path, encoding="latin-1")
+            fs.read_prefix(path, 1024, encoding="latin-1")
+
+        assert [call.kwargs["encoding"] for call in read.call_args_list] == [
+            "utf-8",
+            "latin-1",
+        ]
+
+
+class TestInvalidation:
+    """Writes through the cache drop what they may have changed."""
+
+    def test_write_invalidates_text_probes_and_listings(self) -> None:
+        """A written file is re-read; ancestor listings see it."""
+        fs = _cached({"docs/a.md": "old", "src/x.py": ""})
+        fs.read_text(Path("docs/a.md"))
+        fs.read_text(Path("src/x.py"))
+        assert not fs.exists(Path("docs/new/b.md"))
+        assert list(fs.rglob(Path("docs"), "*.md")) == [Path("docs/a.md")]
+
+        fs.write_text(Path("docs/a.md"), "new")
+        fs.write_text(Path("docs/new/b.md"), "b")
+
+        assert fs.read_text(Path("docs/a.md")) == "new"
+        assert fs.exists(Path("docs/new/b.md"))
+        assert list(fs.rglob(Path("docs"), "*.md")) == [
+            Path("docs/a.md"),
+            Path("docs/new/b.md"),
+        ]
+        fs.read_text(Path("src/x.py"))
+        assert fs.stats.hits == 1  # the unrelated file stayed cached
+
+    def test_copy_and_remove_invalidate_the_tree(self) -> None:
+        """Directory operations drop every entry below the path."""
+        fs = _cached({"t/a.md": "a", "t/sub/b.md": "b", "src.md": "s"})
+        fs.read_text(Path("t/sub/b.md"))
+        assert fs.is_file(Path("t/a.md"))
+
+        fs.remove(Path("t"))
+
+        assert not fs.is_file(Path("t/a.md"))
+        assert not fs.exists(Path("t/sub/b.md"))
+        assert not fs.is_file(Path("copy.md"))
+        fs.copy(Path("src.md"), Path("copy.md"))
+        assert fs.is_file(Path("copy.md"))
+
+    def test_read_racing_a_write_is_not_cached(self) -> None:
+        """Text read before a concurrent write is returned but not stored."""
+        fs = _cached({"a.md": "old"})
+        original = fs.fs.read_text
+
+        def read_then_write(path: Path, encoding: str = "utf-8") -> str:
+            text = original(path, encoding=encoding)
+            fs.write_text(path, "new")
+            return text
+
+        with patch.object(fs.fs, "read_text", side_effect=read_then_write):
+            assert fs.read_text(Path("a.md")) == "old"
+
+        assert fs.read_text(Path("a.md")) == "new"
+
+
+@patch("scripts.core.cortex.audit_orchestrator.AuditOrchestrator")
+def test_cortex_fs_cache_flag(orchestrator_class: MagicMock, tmp_path: Path) -> None:
+    """``cortex --fs-cache`` hands one CachingFileSystem to the command."""
+    orchestrator_class.return_value.run_full_audit.return_value.metadata_result = None
+    orchestrator_class.return_value.run_full_audit.return_value.should_fail = False
+
+    result = CliRunner().invoke(
+        app,
+        ["--fs-cache", "--fs-cache-mb", "8", "audit", str(tmp_path)],
+    )
+
+    assert result.exit_code == 0, result.output
+    fs = orchestrator_class.call_args.kwargs["fs"]
+    assert isinstance(fs, CachingFileSystem)
+    assert fs.max_bytes == 8 * 1024 * 1024
@@ -0,0 +1,166 @@
+"""Tests for static (import-free) CLI introspection.
+
+Usage:
+    pytest tests/test_cli_introspect.py -v
+"""
+
+from __future__ import annotations
+
+# ruff: noqa: S101, PLR2004
+# S101: Use of assert (required for pytest)
+# PLR2004: Magic value in comparison (test constants are acceptable)
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from scripts.core.cli_introspect import (
+    IntrospectionCache,
+    StaticCLIExtractor,
+)
+from scripts.core.doc_gen import CLIDocGenerator
+
+TYPER_CLI = '''"""Tool CLI - Synthetic Typer app.
+
+Usage:
+    tool run
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from clipkg.commands import sync
+
+app = typer.Typer(help="Tool")
+
+
+@app.command("run", help="Run the tool")
+def run_tool(
+    target: Annotated[str, typer.Argument(help="What to run")],
+    output: Annotated[Path, typer.Option("--output", help="Report path")] = Path(
+        "out/report.md",
+    ),
+    retries: int = 3,
+    verbose: bool = False,
+    label: str | None = None,
+) -> None:
+    """Run the tool.
+
+    Longer description.
+    """
+
+
+@app.command()
+def status(name: str = typer.Option("x", help="Ignored")) -> None:
+    """Show status."""
+
+
+app.command(name="sync")(sync)
+'''
+
+COMMANDS = '''"""Commands defined outside the CLI module."""
+
+from __future__ import annotations
+
+from typing import Annotated
+
+import typer
+
+
+def sync(
+    remote: Annotated[str, typer.Option(help="Remote name")] = "origin",
+    dry_run: bool = True,
+) -> None:
+    """Synchronize with the remote."""
+'''
+
+MAIN_CLI = '''"""Main CLI - No Typer app."""
+
+import sys
+
+
+def main(argv: list[str] | None = None, *, strict: bool = False) -> int:
+    """Run it.
+
+    Returns:
+        Exit code
+    """
+    return 0
+'''
+
+
+@pytest.fixture
+def project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """A project root with a ``clipkg`` package of CLI modules."""
+    package = tmp_path / "clipkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("", encoding="utf-8")
+    (package / "tool.py").write_text(TYPER_CLI, encoding="utf-8")
+    (package / "commands.py").write_text(COMMANDS, encoding="utf-8")
+    (package / "plain.py").write_text(MAIN_CLI, encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield tmp_path
+    for name in [m for m in sys.modules if m.split(".")[0] == "clipkg"]:
+        del sys.modules[name]
+
+
+class TestStaticCLIExtractor:
+    """Static extraction against runtime introspection."""
+
+    @pytest.mark.parametrize("module", ["clipkg.tool", "clipkg.plain"])
+    def test_matches_live_introspection(self, project: Path, module: str) -> None:
+        """Commands, parameters, signatures and docstrings match the live app."""
+        static = StaticCLIExtractor(project).extract(module)
+
+        generator = CLIDocGenerator(project / "CLI.md", static=False)
+        live = generator._live_module_info(  # noqa: SLF001
+            generator._import_module(module),  # noqa: SLF001
+        )
+
+        assert static == live
+
+    def test_does_not_import_modules(self, project: Path) -> None:
+        """Module-level code never runs and imported callbacks are followed."""
+        source = project / "clipkg" / "tool.py"
+        source.write_text(
+            TYPER_CLI + "\nraise RuntimeError('executed')\n",
+            encoding="utf-8",
+        )
+        extractor = StaticCLIExtractor(project)
+
+        info = extractor.extract("clipkg.tool")
+
+        assert "clipkg.tool" not in sys.modules
+        assert info is not None
+        assert info.commands is not None
+        assert sorted(info.commands) == ["run", "status", "sync"]
+        assert info.commands["run"].params[1]["default"] == "out/report.md"
+        assert info.commands["sync"].params[0]["help"] == "Remote name"
+        assert extractor.sources == [source, project / "clipkg" / "commands.py"]
+
+
+class TestIntrospectionCache:
+    """Per-source-hash cache of extraction results."""
+
+    def test_hit_skips_parsing_until_a_source_changes(self, project: Path) -> None:
+        """Unchanged sources are served from disk; editing a dependency misses."""
+        cache_path = project / ".cache" / "cli-docs" / "introspection.json"
+        extractor = StaticCLIExtractor(project)
+        first = IntrospectionCache(cache_path)
+        info = extractor.extract("clipkg.tool")
+        first.put("clipkg.tool", project, info, extractor.sources)
+        first.save()
+
+        with patch("scripts.core.cli_introspect._parse_module") as parse:
+            assert IntrospectionCache(cache_path).get("clipkg.tool", project) == info
+        parse.assert_not_called()
+
+        commands = project / "clipkg" / "commands.py"
+        commands.write_text(COMMANDS.replace("origin", "upstream"), encoding="utf-8")
+        assert IntrospectionCache(cache_path).get("clipkg.tool", project) is None
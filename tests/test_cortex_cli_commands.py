@@ -539,6 +539,7 @@ class TestAuditCommand:
         mock_report.total_errors = 0
         mock_report.total_warnings = 0
         mock_report.files_with_errors = []
+        mock_report.file_results = []
         mock_report.is_successful = True
 
         mock_metadata_result = MagicMock()
@@ -639,7 +640,7 @@ class TestGenerateCommand:
 class TestInitCommand:
     """Test 'init' command with mocked orchestrator."""
 
-    @patch("scripts.core.cortex.project_orchestrator.ProjectOrchestrator")
+    @patch("scripts.cortex.commands.setup.ProjectOrchestrator")
     def test_init_new_file(
         self,
         mock_orchestrator_class: Mock,
@@ -678,7 +679,7 @@ class TestInitCommand:
 class TestMigrateCommand:
     """Test 'migrate' command with mocked orchestrator."""
 
-    @patch("scripts.core.cortex.project_orchestrator.ProjectOrchestrator")
+    @patch("scripts.cortex.commands.setup.ProjectOrchestrator")
     def test_migrate_basic(
         self,
         mock_orchestrator_class: Mock,
@@ -697,7 +698,7 @@ class TestMigrateCommand:
 
         # Mock orchestrator instance
         mock_orchestrator = MagicMock()
-        mock_orchestrator.migrate_directory.return_value = mock_summary
+        mock_orchestrator.migrate_project.return_value = mock_summary
         mock_orchestrator_class.return_value = mock_orchestrator
 
         # Create temporary docs directory
@@ -707,8 +708,10 @@ class TestMigrateCommand:
         # Act: Run command
         result = runner.invoke(app, ["migrate", str(docs_path)])
 
-        # Assert: Migration was executed (check output, not mock call)
+        # Assert: Migration was executed through the mocked orchestrator
         assert result.exit_code == 0
+        mock_orchestrator.migrate_project.assert_called_once()
+        assert mock_orchestrator.migrate_project.call_args.kwargs["dry_run"] is True
 
 
 class TestSetupHooksCommand:
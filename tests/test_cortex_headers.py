@@ -0,0 +1,148 @@
+"""Tests for bounded header reads (titles, docstrings, frontmatter).
+
+Usage:
+    pytest tests/test_cortex_headers.py -v
+"""
+
+from __future__ import annotations
+
+# ruff: noqa: S101, PLR2004
+# S101: Use of assert (required for pytest)
+# PLR2004: Magic value in comparison (test constants are acceptable)
+from pathlib import Path
+
+import pytest
+
+from scripts.core.cortex.headers import markdown_title, module_docstring, read_header
+from scripts.core.cortex.mapper import ProjectMapper
+from scripts.core.cortex.migrate import DocumentMigrator
+from scripts.utils.filesystem import RealFileSystem
+
+
+class CountingFileSystem(RealFileSystem):
+    """RealFileSystem that records full reads and prefix sizes."""
+
+    def __init__(self) -> None:
+        """Initialize counters."""
+        self.full_reads: list[Path] = []
+        self.prefix_reads: list[int] = []
+
+    def read_text(self, path: str | Path, encoding: str = "utf-8") -> str:
+        """Record, then read."""
+        self.full_reads.append(Path(path))
+        return super().read_text(path, encoding)
+
+    def read_prefix(
+        self,
+        path: str | Path,
+        max_bytes: int,
+        encoding: str = "utf-8",
+    ) -> tuple[str, bool]:
+        """Record, then read the prefix."""
+        self.prefix_reads.append(max_bytes)
+        return super().read_prefix(path, max_bytes, encoding)
+
+
+class TestReadPrefix:
+    """RealFileSystem.read_prefix."""
+
+    def test_cut_multibyte_character_is_dropped(self, tmp_path: Path) -> None:
+        """A character split at the limit is not decoded as garbage."""
+        path = tmp_path / "doc.md"
+        path.write_text("ação\r\nfim", encoding="utf-8")
+
+        assert RealFileSystem().read_prefix(path, 2) == ("a", False)
+        assert RealFileSystem().read_prefix(path, 100) == ("ação\nfim", True)
+
+
+class TestFinders:
+    """markdown_title and module_docstring."""
+
+    def test_title_skips_frontmatter(self) -> None:
+        """YAML comments in the frontmatter are not headings."""
+        text = "---\n# yaml comment\nid: x\n---\n\n## Sub\n# Title\n"
+
+        assert markdown_title(text) == "Title"
+        assert markdown_title("---\nid: x\n", complete=False) is None
+        assert markdown_title("---\n# Rule below\n") == "Rule below"
+
+    def test_docstring_needs_first_lines(self) -> None:
+        """An incomplete prefix shorter than the scan window is undecided."""
+        assert module_docstring('"""CLI entry point."""\n') == "CLI entry point."
+        assert module_docstring("import os\n", complete=False) is None
+        assert module_docstring("import os\n") == ""
+        assert module_docstring("x = 1\n" * 25, complete=False) == ""
+
+
+class TestReadHeader:
+    """read_header prefix + fallback."""
+
+    def test_heading_in_prefix_avoids_full_read(self, tmp_path: Path) -> None:
+        """Only the prefix is read when it contains the answer."""
+        path = tmp_path / "big.md"
+        path.write_text("# Big\n" + "text\n" * 10_000, encoding="utf-8")
+        fs = CountingFileSystem()
+
+        assert read_header(fs, path, markdown_title, 64) == "Big"
+        assert fs.full_reads == []
+
+    @pytest.mark.parametrize("cap", [8, 64, None])
+    def test_falls_back_to_full_read(self, tmp_path: Path, cap: int | None) -> None:
+        """A heading beyond the cap (or cut by it) is still found."""
+        path = tmp_path / "late.md"
+        path.write_text("intro\n" * 20 + "# Late heading\n", encoding="utf-8")
+        fs = CountingFileSystem()
+
+        assert read_header(fs, path, markdown_title, cap) == "Late heading"
+        assert fs.full_reads == [path]
+
+
+class TestConsumers:
+    """ProjectMapper and DocumentMigrator use bounded reads."""
+
+    def test_mapper_header_bytes(self, tmp_path: Path) -> None:
+        """Titles and docstrings come from prefixes of the configured size."""
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "guide.md").write_text(
+            "# Guide\n" + "body\n" * 5000,
+            encoding="utf-8",
+        )
+        cli = tmp_path / "scripts" / "cli"
+        cli.mkdir(parents=True)
+        (cli / "audit.py").write_text(
+            '"""Audit docs."""\n' + "x = 1\n" * 5000,
+            encoding="utf-8",
+        )
+        fs = CountingFileSystem()
+        mapper = ProjectMapper(tmp_path, fs=fs, header_bytes=256)
+
+        context = mapper.map_project(include_knowledge=False)
+
+        assert [d.title for d in context.documents] == ["Guide"]
+        assert [c.description for c in context.cli_commands] == ["Audit docs."]
+        assert fs.prefix_reads == [256, 256]
+        assert fs.full_reads == []
+
+    def test_migrator_skips_from_head(self, tmp_path: Path) -> None:
+        """Files with frontmatter are skipped without a full read."""
+        done = tmp_path / "done.md"
+        done.write_text(
+            "---\nid: done\n---\n# Done\n" + "x\n" * 5000,
+            encoding="utf-8",
+        )
+        todo = tmp_path / "todo.md"
+        todo.write_text(
+            "# 🚀 Todo\n\nSee scripts/cli/audit.py\n",
+            encoding="utf-8",
+        )
+        fs = CountingFileSystem()
+        migrator = DocumentMigrator(tmp_path, fs=fs, header_bytes=64)
+
+        skipped = migrator.migrate_file(done, dry_run=True)
+        created = migrator.migrate_file(todo, dry_run=True)
+
+        assert skipped.action == "skipped"
+        assert created.inferred_metadata is not None
+        assert created.inferred_metadata["title"] == "Todo"
+        assert created.inferred_metadata["linked_code"] == ["scripts/cli/audit.py"]
+        assert fs.full_reads == []
@@ -0,0 +1,146 @@
+"""Tests for the streaming CORTEX JSON writers.
+
+Usage:
+    pytest tests/test_cortex_json_export.py -v
+"""
+
+from __future__ import annotations
+
+# ruff: noqa: S101, PLR2004, SLF001
+# S101: Use of assert (required for pytest)
+# PLR2004: Magic value in comparison (test constants are acceptable)
+# SLF001: Private member access (necessary for unit testing internals)
+import json
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from scripts.core.cortex.json_export import (
+    ExportLayout,
+    write_json_document,
+    write_json_entries,
+)
+from scripts.core.cortex.mapper import ProjectMapper
+from scripts.core.cortex.models import DocStatus, KnowledgeEntry
+from scripts.utils.filesystem import MemoryFileSystem, RealFileSystem
+
+
+def _entries(count: int) -> list[KnowledgeEntry]:
+    """Entries with nested data and non-ASCII content."""
+    return [
+        KnowledgeEntry(
+            id=f"kno-{i:03d}",
+            status=DocStatus.ACTIVE,
+            tags=["api", "segurança"],
+            golden_paths=[f"src/mod{i}.py -> docs/mod{i}.md"],
+            cached_content=f'# Título {i}\nLinha com "aspas" e\ttab',
+        )
+        for i in range(count)
+    ]
+
+
+def _legacy(entries: list[KnowledgeEntry]) -> str:
+    """Output of the previous in-memory implementation."""
+    return json.dumps(
+        {
+            "entries": [entry.model_dump(mode="json") for entry in entries],
+            "count": len(entries),
+        },
+        indent=2,
+        ensure_ascii=False,
+    )
+
+
+class TestWriteJsonEntries:
+    """write_json_entries layouts."""
+
+    @pytest.mark.parametrize("count", [0, 1, 3])
+    def test_indent_is_byte_identical(self, count: int) -> None:
+        """The default layout reproduces the previous json.dumps output."""
+        fs = MemoryFileSystem()
+        entries = _entries(count)
+
+        assert write_json_entries(fs, Path("/k.json"), entries) == count
+        assert fs.read_text("/k.json") == _legacy(entries)
+
+    @pytest.mark.parametrize("count", [0, 2])
+    def test_compact_parses_to_same_document(self, count: int) -> None:
+        """Compact layout drops whitespace but keeps the document."""
+        fs = MemoryFileSystem()
+        entries = _entries(count)
+
+        write_json_entries(fs, Path("/k.json"), iter(entries), "compact")
+
+        content = fs.read_text("/k.json")
+        assert "\n" not in content
+        assert json.loads(content) == json.loads(_legacy(entries))
+
+    def test_jsonl_writes_one_entry_per_line(self) -> None:
+        """JSON Lines have no envelope: one entry per line."""
+        fs = MemoryFileSystem()
+        entries = _entries(3)
+
+        write_json_entries(fs, Path("/k.jsonl"), entries, "jsonl")
+
+        lines = fs.read_text("/k.jsonl").splitlines()
+        assert [json.loads(line)["id"] for line in lines] == [
+            "kno-000",
+            "kno-001",
+            "kno-002",
+        ]
+
+    def test_failure_keeps_previous_file(self, tmp_path: Path) -> None:
+        """An error mid-stream leaves the old file and no temp file."""
+        target = tmp_path / "knowledge.json"
+        target.write_text("previous", encoding="utf-8")
+
+        def broken() -> Iterator[KnowledgeEntry]:
+            yield from _entries(2)
+            raise RuntimeError("scanner crashed")
+
+        with pytest.raises(RuntimeError):
+            write_json_entries(RealFileSystem(), target, broken())
+
+        assert target.read_text(encoding="utf-8") == "previous"
+        assert [p.name for p in tmp_path.iterdir()] == ["knowledge.json"]
+
+
+class TestProjectMapperExport:
+    """ProjectMapper export_layout."""
+
+    @pytest.mark.parametrize(
+        ("layout", "name"),
+        [("indent", "knowledge.json"), ("jsonl", "knowledge.jsonl")],
+    )
+    def test_knowledge_file_name(self, layout: ExportLayout, name: str) -> None:
+        """The jsonl layout exports knowledge as .cortex/knowledge.jsonl."""
+        fs = MemoryFileSystem()
+        mapper = ProjectMapper(Path("/app"), fs=fs, export_layout=layout)
+
+        mapper._save_knowledge_entries(_entries(2))
+
+        assert fs.exists(Path("/app/.cortex") / name)
+
+    def test_save_context_streams_document(self, tmp_path: Path) -> None:
+        """save_context output is unchanged in the default layout."""
+        fs = RealFileSystem()
+        (tmp_path / "pyproject.toml").write_text(
+            '[project]\nname = "demo"\nversion = "1.0.0"\n',
+            encoding="utf-8",
+        )
+        mapper = ProjectMapper(tmp_path, fs=fs)
+        context = mapper.map_project(include_knowledge=False)
+        output = tmp_path / ".cortex" / "context.json"
+
+        mapper.save_context(context, output)
+        write_json_document(fs, tmp_path / "compact.json", context, "compact")
+
+        expected = json.dumps(
+            context.model_dump(mode="json"),
+            indent=2,
+            ensure_ascii=False,
+        )
+        assert output.read_text(encoding="utf-8") == expected
+        compact = (tmp_path / "compact.json").read_text(encoding="utf-8")
+        assert json.loads(compact) == json.loads(expected)
@@ -0,0 +1,158 @@
+"""Tests for lazy command registration in the CORTEX CLI.
+
+Ensures that command modules are only imported when the command is
+invoked, while the command surface (names, order, help) is unchanged.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from scripts.cortex.cli import CortexGroup, app
+from scripts.cortex.lazy import LazyCommand, LazyTyperGroup, declare_lazy_commands
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+EXPECTED_COMMANDS = [
+    "init",
+    "migrate",
+    "setup-hooks",
+    "config",
+    "map",
+    "knowledge-scan",
+    "knowledge-sync",
+    "guardian-probe",
+    "audit",
+    "generate",
+    "guardian-check",
+]
+
+
+def _loaded_modules_after(code: str) -> set[str]:
+    """Run code in a fresh interpreter and return loaded scripts.* modules."""
+    probe = (
+        f"{code}\nimport sys\n"
+        "print('\\n'.join(m for m in sys.modules if m.startswith('scripts')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+class TestLazyStartup:
+    """Startup must not import command modules."""
+
+    def test_import_cli_does_not_import_commands(self) -> None:
+        """Importing the CLI module leaves every command module unloaded."""
+        loaded = _loaded_modules_after("import scripts.cortex.cli")
+
+        assert "scripts.cortex.cli" in loaded
+        assert not {m for m in loaded if m.startswith("scripts.cortex.commands.")}
+        assert not {m for m in loaded if m.startswith("scripts.core")}
+
+    def test_invoking_command_imports_only_its_module(self) -> None:
+        """Resolving 'audit' imports the docs module and nothing else."""
+        loaded = _loaded_modules_after(
+            "from typer.testing import CliRunner\n"
+            "from scripts.cortex.cli import app\n"
+            "CliRunner().invoke(app, ['audit', '--help'])",
+        )
+
+        assert "scripts.cortex.commands.docs" in loaded
+        assert "scripts.cortex.commands.knowledge" not in loaded
+        assert "scripts.cortex.commands.setup" not in loaded
+
+
+class TestLazyRegistry:
+    """The declared command surface matches the historical eager one."""
+
+    def test_commands_listed_in_declaration_order(self) -> None:
+        """All commands are listed, in registration order."""
+        group = typer.main.get_command(app)
+
+        assert isinstance(group, CortexGroup)
+        assert group.list_commands(None) == EXPECTED_COMMANDS
+
+    @pytest.mark.parametrize("command", EXPECTED_COMMANDS)
+    def test_every_command_resolves(self, command: str) -> None:
+        """Every declared target imports and responds to --help."""
+        result = CliRunner().invoke(app, [command, "--help"])
+
+        assert result.exit_code == 0, result.output
+
+    def test_unknown_command_still_errors(self) -> None:
+        """Unknown commands keep Click's usage error."""
+        result = CliRunner().invoke(app, ["does-not-exist"])
+
+        assert result.exit_code != 0
+
+    def test_resolved_command_is_cached(self) -> None:
+        """A command is materialized once per group instance."""
+        group = typer.main.get_command(app)
+
+        first = group.get_command(None, "map")  # type: ignore[arg-type]
+        second = group.get_command(None, "map")  # type: ignore[arg-type]
+
+        assert first is second
+
+
+class TestLazyCommand:
+    """Unit tests for LazyCommand and declare_lazy_commands."""
+
+    def test_load_callback(self) -> None:
+        """Target in module:attr format resolves to the callable."""
+        spec = LazyCommand(
+            "guardian-check",
+            "scripts.cortex.commands.guardian:guardian_check",
+        )
+
+        callback = spec.load_callback()
+
+        assert callback.__name__ == "guardian_check"
+
+    def test_invalid_target_raises(self) -> None:
+        """Targets without ':' are rejected with a clear error."""
+        spec = LazyCommand("broken", "scripts.cortex.commands.guardian")
+
+        with pytest.raises(ValueError, match="Invalid lazy command target"):
+            spec.load_callback()
+
+    def test_duplicate_names_rejected(self) -> None:
+        """Declaring the same name twice is a programming error."""
+        with pytest.raises(ValueError, match="Duplicate lazy command name"):
+            declare_lazy_commands(
+                LazyCommand("a", "x:y"),
+                LazyCommand("a", "x:z"),
+            )
+
+    def test_custom_group_subclass(self) -> None:
+        """A LazyTyperGroup subclass works for arbitrary Typer apps."""
+
+        class Group(LazyTyperGroup):
+            lazy_commands = declare_lazy_commands(
+                LazyCommand(
+                    "guardian-check",
+                    "scripts.cortex.commands.guardian:guardian_check",
+                ),
+            )
+
+        custom = typer.Typer(cls=Group)
+
+        @custom.callback()
+        def _root() -> None:
+            """Root callback so Typer builds a group."""
+
+        result = CliRunner().invoke(custom, ["guardian-check", "--help"])
+
+        assert result.exit_code == 0, result.output
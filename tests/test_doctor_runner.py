@@ -0,0 +1,148 @@
+"""Tests for the concurrent check runner of DevDoctor.
+
+Usage:
+    pytest tests/test_doctor_runner.py -v
+"""
+
+from __future__ import annotations
+
+# ruff: noqa: S101, PLR2004
+# S101: Use of assert (required for pytest)
+# PLR2004: Magic value in comparison (test constants are acceptable)
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from unittest.mock import patch
+
+from scripts.cli.doctor import DevDoctor, DiagnosticResult
+
+
+def _slow(name: str, delay: float) -> Callable[[], DiagnosticResult]:
+    """Build a check that sleeps, prints and passes."""
+
+    def check() -> DiagnosticResult:
+        time.sleep(delay)
+        print(f"output of {name}")
+        return DiagnosticResult(name, True, "OK")
+
+    return check
+
+
+def _doctor(
+    tmp_path: Path,
+    checks: list[Callable[[], DiagnosticResult]],
+    timeout: float = 5.0,
+) -> DevDoctor:
+    """DevDoctor whose diagnostic_checks() returns ``checks``."""
+    doctor = DevDoctor(tmp_path, check_timeout=timeout)
+    doctor.diagnostic_checks = lambda: checks  # type: ignore[method-assign]
+    return doctor
+
+
+class TestConcurrentRunner:
+    """DevDoctor.run_checks()."""
+
+    def test_bounded_by_slowest_check_in_stable_order(self, tmp_path: Path) -> None:
+        """Checks overlap; results keep declaration order and durations."""
+        doctor = _doctor(
+            tmp_path,
+            [_slow("first", 0.3), _slow("second", 0.1), _slow("third", 0.3)],
+        )
+        delivered: list[tuple[str, str]] = []
+
+        start = time.perf_counter()
+        results = doctor.run_checks(
+            on_result=lambda result, output: delivered.append((result.name, output)),
+        )
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.6
+        assert [r.name for r in results] == ["first", "second", "third"]
+        assert delivered == [
+            ("first", "output of first\n"),
+            ("second", "output of second\n"),
+            ("third", "output of third\n"),
+        ]
+        assert all(0.09 < r.duration < 0.5 for r in results)
+
+    def test_timeout_is_critical_failure(self, tmp_path: Path) -> None:
+        """A hung check is reported after check_timeout, not awaited."""
+        release = threading.Event()
+
+        def check_hung_tool() -> DiagnosticResult:
+            release.wait(5)
+            return DiagnosticResult("Hung", True, "OK")
+
+        doctor = _doctor(tmp_path, [_slow("fast", 0.0), check_hung_tool], 0.2)
+        try:
+            start = time.perf_counter()
+            results = doctor.run_checks()
+            elapsed = time.perf_counter() - start
+        finally:
+            release.set()
+
+        assert elapsed < 1.0
+        assert results[0].passed
+        assert results[1].name == "Hung Tool"
+        assert not results[1].passed
+        assert results[1].critical
+        assert "timeout" in results[1].details
+
+    def test_hung_check_does_not_block_process_exit(self, tmp_path: Path) -> None:
+        """The process exits after the timeout, not when the check returns."""
+        script = textwrap.dedent(
+            f"""
+            import time
+            from pathlib import Path
+            from scripts.cli.doctor import DevDoctor, DiagnosticResult
+
+            def check_hung() -> DiagnosticResult:
+                time.sleep(30)
+                return DiagnosticResult("Hung", True, "OK")
+
+            doctor = DevDoctor(Path({str(tmp_path)!r}), check_timeout=0.5)
+            doctor.diagnostic_checks = lambda: [check_hung]
+            assert not doctor.run_checks()[0].passed
+            """,
+        )
+
+        start = time.perf_counter()
+        subprocess.run(  # noqa: S603
+            [sys.executable, "-c", script],
+            cwd=Path(__file__).resolve().parent.parent,
+            check=True,
+            timeout=20,
+        )
+
+        assert time.perf_counter() - start < 10
+
+    def test_crashing_check_becomes_failure(self, tmp_path: Path) -> None:
+        """An exception inside a check does not abort the run."""
+
+        def check_broken() -> DiagnosticResult:
+            raise RuntimeError("boom")
+
+        doctor = _doctor(tmp_path, [check_broken, _slow("after", 0.0)])
+
+        results = doctor.run_checks()
+
+        assert (results[0].name, results[0].passed) == ("Broken", False)
+        assert results[0].details == "boom"
+        assert results[1].passed
+
+    @patch("scripts.cli.doctor.print")
+    def test_run_diagnostics_fails_on_critical(
+        self,
+        mock_print: object,
+        tmp_path: Path,
+    ) -> None:
+        """run_diagnostics() aggregates the concurrent results."""
+        failing = DiagnosticResult("Hooks", False, "missing", critical=True)
+        doctor = _doctor(tmp_path, [_slow("ok", 0.0), lambda: failing])
+
+        assert doctor.run_diagnostics() is False
+        assert doctor.results[1] is failing
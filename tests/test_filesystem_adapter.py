@@ -10,6 +10,7 @@ License: MIT
 
 from __future__ import annotations
 
+import threading
 from pathlib import Path
 from typing import Any, cast
 
@@ -227,6 +228,70 @@ class TestMemoryFileSystem:
         result = fs.read_text(test_file, encoding="utf-8")
         assert result == content
 
+    def test_rglob_visits_only_the_subtree(self) -> None:
+        """Rglob matches names under the base directory only, in creation order."""
+        fs = MemoryFileSystem()
+        fs.write_many(
+            {Path(f"other/pkg{i}/mod{j}.py"): "" for i in range(50) for j in range(20)}
+        )
+        fs.write_text(Path("docs/b/z.md"), "z")
+        fs.write_text(Path("docs/a.md"), "a")
+        fs.write_text(Path("docs/b/y.txt"), "y")
+        fs.write_text(Path("docs/b/z.md"), "z2")
+
+        found = list(fs.rglob(Path("docs"), "*.md"))
+        visited = list(fs._walk(Path("docs")))  # noqa: SLF001
+
+        assert found == [Path("docs/b/z.md"), Path("docs/a.md")]
+        assert visited == [Path("docs"), Path("docs/b")]
+        assert list(fs.rglob(Path("docs/a.md"), "*.md")) == [Path("docs/a.md")]
+
+    def test_remove_subtree_updates_index(self) -> None:
+        """Removed trees disappear from scans; siblings and parents remain."""
+        fs = MemoryFileSystem()
+        fs.write_text(Path("root/keep/a.py"), "")
+        fs.write_text(Path("root/drop/b.py"), "")
+        fs.write_text(Path("root/drop/deep/c.py"), "")
+        fs.mkdir(Path("root/drop/empty"))
+
+        fs.remove(Path("root/drop"))
+        fs.remove(Path("root/keep/a.py"))
+
+        assert list(fs.rglob(Path("root"), "*")) == []
+        assert not fs.exists(Path("root/drop/empty"))
+        assert fs.is_dir(Path("root/keep"))
+        fs.write_text(Path("root/drop/b.py"), "again")
+        assert list(fs.rglob(Path("root"), "*.py")) == [Path("root/drop/b.py")]
+
+    def test_concurrent_scans_during_writes(self) -> None:
+        """Scans running alongside writers never fail and see whole files."""
+        fs = MemoryFileSystem()
+        fs.write_many({Path(f"src/m{i}.py"): "x" for i in range(100)})
+        errors: list[BaseException] = []
+
+        def scan() -> None:
+            try:
+                for _ in range(50):
+                    for path in fs.rglob(Path("src"), "*.py"):
+                        assert fs.read_text(path) == "x"
+            except BaseException as exc:  # noqa: BLE001
+                errors.append(exc)
+
+        def write() -> None:
+            for i in range(100, 600):
+                fs.write_text(Path(f"src/new/m{i}.py"), "x")
+
+        threads = [threading.Thread(target=scan) for _ in range(4)]
+        threads.append(threading.Thread(target=write))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        expected_files = 600
+        assert len(list(fs.rglob(Path("src"), "*.py"))) == expected_files
+
 
 class TestRealFileSystem:
     """Test suite for RealFileSystem implementation."""
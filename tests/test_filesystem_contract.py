@@ -9,6 +9,7 @@ The tests verify critical contracts:
 - mkdir creates parent directories when parents=True
 - write_text creates parent directories automatically
 - Consistent error handling (FileNotFoundError, FileExistsError)
+- read_bytes/map_bytes return the UTF-8 bytes of what read_text returns
 
 Author: QA Engineering Team
 License: MIT
@@ -23,6 +24,7 @@ from pathlib import Path
 import pytest
 
 from scripts.utils.filesystem import (
+    MMAP_MIN_BYTES,
     FileSystemAdapter,
     MemoryFileSystem,
     RealFileSystem,
@@ -238,6 +240,25 @@ class FileSystemContract:
         assert len(result) == 0
         assert result == []
 
+    @pytest.mark.parametrize("size", [0, 10, MMAP_MIN_BYTES + 1])
+    def test_byte_views_match_text(
+        self,
+        fs: FileSystemAdapter,
+        base_path: Path,
+        size: int,
+    ) -> None:
+        """Contract: read_bytes/map_bytes expose the UTF-8 bytes of the text."""
+        content = ("é" * size)[:size]
+        fs.write_text(base_path / "bytes.txt", content)
+
+        expected = content.encode("utf-8")
+        assert fs.read_bytes(base_path / "bytes.txt") == expected
+        with fs.map_bytes(base_path / "bytes.txt") as view:
+            assert view[:] == expected
+            assert view.find("é".encode()) == (0 if size else -1)
+        with pytest.raises(FileNotFoundError):
+            fs.read_bytes(base_path / "nonexistent.txt")
+
 
 class TestMemoryFileSystemContract(FileSystemContract):
     """Test MemoryFileSystem against FileSystemAdapter contract."""
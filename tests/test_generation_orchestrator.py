@@ -9,8 +9,9 @@ License: MIT
 
 from __future__ import annotations
 
+import shutil
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -23,6 +24,9 @@ from scripts.core.cortex.models import (
     DriftCheckResult,
     SingleGenerationResult,
 )
+from scripts.core.cortex.readme_generator import DocumentGenerator
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
 
 @pytest.fixture
@@ -82,6 +86,7 @@ class TestGenerateSingle:
         mock_generator.generate_document.assert_called_once_with(
             template_name="README.md.j2",
             output_path=None,
+            data=None,
         )
 
         # Verify file was written
@@ -521,3 +526,101 @@ class TestIntegrationScenarios:
 
         # CI would fail based on this result
         assert any(r.has_drift for r in results)
+
+
+class TestDriftFingerprints:
+    """Shared batch data, compiled-template reuse and fingerprint-based checks."""
+
+    @pytest.fixture
+    def project(self, tmp_path: Path) -> Path:
+        """Project with pyproject.toml and two small templates."""
+        (tmp_path / "pyproject.toml").write_text(
+            '[project]\nname = "demo"\nversion = "1.0.0"\n',
+            encoding="utf-8",
+        )
+        templates = tmp_path / "docs" / "templates"
+        templates.mkdir(parents=True)
+        (templates / "README.md.j2").write_text(
+            "# {{ project.name }} {{ project.version }}\n",
+            encoding="utf-8",
+        )
+        (templates / "CONTRIBUTING.md.j2").write_text(
+            "# Contributing to {{ project.name }}\n\n_{{ generated_at }}_\n",
+            encoding="utf-8",
+        )
+        return tmp_path
+
+    def test_batch_collects_data_once(self, project: Path) -> None:
+        """Both documents render from one data collection and one environment."""
+        generator = DocumentGenerator(project_root=project)
+        orchestrator = GenerationOrchestrator(project, generator)
+
+        with patch.object(
+            generator,
+            "collect_all_data",
+            wraps=generator.collect_all_data,
+        ) as collect:
+            result = orchestrator.generate_batch(dry_run=True)
+            orchestrator.check_batch_drift()
+
+        assert result.success is True
+        assert collect.call_count == 2
+        assert generator._environment() is generator._environment()  # noqa: SLF001
+
+    def test_unchanged_document_skips_rendering(self, project: Path) -> None:
+        """A document in sync with an unchanged fingerprint is not re-rendered."""
+        fingerprints = project / ".cache" / "fingerprints.json"
+        orchestrator = GenerationOrchestrator(project, fingerprint_path=fingerprints)
+        assert orchestrator.generate_single(GenerationTarget.README).success
+
+        checker = GenerationOrchestrator(project, fingerprint_path=fingerprints)
+        with patch.object(checker.generator, "generate_document") as render:
+            result = checker.check_drift(GenerationTarget.README)
+        render.assert_not_called()
+        assert result.has_drift is False
+
+        # Data the template uses changed: render and report drift
+        (project / "pyproject.toml").write_text(
+            '[project]\nname = "demo"\nversion = "2.0.0"\n',
+            encoding="utf-8",
+        )
+        result = GenerationOrchestrator(
+            project,
+            fingerprint_path=fingerprints,
+        ).check_drift(GenerationTarget.README)
+        assert result.has_drift is True
+        assert "+# demo 2.0.0" in result.diff
+
+    def test_fingerprint_ignores_generation_time(self, project: Path) -> None:
+        """Timestamps change on every collection but never the fingerprint."""
+        generator = DocumentGenerator(project_root=project)
+        first, second = generator.collect_all_data(), generator.collect_all_data()
+        assert first.generated_at != second.generated_at
+
+        for template in ("README.md.j2", "CONTRIBUTING.md.j2"):
+            assert generator.template_fingerprint(
+                template,
+                first,
+            ) == generator.template_fingerprint(template, second)
+
+    def test_real_templates_skip_rendering_once_in_sync(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """The project's own templates (which print generated_at) use fingerprints."""
+        shutil.copy(PROJECT_ROOT / "pyproject.toml", tmp_path / "pyproject.toml")
+        shutil.copytree(
+            PROJECT_ROOT / "docs" / "templates", tmp_path / "docs" / "templates"
+        )
+        fingerprints = tmp_path / ".cache" / "fingerprints.json"
+        for target in (GenerationTarget.README, GenerationTarget.CONTRIBUTING):
+            assert GenerationOrchestrator(tmp_path).generate_single(target).success
+
+            first = GenerationOrchestrator(tmp_path, fingerprint_path=fingerprints)
+            assert first.check_drift(target).has_drift is False
+            assert fingerprints.is_file()
+
+            second = GenerationOrchestrator(tmp_path, fingerprint_path=fingerprints)
+            with patch.object(second.generator, "generate_document") as render:
+                assert second.check_drift(target).has_drift is False
+            render.assert_not_called()
@@ -0,0 +1,73 @@
+"""Testes unitários para o DocumentationMatcher do Visibility Guardian."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+from scripts.core.guardian.matcher import DocumentationMatcher
+from scripts.core.guardian.models import ConfigFinding, ConfigType
+from scripts.utils.filesystem import MemoryFileSystem
+
+
+def _finding(key: str) -> ConfigFinding:
+    return ConfigFinding(
+        key=key,
+        config_type=ConfigType.ENV_VAR,
+        source_file=Path("app.py"),
+        line_number=1,
+    )
+
+
+def test_find_orphans_with_word_boundaries(tmp_path: Path) -> None:
+    """Chaves só contam como documentadas com fronteira de palavra."""
+    docs = tmp_path / "docs"
+    (docs / "guides").mkdir(parents=True)
+    (docs / "config.md").write_text("Defina `DB_HOST` e DB_PORT.\n", encoding="utf-8")
+    (docs / "guides" / "deploy.md").write_text(
+        "Use DB_HOSTNAME no deploy. Configuração: DB_HOST\r\n",
+        encoding="utf-8",
+    )
+    (docs / "latin1.md").write_bytes("DB_USER é obrigatório\n".encode("latin-1"))
+
+    orphans, documented = DocumentationMatcher(docs).find_orphans(
+        [_finding("DB_HOST"), _finding("DB_PORT"), _finding("DB_USER")],
+    )
+
+    assert [o.key for o in orphans] == ["DB_USER"]
+    assert sorted(documented["DB_HOST"]) == [
+        docs / "config.md",
+        docs / "guides" / "deploy.md",
+    ]
+    assert documented["DB_PORT"] == [docs / "config.md"]
+
+
+def test_only_documents_containing_the_key_are_decoded() -> None:
+    """Cada documento é lido uma vez; só os que contêm uma chave são decodificados."""
+    fs = MemoryFileSystem()
+    docs = Path("docs")
+    fs.write_text(docs / "a.md", "API_KEY é usada aqui")
+    fs.write_text(docs / "c.md", "A API lê API_KEY_V2")
+    fs.write_text(docs / "b.md", "Nada relevante " * 1000)
+    matcher = DocumentationMatcher(docs, fs=fs)
+
+    with (
+        patch.object(fs, "map_bytes", wraps=fs.map_bytes) as mapped,
+        patch.object(matcher, "_decode", wraps=matcher._decode) as decode,  # noqa: SLF001
+    ):
+        orphans, documented = matcher.find_orphans(
+            [_finding("API_KEY"), _finding("API")],
+        )
+
+    assert orphans == []
+    assert documented == {"API_KEY": [docs / "a.md"], "API": [docs / "c.md"]}
+    assert sorted(call.args[0] for call in mapped.call_args_list) == [
+        docs / "a.md",
+        docs / "b.md",
+        docs / "c.md",
+    ]
+    assert sorted(call.args[0] for call in decode.call_args_list) == [
+        docs / "a.md",
+        docs / "c.md",
+    ]
+    assert not hasattr(matcher, "_doc_bytes")  # nada fica retido após a varredura
@@ -31,7 +31,9 @@ if TYPE_CHECKING:
 from scripts.core.cortex.knowledge_sync import (
     HTTP_NOT_MODIFIED,
     HTTP_OK,
+    FetchedSource,
     KnowledgeSyncer,
+    RealHttpClient,
     SyncResult,
     SyncStatus,
 )
@@ -740,3 +742,105 @@ class TestEdgeCases:
         assert result.entry.sources[0].etag is None
         actual_content = memory_fs.read_text(file_path)
         assert "New Content" in actual_content
+
+
+class TestFetchApplySplit:
+    """Tests for the fetch (network) / apply (filesystem) phases."""
+
+    def test_fetch_entry_does_not_touch_filesystem(
+        self,
+        syncer: KnowledgeSyncer,
+        mock_http: MockHttpClient,
+        memory_fs: MemoryFileSystem,
+    ) -> None:
+        """fetch_entry only performs network I/O."""
+        entry = KnowledgeEntry(
+            id="kno-020",
+            status=DocStatus.ACTIVE,
+            tags=["test"],
+            sources=[KnowledgeSource(url=_url("https://example.com/a.md"))],
+        )
+        mock_http.configure(text="# Remote", headers={"ETag": '"v2"'})
+
+        fetched = syncer.fetch_entry(entry)
+
+        assert fetched == [FetchedSource(entry.sources[0], "# Remote", '"v2"')]
+        assert not memory_fs.exists(Path("docs/knowledge/kno-020.md"))
+
+    def test_fetch_entry_uses_client_override(
+        self,
+        syncer: KnowledgeSyncer,
+        mock_http: MockHttpClient,
+    ) -> None:
+        """An explicit http_client replaces the syncer's client for the call."""
+        entry = KnowledgeEntry(
+            id="kno-021",
+            status=DocStatus.ACTIVE,
+            tags=["test"],
+            sources=[KnowledgeSource(url=_url("https://example.com/b.md"))],
+        )
+        mock_http.configure_exception(ConnectionError("must not be used"))
+        override = MockHttpClient()
+        override.configure(text="# From override")
+
+        fetched = syncer.fetch_entry(entry, http_client=override)
+
+        assert fetched[0].content == "# From override"
+
+    def test_apply_fetched_matches_sync_entry(
+        self,
+        syncer: KnowledgeSyncer,
+        memory_fs: MemoryFileSystem,
+    ) -> None:
+        """apply_fetched merges and writes exactly like sync_entry."""
+        file_path = Path("docs/knowledge/kno-022.md")
+        memory_fs.write_text(file_path, "# Old")
+        entry = KnowledgeEntry(
+            id="kno-022",
+            status=DocStatus.ACTIVE,
+            tags=["test"],
+            sources=[KnowledgeSource(url=_url("https://example.com/c.md"))],
+        )
+
+        result = syncer.apply_fetched(
+            entry,
+            file_path,
+            [FetchedSource(entry.sources[0], "# New", '"v3"')],
+        )
+
+        assert result.status == SyncStatus.UPDATED
+        assert result.entry.sources[0].etag == '"v3"'
+        assert "# New" in memory_fs.read_text(file_path)
+
+
+class TestRealHttpClientSession:
+    """Tests for the pooled session used by RealHttpClient."""
+
+    def test_session_is_created_once_and_reused(self) -> None:
+        """Every request goes through the same keep-alive session."""
+        client = RealHttpClient()
+
+        assert client.session is client.session
+
+    def test_get_uses_injected_session(self) -> None:
+        """A provided session is used for GET requests."""
+        session = Mock()
+        client = RealHttpClient(session=session)
+
+        client.get("https://example.com/x.md", headers={"A": "1"}, timeout=5)
+
+        session.get.assert_called_once_with(
+            "https://example.com/x.md",
+            headers={"A": "1"},
+            timeout=5,
+        )
+
+    def test_close_releases_session(self) -> None:
+        """close() closes the pool; the next access creates a new session."""
+        session = Mock()
+        client = RealHttpClient(session=session)
+
+        client.close()
+
+        session.close.assert_called_once()
+        assert client.session is not session
@@ -1,10 +1,11 @@
 """Teste de segurança para garantir a redação de segredos nos logs."""
 
 import logging
+from unittest.mock import patch
 
 import pytest
 
-from scripts.utils.logger import setup_logging
+from scripts.utils.logger import SensitiveDataFilter, setup_logging
 
 
 def test_secrets_are_redacted_in_logs(caplog: pytest.LogCaptureFixture) -> None:
@@ -65,3 +66,45 @@ def test_multiple_secret_patterns_redacted(caplog: pytest.LogCaptureFixture) ->
     assert openai_key not in log_output, "OpenAI key vazou!"
     assert gitlab_token not in log_output, "GitLab token vazou!"
     assert log_output.count("[REDACTED]") >= 3, "Tokens não foram redatados"
+
+
+def test_env_secret_snapshot_and_refresh(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Valores de variáveis sensíveis entram no snapshot após refresh()."""
+    secret = "s3cr3t-value-from-env"
+    monkeypatch.setenv("MY_SERVICE_PASSWORD", secret)
+    SensitiveDataFilter.refresh()
+
+    redacted = SensitiveDataFilter()._redact_text(f"connecting with {secret}")
+
+    assert secret not in redacted
+    assert redacted == "connecting with [REDACTED]"
+
+    monkeypatch.delenv("MY_SERVICE_PASSWORD")
+    SensitiveDataFilter.refresh()
+    assert SensitiveDataFilter()._redact_text(secret) == secret
+
+
+def test_record_redacted_once_across_handlers() -> None:
+    """O filtro compartilhado entre handlers processa cada record uma vez."""
+    sensitive_filter = SensitiveDataFilter()
+    record = logging.LogRecord(
+        "test",
+        logging.INFO,
+        __file__,
+        1,
+        "token %s",
+        ("ghp_ABCDEF123",),
+        None,
+    )
+
+    with patch.object(
+        SensitiveDataFilter,
+        "_redact_text",
+        autospec=True,
+        side_effect=lambda _self, text: text.replace("ghp_ABCDEF123", "[REDACTED]"),
+    ) as redact:
+        assert sensitive_filter.filter(record)
+        assert SensitiveDataFilter().filter(record)
+
+    assert record.getMessage() == "token [REDACTED]"
+    assert redact.call_count == 2  # msg + 1 arg, for the first handler only
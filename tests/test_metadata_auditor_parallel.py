@@ -0,0 +1,159 @@
+"""Tests for the parallel metadata audit and shared frontmatter parsing.
+
+Usage:
+    pytest tests/test_metadata_auditor_parallel.py -v
+"""
+
+from __future__ import annotations
+
+# ruff: noqa: S101, PLR2004
+# S101: Use of assert (required for pytest)
+# PLR2004: Magic value in comparison (test constants are acceptable)
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import frontmatter
+import pytest
+
+from scripts.core.cortex.audit_orchestrator import AuditOrchestrator
+from scripts.core.cortex.scan_session import ScanSession
+from scripts.cortex.core.metadata_auditor import (
+    AuditReport,
+    FileAuditResult,
+    MetadataAuditor,
+)
+from scripts.utils.caching_filesystem import CachingFileSystem
+from scripts.utils.filesystem import RealFileSystem
+from scripts.utils.parallel import PARALLEL_THRESHOLD, process_map
+
+VALID_DOC = """---
+id: doc-{i}
+type: guide
+status: active
+version: 1.0.0
+author: Engineering Team
+date: '2026-01-01'
+linked_code:
+  - scripts/missing_{i}.py
+---
+# Doc {i}
+"""
+
+KNOWLEDGE_NODE = """---
+id: kno-{i}
+status: active
+---
+# Knowledge {i}
+
+See [[kno-0]].
+"""
+
+
+def _workspace(root: Path, docs: int, knowledge: int) -> list[Path]:
+    """Create ``docs`` guides and ``knowledge`` nodes under root/docs."""
+    (root / "docs" / "knowledge").mkdir(parents=True)
+    paths = []
+    for i in range(docs):
+        path = root / "docs" / f"doc_{i:03d}.md"
+        path.write_text(VALID_DOC.format(i=i), encoding="utf-8")
+        paths.append(path)
+    for i in range(knowledge):
+        path = root / "docs" / "knowledge" / f"kno_{i:03d}.md"
+        path.write_text(KNOWLEDGE_NODE.format(i=i), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+class TestParallelAudit:
+    """MetadataAuditor.audit with worker processes."""
+
+    def test_processes_match_sequential(self, tmp_path: Path) -> None:
+        """Worker processes produce the sequential results, in order."""
+        paths = _workspace(tmp_path, PARALLEL_THRESHOLD, 0)
+        auditor = MetadataAuditor(tmp_path)
+
+        sequential = auditor.audit(paths, workers=1)
+        parallel = auditor.audit(paths, workers=2)
+
+        assert [(r.file_path, r.errors) for r in parallel.file_results] == [
+            (r.file_path, r.errors) for r in sequential.file_results
+        ]
+        assert parallel.total_errors == PARALLEL_THRESHOLD
+        assert all(r.duration > 0 for r in parallel.file_results)
+        assert parallel.duration > 0
+
+    def test_processes_run_behind_fs_cache(self, tmp_path: Path) -> None:
+        """A session over CachingFileSystem (--fs-cache) keeps the pool."""
+        paths = _workspace(tmp_path, PARALLEL_THRESHOLD, 0)
+        session = ScanSession(CachingFileSystem(RealFileSystem()))
+        auditor = MetadataAuditor(tmp_path, fs=session)
+
+        with patch(
+            "scripts.cortex.core.metadata_auditor.process_map", wraps=process_map
+        ) as pool:
+            report = auditor.audit(paths, workers=2)
+
+        pool.assert_called_once()
+        assert report.total_errors == PARALLEL_THRESHOLD
+
+
+class TestSharedFrontmatter:
+    """One frontmatter parse per file across the metadata and knowledge audits."""
+
+    @pytest.mark.parametrize(
+        ("docs", "workers", "parent_parses"), [(2, 1, 5), (64, 2, 0)]
+    )
+    def test_full_audit_parses_each_file_once(
+        self,
+        tmp_path: Path,
+        docs: int,
+        workers: int,
+        parent_parses: int,
+    ) -> None:
+        """The knowledge scan reuses parses of the metadata audit (or its workers)."""
+        _workspace(tmp_path, docs, 3)
+        orchestrator = AuditOrchestrator(tmp_path)
+
+        with patch(
+            "scripts.core.cortex.metadata.frontmatter.loads",
+            wraps=frontmatter.loads,
+        ) as loads:
+            result = orchestrator.run_full_audit(
+                path=tmp_path / "docs",
+                check_links=True,
+                output_path=tmp_path / "health.md",
+                workers=workers,
+            )
+
+        assert result.knowledge_result is not None
+        assert result.knowledge_result.num_entries == 3
+        assert loads.call_count == parent_parses
+
+
+class TestAuditTimings:
+    """Per-file timings in AuditReport."""
+
+    def test_slowest_and_json_export(self, tmp_path: Path) -> None:
+        """Outliers are sorted first and exported with their durations."""
+        report = AuditReport(
+            files_scanned=3,
+            file_results=[
+                FileAuditResult(Path(f"docs/{name}.md"), [], [], None, duration)
+                for name, duration in [("a", 0.001), ("b", 0.5), ("c", 0.01)]
+            ],
+            root_violations=[],
+            duration=0.6,
+        )
+        output = tmp_path / "audit.json"
+
+        report.export_to_json(output)
+
+        assert [r.file_path.stem for r in report.slowest(2)] == ["b", "c"]
+        exported = json.loads(output.read_text(encoding="utf-8"))
+        assert exported["files"][1] == {
+            "file": "docs/b.md",
+            "errors": [],
+            "warnings": [],
+            "duration": 0.5,
+        }
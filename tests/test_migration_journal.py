@@ -0,0 +1,173 @@
+"""Tests for parallel, journaled bulk migration.
+
+Usage:
+    pytest tests/test_migration_journal.py -v
+"""
+
+from __future__ import annotations
+
+# ruff: noqa: S101, PLR2004
+# S101: Use of assert (required for pytest)
+# PLR2004: Magic value in comparison (test constants are acceptable)
+from collections.abc import Mapping
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from scripts.core.cortex.migrate import DocumentMigrator, MigrationProgress
+from scripts.core.cortex.migration_journal import (
+    JOURNAL_DIR,
+    MigrationJournal,
+    MigrationJournalError,
+)
+from scripts.utils.caching_filesystem import CachingFileSystem
+from scripts.utils.filesystem import MemoryFileSystem, RealFileSystem
+from scripts.utils.parallel import PARALLEL_THRESHOLD, process_map
+
+ROOT = Path("/repo")
+
+
+class CrashingFileSystem(MemoryFileSystem):
+    """MemoryFileSystem whose Nth batched write outside the journal fails."""
+
+    def __init__(self, fail_at: int) -> None:
+        """Initialize with the 1-based write that raises."""
+        super().__init__()
+        self.fail_at = fail_at
+        self.writes = 0
+
+    def write_many(
+        self,
+        files: Mapping[Path, str],
+        encoding: str = "utf-8",
+    ) -> None:
+        """Write file by file, failing at the ``fail_at``-th target."""
+        for path, content in files.items():
+            if JOURNAL_DIR.parts[-1] not in path.parts:
+                self.writes += 1
+                if self.writes == self.fail_at:
+                    raise OSError("disk full")
+            self.write_text(path, content, encoding)
+
+
+def _docs(fs: MemoryFileSystem, count: int) -> list[Path]:
+    """Create legacy docs without frontmatter."""
+    paths = [ROOT / "docs" / f"doc_{i:03d}.md" for i in range(count)]
+    for i, path in enumerate(paths):
+        fs.write_text(path, f"# Doc {i}\n\nBody\n")
+    return paths
+
+
+def _changes(fs: MemoryFileSystem, paths: list[Path]) -> list[tuple[Path, str, str]]:
+    """Changes that prepend a marker to each file."""
+    return [(p, fs.read_text(p), "migrated\n" + fs.read_text(p)) for p in paths]
+
+
+class TestMigrationJournal:
+    """Commit, rollback and resume."""
+
+    def test_commit_clears_journal(self) -> None:
+        """A successful commit rewrites every file and leaves no journal."""
+        fs = MemoryFileSystem()
+        paths = _docs(fs, 3)
+        journal = MigrationJournal(ROOT / JOURNAL_DIR, fs)
+        progress: list[tuple[int, int]] = []
+
+        assert journal.commit(_changes(fs, paths), lambda *p: progress.append(p)) == 3
+
+        assert all(fs.read_text(p).startswith("migrated") for p in paths)
+        assert not journal.pending()
+        assert not fs.exists(ROOT / JOURNAL_DIR / "000000.orig")
+        assert progress[-1] == (3, 3)
+
+    def test_failure_rolls_back_everything(self) -> None:
+        """An error on the second file restores the first one."""
+        fs = CrashingFileSystem(fail_at=2)
+        paths = _docs(fs, 3)
+        originals = [fs.read_text(p) for p in paths]
+        journal = MigrationJournal(ROOT / JOURNAL_DIR, fs)
+
+        with pytest.raises(OSError, match="disk full"):
+            journal.commit(_changes(fs, paths))
+
+        assert [fs.read_text(p) for p in paths] == originals
+        assert not journal.pending()
+
+    @pytest.mark.parametrize(
+        ("recover", "marker"),
+        [("resume", "migrated"), ("rollback", "# Doc")],
+    )
+    def test_crash_leaves_recoverable_journal(self, recover: str, marker: str) -> None:
+        """After a crash mid-commit, the journal blocks, then resumes or undoes."""
+        fs = MemoryFileSystem()
+        paths = _docs(fs, 3)
+        journal = MigrationJournal(ROOT / JOURNAL_DIR, fs)
+        changes = _changes(fs, paths)
+        # Simulate a process killed after staging and the first write
+        journal._stage(changes)  # noqa: SLF001
+        fs.write_text(paths[0], changes[0][2])
+
+        with pytest.raises(MigrationJournalError):
+            journal.commit(changes)
+
+        assert getattr(journal, recover)() == 3
+        assert all(fs.read_text(p).startswith(marker) for p in paths)
+        assert not journal.pending()
+
+
+class TestParallelMigration:
+    """DocumentMigrator.migrate_directory."""
+
+    def test_processes_match_sequential(self, tmp_path: Path) -> None:
+        """Worker processes produce the sequential results, in order."""
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        for i in range(PARALLEL_THRESHOLD):
+            (docs / f"doc_{i:03d}.md").write_text(
+                f"# Doc {i}\n\nSee scripts/cli/tool_{i}.py\n",
+                encoding="utf-8",
+            )
+        migrator = DocumentMigrator(tmp_path)
+        phases: list[MigrationProgress] = []
+
+        sequential = migrator.migrate_directory(docs, workers=1)
+        parallel = migrator.migrate_directory(
+            docs,
+            dry_run=False,
+            workers=2,
+            on_progress=phases.append,
+        )
+
+        assert [r.inferred_metadata for r in parallel] == [
+            r.inferred_metadata for r in sequential
+        ]
+        assert [p.phase for p in phases if p.done == p.total] == ["analyze", "commit"]
+        assert (docs / "doc_000.md").read_text(encoding="utf-8").startswith("---\n")
+        assert not (tmp_path / JOURNAL_DIR).exists()
+
+    def test_processes_run_behind_fs_cache(self, tmp_path: Path) -> None:
+        """A CachingFileSystem over the real tree (--fs-cache) keeps the pool."""
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        for i in range(PARALLEL_THRESHOLD):
+            (docs / f"doc_{i:03d}.md").write_text(f"# Doc {i}\n", encoding="utf-8")
+        migrator = DocumentMigrator(tmp_path, fs=CachingFileSystem(RealFileSystem()))
+
+        with patch(
+            "scripts.core.cortex.migrate.process_map", wraps=process_map
+        ) as pool:
+            results = migrator.migrate_directory(docs, workers=2)
+
+        pool.assert_called_once()
+        assert len(results) == PARALLEL_THRESHOLD
+
+    def test_pending_journal_blocks_apply(self) -> None:
+        """--apply refuses to start while an interrupted batch is pending."""
+        fs = MemoryFileSystem()
+        paths = _docs(fs, 2)
+        migrator = DocumentMigrator(ROOT, fs=fs)
+        migrator.journal._stage(_changes(fs, paths))  # noqa: SLF001
+
+        with pytest.raises(MigrationJournalError):
+            migrator.migrate_directory(ROOT / "docs", dry_run=False)
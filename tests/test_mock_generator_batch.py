@@ -0,0 +1,74 @@
+"""Testes da gravação em lote de TestMockGenerator.apply_suggestions.
+
+Usage:
+    pytest tests/test_mock_generator_batch.py -v
+"""
+
+from __future__ import annotations
+
+# ruff: noqa: S101, PLR2004
+# S101: Use of assert (required for pytest)
+# PLR2004: Magic value in comparison (test constants are acceptable)
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from scripts.core import mock_generator
+from scripts.core.mock_ci.models_pydantic import MockCIConfig
+from scripts.utils.filesystem import RealFileSystem
+
+CONFIG = Path(__file__).parent.parent / "scripts" / "test_mock_config.yaml"
+
+TEST_FILE = """def test_{name}():
+    assert fetch() == 200
+"""
+
+
+class PartialBatchFileSystem(RealFileSystem):
+    """Grava o primeiro arquivo do lote e falha no seguinte (sem journal)."""
+
+    def write_many(
+        self,
+        files: Mapping[Path, str],
+        encoding: str = "utf-8",
+    ) -> None:
+        """Grava um único arquivo e levanta OSError."""
+        path, content = next(iter(files.items()))
+        self.write_text(path, content, encoding=encoding)
+        msg = "rename failed"
+        raise OSError(msg)
+
+
+def _suggestion(file: str, function: str) -> dict[str, Any]:
+    """Sugestão de alta prioridade para ``function`` em ``file``."""
+    return {
+        "severity": "HIGH",
+        "file": file,
+        "function": function,
+        "pattern": "requests.get",
+        "required_imports": ["import requests"],
+        "mock_template": f'@patch("requests.get")\ndef {function}(mock_get):',
+    }
+
+
+def test_partial_batch_counts_only_unwritten_files(tmp_path: Path) -> None:
+    """Arquivos gravados antes da falha contam como aplicados."""
+    (tmp_path / "tests").mkdir()
+    for name in ("a", "b"):
+        test_file = tmp_path / "tests" / f"test_{name}.py"
+        test_file.write_text(TEST_FILE.format(name=name), encoding="utf-8")
+    config = MockCIConfig(**yaml.safe_load(CONFIG.read_text(encoding="utf-8")))
+    fs = PartialBatchFileSystem()
+    generator = mock_generator.TestMockGenerator(tmp_path, config, fs=fs)
+    generator.suggestions = [
+        _suggestion("tests/test_a.py", "test_a"),
+        _suggestion("tests/test_b.py", "test_b"),
+    ]
+
+    result = generator.apply_suggestions()
+
+    assert (result["applied"], result["failed"]) == (1, 1)
+    assert "@patch" in fs.read_text(tmp_path / "tests" / "test_a.py")
+    assert "@patch" not in fs.read_text(tmp_path / "tests" / "test_b.py")
@@ -0,0 +1,200 @@
+"""Tests for the pip-compile resolution cache.
+
+A local file-based package index (hand-built wheels in tmp_path, served
+through ``PIP_FIND_LINKS`` + ``PIP_NO_INDEX``) stands in for PyPI, so the
+real pip-compile runs offline and "upstream releases" can be simulated.
+
+Usage:
+    pytest tests/test_resolution_cache.py -v
+"""
+
+from __future__ import annotations
+
+# ruff: noqa: S101, SLF001
+# S101: Use of assert (required for pytest)
+# SLF001: Private member access (necessary for unit testing internals)
+import os
+import subprocess
+import sys
+import time
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from scripts.core.dependency_guardian import DependencyGuardian
+from scripts.core.resolution_cache import (
+    COMPILE_FLAGS,
+    DEFAULT_MAX_AGE,
+    ResolutionCache,
+    probe_interpreter,
+)
+
+pytest.importorskip("piptools")
+
+
+def _publish(index: Path, name: str, version: str, *requires: str) -> None:
+    """Add a minimal pure-Python wheel to the local index."""
+    index.mkdir(parents=True, exist_ok=True)
+    dist_info = f"{name}-{version}.dist-info"
+    metadata = f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n"
+    metadata += "".join(f"Requires-Dist: {req}\n" for req in requires)
+    wheel = "Wheel-Version: 1.0\nGenerator: tests\nRoot-Is-Purelib: true\n"
+    wheel += "Tag: py3-none-any\n"
+    with zipfile.ZipFile(index / f"{name}-{version}-py3-none-any.whl", "w") as whl:
+        whl.writestr(f"{name}/__init__.py", "")
+        whl.writestr(f"{dist_info}/METADATA", metadata)
+        whl.writestr(f"{dist_info}/WHEEL", wheel)
+        whl.writestr(f"{dist_info}/RECORD", "")
+
+
+def _compile(in_file: Path, out_file: Path) -> None:
+    """Compile a lockfile with the project flags."""
+    subprocess.run(  # nosec B603 - Safe: shell=False, controlled test inputs
+        [
+            sys.executable,
+            "-m",
+            "piptools",
+            "compile",
+            str(in_file),
+            "--output-file",
+            str(out_file),
+            *COMPILE_FLAGS,
+        ],
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def local_index(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Serve a local find-links index instead of PyPI."""
+    index = tmp_path / "index"
+    _publish(index, "alpha", "1.0.0", "beta>=1.0")
+    _publish(index, "beta", "1.0.0")
+    monkeypatch.setenv("PIP_NO_INDEX", "1")
+    monkeypatch.setenv("PIP_FIND_LINKS", str(index))
+    return index
+
+
+@pytest.fixture
+def project(tmp_path: Path, local_index: Path) -> Path:
+    """Project with a synchronized requirements/dev.in + dev.txt."""
+    req_dir = tmp_path / "project" / "requirements"
+    req_dir.mkdir(parents=True)
+    (req_dir / "dev.in").write_text("# Runtime\nalpha\n", encoding="utf-8")
+    _compile(req_dir / "dev.in", req_dir / "dev.txt")
+    return tmp_path / "project"
+
+
+class TestResolutionCache:
+    """Keying, expiry and storage of cached resolutions."""
+
+    def test_key_ignores_comments_but_tracks_includes(self, tmp_path: Path) -> None:
+        """Comments keep the key; -r includes and index settings change it."""
+        in_file = tmp_path / "dev.in"
+        base = tmp_path / "base.in"
+        base.write_text("beta\n", encoding="utf-8")
+        in_file.write_text("-r base.in\nalpha\n", encoding="utf-8")
+        guardian = DependencyGuardian(tmp_path)
+        cache = ResolutionCache(tmp_path / "cache")
+        interpreter = probe_interpreter(sys.executable)
+        assert interpreter is not None
+
+        def key() -> str:
+            return cache.key(in_file, guardian.compute_input_hash("dev"), interpreter)
+
+        original = key()
+        in_file.write_text("# Documented\n-r base.in\n\nalpha\n", encoding="utf-8")
+        assert key() == original
+
+        base.write_text("beta>=2\n", encoding="utf-8")
+        assert key() != original
+
+        with patch.dict(os.environ, {"PIP_INDEX_URL": "https://mirror.invalid"}):
+            mirrored = key()
+        assert mirrored != key()
+
+    def test_lookup_expires_after_max_age(self, tmp_path: Path) -> None:
+        """Entries older than max_age are misses."""
+        compiled = tmp_path / "out.txt"
+        compiled.write_text("alpha==1.0.0\n", encoding="utf-8")
+        cache = ResolutionCache(tmp_path / "cache")
+
+        entry = cache.store("k" * 64, compiled)
+        assert entry is not None
+        assert cache.lookup("k" * 64) == entry
+
+        stale = time.time() - 2 * DEFAULT_MAX_AGE
+        os.utime(entry, (stale, stale))
+        assert cache.lookup("k" * 64) is None
+
+    def test_empty_output_is_not_cached(self, tmp_path: Path) -> None:
+        """An empty pip-compile output never becomes a cache entry."""
+        compiled = tmp_path / "out.txt"
+        compiled.write_text("", encoding="utf-8")
+        cache = ResolutionCache(tmp_path / "cache")
+
+        assert cache.store("k" * 64, compiled) is None
+        assert cache.lookup("k" * 64) is None
+
+
+class TestCachedDeepConsistency:
+    """DependencyGuardian and verify_deps against the local index."""
+
+    def test_second_check_skips_pip_compile(self, project: Path) -> None:
+        """A cache hit answers without spawning any subprocess."""
+        cache = ResolutionCache(project / ".cache" / "pip-compile")
+        guardian = DependencyGuardian(project / "requirements", cache=cache)
+
+        assert guardian.validate_deep_consistency("dev") == (True, "")
+
+        with patch("subprocess.run", side_effect=AssertionError("spawned")):
+            assert guardian.validate_deep_consistency("dev") == (True, "")
+
+    def test_refresh_detects_new_release(
+        self,
+        project: Path,
+        local_index: Path,
+    ) -> None:
+        """Cached results hide an upstream release until refresh."""
+        cache = ResolutionCache(project / ".cache" / "pip-compile")
+        guardian = DependencyGuardian(project / "requirements", cache=cache)
+        assert guardian.validate_deep_consistency("dev")[0]
+
+        _publish(local_index, "beta", "1.1.0")
+
+        assert guardian.validate_deep_consistency("dev")[0]
+        is_valid, diff = guardian.validate_deep_consistency("dev", refresh=True)
+        assert not is_valid
+        assert "beta==1.1.0" in diff
+
+    def test_check_sync_reuses_resolution(self, project: Path) -> None:
+        """verify_deps.check_sync compiles once, then reads the cache."""
+        from scripts.ci import verify_deps
+
+        paths = (project, Path("requirements/dev.in"), Path("requirements/dev.txt"))
+        with patch.object(verify_deps, "_resolve_paths", return_value=paths):
+            assert verify_deps.check_sync("dev")
+
+            with (
+                patch.object(
+                    verify_deps,
+                    "_ensure_piptools_installed",
+                    side_effect=AssertionError("pip show"),
+                ),
+                patch.object(
+                    verify_deps,
+                    "_compile_in_memory",
+                    side_effect=AssertionError("pip-compile"),
+                ),
+            ):
+                assert verify_deps.check_sync("dev")
+
+            with patch.object(
+                verify_deps,
+                "_compile_in_memory",
+                side_effect=subprocess.CalledProcessError(1, "pip-compile"),
+            ):
+                assert not verify_deps.check_sync("dev", refresh=True)
@@ -0,0 +1,202 @@
+"""Tests for the per-run CORTEX scan session.
+
+Usage:
+    pytest tests/test_scan_session.py -v
+"""
+
+from __future__ import annotations
+
+# ruff: noqa: S101, PLR2004
+# S101: Use of assert (required for pytest)
+# PLR2004: Magic value in comparison (test constants are acceptable)
+import json
+from collections import Counter
+from collections.abc import Iterator
+from pathlib import Path
+
+from scripts.core.cortex.mapper import ProjectMapper
+from scripts.core.cortex.readme_generator import DocumentGenerator
+from scripts.core.cortex.scan_session import ScanSession
+from scripts.utils.filesystem import MemoryFileSystem, RealFileSystem
+
+ROOT = Path("/app")
+
+KNOWLEDGE = """---
+id: kno-{name}
+status: active
+tags: [api]
+golden_paths:
+  - "src/{name}.py -> docs/guides/{name}.md"
+---
+
+# Rule {name}
+
+Always document {name}.
+"""
+
+
+class CountingFileSystem(MemoryFileSystem):
+    """MemoryFileSystem that counts reads and directory walks."""
+
+    def __init__(self) -> None:
+        """Initialize counters."""
+        super().__init__()
+        self.reads: Counter[Path] = Counter()
+        self.walks = 0
+
+    def read_text(self, path: str | Path, encoding: str = "utf-8") -> str:
+        """Count, then read."""
+        self.reads[Path(path)] += 1
+        return super().read_text(path, encoding)
+
+    def rglob(self, path: str | Path, pattern: str) -> Iterator[Path]:
+        """Count, then walk."""
+        self.walks += 1
+        return super().rglob(path, pattern)
+
+
+def _project() -> CountingFileSystem:
+    """Project with CLI scripts, docs and knowledge entries."""
+    fs = CountingFileSystem()
+    fs.write_text(ROOT / "pyproject.toml", '[project]\nname = "demo"\n')
+    fs.write_text(ROOT / "scripts" / "cli" / "audit.py", '"""Audit docs."""\n')
+    fs.write_text(ROOT / "docs" / "guide.md", "# Guide\n")
+    fs.write_text(ROOT / "docs" / "architecture" / "adr.md", "# ADR\n")
+    for name in ("auth", "cache"):
+        fs.write_text(
+            ROOT / "docs" / "knowledge" / f"{name}.md",
+            KNOWLEDGE.format(name=name),
+        )
+    fs.reads.clear()
+    return fs
+
+
+class TestScanSession:
+    """ScanSession memoization and invalidation."""
+
+    def test_reads_and_walks_are_memoized(self) -> None:
+        """Repeated reads and walks hit the underlying adapter once."""
+        fs = _project()
+        session = ScanSession(fs)
+        guide = ROOT / "docs" / "guide.md"
+
+        assert session.read_text(guide) == session.read_text(guide)
+        assert list(session.rglob(ROOT / "docs", "*.md")) == list(
+            session.rglob(ROOT / "docs", "*.md"),
+        )
+
+        assert fs.reads[guide] == 1
+        assert fs.walks == 1
+        assert session.stats["read_hits"] == 1
+
+    def test_text_is_cached_per_encoding(self) -> None:
+        """A read in another encoding is not served the first decoding."""
+        fs = _project()
+        session = ScanSession(fs)
+        guide = ROOT / "docs" / "guide.md"
+
+        session.read_text(guide)
+        assert session.read_prefix(guide, 1024) == ("# Guide\n", True)
+        session.read_text(guide, encoding="latin-1")
+        session.read_prefix(guide, 1024, encoding="latin-1")
+        session.write_text(guide, "# Changed\n")
+
+        assert fs.reads[guide] == 2
+        assert session.read_text(guide, encoding="latin-1") == "# Changed\n"
+
+    def test_write_invalidates_only_affected_entries(self) -> None:
+        """A write drops its file, walks above it and memos scoped to it."""
+        fs = _project()
+        session = ScanSession(fs)
+        docs = ROOT / "docs"
+        knowledge = docs / "knowledge"
+        list(session.rglob(docs, "*.md"))
+        session.memo(knowledge, "scan", lambda: "first")
+
+        session.write_text(ROOT / ".cortex" / "knowledge.json", "{}")
+        assert session.memo(knowledge, "scan", lambda: "second") == "first"
+
+        session.write_text(docs / "new.md", "# New\n")
+        assert docs / "new.md" in list(session.rglob(docs, "*.md"))
+        assert session.read_text(docs / "new.md") == "# New\n"
+        session.write_text(knowledge / "new.md", "# New\n")
+        assert session.memo(knowledge, "scan", lambda: "second") == "second"
+
+    def test_remove_drops_entries_below(self) -> None:
+        """Removing a directory forgets reads, probes and memos inside it."""
+        fs = _project()
+        session = ScanSession(fs)
+        knowledge = ROOT / "docs" / "knowledge"
+        auth = knowledge / "auth.md"
+        session.read_text(auth)
+        assert session.exists(auth)
+        session.memo(auth, "parsed", lambda: "first")
+
+        session.remove(knowledge)
+
+        assert not session.exists(auth)
+        assert session.memo(auth, "parsed", lambda: "second") == "second"
+        assert session.read_text(ROOT / "docs" / "guide.md") == "# Guide\n"
+        assert fs.reads[auth] == 1
+
+    def test_memo_racing_a_write_is_not_kept(self) -> None:
+        """A result computed while its scope was written is not memoized."""
+        session = ScanSession(_project())
+        knowledge = ROOT / "docs" / "knowledge"
+
+        def scan_then_write() -> str:
+            session.write_text(knowledge / "new.md", "# New\n")
+            return "stale"
+
+        assert session.memo(knowledge, "scan", scan_then_write) == "stale"
+        assert session.memo(knowledge, "scan", lambda: "fresh") == "fresh"
+
+
+class TestSharedScans:
+    """ProjectMapper and DocumentGenerator read each file once."""
+
+    def test_map_project_reads_each_file_once(self) -> None:
+        """Knowledge files are scanned once for links and rules."""
+        fs = _project()
+        mapper = ProjectMapper(ROOT, fs=fs)
+
+        context = mapper.map_project()
+
+        assert context.knowledge_entries_count == 2
+        assert len(context.golden_paths) == 2
+        assert [c.name for c in context.cli_commands] == ["audit"]
+        assert [d.title for d in context.architecture_docs] == ["ADR"]
+        assert fs.reads[ROOT / "docs" / "knowledge" / "auth.md"] == 1
+        assert max(fs.reads.values()) == 1
+
+    def test_each_map_project_call_starts_fresh(self) -> None:
+        """A mapper reused across runs sees files changed in between."""
+        fs = _project()
+        mapper = ProjectMapper(ROOT, fs=fs)
+        mapper.map_project()
+
+        fs.write_text(ROOT / "docs" / "guide.md", "# Renamed\n")
+
+        titles = [d.title for d in mapper.map_project().documents]
+        assert "Renamed" in titles
+
+    def test_generator_parses_context_once(self, tmp_path: Path) -> None:
+        """Graph statistics and CLI commands share one context.json parse."""
+        (tmp_path / "pyproject.toml").write_text(
+            '[project]\nname = "demo"\n',
+            encoding="utf-8",
+        )
+        context = tmp_path / ".cortex" / "context.json"
+        context.parent.mkdir()
+        context.write_text(
+            json.dumps({"cli_commands": [{"name": "audit"}]}),
+            encoding="utf-8",
+        )
+        session = ScanSession(RealFileSystem())
+        generator = DocumentGenerator(project_root=tmp_path, session=session)
+
+        data = generator.collect_all_data()
+
+        assert [c.name for c in data.cli_commands] == ["audit"]
+        assert data.project.name == "demo"
+        assert session.stats["reads"] == 2
@@ -93,6 +93,7 @@ class TestConfigLoading(unittest.TestCase):
         self.assertTrue(config["audit_enabled"])
         self.assertEqual(config["audit_timeout"], 300)
         self.assertEqual(config["audit_fail_threshold"], "HIGH")
+        self.assertEqual(config["audit_changed_since"], "HEAD")
         self.assertTrue(config["strict_audit"])
 
     @patch("scripts.git_sync.config.Path.exists")
@@ -373,19 +374,13 @@ class TestSyncOrchestratorAdvanced(unittest.TestCase):
         mock_git_dir.exists.return_value = True
         mock_workspace.__truediv__.return_value = mock_git_dir
 
-        # ✅ Mock: git status returns empty (clean repo)
+        # ✅ Mock: single porcelain v2 status, clean repo on main
         mock_status_result = MagicMock()
         mock_status_result.returncode = 0
-        mock_status_result.stdout = ""  # Clean repo
+        mock_status_result.stdout = "# branch.oid abc123def456\0# branch.head main\0"
         mock_status_result.stderr = ""
 
-        # ✅ Mock: git branch returns main
-        mock_branch_result = MagicMock()
-        mock_branch_result.returncode = 0
-        mock_branch_result.stdout = "main"
-        mock_branch_result.stderr = ""
-
-        mock_run.side_effect = [mock_status_result, mock_branch_result]
+        mock_run.side_effect = [mock_status_result]
 
         sync = SyncOrchestrator(
             workspace_root=mock_workspace,
@@ -399,6 +394,12 @@ class TestSyncOrchestratorAdvanced(unittest.TestCase):
         self.assertTrue(result["is_clean"])
         self.assertEqual(result["total_changes"], 0)
         self.assertEqual(result["current_branch"], "main")
+        self.assertEqual(result["head"], "abc123def456")
+        mock_run.assert_called_once()
+        self.assertEqual(
+            mock_run.call_args.args[0],
+            ["git", "status", "--porcelain=v2", "--branch", "-z"],
+        )
 
     @patch("scripts.git_sync.sync_logic.Path")
     @patch("scripts.git_sync.sync_logic.subprocess.run")
@@ -415,19 +416,20 @@ class TestSyncOrchestratorAdvanced(unittest.TestCase):
         mock_git_dir.exists.return_value = True
         mock_workspace.__truediv__.return_value = mock_git_dir
 
-        # ✅ Mock: git status returns modified files
+        # ✅ Mock: single porcelain v2 status with staged files and upstream
         mock_status_result = MagicMock()
         mock_status_result.returncode = 0
-        mock_status_result.stdout = "M  file1.py\nA  file2.py\n"
+        mock_status_result.stdout = (
+            "# branch.oid abc123def456\0"
+            "# branch.head feature-branch\0"
+            "# branch.upstream origin/feature-branch\0"
+            "# branch.ab +2 -1\0"
+            "1 M. N... 100644 100644 100644 aaa bbb file1.py\0"
+            "1 A. N... 000000 100644 100644 000 ccc file2.py\0"
+        )
         mock_status_result.stderr = ""
 
-        # ✅ Mock: git branch returns feature-branch
-        mock_branch_result = MagicMock()
-        mock_branch_result.returncode = 0
-        mock_branch_result.stdout = "feature-branch"
-        mock_branch_result.stderr = ""
-
-        mock_run.side_effect = [mock_status_result, mock_branch_result]
+        mock_run.side_effect = [mock_status_result]
 
         sync = SyncOrchestrator(
             workspace_root=mock_workspace,
@@ -443,6 +445,9 @@ class TestSyncOrchestratorAdvanced(unittest.TestCase):
         self.assertEqual(len(result["changed_files"]), 2)
         self.assertIn("M  file1.py", result["changed_files"])
         self.assertIn("A  file2.py", result["changed_files"])
+        self.assertEqual(result["current_branch"], "feature-branch")
+        self.assertEqual(result["upstream"], "origin/feature-branch")
+        self.assertEqual((result["ahead"], result["behind"]), (2, 1))
 
     @patch("scripts.git_sync.sync_logic.Path")
     @patch("scripts.git_sync.sync_logic.subprocess.run")
@@ -493,6 +498,27 @@ class TestSyncOrchestratorAdvanced(unittest.TestCase):
         self.assertTrue(result["passed"])
         self.assertEqual(result["status"], "skipped")
 
+    def test_run_code_audit_incremental(self) -> None:
+        """Test _run_code_audit passes the incremental base ref to the audit."""
+        mock_workspace = MagicMock(spec=Path)
+        mock_workspace.resolve.return_value = mock_workspace
+        mock_workspace.__truediv__.return_value = mock_workspace
+        mock_workspace.exists.return_value = True
+
+        sync = SyncOrchestrator(
+            workspace_root=mock_workspace,
+            config={"audit_changed_since": "origin/main", "strict_audit": False},
+            dry_run=False,
+        )
+
+        with patch.object(sync, "_run_command") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+            result = sync._run_code_audit()
+
+        command = mock_run.call_args.args[0]
+        self.assertTrue(result["passed"])
+        self.assertEqual(command[-2:], ["--changed-since", "origin/main"])
+
     @patch("scripts.git_sync.sync_logic.Path")
     @patch("scripts.git_sync.sync_logic.subprocess.run")
     def test_commit_and_push_success(
@@ -831,25 +857,18 @@ class TestSyncOrchestratorAdvanced(unittest.TestCase):
         mock_git_dir.exists.return_value = True
         mock_workspace.__truediv__.return_value = mock_git_dir
 
-        # ✅ Mock: git status returns changes on main branch
+        # ✅ Mock: git status returns changes on 'main' (protected branch)
         mock_status_result = MagicMock()
         mock_status_result.returncode = 0
-        mock_status_result.stdout = "M  file1.py\n"
+        mock_status_result.stdout = (
+            "# branch.oid abc123def456\0"
+            "# branch.head main\0"
+            "1 .M N... 100644 100644 100644 aaa aaa file1.py\0"
+        )
         mock_status_result.stderr = ""
 
-        # ✅ Mock: git branch returns 'main' (protected branch)
-        mock_branch_result = MagicMock()
-        mock_branch_result.returncode = 0
-        mock_branch_result.stdout = "main"
-        mock_branch_result.stderr = ""
-
-        # Heartbeat also calls branch, so we need more mocks
-        mock_run.side_effect = [
-            mock_status_result,  # git status
-            mock_branch_result,  # git branch in _check_git_status
-            mock_branch_result,  # git branch in heartbeat (running)
-            mock_branch_result,  # git branch in heartbeat (failed)
-        ]
+        # Heartbeat and status check share one cached git status call
+        mock_run.side_effect = [mock_status_result]
 
         sync = SyncOrchestrator(
             workspace_root=mock_workspace,
@@ -0,0 +1,163 @@
+"""Tests for fleet mode of the TOML merger.
+
+Usage:
+    pytest tests/test_toml_fleet.py -v
+"""
+
+from __future__ import annotations
+
+# ruff: noqa: S101, PLR2004
+# S101: Use of assert (required for pytest)
+# PLR2004: Magic value in comparison (test constants are acceptable)
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import tomlkit
+from typer.testing import CliRunner
+
+from scripts.cli.fusion import app
+from scripts.utils.toml_fleet import (
+    FLEET_PARALLEL_THRESHOLD,
+    FleetMerger,
+    resolve_project_roots,
+)
+from scripts.utils.toml_merger import MergeStrategy, TOMLMerger
+
+TEMPLATE = """[project]
+dependencies = ["pydantic>=2.5", "rich>=13"]
+
+[tool.ruff]
+line-length = 88
+"""
+
+PROJECT = """# project {i}
+[project]
+name = "p{i}"  # mine
+dependencies = [
+    "pydantic>=2.0",  # pinned
+]
+
+[tool.ruff]
+line-length = 100
+"""
+
+
+def _fleet(root: Path, count: int) -> list[Path]:
+    """Create ``count`` projects under root/repos and a template."""
+    (root / "template.toml").write_text(TEMPLATE, encoding="utf-8")
+    projects = []
+    for i in range(count):
+        project = root / "repos" / f"p{i:02d}"
+        project.mkdir(parents=True)
+        (project / "pyproject.toml").write_text(PROJECT.format(i=i), encoding="utf-8")
+        projects.append(project)
+    return projects
+
+
+class TestFleetMerger:
+    """FleetMerger.merge."""
+
+    def test_template_parsed_once(self, tmp_path: Path) -> None:
+        """One template parse for the fleet; one parse per target."""
+        projects = _fleet(tmp_path, 3)
+
+        with patch("tomlkit.parse", wraps=tomlkit.parse) as parse:
+            fleet = FleetMerger(tmp_path / "template.toml")
+            report = fleet.merge(projects, dry_run=True, workers=1)
+
+        parsed = [call.args[0] for call in parse.call_args_list]
+        assert parsed.count(TEMPLATE) == 1
+        assert len(parsed) == 1 + len(projects)
+        assert report.changed == 3
+        assert all('+    "rich>=13",' in r.diff for r in report.results)
+        assert report.results[0].conflict_keys == [
+            "project.dependencies.pydantic",
+            "tool.ruff.line-length",
+        ]
+        assert report.total_conflicts == 6
+        # Dry run leaves targets untouched
+        assert "rich" not in (projects[0] / "pyproject.toml").read_text(
+            encoding="utf-8"
+        )
+
+    def test_processes_match_sequential(self, tmp_path: Path) -> None:
+        """Worker processes produce the sequential results, in order."""
+        projects = _fleet(tmp_path, FLEET_PARALLEL_THRESHOLD)
+        (projects[1] / "pyproject.toml").write_text("x = [", encoding="utf-8")
+        fleet = FleetMerger(tmp_path / "template.toml")
+
+        sequential = fleet.merge(projects, dry_run=True, workers=1)
+        parallel = fleet.merge(projects, dry_run=True, workers=2)
+
+        assert [
+            (r.project, r.diff, r.conflict_keys, r.errors) for r in parallel.results
+        ] == [
+            (r.project, r.diff, r.conflict_keys, r.errors) for r in sequential.results
+        ]
+        assert parallel.failed == 1
+        assert not parallel.results[1].success
+
+    def test_write_and_report(self, tmp_path: Path) -> None:
+        """Targets are rewritten like a single merge and the report is exported."""
+        projects = _fleet(tmp_path, 2)
+        expected = TOMLMerger().merge(
+            tmp_path / "template.toml",
+            projects[0] / "pyproject.toml",
+            dry_run=True,
+        )
+
+        report = FleetMerger(tmp_path / "template.toml").merge(projects, backup=False)
+        report.export_to_json(tmp_path / "report.json")
+
+        assert report.results[0].diff == expected.diff
+        assert '"rich>=13",' in (projects[1] / "pyproject.toml").read_text(
+            encoding="utf-8"
+        )
+        exported = json.loads((tmp_path / "report.json").read_text(encoding="utf-8"))
+        assert exported["summary"] == {
+            "projects": 2,
+            "succeeded": 2,
+            "failed": 0,
+            "changed": 2,
+            "conflicts": 4,
+        }
+        assert exported["projects"][0]["conflicts"] == 2
+
+    def test_interactive_strategy_rejected(self, tmp_path: Path) -> None:
+        """Conflict callbacks cannot run across the fleet."""
+        _fleet(tmp_path, 1)
+
+        with pytest.raises(ValueError, match="Interactive"):
+            FleetMerger(tmp_path / "template.toml", MergeStrategy.INTERACTIVE)
+
+
+def test_resolve_project_roots(tmp_path: Path) -> None:
+    """Globs expand to sorted directories, files to their parent, no duplicates."""
+    projects = _fleet(tmp_path, 3)
+
+    roots, unmatched = resolve_project_roots(
+        ["repos/p02/pyproject.toml", "repos/*", "missing", "other/*"],
+        base_dir=tmp_path,
+    )
+
+    assert roots == [projects[2], projects[0], projects[1]]
+    assert unmatched == ["missing", "other/*"]
+
+
+def test_fleet_cli_fails_on_unmatched_pattern(tmp_path: Path) -> None:
+    """A mistyped --fleet root fails the run before any project is merged."""
+    projects = _fleet(tmp_path, 2)
+    args = [str(tmp_path / "template.toml"), "--fleet", str(tmp_path / "repos/*")]
+
+    preview = CliRunner().invoke(app, [*args, "-n"])
+    result = CliRunner().invoke(app, [*args, "--fleet", "typo"])
+
+    assert preview.exit_code == 0
+    assert result.exit_code == 1
+    assert "--fleet typo matched no project root" in result.output
+    assert all(
+        (p / "pyproject.toml").read_text(encoding="utf-8") == PROJECT.format(i=i)
+        for i, p in enumerate(projects)
+    )
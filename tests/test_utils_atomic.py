@@ -5,6 +5,7 @@ Tests cover:
 - Sad path: exception handling and cleanup
 - Race condition prevention
 - POSIX compliance (fsync)
+- Batched multi-file commits and crash recovery
 """
 
 from __future__ import annotations
@@ -16,7 +17,13 @@ from pathlib import Path
 import pytest
 from pytest import MonkeyPatch
 
-from scripts.utils.atomic import AtomicFileWriter, atomic_write_json
+from scripts.utils.atomic import (
+    AtomicBatch,
+    AtomicFileWriter,
+    atomic_write_json,
+    recover_batch,
+)
+from scripts.utils.filesystem import RealFileSystem
 
 
 class TestAtomicFileWriter:
@@ -256,3 +263,134 @@ class TestRaceConditionPrevention:
 
         # Failed file should not exist
         assert not failed_file.exists()
+
+
+class TestAtomicBatch:
+    """Test suite for AtomicBatch and recover_batch."""
+
+    def test_commit_replaces_all_files(self, tmp_path: Path) -> None:
+        """Test that every staged file is written and no temp file remains."""
+        targets = [tmp_path / "a" / "one.md", tmp_path / "b" / "two.md"]
+        targets[0].parent.mkdir()
+        targets[0].write_text("old")
+
+        with AtomicBatch() as batch:
+            for target in targets:
+                batch.write(target, f"new {target.name}")
+            assert targets[0].read_text() == "old"
+
+        assert [t.read_text() for t in targets] == ["new one.md", "new two.md"]
+        assert sorted(p.name for p in tmp_path.rglob("*.tmp.*")) == []
+
+    def test_exception_discards_batch(self, tmp_path: Path) -> None:
+        """Test that a failing block leaves targets and directory untouched."""
+        target = tmp_path / "keep.md"
+        target.write_text("original")
+
+        with pytest.raises(ValueError, match="boom"), AtomicBatch() as batch:
+            batch.write(target, "changed")
+            raise ValueError("boom")
+
+        assert target.read_text() == "original"
+        assert [p.name for p in tmp_path.iterdir()] == ["keep.md"]
+
+    def test_fsyncs_files_then_each_directory_once(
+        self,
+        tmp_path: Path,
+        monkeypatch: MonkeyPatch,
+    ) -> None:
+        """Test one fsync per file plus one per distinct parent directory."""
+        fsync_calls: list[int] = []
+        monkeypatch.setattr(os, "fsync", fsync_calls.append)
+
+        with AtomicBatch() as batch:
+            for i in range(4):
+                batch.write(tmp_path / f"d{i % 2}" / f"f{i}.md", "x")
+
+        assert len(fsync_calls) == 4 + 2
+
+    def test_recover_completes_interrupted_batch(
+        self,
+        tmp_path: Path,
+        monkeypatch: MonkeyPatch,
+    ) -> None:
+        """Test that the intent journal rolls a crashed commit forward."""
+        journal = tmp_path / "batch.journal"
+        targets = [tmp_path / f"f{i}.md" for i in range(3)]
+        original_replace = Path.replace
+        renames: list[Path] = []
+
+        def crash_on_second(self: Path, target: Path) -> Path:
+            if Path(target) in targets:
+                renames.append(Path(target))
+                if len(renames) == 2:
+                    raise OSError("power loss")
+            return original_replace(self, target)
+
+        monkeypatch.setattr(Path, "replace", crash_on_second)
+        batch = AtomicBatch(journal=journal)
+        for target in targets:
+            batch.write(target, f"new {target.name}")
+        with pytest.raises(OSError, match="power loss"):
+            batch.commit()
+        monkeypatch.undo()
+
+        assert journal.exists()
+        assert recover_batch(journal) == 2
+        assert [t.read_text() for t in targets] == [f"new {t.name}" for t in targets]
+        assert not journal.exists()
+        assert recover_batch(journal) == 0
+
+    def test_failed_fsync_removes_temporaries(
+        self,
+        tmp_path: Path,
+        monkeypatch: MonkeyPatch,
+    ) -> None:
+        """Test that a commit failing before the renames leaves no trace."""
+        journal = tmp_path / "batch.journal"
+        target = tmp_path / "keep.md"
+        target.write_text("original")
+
+        def failing_fsync(fd: int) -> None:
+            raise OSError("disk full")
+
+        batch = AtomicBatch(journal=journal)
+        batch.write(target, "changed")
+        batch.write(tmp_path / "new.md", "new")
+        monkeypatch.setattr(os, "fsync", failing_fsync)
+        with pytest.raises(OSError, match="disk full"):
+            batch.commit()
+
+        assert target.read_text() == "original"
+        assert [p.name for p in tmp_path.iterdir()] == ["keep.md"]
+        assert len(batch) == 0
+
+    def test_failed_rename_without_journal_removes_temporaries(
+        self,
+        tmp_path: Path,
+        monkeypatch: MonkeyPatch,
+    ) -> None:
+        """Test that temporaries not yet renamed are removed (no recovery)."""
+        targets = [tmp_path / f"f{i}.md" for i in range(3)]
+        original_replace = Path.replace
+
+        def fail_on_second(self: Path, target: Path) -> Path:
+            if Path(target) == targets[1]:
+                raise OSError("permission denied")
+            return original_replace(self, target)
+
+        monkeypatch.setattr(Path, "replace", fail_on_second)
+        with pytest.raises(OSError, match="permission denied"), AtomicBatch() as batch:
+            for target in targets:
+                batch.write(target, f"new {target.name}")
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["f0.md"]
+        assert targets[0].read_text() == "new f0.md"
+
+    def test_real_filesystem_write_many(self, tmp_path: Path) -> None:
+        """Test the FileSystemAdapter entry point backed by AtomicBatch."""
+        files = {tmp_path / "x" / "a.md": "ação", tmp_path / "b.md": "b"}
+
+        RealFileSystem().write_many(files)
+
+        assert {p: p.read_text(encoding="utf-8") for p in files} == files
@@ -0,0 +1,165 @@
+"""Unit tests for the single-shot Git state probe.
+
+Tests cover:
+- Parsing of porcelain v2 headers (branch, HEAD, upstream, ahead/behind)
+- Ordinary, renamed, unmerged and untracked entries (-z separated)
+- Per-run caching and invalidation in GitStateProbe
+- Integration with a real temporary repository
+"""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+from collections.abc import Sequence
+from pathlib import Path
+
+import pytest
+
+from scripts.core.mock_ci.git_ops import GitOperations
+from scripts.utils.git_state import (
+    GIT_STATE_COMMAND,
+    FileChange,
+    GitStateProbe,
+    parse_porcelain_v2,
+)
+
+SAMPLE_OUTPUT = (
+    "# branch.oid 0123456789abcdef0123456789abcdef01234567\0"
+    "# branch.head feat/probe\0"
+    "# branch.upstream origin/feat/probe\0"
+    "# branch.ab +3 -1\0"
+    "1 .M N... 100644 100644 100644 aaa aaa src/app.py\0"
+    "1 A. N... 000000 100644 100644 000 bbb docs/new file.md\0"
+    "2 R. N... 100644 100644 100644 ccc ccc R100 scripts/new.py\0scripts/old.py\0"
+    "u UU N... 100644 100644 100644 100644 d1 d2 d3 conflict.txt\0"
+    "? notes.txt\0"
+)
+
+
+class TestParsePorcelainV2:
+    """Test suite for parse_porcelain_v2."""
+
+    def test_headers(self) -> None:
+        """Branch, HEAD and upstream tracking come from the headers."""
+        state = parse_porcelain_v2(SAMPLE_OUTPUT)
+
+        assert state.branch == "feat/probe"
+        assert state.head == "0123456789abcdef0123456789abcdef01234567"
+        assert state.short_head == "01234567"
+        assert state.upstream == "origin/feat/probe"
+        assert (state.ahead, state.behind) == (3, 1)
+
+    def test_entries(self) -> None:
+        """Every entry type is converted to a v1-style FileChange."""
+        state = parse_porcelain_v2(SAMPLE_OUTPUT)
+
+        assert state.changes == (
+            FileChange(" M", "src/app.py"),
+            FileChange("A ", "docs/new file.md"),
+            FileChange("R ", "scripts/new.py", "scripts/old.py"),
+            FileChange("UU", "conflict.txt"),
+            FileChange("??", "notes.txt"),
+        )
+        assert state.porcelain_lines()[2] == "R  scripts/old.py -> scripts/new.py"
+        assert not state.is_clean
+
+    def test_initial_detached_without_upstream(self) -> None:
+        """Unborn HEAD / detached HEAD map to None, tracking to zero."""
+        state = parse_porcelain_v2(
+            "# branch.oid (initial)\0# branch.head (detached)\0",
+        )
+
+        assert state.head is None
+        assert state.branch is None
+        assert state.upstream is None
+        assert (state.ahead, state.behind) == (0, 0)
+        assert state.is_clean
+
+
+class TestGitStateProbe:
+    """Test suite for GitStateProbe caching."""
+
+    def test_runs_git_once_per_run(self, tmp_path: Path) -> None:
+        """Repeated get() calls reuse the first snapshot."""
+        calls: list[Sequence[str]] = []
+
+        def runner(command: Sequence[str]) -> str:
+            calls.append(command)
+            return SAMPLE_OUTPUT
+
+        probe = GitStateProbe(tmp_path, runner=runner)
+        first = probe.get()
+        second = probe.get()
+
+        assert first is second
+        assert calls == [GIT_STATE_COMMAND]
+
+    def test_invalidate_and_refresh(self, tmp_path: Path) -> None:
+        """invalidate() and refresh=True query git again."""
+        calls: list[Sequence[str]] = []
+
+        def runner(command: Sequence[str]) -> str:
+            calls.append(command)
+            return SAMPLE_OUTPUT
+
+        probe = GitStateProbe(tmp_path, runner=runner)
+        probe.get()
+        probe.invalidate()
+        probe.get()
+        probe.get(refresh=True)
+
+        assert len(calls) == 3
+
+    def test_runner_failure_means_not_a_repo(self, tmp_path: Path) -> None:
+        """A failed command yields None (and is cached too)."""
+        calls: list[Sequence[str]] = []
+
+        def runner(command: Sequence[str]) -> str | None:
+            calls.append(command)
+            return None
+
+        probe = GitStateProbe(tmp_path, runner=runner)
+
+        assert probe.get() is None
+        assert probe.get() is None
+        assert len(calls) == 1
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+class TestRealRepository:
+    """Integration tests against a temporary Git repository."""
+
+    @staticmethod
+    def _git(repo: Path, *args: str) -> None:
+        subprocess.run(  # noqa: S603
+            ["git", *args],  # noqa: S607
+            cwd=repo,
+            check=True,
+            capture_output=True,
+        )
+
+    def test_default_runner_and_git_operations(self, tmp_path: Path) -> None:
+        """The default runner and GitOperations.get_status read a real repo."""
+        self._git(tmp_path, "init", "-q", "-b", "work")
+        self._git(tmp_path, "config", "user.email", "dev@example.com")
+        self._git(tmp_path, "config", "user.name", "Dev")
+        (tmp_path / "a.txt").write_text("a\n", encoding="utf-8")
+        self._git(tmp_path, "add", "a.txt")
+        self._git(tmp_path, "commit", "-q", "-m", "init")
+        (tmp_path / "a.txt").write_text("changed\n", encoding="utf-8")
+
+        state = GitStateProbe(tmp_path).get()
+        info = GitOperations(tmp_path).get_status()
+
+        assert state is not None
+        assert state.branch == "work"
+        assert state.porcelain_lines() == [" M a.txt"]
+        assert info.is_git_repo
+        assert info.has_changes
+        assert info.current_branch == "work"
+        assert info.commit_hash == state.short_head
+
+    def test_not_a_repository(self, tmp_path: Path) -> None:
+        """Outside a repository the default runner reports None."""
+        assert GitStateProbe(tmp_path).get() is None
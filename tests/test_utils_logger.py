@@ -10,7 +10,11 @@ from __future__ import annotations
 # S101: Use of assert (required for pytest)
 # PLR2004: Magic value in comparison (test constants are acceptable)
 # SLF001: Private member access (necessary for unit testing internals)
+import json
 import logging
+import sys
+import threading
+from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -19,8 +23,10 @@ if TYPE_CHECKING:
     import pytest
 
 from scripts.utils.logger import (
+    BoundedQueueHandler,
     ErrorHandler,
     InfoHandler,
+    JSONFormatter,
     StdoutFilter,
     TerminalColors,
     get_colors,
@@ -322,3 +328,287 @@ class TestIntegration:
         # Não deve conter códigos ANSI
         assert "\033[" not in captured.err
         assert "Error without colors" in captured.err
+
+
+class _GatedHandler(logging.Handler):
+    """Handler que bloqueia até o teste liberar (simula I/O lento)."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.gate = threading.Event()
+        self.messages: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.gate.wait(timeout=5)
+        self.messages.append(record.getMessage())
+
+
+def _log_in_child() -> None:
+    """Alvo do processo filho: registra além da capacidade da fila herdada."""
+    for i in range(5):
+        logging.getLogger("test_async_fork").warning("filho %d", i)
+
+
+class TestAsyncLogging:
+    """Testes do modo assíncrono (QueueHandler/QueueListener)."""
+
+    def test_async_mode_uses_single_queue_handler(self, tmp_path: Path) -> None:
+        """O logger recebe apenas o BoundedQueueHandler."""
+        log_file = tmp_path / "async.log"
+        logger = setup_logging("test_async", log_file=str(log_file), async_mode=True)
+
+        assert len(logger.handlers) == 1
+        handler = logger.handlers[0]
+        assert isinstance(handler, BoundedQueueHandler)
+
+        logger.info("token ghp_SECRET123 via queue")
+        handler.close()
+
+        content = log_file.read_text()
+        assert "[REDACTED] via queue" in content
+        assert "ghp_SECRET123" not in content
+
+    def test_trace_id_captured_on_producer_thread(self, tmp_path: Path) -> None:
+        """O trace_id do contexto do produtor aparece no arquivo."""
+        from scripts.utils.context import trace_context
+
+        log_file = tmp_path / "trace.log"
+        logger = setup_logging(
+            "test_async_trace", log_file=str(log_file), async_mode=True
+        )
+
+        with trace_context("trace-from-producer"):
+            logger.info("traced")
+        logger.handlers[0].close()
+
+        assert "[trace-from-producer]" in log_file.read_text()
+
+    def test_drop_policy_counts_overflow(self) -> None:
+        """Com a fila cheia, 'drop' descarta e contabiliza registros."""
+        target = _GatedHandler()
+        handler = BoundedQueueHandler([target], queue_size=1, overflow="drop")
+        logger = logging.getLogger("test_async_drop")
+        logger.handlers.clear()
+        logger.propagate = False
+        logger.addHandler(handler)
+
+        for i in range(20):
+            logger.warning("msg %d", i)
+        target.gate.set()
+        handler.close()
+
+        assert handler.dropped > 0
+        assert len(target.messages) + handler.dropped == 20
+
+    def test_block_policy_delivers_everything(self) -> None:
+        """Com 'block', nenhum registro é perdido mesmo com fila mínima."""
+        target = _GatedHandler()
+        target.gate.set()
+        handler = BoundedQueueHandler([target], queue_size=1, overflow="block")
+        logger = logging.getLogger("test_async_block")
+        logger.handlers.clear()
+        logger.propagate = False
+        logger.addHandler(handler)
+
+        for i in range(50):
+            logger.warning("msg %d", i)
+        handler.close()
+
+        assert target.messages == [f"msg {i}" for i in range(50)]
+
+    def test_setup_logging_again_drains_previous_handler(self, tmp_path: Path) -> None:
+        """Reconfigurar o logger drena e fecha o handler assíncrono anterior."""
+        log_file = tmp_path / "reset.log"
+        logger = setup_logging(
+            "test_async_reset", log_file=str(log_file), async_mode=True
+        )
+        first = logger.handlers[0]
+        assert isinstance(first, BoundedQueueHandler)
+        logger.info("antes do reset")
+
+        setup_logging("test_async_reset", async_mode=False)
+
+        assert "antes do reset" in log_file.read_text()
+        assert len(logger.handlers) == 2
+        assert first.listener._thread is not None  # listener compartilhado segue ativo
+
+    def test_loggers_share_one_listener_thread(self, tmp_path: Path) -> None:
+        """Vários setup_logging assíncronos usam uma única fila e thread."""
+        handlers = [
+            setup_logging(
+                f"test_async_shared_{i}",
+                log_file=str(tmp_path / f"{i}.log"),
+                async_mode=True,
+            ).handlers[0]
+            for i in range(3)
+        ]
+        listeners = {id(handler.listener) for handler in handlers}  # type: ignore[attr-defined]
+
+        for i, handler in enumerate(handlers):
+            logging.getLogger(f"test_async_shared_{i}").info("registro %d", i)
+            handler.close()
+
+        assert len(listeners) == 1
+        for i in range(3):
+            content = (tmp_path / f"{i}.log").read_text()
+            assert f"registro {i}" in content
+            assert f"registro {(i + 1) % 3}" not in content
+
+    def test_forked_child_logs_synchronously(self, tmp_path: Path) -> None:
+        """Um filho criado por fork escreve seus registros (sem listener herdado)."""
+        import multiprocessing
+
+        import pytest
+
+        if "fork" not in multiprocessing.get_all_start_methods():
+            pytest.skip("fork indisponível nesta plataforma")
+        log_file = tmp_path / "fork.log"
+        logger = setup_logging(
+            "test_async_fork",
+            log_file=str(log_file),
+            async_mode=True,
+            queue_size=1,
+        )
+        logger.warning("pai")
+
+        child = multiprocessing.get_context("fork").Process(target=_log_in_child)
+        child.start()
+        child.join(timeout=20)
+        if child.is_alive():  # regressão: filho preso na fila sem listener
+            child.kill()
+        logger.handlers[0].close()
+
+        assert child.exitcode == 0
+        content = log_file.read_text()
+        assert "pai" in content
+        assert all(f"filho {i}" in content for i in range(5))
+
+    def test_drop_policy_counts_concurrent_overflow(self) -> None:
+        """Descartes de várias threads produtoras são contados sem perda."""
+        target = _GatedHandler()
+        handler = BoundedQueueHandler([target], queue_size=1, overflow="drop")
+        logger = logging.getLogger("test_async_drop_threads")
+        logger.handlers.clear()
+        logger.propagate = False
+        logger.addHandler(handler)
+
+        def produce() -> None:
+            for i in range(200):
+                logger.warning("msg %d", i)
+
+        producers = [threading.Thread(target=produce) for _ in range(4)]
+        for producer in producers:
+            producer.start()
+        for producer in producers:
+            producer.join()
+        target.gate.set()
+        handler.close()
+
+        assert len(target.messages) + handler.dropped == 800
+
+    def test_invalid_configuration(self) -> None:
+        """queue_size e overflow inválidos são rejeitados."""
+        import pytest
+
+        with pytest.raises(ValueError, match="queue_size"):
+            BoundedQueueHandler([], queue_size=0)
+        with pytest.raises(ValueError, match="overflow"):
+            BoundedQueueHandler([], overflow="spill")  # type: ignore[arg-type]
+
+
+def _reference_json(formatter: JSONFormatter, record: logging.LogRecord) -> str:
+    """Saída do JSONFormatter original (dict + json.dumps)."""
+    entry = {
+        "timestamp": datetime.fromtimestamp(
+            record.created,
+            tz=timezone.utc,
+        ).isoformat(),
+        "level": record.levelname,
+        "logger": record.name,
+        "message": record.getMessage(),
+        "trace_id": getattr(record, "trace_id", "no-trace-id"),
+        "location": f"{record.filename}:{record.lineno}",
+    }
+    if record.exc_info:
+        entry["exception"] = formatter.formatException(record.exc_info)
+    extra = getattr(record, "extra", None)
+    if extra:
+        entry["extra"] = extra
+    return json.dumps(entry, ensure_ascii=False)
+
+
+class TestJSONFormatter:
+    """Testes do JSONFormatter com fragmentos em cache."""
+
+    @staticmethod
+    def _record(
+        created: float, msg: str = "msg %s", lineno: int = 7
+    ) -> logging.LogRecord:
+        record = logging.LogRecord(
+            'app."mod"',
+            logging.INFO,
+            "/src/app.py",
+            lineno,
+            msg,
+            ("ção 🚀",),
+            None,
+        )
+        record.created = created
+        return record
+
+    def test_default_output_is_byte_identical(self) -> None:
+        """Saída padrão é idêntica à do dict + json.dumps original."""
+        formatter = JSONFormatter()
+        timestamps = [
+            0.0,
+            1_700_000_000.0,  # microsegundos == 0 (sem fração no ISO)
+            1_700_000_000.25,
+            1_700_000_000.9999996,  # arredonda para o segundo seguinte
+            1_700_000_001.0000004,
+            1_733_262_300.123456,
+        ]
+        for created in timestamps:
+            record = self._record(created, 'tab\t "aspas" \\ %s\n\x01')
+            assert formatter.format(record) == _reference_json(formatter, record)
+
+    def test_exception_trace_id_and_extra(self) -> None:
+        """Campos opcionais seguem a mesma ordem e codificação."""
+        formatter = JSONFormatter()
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            exc_info = sys.exc_info()
+        record = self._record(1_700_000_000.5)
+        record.exc_info = exc_info
+        record.trace_id = "abc-123"
+        record.extra = {"user": "ü", "ids": [1, 2]}
+
+        assert formatter.format(record) == _reference_json(formatter, record)
+
+    def test_cached_fragments_follow_record_changes(self) -> None:
+        """Cache por segundo e por localização não reaproveita valores errados."""
+        formatter = JSONFormatter()
+        first = json.loads(formatter.format(self._record(1_700_000_000.1, lineno=1)))
+        second = json.loads(formatter.format(self._record(1_700_000_061.1, lineno=2)))
+
+        assert first["timestamp"] == "2023-11-14T22:13:20.100000+00:00"
+        assert second["timestamp"] == "2023-11-14T22:14:21.100000+00:00"
+        assert (first["location"], second["location"]) == ("app.py:1", "app.py:2")
+
+    def test_third_party_encoder_or_fallback(self) -> None:
+        """orjson/msgspec produzem o mesmo conteúdo (ou caem para stdlib)."""
+        record = self._record(1_700_000_000.5)
+        for encoder in ("orjson", "msgspec"):
+            formatter = JSONFormatter(encoder=encoder)
+
+            assert formatter.encoder in (encoder, "json")
+            assert json.loads(formatter.format(record)) == json.loads(
+                _reference_json(formatter, record),
+            )
+
+    def test_unknown_encoder_rejected(self) -> None:
+        """Backend desconhecido é erro de configuração."""
+        import pytest
+
+        with pytest.raises(ValueError, match="encoder"):
+            JSONFormatter(encoder="yaml")  # type: ignore[arg-type]
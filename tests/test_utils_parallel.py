@@ -0,0 +1,120 @@
+"""Tests for the shared process-pool helpers of the batch tools.
+
+Test Coverage:
+    - worker_count: threshold, default cap, explicit requests
+    - process_map: input order, one context per worker process
+    - TimedReport: slowest results and JSON export
+
+Usage:
+    pytest tests/test_utils_parallel.py -v
+"""
+
+from __future__ import annotations
+
+# ruff: noqa: S101, PLR2004
+# S101: Use of assert (required for pytest)
+# PLR2004: Magic value in comparison (test constants are acceptable)
+import json
+import os
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from scripts.utils.parallel import (
+    MAX_DEFAULT_WORKERS,
+    PARALLEL_THRESHOLD,
+    TimedReport,
+    process_map,
+    worker_count,
+)
+
+
+def _context() -> tuple[int, str]:
+    """Per-worker context: the worker's pid and a marker."""
+    return os.getpid(), "ready"
+
+
+def _square(context: tuple[int, str], item: int) -> tuple[int, int, str]:
+    """Square an item and report which worker context handled it."""
+    pid, marker = context
+    return item * item, pid, marker
+
+
+class TestWorkerCount:
+    """Sizing of the pool."""
+
+    def test_small_batches_stay_in_process(self) -> None:
+        """Below the threshold no processes are started, even if requested."""
+        assert worker_count(PARALLEL_THRESHOLD - 1, 4) == 1
+        assert worker_count(3, 4, threshold=8) == 1
+
+    def test_default_is_capped_on_large_machines(self) -> None:
+        """A 64-core runner does not start 64 interpreters by default."""
+        with patch("scripts.utils.parallel.os.cpu_count", return_value=64):
+            assert worker_count(PARALLEL_THRESHOLD) == MAX_DEFAULT_WORKERS
+        with patch("scripts.utils.parallel.os.cpu_count", return_value=2):
+            assert worker_count(PARALLEL_THRESHOLD) == 2
+
+    def test_requests_are_honored_up_to_the_batch_size(self) -> None:
+        """Explicit requests may exceed the cap but not the number of items."""
+        assert worker_count(100, 16) == 16
+        assert worker_count(10, 16, threshold=8) == 10
+        assert worker_count(100, 1) == 1
+
+
+class TestProcessMap:
+    """Ordered map over worker processes."""
+
+    def test_results_in_order_with_per_worker_context(self) -> None:
+        """Results follow the input; each worker built its own context."""
+        items = list(range(40))
+
+        results = list(process_map(_square, items, context=_context, workers=2))
+
+        assert [square for square, _, _ in results] == [i * i for i in items]
+        assert {marker for _, _, marker in results} == {"ready"}
+        pids = {pid for _, pid, _ in results}
+        assert os.getpid() not in pids
+        assert 1 <= len(pids) <= 2
+
+
+@dataclass
+class _Item:
+    """Timed result of the test report."""
+
+    name: str
+    duration: float
+
+
+@dataclass
+class _Report(TimedReport[_Item]):
+    """Minimal report over _Item results."""
+
+    items: list[_Item]
+
+    @property
+    def timed_results(self) -> Sequence[_Item]:
+        """Items of the report."""
+        return self.items
+
+    def to_dict(self) -> dict[str, Any]:
+        """Names and durations."""
+        return {"items": {item.name: item.duration for item in self.items}}
+
+
+class TestTimedReport:
+    """Shared slowest() and export_to_json()."""
+
+    def test_slowest_and_export(self, tmp_path: Path) -> None:
+        """Slowest first; the export creates missing parents."""
+        report = _Report([_Item("a", 0.1), _Item("b", 0.5), _Item("c", 0.2)])
+        output = tmp_path / "reports" / "timings.json"
+
+        report.export_to_json(output)
+
+        assert [item.name for item in report.slowest(2)] == ["b", "c"]
+        assert json.loads(output.read_text(encoding="utf-8")) == {
+            "items": {"a": 0.1, "b": 0.5, "c": 0.2},
+        }